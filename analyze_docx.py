@@ -1,133 +1,382 @@
-import zipfile
-import xml.etree.ElementTree as ET
-import re
+#!/usr/bin/env python3
+"""
+신학과사회 DOCX 형식 분석기
+word/document.xml을 iterparse로 한 번만 스트리밍하며 페이지 크기, 마진,
+run별 글꼴/크기, 줄간격, 스타일 사용량을 수집 (문서 크기와 무관한 메모리 사용)
+
+사용법:
+    python analyze_docx.py paper.docx [--json]
+"""
+
+import json
 import sys
-sys.stdout.reconfigure(encoding='utf-8')
-
-docx_path = r'C:\Users\sshin\OneDrive - Global Education Research Institutute\바탕 화면\GPTs_Leadership_Paper_ShinSa_Format.docx'
-
-ns = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
-
-# Claude Desktop Output 분석 결과
-print('=' * 60)
-print('Claude Desktop 출력물 분석 결과')
-print('=' * 60)
-
-with zipfile.ZipFile(docx_path, 'r') as z:
-    # 페이지 설정 (sectPr)
-    with z.open('word/document.xml') as f:
-        doc_tree = ET.parse(f)
-        doc_root = doc_tree.getroot()
-
-        sectPr = doc_root.find('.//w:sectPr', ns)
-        if sectPr is not None:
-            pgSz = sectPr.find('w:pgSz', ns)
-            pgMar = sectPr.find('w:pgMar', ns)
-
-            if pgSz is not None:
-                # 1 inch = 1440 twips, 1 mm = 56.7 twips
-                w = int(pgSz.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}w', '0'))
-                h = int(pgSz.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}h', '0'))
-                w_mm = round(w / 56.7)
-                h_mm = round(h / 56.7)
-                print(f'\n[페이지 크기]')
-                print(f'  실제: {w_mm}mm x {h_mm}mm ({w} x {h} twips)')
-
-                if w_mm > 200:
-                    print(f'  → A4 사용됨 (210x297mm)')
-                    print(f'  ❌ 2025 기준: 신국판 (152x225mm)')
-                else:
-                    print(f'  ✓ 신국판 사용됨')
-
-            if pgMar is not None:
-                top = int(pgMar.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}top', '0'))
-                bottom = int(pgMar.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}bottom', '0'))
-                left = int(pgMar.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}left', '0'))
-                right = int(pgMar.get('{http://schemas.openxmlformats.org/wordprocessingml/2006/main}right', '0'))
-
-                # 1 inch = 1440 twips, 1 mm = 56.7 twips
-                top_mm = round(top / 56.7)
-                bottom_mm = round(bottom / 56.7)
-                left_mm = round(left / 56.7)
-                right_mm = round(right / 56.7)
-
-                print(f'\n[마진]')
-                print(f'  실제: 상 {top_mm}mm, 하 {bottom_mm}mm, 좌 {left_mm}mm, 우 {right_mm}mm')
-                print(f'  2025 기준: 상 24mm, 하 25mm, 좌 25mm, 우 23mm')
-
-                # 체크
-                issues = []
-                if abs(top_mm - 24) > 3:
-                    issues.append(f'상단 마진 ({top_mm}mm != 24mm)')
-                if abs(bottom_mm - 25) > 3:
-                    issues.append(f'하단 마진 ({bottom_mm}mm != 25mm)')
-                if abs(left_mm - 25) > 3:
-                    issues.append(f'좌측 마진 ({left_mm}mm != 25mm)')
-                if abs(right_mm - 23) > 3:
-                    issues.append(f'우측 마진 ({right_mm}mm != 23mm)')
-
-                if issues:
-                    print(f'  ❌ 문제: ' + ', '.join(issues))
-                else:
-                    print(f'  ✓ 마진 OK')
-
-    # 폰트 분석
+import zipfile
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from shinsa_spec import TWIPS_PER_MM, load_profile, profile_names
+
+try:
+    from lxml import etree as ET
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    HAS_LXML = False
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W = '{' + W_NS + '}'
+
+# 분석·판정 방식이 바뀌면 올린다 (scan_submissions 캐시 키에 포함)
+ANALYZER_VERSION = 2
+
+# 2025년 기준 (spec/shinsa_spec.json — 생성기와 같은 프로필)
+SPEC_2025 = load_profile("2025")
+
+# 글꼴 속성 → 보고서 키
+FONT_ATTRS = {"eastAsia": "east_asia", "ascii": "ascii"}
+
+
+def _tag(name: str) -> str:
+    return W + name
+
+
+def _int(value, default=0) -> int:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def _read_props(rPr, pPr) -> dict:
+    """rPr/pPr 요소에서 크기·글꼴·줄간격만 추출"""
+    props = {}
+    if rPr is not None:
+        sz = rPr.find(_tag("sz"))
+        if sz is not None:
+            props["sz"] = _int(sz.get(_tag("val")))
+        fonts = rPr.find(_tag("rFonts"))
+        if fonts is not None:
+            for attr in FONT_ATTRS:
+                value = fonts.get(_tag(attr))
+                theme = fonts.get(_tag(attr + "Theme"))
+                if value:
+                    props[attr] = value
+                elif theme:
+                    props[attr] = "theme:" + theme
+    if pPr is not None:
+        spacing = pPr.find(_tag("spacing"))
+        if spacing is not None and spacing.get(_tag("line")) is not None:
+            props["line"] = _int(spacing.get(_tag("line")))
+            props["lineRule"] = spacing.get(_tag("lineRule"), "auto")
+    return props
+
+
+def load_styles(z: zipfile.ZipFile) -> tuple:
+    """styles.xml에서 스타일별 유효 속성 (basedOn 상속 해소)과 기본 문단 스타일 반환"""
+    defaults = {}
+    raw = {}
+    default_para = None
+
+    try:
+        f = z.open('word/styles.xml')
+    except KeyError:
+        return {}, defaults, None
+
+    with f:
+        root = ET.parse(f).getroot()
+
+    doc_defaults = root.find(_tag("docDefaults"))
+    if doc_defaults is not None:
+        rPr = doc_defaults.find(f"{_tag('rPrDefault')}/{_tag('rPr')}")
+        pPr = doc_defaults.find(f"{_tag('pPrDefault')}/{_tag('pPr')}")
+        defaults = _read_props(rPr, pPr)
+
+    for style in root.iter(_tag("style")):
+        if style.get(_tag("type")) != "paragraph":
+            continue
+        style_id = style.get(_tag("styleId"))
+        based = style.find(_tag("basedOn"))
+        raw[style_id] = (
+            based.get(_tag("val")) if based is not None else None,
+            _read_props(style.find(_tag("rPr")), style.find(_tag("pPr"))),
+        )
+        if style.get(_tag("default")) == "1":
+            default_para = style_id
+
+    resolved = {}
+
+    def resolve(style_id, depth=0):
+        if style_id in resolved:
+            return resolved[style_id]
+        if style_id not in raw or depth > 20:
+            return dict(defaults)
+        parent, props = raw[style_id]
+        merged = resolve(parent, depth + 1) if parent else dict(defaults)
+        merged = {**merged, **props}
+        resolved[style_id] = merged
+        return merged
+
+    for style_id in raw:
+        resolve(style_id)
+
+    return resolved, defaults, default_para
+
+
+def _release(elem) -> None:
+    """처리 끝난 요소 메모리 해제 (lxml은 앞선 형제 노드까지 제거)"""
+    elem.clear()
+    if HAS_LXML:
+        parent = elem.getparent()
+        while elem.getprevious() is not None and parent is not None:
+            del parent[0]
+
+
+def analyze_docx(docx_path, name: str = None) -> dict:
+    """DOCX 형식 정보를 단일 스트리밍 패스로 수집 (경로 또는 파일 객체)"""
+    font_sizes = Counter()      # half-points → 글자 수
+    fonts = {key: Counter() for key in FONT_ATTRS.values()}
+    line_spacing = Counter()    # (line, lineRule) → 문단 수
+    line_chars = Counter()      # (line, lineRule) → 글자 수
+    style_usage = Counter()     # styleId → 문단 수
+    role_sizes = {}             # styleId → Counter(half-points → 글자 수)
+    sections = []
+    paragraphs = 0
+    runs = 0
+
+    with zipfile.ZipFile(docx_path, 'r') as z:
+        styles, defaults, default_para = load_styles(z)
+
+        p_tag, r_tag, sect_tag = _tag("p"), _tag("r"), _tag("sectPr")
+        pStyle_tag, pPr_tag, rPr_tag = _tag("pStyle"), _tag("pPr"), _tag("rPr")
+        t_tag = _tag("t")
+
+        para_style = default_para
+        para_props = {}
+        para_chars = 0
+        depth_p = 0
+
+        with z.open('word/document.xml') as f:
+            for event, elem in ET.iterparse(f, events=("start", "end")):
+                tag = elem.tag
+
+                if event == "start":
+                    if tag == p_tag:
+                        depth_p += 1
+                        para_style = default_para
+                        para_props = {}
+                        para_chars = 0
+                    continue
+
+                if tag == pStyle_tag:
+                    para_style = elem.get(_tag("val"))
+                elif tag == pPr_tag:
+                    para_props = _read_props(elem.find(rPr_tag), elem)
+                elif tag == r_tag and depth_p:
+                    base = styles.get(para_style, defaults)
+                    props = {**base, **_read_props(elem.find(rPr_tag), None)}
+                    chars = sum(len(t.text or "") for t in elem.iter(t_tag))
+                    runs += 1
+                    para_chars += chars
+                    if chars:
+                        size = props.get("sz")
+                        if size:
+                            font_sizes[size] += chars
+                            role_sizes.setdefault(para_style or "", Counter())[size] += chars
+                        for attr, key in FONT_ATTRS.items():
+                            if attr in props:
+                                fonts[key][props[attr]] += chars
+                    _release(elem)
+                elif tag == p_tag:
+                    depth_p -= 1
+                    paragraphs += 1
+                    style_usage[para_style or ""] += 1
+                    effective = {**styles.get(para_style, defaults), **para_props}
+                    if "line" in effective:
+                        key = (effective["line"], effective.get("lineRule", "auto"))
+                        line_spacing[key] += 1
+                        line_chars[key] += para_chars
+                    if depth_p == 0:
+                        _release(elem)
+                elif tag == sect_tag:
+                    sections.append(_read_section(elem))
+
+    main_section = sections[-1] if sections else {}
+
+    return {
+        "path": name or str(docx_path),
+        "page": main_section.get("page"),
+        "margins": main_section.get("margins"),
+        "sections": len(sections),
+        "paragraphs": paragraphs,
+        "runs": runs,
+        "font_sizes": {str(k): v for k, v in sorted(font_sizes.items(), reverse=True)},
+        "fonts": {key: dict(counter.most_common()) for key, counter in fonts.items()},
+        "line_spacing": [
+            {"line": line, "rule": rule, "paragraphs": count, "chars": line_chars[(line, rule)]}
+            for (line, rule), count in line_spacing.most_common()
+        ],
+        "styles": dict(style_usage.most_common()),
+        "style_sizes": {
+            style: {str(k): v for k, v in counter.most_common()}
+            for style, counter in role_sizes.items()
+        },
+    }
+
+
+def _read_section(sectPr) -> dict:
+    """sectPr → 페이지 크기/마진 (twips와 mm)"""
+    result = {}
+    pgSz = sectPr.find(_tag("pgSz"))
+    if pgSz is not None:
+        w = _int(pgSz.get(_tag("w")))
+        h = _int(pgSz.get(_tag("h")))
+        result["page"] = {
+            "width_twips": w, "height_twips": h,
+            "width_mm": round(w / TWIPS_PER_MM), "height_mm": round(h / TWIPS_PER_MM),
+        }
+    pgMar = sectPr.find(_tag("pgMar"))
+    if pgMar is not None:
+        result["margins"] = {
+            side: round(_int(pgMar.get(_tag(side))) / TWIPS_PER_MM)
+            for side in ("top", "bottom", "left", "right")
+        }
+    return result
+
+
+def dominant_size_pt(analysis: dict):
+    """가장 많은 글자에 쓰인 글자 크기 (본문 크기 추정)"""
+    sizes = analysis["font_sizes"]
+    if not sizes:
+        return None
+    half_points = max(sizes, key=sizes.get)
+    return int(half_points) / 2
+
+
+def check_spec(analysis: dict, spec: dict = SPEC_2025) -> list:
+    """분석 결과를 사양 프로필과 비교해 규칙별 통과 여부 반환"""
+    checks = []
+    page_spec = spec["page"]
+    fonts_spec = spec["fonts"]
+    tolerances = spec["tolerances"]
+
+    def add(rule, passed, expected, actual):
+        checks.append({"rule": rule, "passed": bool(passed), "expected": expected, "actual": actual})
+
+    # 페이지 크기는 twips 그대로 프로필의 미리 계산한 값과 비교 (반 mm 이내)
+    page = analysis.get("page") or {}
+    page_twips = spec["units"]["page_twips"]
+    expected_page = [page_spec["width_mm"], page_spec["height_mm"]]
+    actual_page = [page.get("width_mm"), page.get("height_mm")]
+    add("page_size",
+        bool(page) and all(abs(page[f"{k}_twips"] - page_twips[k]) <= TWIPS_PER_MM / 2
+                           for k in ("width", "height")),
+        expected_page, actual_page)
+
+    margins = analysis.get("margins") or {}
+    for side in ("top", "bottom", "left", "right"):
+        expected = page_spec[f"margin_{side}_mm"]
+        actual = margins.get(side)
+        add(f"margin_{side}", actual is not None and abs(actual - expected) <= tolerances["margin_mm"],
+            expected, actual)
+
+    size_tol = tolerances["size_pt"]
+    sizes_pt = [int(s) / 2 for s in analysis["font_sizes"]]
+    title = max(sizes_pt) if sizes_pt else None
+    add("title_size", title is not None and abs(title - fonts_spec["title_size"]) <= size_tol,
+        fonts_spec["title_size"], title)
+
+    body = dominant_size_pt(analysis)
+    add("body_size", body is not None and abs(body - fonts_spec["body_size"]) <= size_tol,
+        fonts_spec["body_size"], body)
+
+    has_abstract = any(abs(s - fonts_spec["abstract_size"]) <= size_tol for s in sizes_pt)
+    add("abstract_size", has_abstract, fonts_spec["abstract_size"], sorted(set(sizes_pt)))
+
+    east_asia = analysis["fonts"]["east_asia"]
+    main_font = max(east_asia, key=east_asia.get) if east_asia else None
+    add("font", main_font is not None and fonts_spec["korean"] in main_font, fonts_spec["korean"], main_font)
+
+    # 본문 줄간격: 가장 많은 글자가 쓰인 줄간격
+    auto_lines = [s for s in analysis["line_spacing"] if s["rule"] == "auto"]
+    body_line = max(auto_lines, key=lambda s: s["chars"])["line"] / 240 if auto_lines else None
+    add("line_spacing",
+        body_line is not None and abs(body_line - spec["line_spacing"]) <= tolerances["line_spacing"],
+        spec["line_spacing"], body_line)
+
+    return checks
+
+
+def print_report(analysis: dict, checks: list, spec: dict = SPEC_2025) -> None:
+    """사람이 읽는 분석 보고서 출력"""
+    print('=' * 60)
+    print(f"DOCX 형식 분석: {analysis['path']}")
+    print('=' * 60)
+
+    page = analysis.get("page")
+    if page:
+        print(f'\n[페이지 크기]')
+        print(f"  실제: {page['width_mm']}mm x {page['height_mm']}mm "
+              f"({page['width_twips']} x {page['height_twips']} twips)")
+
+    margins = analysis.get("margins")
+    if margins:
+        print(f'\n[마진]')
+        print(f"  실제: 상 {margins['top']}mm, 하 {margins['bottom']}mm, "
+              f"좌 {margins['left']}mm, 우 {margins['right']}mm")
+
     print(f'\n[폰트 설정]')
-    with z.open('word/document.xml') as f:
-        content = f.read().decode('utf-8')
-
-        # 타이틀 폰트 (sz val=32 is 16pt)
-        sz_matches = re.findall(r'<w:sz w:val="(\d+)"', content)
-        font_matches = re.findall(r'w:eastAsia="([^"]+)"', content)
-        ascii_fonts = re.findall(r'w:ascii="([^"]+)"', content)
-
-        unique_sizes = sorted(set(int(s) for s in sz_matches), reverse=True)
-        unique_fonts = set(font_matches)
-        unique_ascii = set(ascii_fonts)
-
-        print(f'  사용된 폰트 크기 (half-points): {unique_sizes[:10]}')
-        pt_sizes = [s/2 for s in unique_sizes[:10]]
-        print(f'  → pt 변환: {pt_sizes}')
-        print(f'  사용된 eastAsia 폰트: {unique_fonts}')
-        print(f'  사용된 ascii 폰트: {unique_ascii}')
-
-        # 2025 기준 비교
-        print(f'\n[2025 기준 폰트 크기 비교]')
-        max_size = max(unique_sizes)/2 if unique_sizes else 0
-        print(f'  - 제목: 14pt (2025 기준) vs {max_size}pt (실제)')
-        print(f'  - 본문: 10.3pt (2025 기준)')
-        print(f'  - 초록: 8.5pt (2025 기준)')
-        print(f'  - 폰트: 바탕체 (2025 기준) vs {unique_fonts or unique_ascii} (실제)')
-
-        if 'Times New Roman' in unique_fonts or 'Times New Roman' in unique_ascii:
-            print(f'  ❌ Times New Roman 사용됨 (바탕체 사용해야 함)')
-
-    # 줄간격 분석
+    sizes = analysis["font_sizes"]
+    print(f"  사용된 폰트 크기 (half-points: 글자 수): {dict(list(sizes.items())[:10])}")
+    print(f"  → pt 변환: {[int(s) / 2 for s in list(sizes)[:10]]}")
+    print(f"  사용된 eastAsia 폰트: {analysis['fonts']['east_asia']}")
+    print(f"  사용된 ascii 폰트: {analysis['fonts']['ascii']}")
+
     print(f'\n[줄간격]')
-    with z.open('word/document.xml') as f:
-        content = f.read().decode('utf-8')
-        spacing_matches = re.findall(r'<w:spacing[^>]*w:line="(\d+)"[^>]*/>', content)
-        if spacing_matches:
-            unique_spacing = sorted(set(int(s) for s in spacing_matches), reverse=True)
-            print(f'  사용된 줄간격 (twips): {unique_spacing[:5]}')
-            # 160% of 12pt = 480 twips roughly
-            print(f'  2025 기준: 160% (약 384 twips for 10pt)')
-        else:
-            print(f'  줄간격 설정 없음 (기본값 사용)')
-
-# 2025 실제 논문과 비교 요약
-print('\n' + '=' * 60)
-print('A/B 테스트 요약')
-print('=' * 60)
-print('''
-항목                | 2025 실제 논문      | Claude Desktop 출력
---------------------|--------------------|-----------------------
-페이지 크기         | 신국판 (152x225mm) | A4 (210x297mm) ❌
-마진               | 24/25/25/23mm      | 25.4mm (1inch) ❌
-폰트               | 바탕체             | Times New Roman ❌
-제목 크기          | 14pt               | 16pt ❌
-본문 크기          | 10.3pt             | 12pt ❌
-초록 크기          | 8.5pt              | 9pt
-헤더 크기          | 8.1pt              | 9pt
-줄간격             | 160%               | 기본값 (100%?)
-''')
+    if analysis["line_spacing"]:
+        for item in analysis["line_spacing"][:5]:
+            ratio = f" ({item['line'] / 240:.0%})" if item["rule"] == "auto" else ""
+            print(f"  {item['line']} ({item['rule']}){ratio}: 문단 {item['paragraphs']}개, {item['chars']}자")
+    else:
+        print(f'  줄간격 설정 없음 (기본값 사용)')
+
+    print(f'\n[스타일 사용]')
+    for style, count in list(analysis["styles"].items())[:10]:
+        print(f"  {style or '(없음)'}: {count}")
+
+    print('\n' + '=' * 60)
+    print(f"{spec['name']} 기준 비교 (spec {spec['spec_version']})")
+    print('=' * 60)
+    for check in checks:
+        mark = '✓' if check["passed"] else '❌'
+        print(f"  {mark} {check['rule']}: 기준 {check['expected']} / 실제 {check['actual']}")
+
+
+def main(argv: list) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="신학과사회 DOCX 형식 분석")
+    parser.add_argument("docx", help="분석할 .docx 파일")
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    parser.add_argument("--profile", choices=profile_names(), default=SPEC_2025["name"],
+                        help="비교할 연도 프로필 (기본 2025)")
+    opts = parser.parse_args(argv)
+    spec = load_profile(opts.profile)
+
+    try:
+        analysis = analyze_docx(opts.docx)
+    except (OSError, KeyError, zipfile.BadZipFile, ET.ParseError) as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False))
+        return 1
+
+    checks = check_spec(analysis, spec)
+    if opts.json:
+        print(json.dumps({**analysis, "checks": checks}, ensure_ascii=False, indent=2))
+    else:
+        print_report(analysis, checks, spec)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
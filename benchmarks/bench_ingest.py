@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+인용 말뭉치 적재 벤치마크: 처음 적재(first) vs 체크포인트로 이어 가기(resume)
+합성 논문 N편을 DOCX로 만든 뒤 hash 임베더·임시 로컬 색인으로 두 번 적재한다.
+두 번째 실행은 바뀐 파일이 없으므로 모든 논문을 건너뛰어야 한다 (아니면 실패로 보고, 종료 코드 1).
+
+    first_ms      처음 적재 (추출·분류·임베딩·기록)
+    resume_ms     같은 폴더 재실행 (체크포인트 지문 대조만)
+    skipped       재실행에서 건너뛴 논문 수 (= papers 여야 함)
+
+사용법:
+    python benchmarks/bench_ingest.py [--papers 20] [--pages 5] [--jobs N]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from create_docx import create_shinsa_docx
+from ingest_citations import HashEmbedder, LocalTarget, ingest, load_checkpoint
+from synthetic_paper import synthetic_paper
+
+
+def run(source: Path, index: Path, checkpoint_path: Path, jobs) -> tuple:
+    """적재 1회 (체크포인트는 파일에서 다시 읽음 — 명령을 다시 실행하는 것과 같게)"""
+    target = LocalTarget(index)
+    checkpoint = load_checkpoint(checkpoint_path, target.describe())
+    started = time.perf_counter()
+    try:
+        stats = ingest(source, target, HashEmbedder(64), checkpoint, checkpoint_path, max_workers=jobs)
+    finally:
+        target.close()
+    return round((time.perf_counter() - started) * 1000, 1), stats
+
+
+def measure(papers: int, pages: int, jobs) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "papers"
+        source.mkdir()
+        for index in range(papers):
+            create_shinsa_docx(synthetic_paper(pages, seed=index),
+                               source / f"paper_{index + 1:02d}.docx", section_cache=None)
+
+        index_dir = Path(tmp) / "index"
+        checkpoint_path = Path(tmp) / "checkpoint.json"
+        first_ms, first = run(source, index_dir, checkpoint_path, jobs)
+        resume_ms, resume = run(source, index_dir, checkpoint_path, jobs)
+
+    return {
+        "papers": papers,
+        "pages": pages,
+        "first_ms": first_ms,
+        "resume_ms": resume_ms,
+        "added": first["added"],
+        "extracted": first["extracted"],
+        "skipped": resume["skipped_papers"],
+        "reread": resume["papers"],
+        "resumed": resume["skipped_papers"] == papers and resume["papers"] == 0,
+        "failed": len(first["failed"]) + len(resume["failed"]),
+    }
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="인용 말뭉치 적재 처음/이어 가기 비교")
+    parser.add_argument("--papers", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=5, help="합성 논문 1편 분량")
+    parser.add_argument("--jobs", type=int, default=None, help="추출 프로세스 수 (기본: CPU 수)")
+    opts = parser.parse_args(argv)
+
+    report = measure(opts.papers, opts.pages, opts.jobs)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0 if report["resumed"] and not report["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
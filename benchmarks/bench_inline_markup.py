@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+인라인 서식 토크나이저 벤치마크
+큰 본문에서 토크나이저 처리량과, 서식을 살려도 w:r 수가 크게 늘지 않는지 확인한다.
+
+    tokenizer   합성 문단 (--chars자, 서식 표시 밀도 --markup)의 inline_runs 중앙값
+                plain_ms: 같은 분량의 서식 없는 문단 (빠른 경로 — 서식 없는 원고의 추가 비용)
+                tokens: 합치기 전 토큰 수 / runs: 합친 뒤 run 수 (문단당·표시당)
+    document    합성 논문 --pages쪽을 서식 표시 없이 / 있게 생성한 시간과 document.xml의 w:r 수 (쪽당)
+
+사용법:
+    python benchmarks/bench_inline_markup.py [--chars 2000000] [--markup 0.5] [--pages 50] [--repeat 5]
+"""
+
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from create_docx import create_shinsa_docx
+from inline_markup import MARKUP_RE, coalesce, inline_runs, tokenize
+from synthetic_paper import _paragraph, synthetic_paper
+
+RUN_RE = re.compile(rb"<w:r[ >]")
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def paragraphs(chars: int, markup: float, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    result = []
+    size = 0
+    while size < chars:
+        result.append(_paragraph(rng, markup))
+        size += len(result[-1])
+    return result
+
+
+def measure_tokenizer(chars: int, markup: float, repeat: int) -> dict:
+    marked = paragraphs(chars, markup)
+    plain = paragraphs(chars, 0.0)
+    marked_runs = [[(text, None)] for text in marked]
+    plain_runs = [[(text, None)] for text in plain]
+
+    ms = _median_ms(lambda: [inline_runs(runs) for runs in marked_runs], repeat)
+    plain_ms = _median_ms(lambda: [inline_runs(runs) for runs in plain_runs], repeat)
+
+    marks = sum(len(MARKUP_RE.findall(text)) for text in marked)
+    tokens = sum(len(tokenize(text)) for text in marked)
+    runs = sum(len(coalesce(tokenize(text))) for text in marked)
+    total = sum(map(len, marked))
+    return {
+        "chars": total,
+        "paragraphs": len(marked),
+        "marks": marks,
+        "ms": ms,
+        "mb_per_s": round(len("".join(marked).encode("utf-8")) / 1e6 / (ms / 1000), 1),
+        "us_per_paragraph": round(ms * 1000 / len(marked), 2),
+        "plain_ms": plain_ms,
+        "tokens": tokens,
+        "runs": runs,
+        "runs_per_paragraph": round(runs / len(marked), 2),
+        "runs_per_mark": round((runs - len(marked)) / marks, 2) if marks else None,
+    }
+
+
+def document_runs(path: Path) -> int:
+    with zipfile.ZipFile(path) as z:
+        return len(RUN_RE.findall(z.read("word/document.xml")))
+
+
+def measure_document(pages: int, markup: float, repeat: int) -> dict:
+    result = {"pages": pages}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, density in (("plain", 0.0), ("markup", markup)):
+            data = synthetic_paper(pages, markup=density)
+            path = Path(tmp) / f"{name}.docx"
+            create_shinsa_docx(data, path, section_cache=None)  # 첫 생성(템플릿·import)은 버림
+            result[f"{name}_ms"] = _median_ms(
+                lambda: create_shinsa_docx(data, path, section_cache=None), repeat)
+            runs = document_runs(path)
+            result[f"{name}_runs"] = runs
+            result[f"{name}_runs_per_page"] = round(runs / pages, 1)
+    result["overhead"] = round(result["markup_ms"] / result["plain_ms"] - 1, 3)
+    return result
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="인라인 서식 토크나이저 벤치마크")
+    parser.add_argument("--chars", type=int, default=2_000_000)
+    parser.add_argument("--markup", type=float, default=0.5, help="문단별 서식 표시 확률")
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    opts = parser.parse_args(argv)
+
+    print(json.dumps({
+        "tokenizer": measure_tokenizer(opts.chars, opts.markup, opts.repeat),
+        "document": measure_document(opts.pages, opts.markup, opts.repeat),
+    }, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+쪽수 추정기 벤치마크: 속도 + 실제 렌더링 쪽수 대비 정확도
+    속도      synthetic_paper 10·50·300쪽 입력의 estimate_paper_pages 중앙값 (블록 생성 포함)
+    정확도    실제 쪽수가 있는 논문마다 추정 쪽수와 비교
+              (오차 = 추정 - 실제, mean_abs_error, max_abs_error, within_1: ±1쪽 이내 비율,
+               bias: 평균 오차, ratio: 실제 합 / 추정 합 — LINE_EM·폭 표 보정의 출발점)
+
+실제 쪽수 출처 (여러 개 함께 사용 가능):
+    --truth truth.json   [{"input": "paper.json", "pages": 23}, ...] (경로는 파일 기준 상대)
+    --pdf-dir DIR        DIR/이름.json 과 같은 이름의 DIR/이름.pdf (생성 DOCX를 Word 등으로 PDF 저장)
+    --render             입력(없으면 합성 논문 --pages)을 생성해 LibreOffice(soffice) 변환 풀로 PDF 변환
+                         — 바탕·Times New Roman 글꼴이 설치되어 있어야 의미 있는 값이 나온다
+
+사용법:
+    python benchmarks/bench_page_estimate.py [--pages 10 50 300]
+    python benchmarks/bench_page_estimate.py --truth truth.json --pdf-dir rendered/
+    python benchmarks/bench_page_estimate.py --render --pages 5 10 20 30
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from create_docx import create_shinsa_docx, estimate_paper_pages
+from pdf_proofs import open_pool, pdf_pages
+from synthetic_paper import synthetic_paper
+
+
+def render_pages(inputs: list, tmp: Path) -> list:
+    """생성 → 변환 풀(soffice)로 PDF → 쪽수, 입력 순서대로"""
+    paths = []
+    for name, data in inputs:
+        docx = tmp / f"{name}.docx"
+        create_shinsa_docx(data, docx, section_cache=None)
+        paths.append(docx)
+    with open_pool("soffice") as pool:
+        return [future.result()["pages"] for future in [pool.submit(path) for path in paths]]
+
+
+def _load(path: Path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    data.pop("end_page", None)
+    return data
+
+
+def truth_cases(opts) -> list:
+    """[(이름, 입력 dict, 실제 쪽수)]"""
+    cases = []
+    if opts.truth:
+        truth = Path(opts.truth)
+        with open(truth, "r", encoding="utf-8") as f:
+            for item in json.load(f):
+                path = truth.parent / item["input"]
+                cases.append((path.stem, _load(path), int(item["pages"])))
+    if opts.pdf_dir:
+        for pdf in sorted(Path(opts.pdf_dir).glob("*.pdf")):
+            source = pdf.with_suffix(".json")
+            if source.exists():
+                cases.append((pdf.stem, _load(source), pdf_pages(pdf)))
+    if opts.render:
+        inputs = [(Path(p).stem, _load(Path(p))) for p in opts.inputs] or [
+            (f"synthetic_{pages}p", synthetic_paper(pages, seed=pages)) for pages in opts.pages]
+        for _, data in inputs:
+            data.pop("end_page", None)
+        with tempfile.TemporaryDirectory() as tmp:
+            pages = render_pages(inputs, Path(tmp))
+        cases += [(name, data, actual) for (name, data), actual in zip(inputs, pages)]
+    return cases
+
+
+def accuracy(cases: list) -> dict:
+    rows = []
+    for name, data, actual in cases:
+        estimated = estimate_paper_pages(data)["pages"]
+        rows.append({"name": name, "estimated": estimated, "actual": actual,
+                     "error": estimated - actual})
+    errors = [row["error"] for row in rows]
+    return {
+        "papers": len(rows),
+        "mean_abs_error": round(statistics.mean(abs(e) for e in errors), 2),
+        "max_abs_error": max(abs(e) for e in errors),
+        "within_1": round(sum(1 for e in errors if abs(e) <= 1) / len(errors), 3),
+        "bias": round(statistics.mean(errors), 2),
+        "ratio": round(sum(r["actual"] for r in rows) / sum(r["estimated"] for r in rows), 3),
+        "rows": rows,
+    }
+
+
+def speed(pages_list: list, repeat: int) -> list:
+    rows = []
+    for pages in pages_list:
+        data = synthetic_paper(pages)
+        data.pop("end_page")
+        estimate = estimate_paper_pages(data)
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            estimate_paper_pages(data)
+            samples.append(time.perf_counter() - started)
+        ms = statistics.median(samples) * 1000
+        rows.append({
+            "input_pages": pages,
+            "chars": len(data["body"]),
+            "estimated_pages": estimate["pages"],
+            "lines": estimate["lines"],
+            "footnote_lines": estimate["footnote_lines"],
+            "estimate_ms": round(ms, 2),
+            "ms_per_estimated_page": round(ms / estimate["pages"], 3),
+        })
+    return rows
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="쪽수 추정기 속도·정확도")
+    parser.add_argument("inputs", nargs="*", help="--render에 쓸 입력 JSON (없으면 합성 논문)")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 50, 300])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--truth", help="실제 쪽수 목록 JSON")
+    parser.add_argument("--pdf-dir", help="입력 JSON과 같은 이름의 PDF가 있는 폴더")
+    parser.add_argument("--render", action="store_true", help="LibreOffice로 렌더링해 실제 쪽수 측정")
+    opts = parser.parse_args(argv)
+
+    if opts.render and not shutil.which("soffice"):
+        print(json.dumps({"error": "soffice not found", "fix": "LibreOffice 설치 (soffice가 PATH에 있어야 함)"},
+                         ensure_ascii=False))
+        return 1
+
+    report = {"speed": speed(opts.pages, opts.repeat)}
+    try:
+        cases = truth_cases(opts)
+    except (OSError, KeyError, ValueError, RuntimeError) as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False))
+        return 1
+    if cases:
+        report["accuracy"] = accuracy(cases)
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+parse_body_sections 벤치마크
+합성 본문(기본 500k자)에서 섹션 파서의 처리 시간과 선형성을 측정한다.
+기준선으로 이전 구현(줄마다 정규식 6개)을 함께 측정한다.
+
+사용법:
+    python benchmarks/bench_parse_sections.py [--chars 500000] [--repeat 5]
+"""
+
+import argparse
+import json
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from create_docx import parse_body_sections
+
+WORDS = ["신학", "사회", "교회", "윤리", "공동체", "하나님", "나라", "정의", "평화", "theology",
+         "연구", "분석", "해석", "역사", "전통", "실천", "성서", "복음", "선교", "문화"]
+
+
+def synthetic_body(chars: int, seed: int = 0) -> str:
+    """장/절/항 제목과 문단이 섞인 합성 본문"""
+    rng = random.Random(seed)
+    parts = []
+    size = 0
+    chapter = 0
+    while size < chars:
+        chapter += 1
+        block = [f"# 제{chapter}장 {rng.choice(WORDS)}"]
+        for section in range(1, rng.randint(2, 4) + 1):
+            block.append(f"## {rng.choice(WORDS)}와 {rng.choice(WORDS)}")
+            for _ in range(rng.randint(3, 6)):
+                block.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 90))) + ".")
+                block.append("")
+            if rng.random() < 0.4:
+                block.append(f"1) {rng.choice(WORDS)}")
+                block.append(" ".join(rng.choice(WORDS) for _ in range(30)) + ".")
+        text = "\n".join(block) + "\n"
+        parts.append(text)
+        size += len(text)
+    return "".join(parts)[:chars]
+
+
+def legacy_parse_body_sections(body: str) -> list:
+    """기준선: 이전 구현 (줄마다 컴파일되지 않은 re.match 6회)"""
+    sections = []
+    current = {"level": 0, "number": "", "title": "", "content": []}
+    for line in body.split("\n"):
+        line = line.strip()
+        if not line:
+            continue
+        h1 = re.match(r'^#\s+(.+)$', line)
+        roman = re.match(r'^(I{1,3}|IV|V|VI{0,3})\.\s+(.+)$', line)
+        h2 = re.match(r'^##\s+(.+)$', line)
+        arabic = re.match(r'^(\d+)\.\s+(.+)$', line)
+        h3 = re.match(r'^###\s+(.+)$', line)
+        paren = re.match(r'^(\d+)\)\s+(.+)$', line)
+        if h1 or roman or h2 or arabic or h3 or paren:
+            if current["title"] or current["content"]:
+                current["content"] = "\n".join(current["content"])
+                sections.append(current)
+            current = {"level": 1, "number": "", "title": line, "content": []}
+        else:
+            current["content"].append(line)
+    if current["title"] or current["content"]:
+        current["content"] = "\n".join(current["content"])
+        sections.append(current)
+    return sections
+
+
+def best_of(fn, arg, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(arg)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="parse_body_sections 벤치마크")
+    parser.add_argument("--chars", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    opts = parser.parse_args(argv)
+
+    results = []
+    for fraction in (0.25, 0.5, 1.0):
+        body = synthetic_body(int(opts.chars * fraction))
+        new = best_of(parse_body_sections, body, opts.repeat)
+        old = best_of(legacy_parse_body_sections, body, opts.repeat)
+        results.append({
+            "chars": len(body),
+            "lines": body.count("\n") + 1,
+            "sections": len(parse_body_sections(body)),
+            "parse_ms": round(new * 1000, 2),
+            "legacy_ms": round(old * 1000, 2),
+            "speedup": round(old / new, 2) if new else None,
+            "ns_per_char": round(new * 1e9 / len(body), 1),
+        })
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
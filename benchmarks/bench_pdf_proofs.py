@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+교정쇄 PDF 변환 벤치마크: 파일마다 변환기 새로 띄우기(cold) vs 따뜻한 풀(warm)
+합성 논문 N편(기본 20편, 한 호 분량)을 DOCX로 만든 뒤 같은 파일들을 두 방식으로 변환한다.
+
+    cold_ms       워커 1개, 1건마다 교체 (= 파일마다 soffice --convert-to 를 부르는 것과 같은 구조)
+    warm_ms       워커 --workers개, 교체 없음 (기동 비용은 워커 수만큼만)
+    speedup       cold_ms / warm_ms
+
+--backend stub(기본)은 LibreOffice 없이 --stub-startup / --stub-delay로 기동·변환 시간을 흉내 낸다.
+실제 수치는 LibreOffice가 설치된 환경에서 --backend soffice로 잰다.
+
+사용법:
+    python benchmarks/bench_pdf_proofs.py [--papers 20] [--pages 10] [--workers 4]
+    python benchmarks/bench_pdf_proofs.py --backend soffice
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from create_docx import create_shinsa_docx
+from pdf_proofs import open_pool
+from synthetic_paper import synthetic_paper
+
+
+def run(paths: list, **pool_options) -> dict:
+    started = time.perf_counter()
+    with open_pool(**pool_options) as pool:
+        results = pool.convert_all(paths)
+    elapsed = time.perf_counter() - started
+    return {
+        "ms": round(elapsed * 1000, 1),
+        "failed": sum(1 for r in results if "error" in r),
+        "pool": pool.stats(),
+    }
+
+
+def measure(papers: int, pages: int, workers: int, backend: str, stub_startup: float,
+            stub_delay: float) -> dict:
+    options = {"backend": backend}
+    if backend == "stub":
+        options.update(stub_startup=stub_startup, stub_delay=stub_delay)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for index in range(papers):
+            path = Path(tmp) / f"paper_{index + 1:02d}.docx"
+            create_shinsa_docx(synthetic_paper(pages, seed=index), path, section_cache=None)
+            paths.append(path)
+
+        cold = run(paths, workers=1, max_jobs=1, **options)
+        warm = run(paths, workers=workers, **options)
+
+    return {
+        "backend": backend,
+        "papers": papers,
+        "pages": pages,
+        "workers": workers,
+        **({"stub_startup": stub_startup, "stub_delay": stub_delay} if backend == "stub" else {}),
+        "cold_ms": cold["ms"],
+        "warm_ms": warm["ms"],
+        "speedup": round(cold["ms"] / warm["ms"], 2),
+        "failed": cold["failed"] + warm["failed"],
+        "cold_pool": cold["pool"],
+        "warm_pool": warm["pool"],
+    }
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="교정쇄 PDF 변환 cold/warm 비교")
+    parser.add_argument("--papers", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=10, help="합성 논문 1편 분량")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--backend", choices=("stub", "soffice"), default="stub")
+    parser.add_argument("--stub-startup", type=float, default=1.0, help="stub 기동 시간 (초)")
+    parser.add_argument("--stub-delay", type=float, default=0.2, help="stub 변환 1건 시간 (초)")
+    opts = parser.parse_args(argv)
+
+    try:
+        report = measure(opts.papers, opts.pages, opts.workers, opts.backend, opts.stub_startup,
+                         opts.stub_delay)
+    except ValueError as e:
+        print(json.dumps({"error": str(e)}, ensure_ascii=False))
+        return 1
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+참고문헌 엔진 벤치마크
+합성 참고문헌(국문 논문·단행본·번역서·외국어 논문·단행본·학위논문·인터넷 자료 혼합)
+N건을 process_references로 한 번에 분류·정규화·정렬하는 시간을 잰다.
+
+사용법:
+    python benchmarks/bench_references.py [--entries 1000 5000 20000] [--repeat 3]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from references import process_references
+
+SURNAMES_KR = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신"]
+GIVEN_KR = ["민수", "영희", "철수", "지훈", "서연", "하늘", "은혜", "성진"]
+SURNAMES_EN = ["Smith", "Barth", "Moltmann", "Hauerwas", "Tillich", "Ábel", "Niebuhr", "Volf"]
+GIVEN_EN = ["John", "Karl", "Jürgen", "Stanley", "Paul", "Reinhold", "Miroslav", "Anna"]
+WORDS = ["신학", "사회", "교회", "윤리", "공동체", "정의", "평화", "전통", "선교", "문화"]
+WORDS_EN = ["Theology", "Church", "Ethics", "Grace", "Hope", "Justice", "Community", "Public"]
+
+
+def synthetic_references(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    templates = [
+        lambda kr, en, y: f'{kr}, "{rng.choice(WORDS)}와 {rng.choice(WORDS)}," 「신학과사회」 '
+                          f'{rng.randint(1, 40)}/{rng.randint(1, 4)} ({y}), {rng.randint(1, 99)}-{rng.randint(100, 200)}.',
+        lambda kr, en, y: f"{kr}. 『{rng.choice(WORDS)}의 {rng.choice(WORDS)}』. 서울: 대한기독교서회. {y}.",
+        lambda kr, en, y: f"{en} / {kr} 옮김, 『{rng.choice(WORDS)}의 신학』 (서울: 새물결, {y}), {rng.randint(1, 300)}.",
+        lambda kr, en, y: f'{en.split()[1]}, {en.split()[0]}. "{rng.choice(WORDS_EN)} and {rng.choice(WORDS_EN)}." '
+                          f"*Theology Today* {rng.randint(1, 80)}/{rng.randint(1, 4)}. {y}. 1-20.",
+        lambda kr, en, y: f"{en}, *The {rng.choice(WORDS_EN)} of {rng.choice(WORDS_EN)}* "
+                          f"(New York: Oxford University Press, {y}), {rng.randint(1, 300)}.",
+        lambda kr, en, y: f'{kr}, "{rng.choice(WORDS)} 연구," 박사학위논문, 장로회신학대학교, {y}.',
+        lambda kr, en, y: f'{kr}, "{rng.choice(WORDS)} 자료," [온라인자료] https://example.org/{rng.randint(1, 9999)}, '
+                          f"{y}.{rng.randint(1, 12)}.{rng.randint(1, 28)} 접속.",
+    ]
+    refs = []
+    for _ in range(count):
+        kr = rng.choice(SURNAMES_KR) + rng.choice(GIVEN_KR)
+        en = f"{rng.choice(GIVEN_EN)} {rng.choice(SURNAMES_EN)}"
+        refs.append(rng.choice(templates)(kr, en, rng.randint(1950, 2025)))
+    return refs
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="참고문헌 엔진 벤치마크")
+    parser.add_argument("--entries", type=int, nargs="+", default=[1000, 5000, 20000])
+    parser.add_argument("--repeat", type=int, default=3)
+    opts = parser.parse_args(argv)
+
+    results = []
+    for count in opts.entries:
+        refs = synthetic_references(count)
+        best = float("inf")
+        for _ in range(opts.repeat):
+            started = time.perf_counter()
+            result = process_references(refs)
+            best = min(best, time.perf_counter() - started)
+        results.append({
+            "entries": count,
+            "elapsed_ms": round(best * 1000, 1),
+            "us_per_entry": round(best * 1e6 / count, 1),
+            "unknown": result["stats"]["unknown"],
+            "duplicates": result["stats"]["duplicates"],
+        })
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
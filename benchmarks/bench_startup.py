@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+DOCX 생성기 시작 시간 벤치마크 + import 시간 보고서
+명령 1회 실행의 벽시계 중앙값과 `python -X importtime` 기준 create_docx import 분석을 낸다.
+
+    python_ms            python -c pass (인터프리터 자체 하한)
+    version_ms           shinsa_docx.py --version (python-docx import 없음)
+    check_ms             shinsa_docx.py --check (python-docx import 없음)
+    create_ms            shinsa_docx.py 1쪽 논문 단건 생성
+    bundle_version_ms    zipapp 번들 --version
+    bundle_create_ms     zipapp 번들 단건 생성
+    create_docx_import_ms  -X importtime으로 잰 import create_docx 누적 시간
+    import_top           자기 시간(self)이 큰 모듈 순위 / import_direct: create_docx가 직접 부르는 모듈
+
+bench_suite.py가 "startup" 항목으로 함께 실행해 기준선과 비교한다.
+
+사용법:
+    python benchmarks/bench_startup.py [--repeat 10] [--top 15]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+ENV = {**os.environ, "SHINSA_SECTION_CACHE": "0", "SHINSA_METRICS_FILE": "",
+       "SHINSA_PROFILE_DIR": ""}
+
+IMPORT_CREATE_DOCX = "import sys; sys.path.insert(0, 'scripts'); import create_docx"
+
+
+def _wall_ms(args: list, repeat: int) -> float:
+    """명령 repeat회 실행 벽시계 중앙값 (ms)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], capture_output=True, check=True, env=ENV, cwd=ROOT)
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 1)
+
+
+def parse_importtime(stderr: str) -> list:
+    """-X importtime 출력 → [{module, depth, self_ms, cumulative_ms}] (import 순서)"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        indent = len(name) - len(name.lstrip(" "))
+        rows.append({
+            "module": name.strip(),
+            "depth": (indent - 1) // 2,
+            "self_ms": round(int(self_us) / 1000, 2),
+            "cumulative_ms": round(int(cumulative_us) / 1000, 2),
+        })
+    return rows
+
+
+def import_report(top: int) -> dict:
+    """create_docx import 분석 (새 인터프리터, 바이트코드 캐시가 있는 상태)"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", IMPORT_CREATE_DOCX],
+                          capture_output=True, text=True, check=True, env=ENV, cwd=ROOT)
+    rows = parse_importtime(proc.stderr)
+    root = next(row for row in rows if row["module"] == "create_docx" and row["depth"] == 0)
+    # 출력은 자식이 부모보다 먼저 나오므로 create_docx 바로 앞의 depth > 0 항목들이 그 하위 트리
+    index = rows.index(root)
+    start = index
+    while start > 0 and rows[start - 1]["depth"] > 0:
+        start -= 1
+    subtree = rows[start:index + 1]
+    return {
+        "create_docx_import_ms": root["cumulative_ms"],
+        "modules": len(subtree),
+        "import_direct": sorted((row for row in subtree if row["depth"] == 1),
+                                key=lambda row: -row["cumulative_ms"])[:top],
+        "import_top": sorted(subtree, key=lambda row: -row["self_ms"])[:top],
+    }
+
+
+def measure(repeat: int = 10, top: int = 15) -> dict:
+    from build_bundle import build_bundle
+    from synthetic_paper import synthetic_paper
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        bundle = tmp / "shinsa_docx.pyz"
+        build_bundle(bundle)
+        source, output = tmp / "paper.json", tmp / "out.docx"
+        source.write_text(json.dumps(synthetic_paper(1), ensure_ascii=False), encoding="utf-8")
+
+        # 첫 실행은 __pycache__·템플릿 디스크 캐시 적재용으로 버린다
+        _wall_ms(["scripts/shinsa_docx.py", str(source), str(output)], 1)
+        result = {
+            "python_ms": _wall_ms(["-c", "pass"], repeat),
+            "version_ms": _wall_ms(["scripts/shinsa_docx.py", "--version"], repeat),
+            "check_ms": _wall_ms(["scripts/shinsa_docx.py", "--check"], repeat),
+            "create_ms": _wall_ms(["scripts/shinsa_docx.py", str(source), str(output)], repeat),
+            "bundle_version_ms": _wall_ms([str(bundle), "--version"], repeat),
+            "bundle_create_ms": _wall_ms([str(bundle), str(source), str(output)], repeat),
+        }
+
+    return {**result, **import_report(top)}
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="DOCX 생성기 시작 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=15, help="import 보고서 순위 개수")
+    opts = parser.parse_args(argv)
+
+    print(json.dumps(measure(opts.repeat, opts.top), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+DOCX 백엔드 벤치마크 (docx ↔ stream)
+합성 본문 크기별로 두 백엔드의 생성 시간, 최대 메모리(ru_maxrss), 출력 크기를 잰다.
+최대 메모리는 프로세스 단위 값이므로 측정마다 새 하위 프로세스를 띄운다.
+
+사용법:
+    python benchmarks/bench_stream_writer.py [--chars 200000 500000 1000000]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+
+def measure(backend: str, chars: int) -> dict:
+    """하위 프로세스 본체: 문서 1편 생성 후 결과 출력"""
+    from bench_parse_sections import synthetic_body
+    from create_docx import create_shinsa_docx, new_document
+
+    data = {
+        "title": "벤치마크", "author": "홍길동",
+        "body": synthetic_body(chars),
+        "references": ["김철수. 『책』. 2020."] * 50,
+    }
+    new_document()  # 템플릿 캐시 적재는 측정에서 제외
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "out.docx"
+        started = time.perf_counter()
+        result = create_shinsa_docx(data, path, section_cache=None, backend=backend)
+        elapsed = time.perf_counter() - started
+        size = path.stat().st_size
+
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "backend": backend,
+        "chars": len(data["body"]),
+        "sections": result["sections"]["rendered"],
+        "elapsed_ms": round(elapsed * 1000, 1),
+        "peak_rss_mb": round(peak_kb / 1024, 1),
+        "delta_rss_mb": round((peak_kb - baseline_kb) / 1024, 1),
+        "output_kb": round(size / 1024, 1),
+    }
+
+
+def run_child(backend: str, chars: int) -> dict:
+    proc = subprocess.run(
+        [sys.executable, __file__, "--child", backend, str(chars)],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "SHINSA_SECTION_CACHE": "0"},
+    )
+    return json.loads(proc.stdout)
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="DOCX 백엔드 벤치마크")
+    parser.add_argument("--chars", type=int, nargs="+", default=[200_000, 500_000, 1_000_000])
+    parser.add_argument("--child", nargs=2, help=argparse.SUPPRESS)
+    opts = parser.parse_args(argv)
+
+    if opts.child:
+        backend, chars = opts.child
+        print(json.dumps(measure(backend, int(chars))))
+        return 0
+
+    results = []
+    for chars in opts.chars:
+        docx = run_child("docx", chars)
+        stream = run_child("stream", chars)
+        results.append({
+            "chars": docx["chars"],
+            "docx": docx,
+            "stream": stream,
+            "speedup": round(docx["elapsed_ms"] / stream["elapsed_ms"], 2),
+            "rss_ratio": round(docx["delta_rss_mb"] / max(stream["delta_rss_mb"], 0.1), 1),
+        })
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
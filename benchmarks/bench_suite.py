@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+DOCX 파이프라인 벤치마크 모음 + 기준선 비교
+synthetic_paper로 만든 논문(기본 10·50·300쪽)마다 다음을 잰다.
+
+    create_cold_ms      python scripts/create_docx.py 1회 (인터프리터 시작·import 포함, 하위 프로세스 벽시계)
+    create_warm_ms      같은 프로세스에서 두 번째 이후 생성의 중앙값 (섹션 캐시 끔)
+    parse_ms            parse_body_sections 중앙값
+    analyze_cold_ms     python analyze_docx.py --json 1회
+    analyze_ms          analyze_docx 중앙값
+    peak_rss_mb         측정 프로세스 최대 RSS (크기마다 새 프로세스)
+    output_kb           생성된 DOCX 크기
+    *_pages_per_s       처리량
+    startup             bench_startup.py 결과 (--version·--check·단건 생성·번들 벽시계, import 시간)
+
+--save-baseline으로 결과를 기준선 파일에 쓰고, --compare로 기준선과 비교해
+임계값(--threshold, 기본 25%)보다 나빠진 항목이 있으면 종료 코드 1을 돌려준다.
+
+사용법:
+    python benchmarks/bench_suite.py [--pages 10 50 300] [--repeat 3] [--no-startup]
+    python benchmarks/bench_suite.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_suite.py --compare benchmarks/baseline.json [--threshold 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(BENCH_DIR))
+
+BASELINE_VERSION = 1
+
+# 비교 항목: 이름 → 무시할 절대 차이 (작은 값의 측정 잡음). 모두 낮을수록 좋음
+COMPARED = {
+    "create_cold_ms": 20.0,
+    "create_warm_ms": 5.0,
+    "parse_ms": 1.0,
+    "analyze_cold_ms": 20.0,
+    "analyze_ms": 2.0,
+    "peak_rss_mb": 2.0,
+    "output_kb": 1.0,
+    "version_ms": 10.0,
+    "check_ms": 10.0,
+    "create_ms": 20.0,
+    "bundle_create_ms": 20.0,
+    "create_docx_import_ms": 10.0,
+}
+
+CHILD_ENV = {**os.environ, "SHINSA_SECTION_CACHE": "0", "SHINSA_METRICS_FILE": "",
+             "SHINSA_PROFILE_DIR": ""}
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def measure(pages: int, footnotes, references, repeat: int) -> dict:
+    """하위 프로세스 본체: 논문 1편 크기의 warm 측정"""
+    from analyze_docx import analyze_docx
+    from create_docx import create_shinsa_docx, parse_body_sections
+    from synthetic_paper import synthetic_paper
+
+    paper = synthetic_paper(pages, footnotes, references)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "out.docx"
+        first = create_shinsa_docx(paper, path, section_cache=None)  # 지연 로딩·템플릿 캐시 적재
+        warm_ms = _median_ms(lambda: create_shinsa_docx(paper, path, section_cache=None), repeat)
+        parse_ms = _median_ms(lambda: parse_body_sections(paper["body"]), repeat)
+        analyze_docx(path)
+        analyze_ms = _median_ms(lambda: analyze_docx(path), repeat)
+        output_kb = round(path.stat().st_size / 1024, 1)
+
+    return {
+        "pages": pages,
+        "chars": len(paper["body"]),
+        "footnotes": len(paper["footnotes"]),
+        "references": len(paper["references"]),
+        "paragraphs": first["metrics"]["counts"]["paragraphs"],
+        "create_warm_ms": warm_ms,
+        "parse_ms": parse_ms,
+        "analyze_ms": analyze_ms,
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+        "output_kb": output_kb,
+        "create_pages_per_s": round(pages / (warm_ms / 1000), 1),
+        "parse_pages_per_s": round(pages / (parse_ms / 1000), 1),
+        "analyze_pages_per_s": round(pages / (analyze_ms / 1000), 1),
+    }
+
+
+def _run(args: list) -> tuple:
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, *args], capture_output=True, text=True,
+                          check=True, env=CHILD_ENV, cwd=ROOT)
+    return proc.stdout, round((time.perf_counter() - started) * 1000, 1)
+
+
+def measure_cold(pages: int, footnotes, references) -> dict:
+    """CLI 1회 실행 벽시계 (인터프리터 시작 + import + 처리)"""
+    from synthetic_paper import synthetic_paper
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source, output = Path(tmp) / "paper.json", Path(tmp) / "out.docx"
+        source.write_text(json.dumps(synthetic_paper(pages, footnotes, references),
+                                     ensure_ascii=False), encoding="utf-8")
+        stdout, create_ms = _run(["scripts/create_docx.py", str(source), str(output)])
+        phases = json.loads(stdout)["metrics"]["phases_ms"]
+        _, analyze_ms = _run(["analyze_docx.py", str(output), "--json"])
+    return {
+        "create_cold_ms": create_ms,
+        "analyze_cold_ms": analyze_ms,
+        "startup_ms": phases.get("startup"),
+        "import_ms": phases.get("import"),
+    }
+
+
+def run_case(pages: int, footnotes, references, repeat: int) -> dict:
+    stdout, _ = _run([str(Path(__file__).relative_to(ROOT)), "--child", str(pages),
+                      json.dumps(footnotes), json.dumps(references), str(repeat)])
+    return {**json.loads(stdout), **measure_cold(pages, footnotes, references)}
+
+
+def run_startup(repeat: int) -> dict:
+    """시작 시간 항목 (import 순위 목록은 빼고 수치만 기준선에 남긴다)"""
+    from bench_startup import measure as measure_startup
+
+    result = measure_startup(max(repeat, 5))
+    return {name: value for name, value in result.items() if not isinstance(value, list)}
+
+
+def machine() -> dict:
+    return {"python": platform.python_version(), "platform": platform.platform(),
+            "processor": platform.machine(), "cpus": os.cpu_count()}
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """기준선 대비 변화. 상대 변화가 threshold를 넘고 절대 차이도 잡음 한도를 넘으면 회귀"""
+    rows = []
+    for case, result in current["cases"].items():
+        base = baseline.get("cases", {}).get(case)
+        if not base:
+            continue
+        for metric, floor in COMPARED.items():
+            old, new = base.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old
+            rows.append({
+                "case": case, "metric": metric, "baseline": old, "current": new,
+                "change_pct": round(change * 100, 1),
+                "regression": change > threshold and new - old > floor,
+                "improvement": change < -threshold and old - new > floor,
+            })
+    return rows
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="DOCX 파이프라인 벤치마크 모음")
+    parser.add_argument("--pages", type=int, nargs="+", default=[10, 50, 300])
+    parser.add_argument("--footnotes", type=int, default=None, help="기본: 쪽당 3개")
+    parser.add_argument("--references", type=int, default=None, help="기본: 쪽당 2개")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save-baseline", metavar="FILE", help="결과를 기준선 파일로 저장")
+    parser.add_argument("--compare", metavar="FILE", help="기준선 파일과 비교")
+    parser.add_argument("--threshold", type=float, default=0.25, help="회귀 판정 상대 변화 (기본 0.25)")
+    parser.add_argument("--no-startup", action="store_true", help="시작 시간 항목 생략")
+    parser.add_argument("--child", nargs=4, help=argparse.SUPPRESS)
+    opts = parser.parse_args(argv)
+
+    if opts.child:
+        pages, footnotes, references, repeat = opts.child
+        print(json.dumps(measure(int(pages), json.loads(footnotes), json.loads(references),
+                                 int(repeat))))
+        return 0
+
+    baseline = None
+    if opts.compare:
+        try:
+            with open(opts.compare, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False))
+            return 1
+
+    current = {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "machine": machine(),
+        "repeat": opts.repeat,
+        "cases": {f"{pages}p": run_case(pages, opts.footnotes, opts.references, opts.repeat)
+                  for pages in opts.pages},
+    }
+    if not opts.no_startup:
+        current["cases"]["startup"] = run_startup(opts.repeat)
+
+    if opts.save_baseline:
+        Path(opts.save_baseline).write_text(
+            json.dumps(current, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    report = current
+    if baseline is not None:
+        rows = compare(current, baseline, opts.threshold)
+        report = {
+            **current,
+            "baseline": {"file": opts.compare, "created": baseline.get("created"),
+                         "same_machine": baseline.get("machine") == current["machine"]},
+            "threshold": opts.threshold,
+            "comparison": rows,
+            "regressions": [row for row in rows if row["regression"]],
+        }
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 1 if baseline is not None and report["regressions"] else 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+표 렌더링 벤치마크: <w:tbl> 일괄 생성 vs python-docx 셀 API
+행 수를 늘려 가며 표 1개를 문서 끝에 넣는 시간을 잰다 (기본 50×10, 500×8, 그리고 500×8의 2·4배).
+
+    bulk_ms       tables.prepare_table + create_docx.add_table (XML 문자열 → 한 번 파싱)
+    stream_ms     같은 표의 stream_docx.table_xml (스트리밍 백엔드)
+    cell_api_ms   doc.add_table(r, c) 후 table.cell(i, j).text = ... (--cell-api-max-cells 셀 이하만)
+    us_per_cell   셀 1개당 시간 — 표가 커져도 일정하면 선형
+    linear        가장 큰 표와 가장 작은 표의 us_per_cell 비 (1에 가까울수록 선형)
+
+사용법:
+    python benchmarks/bench_tables.py [--sizes 50x10 500x8 1000x8 2000x8] [--repeat 5]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+ROOT = BENCH_DIR.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from create_docx import SHINSA_2025, STYLE_IDS, add_table, new_document
+from stream_docx import table_xml
+from tables import prepare_table, text_width_twips
+
+WORDS = ["관점 확보", "맹점 식별", "의사결정 품질", "산업 맥락", "인간 판단", "기술 의존",
+         "매우 그렇다", "그렇다", "보통", "3.42", "0.87", "n=128", "p < .05", "**유의**"]
+
+
+def _median_ms(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return round(statistics.median(samples) * 1000, 2)
+
+
+def synthetic_table(rows: int, cols: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return {
+        "caption": f"합성 표 {rows}×{cols}",
+        "columns": [f"항목 {j + 1}" for j in range(cols)],
+        "rows": [[rng.choice(WORDS) for _ in range(cols)] for _ in range(rows)],
+    }
+
+
+def bulk(doc, table: dict) -> None:
+    add_table(doc, prepare_table(table, 1, text_width_twips(SHINSA_2025)))
+
+
+def cell_api(doc, table: dict) -> None:
+    columns, rows = table["columns"], table["rows"]
+    docx_table = doc.add_table(rows=len(rows) + 1, cols=len(columns))
+    for j, text in enumerate(columns):
+        docx_table.cell(0, j).text = text
+    for i, row in enumerate(rows, 1):
+        for j, text in enumerate(row):
+            docx_table.cell(i, j).text = text
+
+
+def measure(rows: int, cols: int, repeat: int, cell_api_max: int) -> dict:
+    table = synthetic_table(rows, cols)
+    cells = (rows + 1) * cols
+    prepared = prepare_table(table, 1, text_width_twips(SHINSA_2025))
+    # 문서 생성(템플릿 로드)은 재지 않는다 — 표는 같은 문서 끝에 계속 붙음
+    doc = new_document()
+
+    result = {"rows": rows, "cols": cols, "cells": cells}
+    result["bulk_ms"] = _median_ms(lambda: bulk(doc, table), repeat)
+    result["stream_ms"] = _median_ms(lambda: table_xml(prepared, STYLE_IDS), repeat)
+    result["us_per_cell"] = round(result["bulk_ms"] * 1000 / cells, 2)
+    if cells <= cell_api_max:
+        api_doc = new_document()
+        result["cell_api_ms"] = _median_ms(lambda: cell_api(api_doc, table), max(1, repeat // 2))
+        result["cell_api_us_per_cell"] = round(result["cell_api_ms"] * 1000 / cells, 2)
+        result["speedup"] = round(result["cell_api_ms"] / result["bulk_ms"], 1)
+    return result
+
+
+def size(text: str) -> tuple:
+    rows, cols = text.lower().split("x")
+    return int(rows), int(cols)
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="표 렌더링 벤치마크")
+    parser.add_argument("--sizes", nargs="+", type=size,
+                        default=[(50, 10), (500, 8), (1000, 8), (2000, 8)], help="행x열")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--cell-api-max-cells", type=int, default=600,
+                        help="셀 API 비교를 할 최대 셀 수 (느려서 큰 표는 건너뜀)")
+    opts = parser.parse_args(argv)
+
+    bulk(new_document(), synthetic_table(10, 3))  # 템플릿·import 준비는 버림
+    tables = [measure(rows, cols, opts.repeat, opts.cell_api_max_cells) for rows, cols in opts.sizes]
+    per_cell = [t["us_per_cell"] for t in tables]
+    print(json.dumps({
+        "tables": tables,
+        "linear": round(per_cell[-1] / per_cell[0], 2),
+    }, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+로컬 벡터 색인 벤치마크 (전수 탐색 ↔ IVF)
+군집 구조를 가진 합성 임베딩 N개로 임시 색인을 만들고
+질의 지연(단건·묶음)과 IVF nprobe별 recall@k를 전수 탐색 결과와 비교한다.
+
+사용법:
+    python benchmarks/bench_vector_index.py [--rows 50000] [--dim 1536] [--queries 200] [--k 10]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+from vector_index import LocalIndex
+
+TYPES = ["korean_article", "korean_book", "foreign_book", "foreign_article", "thesis"]
+
+
+def synthetic_embeddings(rows: int, dim: int, clusters: int = 200, seed: int = 0):
+    """군집 중심 + 잡음 (실제 인용 임베딩처럼 주제별로 뭉친 분포)"""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    labels = rng.integers(0, clusters, size=rows)
+    data = centers[labels] + 0.8 * rng.standard_normal((rows, dim)).astype(np.float32)
+    return data, centers, rng
+
+
+def timed(fn, repeat: int = 1):
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return result, best
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="로컬 벡터 색인 벤치마크")
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--dtype", choices=["float32", "float16"], default="float32")
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    opts = parser.parse_args(argv)
+
+    data, _, rng = synthetic_embeddings(opts.rows, opts.dim)
+    picks = rng.integers(0, opts.rows, size=opts.queries)
+    queries = data[picks] + 0.5 * rng.standard_normal((opts.queries, opts.dim)).astype(np.float32)
+    rows = [{"content": f"citation {i}", "citation_type": TYPES[i % len(TYPES)]}
+            for i in range(opts.rows)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        index = LocalIndex.create(tmp, opts.dim, opts.dtype)
+        _, load_s = timed(lambda: index.add(data, rows))
+        index.rows  # 행 메타데이터 적재는 측정에서 제외
+
+        exact, batch_s = timed(lambda: index.search(queries, opts.k, exact=True), repeat=2)
+        _, single_s = timed(lambda: [index.search(q, opts.k, exact=True) for q in queries[:20]])
+        _, filtered_s = timed(lambda: index.search(queries, opts.k, "thesis", exact=True))
+        truth = [{r["id"] for r in result} for result in exact]
+
+        ivf_info, build_s = timed(lambda: index.build_ivf())
+        ivf_results = []
+        for nprobe in opts.nprobe:
+            found, ivf_s = timed(lambda: index.search(queries, opts.k, nprobe=nprobe))
+            recall = np.mean([len(truth[i] & {r["id"] for r in found[i]}) / opts.k
+                              for i in range(opts.queries)])
+            ivf_results.append({
+                "nprobe": nprobe,
+                "recall_at_k": round(float(recall), 4),
+                "ms_per_query": round(ivf_s * 1000 / opts.queries, 3),
+            })
+
+    print(json.dumps({
+        "rows": opts.rows, "dim": opts.dim, "dtype": opts.dtype, "k": opts.k,
+        "load_s": round(load_s, 2),
+        "brute_force": {
+            "batch_ms_per_query": round(batch_s * 1000 / opts.queries, 3),
+            "single_ms_per_query": round(single_s * 1000 / 20, 3),
+            "filtered_batch_ms_per_query": round(filtered_s * 1000 / opts.queries, 3),
+        },
+        "ivf": {"nlist": ivf_info["nlist"], "build_s": round(build_s, 2), "probes": ivf_results},
+    }, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+합성 논문 생성기 (벤치마크용, 결정적)
+쪽수·각주 수·참고문헌 수를 정하면 create_docx 입력(JSON)을 만든다.
+같은 인자와 seed면 항상 같은 논문이 나온다.
+
+    - 본문: Ⅰ./1./1) 제목과 국문·영문 단어가 섞인 문단, 쪽당 약 CHARS_PER_PAGE자
+    - 각주: 국문 단행본·논문, 외국어 단행본, Ibid., 설명 각주 혼합 (본문에 [^n] 표시)
+    - 참고문헌: bench_references.synthetic_references (7개 유형 혼합)
+    - markup: 문단마다 이 확률로 인라인 서식 표시 (*외국어 서명*, **강조**, 19^th^) 삽입 (기본 0)
+
+사용법:
+    python benchmarks/synthetic_paper.py --pages 50 [--footnotes 150] [--references 100] [--markup 0.5] -o paper.json
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_references import GIVEN_EN, GIVEN_KR, SURNAMES_EN, SURNAMES_KR, WORDS, WORDS_EN, \
+    synthetic_references
+
+# 신학과사회 본문 10pt 기준 한 쪽 분량 (공백 포함 글자 수)
+# 쪽당 각주 3개·참고문헌 2개와 함께 estimate_paper_pages로 맞춘 값 (10·50·300쪽 → 13·53·300쪽 추정,
+# 짧은 논문은 표제·초록 몫만큼 더 나온다)
+CHARS_PER_PAGE = 800
+
+ROMAN = "ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩⅪⅫ"
+BODY_WORDS = WORDS + ["하나님", "나라", "공공성", "성서", "해석", "실천", "역사", "복음",
+                      "theology", "church", "ethics", "public", "연구", "분석"]
+
+
+def _footnote(rng: random.Random) -> str:
+    kr = rng.choice(SURNAMES_KR) + rng.choice(GIVEN_KR)
+    en = f"{rng.choice(GIVEN_EN)} {rng.choice(SURNAMES_EN)}"
+    year, page = rng.randint(1950, 2025), rng.randint(1, 400)
+    kind = rng.random()
+    if kind < 0.3:
+        return f"{kr}, 『{rng.choice(WORDS)}의 {rng.choice(WORDS)}』 (서울: 대한기독교서회, {year}), {page}."
+    if kind < 0.55:
+        return (f'{kr}, "{rng.choice(WORDS)}와 {rng.choice(WORDS)}," 「신학과사회」 '
+                f"{rng.randint(1, 40)}/{rng.randint(1, 4)} ({year}), {page}.")
+    if kind < 0.75:
+        return (f"{en}, *The {rng.choice(WORDS_EN)} of {rng.choice(WORDS_EN)}* "
+                f"(New York: Oxford University Press, {year}), {page}.")
+    if kind < 0.85:
+        return f"Ibid., {page}."
+    return (f"이 점에 관해서는 {kr}의 {rng.choice(WORDS)} 논의를 참조하라. "
+            + " ".join(rng.choice(BODY_WORDS) for _ in range(rng.randint(8, 20))) + ".")
+
+
+def _paragraph(rng: random.Random, markup: float = 0.0) -> str:
+    words = [rng.choice(BODY_WORDS) for _ in range(rng.randint(40, 90))]
+    # markup이 0이면 난수를 더 뽑지 않는다 (기존 합성 논문과 같은 결과)
+    while markup and rng.random() < markup:
+        kind = rng.random()
+        if kind < 0.5:
+            mark = f"*The {rng.choice(WORDS_EN)} of {rng.choice(WORDS_EN)}*"
+        elif kind < 0.85:
+            mark = f"**{rng.choice(BODY_WORDS)}**"
+        else:
+            mark = f"{rng.randint(16, 21)}^th^"
+        words.insert(rng.randrange(len(words)), mark)
+    return " ".join(words) + "."
+
+
+def synthetic_paper(pages: int = 10, footnotes=None, references=None, seed: int = 0,
+                    markup: float = 0.0) -> dict:
+    """create_docx 입력 dict (footnotes 기본 쪽당 3개, references 기본 쪽당 2개)"""
+    rng = random.Random(seed)
+    footnotes = pages * 3 if footnotes is None else footnotes
+    references = pages * 2 if references is None else references
+
+    # 본문 문단을 먼저 만들고 각주 표시를 문단 끝에 고르게 나눠 붙인다
+    target = pages * CHARS_PER_PAGE
+    paragraphs = []
+    size = 0
+    while size < target:
+        paragraphs.append(_paragraph(rng, markup))
+        size += len(paragraphs[-1]) + 2
+    for n in range(1, footnotes + 1):
+        i = (n - 1) * len(paragraphs) // max(footnotes, 1)
+        paragraphs[i] += f"[^{n}]"
+
+    # 장(Ⅰ.) 마다 절(1.) 2~4개, 절마다 문단 2~6개, 가끔 항(1))
+    lines = []
+    chapter = 0
+    index = 0
+    while index < len(paragraphs):
+        chapter += 1
+        numeral = ROMAN[(chapter - 1) % len(ROMAN)]
+        lines.append(f"{numeral}. {rng.choice(WORDS)}와 {rng.choice(WORDS)}")
+        for section in range(1, rng.randint(2, 4) + 1):
+            lines.append(f"{section}. {rng.choice(WORDS)}의 {rng.choice(WORDS)}")
+            for item in range(rng.randint(2, 6)):
+                if index >= len(paragraphs):
+                    break
+                if rng.random() < 0.15:
+                    lines.append(f"{item + 1}) {rng.choice(WORDS)}")
+                lines.append(paragraphs[index])
+                lines.append("")
+                index += 1
+
+    return {
+        "title": f"{rng.choice(WORDS)}와 {rng.choice(WORDS)}: 합성 논문 {pages}쪽",
+        "subtitle": f"{rng.choice(WORDS)}에 관한 연구",
+        "author": rng.choice(SURNAMES_KR) + rng.choice(GIVEN_KR),
+        "affiliation": "장로회신학대학교",
+        "field": "조직신학",
+        "email": "bench@example.org",
+        "abstract_kr": " ".join(_paragraph(rng) for _ in range(3)),
+        "keywords_kr": rng.sample(WORDS, 5),
+        "abstract_en": " ".join(" ".join(rng.choice(WORDS_EN).lower() for _ in range(60)) + "."
+                                for _ in range(3)),
+        "keywords_en": rng.sample(WORDS_EN, 5),
+        "body": "\n".join(lines),
+        "footnotes": [_footnote(rng) for _ in range(footnotes)],
+        "references": synthetic_references(references, seed),
+        "volume": 39, "issue": 2, "year": 2025,
+        "start_page": 1, "end_page": pages,
+    }
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="합성 논문 생성 (create_docx 입력 JSON)")
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--footnotes", type=int, default=None, help="기본: 쪽당 3개")
+    parser.add_argument("--references", type=int, default=None, help="기본: 쪽당 2개")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--markup", type=float, default=0.0, help="문단별 인라인 서식 표시 확률")
+    parser.add_argument("-o", "--output", help="출력 파일 (기본: stdout)")
+    opts = parser.parse_args(argv)
+
+    paper = synthetic_paper(opts.pages, opts.footnotes, opts.references, opts.seed, opts.markup)
+    text = json.dumps(paper, ensure_ascii=False, indent=2)
+    if opts.output:
+        Path(opts.output).write_text(text, encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
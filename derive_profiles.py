@@ -0,0 +1,593 @@
+#!/usr/bin/env python3
+"""
+출간 논문 코퍼스 → 연도별 형식 프로필 도출
+폴더·zip 아카이브(여러 개 가능)의 .docx를 프로세스 풀로 한 번씩 스트리밍해 논문마다 요약을 만들고,
+연도별로 모아 spec/shinsa_spec.json과 같은 형식의 프로필 파일을 쓴다.
+
+    논문 요약   페이지 크기·여백(mm), 역할별 글자 크기·글꼴·줄간격 분포(글자 수 가중), 기호 사용
+                역할: 문단 순서와 글자(국문초록, 주제어, Ⅰ. 장 제목, 참고문헌, Abstract ...)로 구분
+                기호: 제목·저자 각주 기호(*, ＊, ❉), 국문초록 제목, 논문/게재확정일자
+    연도        머리글의 「신학과 사회」 ... 2019 → 없으면 파일 경로의 연도
+    프로필      corpus-<연도>: 값마다 최빈값(글자 크기·기호) 또는 중앙값(쪽 크기·여백),
+                나머지 기호는 legacy_variants, 근거(논문 수, 최빈값 비율)는 derived에 기록.
+                도출하지 못한 값과 손 프로필 값의 허용 오차 안인 글자 크기·줄간격은 가까운 손 프로필(extends)에서 상속
+
+상태 파일에 파일 지문(크기·수정 시각)과 내용 해시별 요약을 저장해, 다시 실행하면 새 파일·바뀐 파일만 분석한다
+(한 호를 추가하면 그 호의 논문만). 요약은 작으므로 연도별 집계는 매번 전체 요약으로 다시 한다.
+
+생성기·분석기에서 쓰기:
+    SHINSA_PROFILES=spec/derived/shinsa_corpus.json python analyze_docx.py paper.docx --profile corpus-2019
+
+사용법:
+    python derive_profiles.py corpus/ [issue_2025_2.zip ...] [-o spec/derived/shinsa_corpus.json] [--jobs N]
+    python derive_profiles.py corpus/ --state corpus_state.json --min-papers 3
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import statistics
+import sys
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from analyze_docx import ET, _read_props, _release, _tag, load_styles
+from local_cache import cache_dir, file_fingerprint
+from scan_submissions import content_hash, iter_submissions, open_submission
+from shinsa_spec import TWIPS_PER_MM, load_profile, load_spec
+
+# 요약 형식이 바뀌면 올려서 상태 파일의 이전 요약을 버림
+SUMMARY_VERSION = 1
+
+# 상태 파일 중간 저장 간격 (분석 N편마다 — 중단돼도 그때까지의 분석은 남음)
+CHECKPOINT_EVERY = 200
+
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / "spec" / "derived" / "shinsa_corpus.json"
+
+# 역할 → 프로필 fonts 키
+ROLE_SIZE_KEYS = {
+    "title": "title_size",
+    "subtitle": "subtitle_size",
+    "author": "author_size",
+    "abstract_title": "abstract_title_size",
+    "abstract_kr": "abstract_size",
+    "heading1": "section_title_size",
+    "body": "body_size",
+    "footnote": "footnote_size",
+    "header": "header_size",
+}
+MARKER_KEYS = ("title_footnote", "author_footnotes", "abstract_kr_title", "accepted_date_label")
+PAGE_KEYS = ("width_mm", "height_mm", "margin_top_mm", "margin_bottom_mm",
+             "margin_left_mm", "margin_right_mm")
+
+ABSTRACT_KR_RE = re.compile(r"국문\s*초록")
+KEYWORDS_KR_RE = re.compile(r"주\s*제\s*어")
+REFERENCES_RE = re.compile(r"참\s*고\s*문\s*헌")
+ABSTRACT_EN_RE = re.compile(r"abstract", re.I)
+KEYWORDS_EN_RE = re.compile(r"key\s*words", re.I)
+ACCEPTED_RE = re.compile(r"(논문|게재)\s*확정\s*일자")
+HEADING1_RE = re.compile(r"(?:[Ⅰ-Ⅻ]+|[IVX]+)\.\s")
+HEADING2_RE = re.compile(r"\d+\.\s")
+HEADING3_RE = re.compile(r"\d+\)\s")
+SYMBOL_RE = re.compile(r"[*＊❉✱✽]+")
+DIVIDER_RE = re.compile(r"[─━—―\-_=]{5,}")
+YEAR_RE = re.compile(r"(?<!\d)(19[5-9]\d|20\d\d)(?!\d)")
+
+# 제목이 되기엔 너무 긴 문단 (장·절 제목 판별)
+HEADING_MAX_CHARS = 60
+
+
+# ===== 논문 1편 =====
+
+def _paragraphs(f, styles: dict, defaults: dict, default_para):
+    """XML 파트의 문단마다 (텍스트, 크기 Counter, eastAsia 글꼴 Counter, ascii 글꼴 Counter, 줄간격)
+
+    analyze_docx와 같은 스트리밍 방식 (스타일 상속 해소, 처리한 요소는 바로 해제)
+    """
+    p_tag, r_tag, t_tag = _tag("p"), _tag("r"), _tag("t")
+    pStyle_tag, pPr_tag, rPr_tag, sect_tag = _tag("pStyle"), _tag("pPr"), _tag("rPr"), _tag("sectPr")
+    depth = 0
+    style = default_para
+    para_props = {}
+    texts = []
+    sizes, fonts, ascii_fonts = Counter(), Counter(), Counter()
+
+    for event, elem in ET.iterparse(f, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == p_tag:
+                depth += 1
+                style, para_props, texts = default_para, {}, []
+                sizes, fonts, ascii_fonts = Counter(), Counter(), Counter()
+            continue
+
+        if tag == pStyle_tag:
+            style = elem.get(_tag("val"))
+        elif tag == pPr_tag:
+            para_props = _read_props(elem.find(rPr_tag), elem)
+        elif tag == r_tag and depth:
+            props = {**styles.get(style, defaults), **_read_props(elem.find(rPr_tag), None)}
+            text = "".join(t.text or "" for t in elem.iter(t_tag))
+            texts.append(text)
+            chars = len(text.strip())
+            if chars:
+                if props.get("sz"):
+                    sizes[props["sz"]] += chars
+                if "eastAsia" in props:
+                    fonts[props["eastAsia"]] += chars
+                if "ascii" in props:
+                    ascii_fonts[props["ascii"]] += chars
+            _release(elem)
+        elif tag == p_tag:
+            depth -= 1
+            effective = {**styles.get(style, defaults), **para_props}
+            line = effective.get("line") if effective.get("lineRule", "auto") == "auto" else None
+            yield "".join(texts).strip(), sizes, fonts, ascii_fonts, line
+            if depth == 0:
+                _release(elem)
+        elif tag == sect_tag:
+            yield elem, None, None, None, None
+
+
+def _section_mm(sectPr) -> dict:
+    """sectPr → {width_mm, ..., margin_right_mm} (0.1mm 단위)"""
+    result = {}
+    size = sectPr.find(_tag("pgSz"))
+    if size is not None:
+        for key, attr in (("width_mm", "w"), ("height_mm", "h")):
+            if size.get(_tag(attr)):
+                result[key] = round(int(size.get(_tag(attr))) / TWIPS_PER_MM, 1)
+    margins = sectPr.find(_tag("pgMar"))
+    if margins is not None:
+        for side in ("top", "bottom", "left", "right"):
+            if margins.get(_tag(side)):
+                result[f"margin_{side}_mm"] = round(int(margins.get(_tag(side))) / TWIPS_PER_MM, 1)
+    return result
+
+
+class RoleTracker:
+    """문단 순서대로 역할을 정하고 역할별 분포·기호를 모음"""
+
+    def __init__(self):
+        self.state = "front"
+        self.roles = {}
+        self.markers = {}
+        self.author_symbols = []
+        self.seen_title = False
+
+    def role(self, text: str) -> str:
+        state = self.state
+        if ACCEPTED_RE.search(text):
+            self.markers.setdefault("accepted_date_label", re.sub(r"\s", "", ACCEPTED_RE.search(text).group()))
+        if DIVIDER_RE.fullmatch(text):
+            return None
+
+        if state == "front":
+            if ABSTRACT_KR_RE.fullmatch(text):
+                self.markers["abstract_kr_title"] = text
+                self.state = "abstract_kr"
+                return "abstract_title"
+            symbols = SYMBOL_RE.findall(text)
+            if not self.seen_title:
+                self.seen_title = True
+                if symbols and text.endswith(symbols[-1]):
+                    self.markers["title_footnote"] = symbols[-1]
+                return "title"
+            # 저자 줄에는 저자 각주 기호가 붙으므로, 그 앞의 기호 없는 문단은 부제
+            if not symbols and not self.author_symbols:
+                return "subtitle"
+            self.author_symbols.extend(s for s in symbols if s not in self.author_symbols)
+            return "author"
+        if state == "abstract_kr":
+            if KEYWORDS_KR_RE.match(text):
+                self.state = "body"
+                return "keywords_kr"
+            return "abstract_kr"
+        if state == "body":
+            if REFERENCES_RE.fullmatch(text):
+                self.state = "references"
+                return "reference_title"
+            if len(text) <= HEADING_MAX_CHARS:
+                if HEADING1_RE.match(text):
+                    return "heading1"
+                if HEADING2_RE.match(text):
+                    return "heading2"
+                if HEADING3_RE.match(text):
+                    return "heading3"
+            return "body"
+        if state == "references":
+            if ABSTRACT_EN_RE.fullmatch(text):
+                self.state = "abstract_en"
+                return "abstract_title_en"
+            if text.startswith("<") and text.endswith(">"):
+                return "reference_group"
+            return "reference"
+        if state == "abstract_en":
+            if KEYWORDS_EN_RE.match(text):
+                self.state = "end"
+                return "keywords_en"
+            return "abstract_en"
+        return None
+
+    def add(self, role: str, sizes: Counter, fonts: Counter, ascii_fonts: Counter, line) -> None:
+        entry = self.roles.get(role)
+        if entry is None:
+            entry = self.roles[role] = {"sizes": Counter(), "fonts": Counter(), "ascii": Counter(),
+                                        "lines": Counter()}
+        entry["sizes"].update(sizes)
+        entry["fonts"].update(fonts)
+        entry["ascii"].update(ascii_fonts)
+        if line:
+            entry["lines"][line] += sum(sizes.values()) or 1
+
+    def summary(self) -> tuple:
+        markers = dict(self.markers)
+        if self.author_symbols:
+            markers["author_footnotes"] = self.author_symbols
+        roles = {
+            role: {key: {str(k): v for k, v in counter.items()} for key, counter in entry.items() if counter}
+            for role, entry in self.roles.items()
+        }
+        return roles, markers
+
+
+def summarize_paper(f, name: str) -> dict:
+    """논문 1편 → 요약 (document·footnotes·header 파트를 한 번씩 스트리밍)"""
+    tracker = RoleTracker()
+    page = {}
+    header_text = []
+    paragraphs = 0
+
+    with zipfile.ZipFile(f) as z:
+        styles, defaults, default_para = load_styles(z)
+        names = set(z.namelist())
+
+        with z.open("word/document.xml") as part:
+            for text, sizes, fonts, ascii_fonts, line in _paragraphs(part, styles, defaults, default_para):
+                if sizes is None:
+                    page = _section_mm(text) or page  # 마지막 sectPr = 본문 구역
+                    continue
+                paragraphs += 1
+                if not text:
+                    continue
+                role = tracker.role(text)
+                if role:
+                    tracker.add(role, sizes, fonts, ascii_fonts, line)
+
+        if "word/footnotes.xml" in names:
+            with z.open("word/footnotes.xml") as part:
+                for text, sizes, fonts, ascii_fonts, line in _paragraphs(part, styles, defaults, default_para):
+                    if sizes is not None and text:
+                        tracker.add("footnote", sizes, fonts, ascii_fonts, line)
+
+        for part_name in sorted(n for n in names if re.fullmatch(r"word/header\d*\.xml", n)):
+            with z.open(part_name) as part:
+                for text, sizes, fonts, ascii_fonts, line in _paragraphs(part, styles, defaults, default_para):
+                    if sizes is not None and text:
+                        header_text.append(text)
+                        tracker.add("header", sizes, fonts, ascii_fonts, line)
+
+    year, source = None, None
+    match = YEAR_RE.search(" ".join(header_text))
+    if match:
+        year, source = int(match.group()), "header"
+    else:
+        years = YEAR_RE.findall(name)
+        if years:
+            year, source = int(years[-1]), "path"
+
+    roles, markers = tracker.summary()
+    return {
+        "year": year,
+        "year_source": source,
+        "page": page,
+        "roles": roles,
+        "markers": markers,
+        "paragraphs": paragraphs,
+    }
+
+
+def summarize_one(name: str, location: tuple) -> dict:
+    """프로세스 풀 작업: 원고 1편 요약 (실패는 error로)"""
+    try:
+        with open_submission(location) as f:
+            return summarize_paper(f, name)
+    except Exception as e:
+        return {"error": f"{type(e).__name__}: {e}"}
+
+
+# ===== 상태 (증분) =====
+
+def default_state_path() -> Path:
+    return cache_dir() / "corpus_state.json"
+
+
+def load_state(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        state = {}
+    if state.get("version") != SUMMARY_VERSION:
+        state = {"version": SUMMARY_VERSION, "files": {}, "summaries": {}}
+    return state
+
+
+def save_state(path: Path, state: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def collect(sources: list, state: dict, max_workers=None, save=None) -> dict:
+    """코퍼스의 논문 요약 {sha256: 요약} — 상태에 없는 논문만 병렬 분석"""
+    files = state["files"]
+    summaries = state["summaries"]
+    corpus = {}
+    pending = []
+    archives = {}
+    stats = {"files": 0, "analyzed": 0, "cached": 0, "failed": 0, "errors": []}
+
+    for source in sources:
+        for name, location in iter_submissions(source):
+            stats["files"] += 1
+            file_key = f"{Path(source).resolve()}::{name}"
+            mark = file_fingerprint(location, archives)
+            known = files.get(file_key)
+            digest = known[1] if known and known[0] == mark else content_hash(location)
+            files[file_key] = [mark, digest]
+            if digest in summaries:
+                corpus[digest] = summaries[digest]
+                stats["cached"] += 1
+            elif digest not in corpus:
+                corpus[digest] = None
+                pending.append((name, location, digest))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {pool.submit(summarize_one, name, location): (name, digest)
+                   for name, location, digest in pending}
+        for done, future in enumerate(as_completed(futures), 1):
+            name, digest = futures[future]
+            summary = future.result()
+            if "error" in summary:
+                stats["failed"] += 1
+                stats["errors"].append({"file": name, "error": summary["error"]})
+                del corpus[digest]
+                continue
+            summaries[digest] = corpus[digest] = summary
+            stats["analyzed"] += 1
+            if save and done % CHECKPOINT_EVERY == 0:
+                save(state)
+
+    stats["summaries"] = corpus
+    return stats
+
+
+# ===== 연도별 집계 =====
+
+def _mode(counter: Counter):
+    """(최빈값, 비율)"""
+    if not counter:
+        return None, 0.0
+    value, count = counter.most_common(1)[0]
+    return value, round(count / sum(counter.values()), 3)
+
+
+def aggregate(papers: list) -> dict:
+    """같은 연도 논문 요약들 → {page, roles: {역할: {sizes, fonts, ascii, lines}}, markers: {키: Counter}}"""
+    pages = {key: [] for key in PAGE_KEYS}
+    roles = {}
+    markers = {key: Counter() for key in MARKER_KEYS}
+    for paper in papers:
+        for key in PAGE_KEYS:
+            if key in paper["page"]:
+                pages[key].append(paper["page"][key])
+        for role, entry in paper["roles"].items():
+            target = roles.setdefault(role, {})
+            for key, values in entry.items():
+                counter = target.setdefault(key, Counter())
+                for value, count in values.items():
+                    counter[value] += count
+        for key, value in paper["markers"].items():
+            markers[key][json.dumps(value, ensure_ascii=False)] += 1
+    return {"pages": pages, "roles": roles, "markers": markers}
+
+
+def author_symbols(counter: Counter) -> tuple:
+    """논문별 저자 각주 기호 목록 → (기호 계열의 순서 목록, 다른 계열 기호, 지지 비율)
+
+    연구비 각주가 있으면 저자는 **부터 시작하므로 목록을 그대로 세지 않고 기호 글자(계열)별로 모은다
+    (＊ 계열에서 ＊＊까지 보였으면 ["＊", "＊＊"]).
+    """
+    families = Counter()
+    longest = Counter()
+    for value, papers in counter.items():
+        symbols = json.loads(value)
+        for symbol in symbols:
+            longest[symbol[0]] = max(longest[symbol[0]], len(symbol))
+        families.update({symbol[0]: papers for symbol in set(s[0] for s in symbols)})
+    family = families.most_common(1)[0][0]
+    sequence = [family * n for n in range(1, longest[family] + 1)]
+    others = sorted(ch * n for ch in longest if ch != family for n in range(1, longest[ch] + 1))
+    agree = sum(papers for value, papers in counter.items() if all(s[0] == family for s in json.loads(value)))
+    return sequence, others, round(agree / sum(counter.values()), 3)
+
+
+def base_profile(year: int, names: list) -> str:
+    """상속할 손 프로필: 연도 이하 중 가장 최근 (없으면 가장 오래된 것)"""
+    years = sorted(int(n) for n in names if n.isdigit())
+    older = [y for y in years if y <= year]
+    return str(older[-1] if older else years[0])
+
+
+def derive_profile(year: int, papers: list, base: str) -> dict:
+    """연도 1개의 프로필 (근거가 있는 값만)
+
+    Word 파일의 글자 크기는 반 포인트 단위라 손 프로필의 10.3pt가 10pt로 읽히므로,
+    최빈값이 상속할 프로필 값과 허용 오차(tolerances) 안이면 그 값을 덮어쓰지 않는다.
+    """
+    base_cfg = load_profile(base)
+    tolerances = base_cfg["tolerances"]
+    size_tol = tolerances["size_pt"]
+    totals = aggregate(papers)
+    support = {}
+    profile = {"extends": base, "label": f"{year}년 코퍼스 도출 (논문 {len(papers)}편)"}
+
+    page = {}
+    for key, values in totals["pages"].items():
+        if values:
+            median = statistics.median(values)
+            page[key] = round(median, 1)
+            support[f"page.{key}"] = round(sum(1 for v in values if abs(v - median) <= 1) / len(values), 3)
+    if page:
+        profile["page"] = page
+
+    fonts = {}
+    roles = totals["roles"]
+    for role, key in ROLE_SIZE_KEYS.items():
+        sizes = roles.get(role, {}).get("sizes")
+        half_points, share = _mode(sizes)
+        if half_points is not None:
+            size = int(half_points) / 2
+            inherited = base_cfg["fonts"].get(key)
+            if inherited is not None and abs(size - inherited) <= size_tol:
+                size = inherited
+            else:
+                fonts[key] = size
+            # 허용 오차 안의 글자 비율 (10.3pt가 10pt로 기록된 파일 등)
+            total = sum(sizes.values())
+            near = sum(c for hp, c in sizes.items() if abs(int(hp) / 2 - size) <= size_tol)
+            support[f"fonts.{key}"] = round(near / total, 3)
+    body = roles.get("body", {})
+    korean, share = _mode(body.get("fonts"))
+    if korean is not None:
+        fonts["korean"] = korean
+        support["fonts.korean"] = share
+    english = Counter()
+    for role in ("abstract_en", "reference"):
+        english.update(roles.get(role, {}).get("ascii", {}))
+    latin, share = _mode(english)
+    if latin is not None:
+        fonts["english"] = latin
+        support["fonts.english"] = share
+    if fonts:
+        profile["fonts"] = fonts
+
+    line, share = _mode(body.get("lines"))
+    if line is not None:
+        spacing = round(int(line) / 240, 2)
+        if abs(spacing - base_cfg["line_spacing"]) > tolerances["line_spacing"]:
+            profile["line_spacing"] = spacing
+        support["line_spacing"] = share
+
+    markers, variants = {}, {}
+    for key, counter in totals["markers"].items():
+        if not counter:
+            continue
+        if key == "author_footnotes":
+            markers[key], others, support[f"markers.{key}"] = author_symbols(counter)
+        else:
+            ranked = [json.loads(value) for value, _ in counter.most_common()]
+            markers[key], others = ranked[0], ranked[1:]
+            support[f"markers.{key}"] = round(counter.most_common(1)[0][1] / sum(counter.values()), 3)
+        if others:
+            variants[key] = others
+    if markers:
+        profile["markers"] = markers
+    if variants:
+        profile["legacy_variants"] = variants
+
+    profile["derived"] = {
+        "papers": len(papers),
+        "year_sources": dict(Counter(p["year_source"] for p in papers)),
+        "support": support,
+    }
+    return profile
+
+
+def derive_profiles(summaries, min_papers: int = 1) -> dict:
+    """논문 요약 전체 → 사양 파일 (profiles: corpus-<연도>)"""
+    spec = load_spec()
+    hand = [name for name in spec["profiles"] if name.isdigit()]
+    by_year = {}
+    for summary in summaries:
+        if summary.get("year") is not None:
+            by_year.setdefault(summary["year"], []).append(summary)
+
+    profiles = {}
+    for year in sorted(by_year):
+        papers = by_year[year]
+        if len(papers) >= min_papers:
+            profiles[f"corpus-{year}"] = derive_profile(year, papers, base_profile(year, hand))
+
+    content = json.dumps(profiles, sort_keys=True, ensure_ascii=False)
+    return {
+        # 같은 코퍼스면 같은 버전 — 생성기 캐시 키(spec_version)가 도출 결과에 따라 바뀐다
+        "version": f"{spec['version']}+corpus.{hashlib.sha256(content.encode('utf-8')).hexdigest()[:8]}",
+        "base_version": spec["version"],
+        "default_profile": spec["default_profile"],
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "profiles": profiles,
+    }
+
+
+def write_profiles(path: Path, derived: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(derived, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="출간 논문 코퍼스에서 연도별 형식 프로필 도출")
+    parser.add_argument("sources", nargs="+", help="논문 폴더 또는 .zip 아카이브")
+    parser.add_argument("-o", "--output", default=str(DEFAULT_OUTPUT),
+                        help="프로필 파일 (기본: spec/derived/shinsa_corpus.json)")
+    parser.add_argument("--state", help="상태 파일 (기본: ~/.cache/shinsa-mcp/corpus_state.json)")
+    parser.add_argument("--jobs", type=int, default=None, help="동시 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--min-papers", type=int, default=1, help="프로필을 만들 최소 논문 수")
+    opts = parser.parse_args(argv)
+
+    sources = [Path(s) for s in opts.sources]
+    missing = [str(s) for s in sources if not s.exists()]
+    if missing:
+        print(json.dumps({"error": f"Not found: {', '.join(missing)}"}, ensure_ascii=False))
+        return 1
+
+    state_path = Path(opts.state) if opts.state else default_state_path()
+    state = load_state(state_path)
+    started = time.perf_counter()
+    try:
+        stats = collect(sources, state, opts.jobs, save=lambda s: save_state(state_path, s))
+    except zipfile.BadZipFile as e:
+        print(json.dumps({"error": f"BadZipFile: {e}"}, ensure_ascii=False))
+        return 1
+    save_state(state_path, state)
+
+    summaries = list(stats.pop("summaries").values())
+    derived = derive_profiles(summaries, opts.min_papers)
+    write_profiles(Path(opts.output), derived)
+
+    print(json.dumps({
+        "output": opts.output,
+        "version": derived["version"],
+        **stats,
+        "undated": sum(1 for s in summaries if s.get("year") is None),
+        "years": {name: p["derived"]["papers"] for name, p in derived["profiles"].items()},
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+신학과사회 투고 원고 일괄 형식 검사
+폴더 또는 zip 아카이브 안의 모든 .docx를 프로세스 풀로 분석하고
+원고마다 규칙별 통과 여부를 JSON Lines/CSV 한 줄로 출력
+
+파일 내용 해시로 결과를 캐시하므로 바뀌지 않은 원고는 다시 분석하지 않는다.
+캐시 키에는 분석기 버전(ANALYZER_VERSION)과 기준 해시가 들어가고, 다른 버전의 항목은 저장할 때 버린다.
+
+사용법:
+    python scan_submissions.py submissions/ [-o report.jsonl] [--format csv] [--jobs N]
+    python scan_submissions.py submissions.zip --no-cache
+"""
+
+import argparse
+import csv
+import hashlib
+import io
+import json
+import os
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from analyze_docx import ANALYZER_VERSION, SPEC_2025, analyze_docx, check_spec
+from local_cache import cache_dir
+from shinsa_spec import load_profile, profile_names
+
+RULES = [
+    "page_size", "margin_top", "margin_bottom", "margin_left", "margin_right",
+    "title_size", "body_size", "abstract_size", "font", "line_spacing",
+]
+
+
+def spec_key(spec: dict = SPEC_2025) -> str:
+    """기준이 바뀌면 캐시가 무효화되도록 기준 자체를 해시"""
+    payload = json.dumps(spec, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def cache_key(digest: str, spec: dict = SPEC_2025) -> str:
+    """캐시 키: 내용 해시 : 분석기 버전 : 기준 해시"""
+    return f"{digest}:v{ANALYZER_VERSION}:{spec_key(spec)}"
+
+
+def is_current(key: str) -> bool:
+    """지금 분석기 버전으로 만든 항목인지 (옛 형식 키 포함 나머지는 버림)"""
+    parts = key.split(":")
+    return len(parts) == 3 and parts[1] == f"v{ANALYZER_VERSION}"
+
+
+def default_cache_path() -> Path:
+    return cache_dir() / "scan_cache.json"
+
+
+def load_cache(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(path: Path, cache: dict) -> None:
+    """캐시 저장 (다른 분석기 버전의 항목은 버려 파일이 계속 커지지 않게 함)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({k: v for k, v in cache.items() if is_current(k)}, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def iter_submissions(source: Path):
+    """(이름, 위치) 순회: 폴더는 재귀, zip은 내부 .docx 항목
+
+    위치는 (파일 경로, zip 항목 이름 또는 None) — 내용은 작업 프로세스가 직접 연다.
+    """
+    if source.is_dir():
+        for path in sorted(source.rglob("*.docx")):
+            # Word 잠금 파일 (~$paper.docx) 제외
+            if path.name.startswith("~$"):
+                continue
+            yield str(path.relative_to(source)), (str(path), None)
+    else:
+        with zipfile.ZipFile(source) as archive:
+            names = [info.filename for info in archive.infolist() if not info.is_dir()]
+        for name in names:
+            if not name.lower().endswith(".docx") or name.startswith("__MACOSX/"):
+                continue
+            if Path(name).name.startswith("~$"):
+                continue
+            yield name, (str(source), name)
+
+
+def open_submission(location: tuple):
+    """위치 → 읽기용 파일 객체"""
+    path, member = location
+    if member is None:
+        return open(path, "rb")
+    archive = zipfile.ZipFile(path)
+    # zip 항목은 시크가 필요하므로 메모리로 읽는다 (원고 1편 크기)
+    with archive, archive.open(member) as f:
+        return io.BytesIO(f.read())
+
+
+def content_hash(location: tuple) -> str:
+    """원고 내용 sha256 (청크 단위로 읽어 메모리 일정)"""
+    digest = hashlib.sha256()
+    with open_submission(location) as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_one(name: str, location: tuple) -> dict:
+    """프로세스 풀 작업: 원고 1편 내용 해시 (읽기 실패는 그 원고의 오류 행으로)"""
+    try:
+        return {"file": name, "sha256": content_hash(location)}
+    except Exception as e:
+        return {"file": name, "passed": False, "error": f"{type(e).__name__}: {e}",
+                "sha256": None, "cached": False}
+
+
+def scan_one(name: str, location: tuple, spec: dict = SPEC_2025) -> dict:
+    """프로세스 풀 작업: 원고 1편 분석 후 규칙별 결과 반환"""
+    row = {"file": name}
+    try:
+        with open_submission(location) as f:
+            analysis = analyze_docx(f, name=name)
+    except Exception as e:
+        row.update(passed=False, error=f"{type(e).__name__}: {e}")
+        return row
+
+    checks = check_spec(analysis, spec)
+    row["passed"] = all(c["passed"] for c in checks)
+    row["rules"] = {c["rule"]: c["passed"] for c in checks}
+    row["actual"] = {c["rule"]: c["actual"] for c in checks}
+    row["paragraphs"] = analysis["paragraphs"]
+    return row
+
+
+def scan(source: Path, cache: dict, max_workers=None, spec: dict = SPEC_2025) -> list:
+    """캐시에 없는 원고만 병렬 분석, 원고 이름 순으로 결과 반환
+
+    해시도 작업 프로세스에서 계산하므로 읽을 수 없는 파일·zip 항목은 그 원고만 오류 행이 된다.
+    """
+    rows = []
+    pending = {}
+    submissions = list(iter_submissions(source))
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        hashed = pool.map(hash_one, *zip(*submissions), chunksize=4) if submissions else []
+        for (name, location), entry in zip(submissions, hashed):
+            if "error" in entry:
+                rows.append(entry)
+                continue
+            digest = entry["sha256"]
+            key = cache_key(digest, spec)
+            if key in cache:
+                rows.append({"file": name, **cache[key], "sha256": digest, "cached": True})
+                continue
+            pending[pool.submit(scan_one, name, location, spec)] = (name, digest, key)
+
+        for future, (name, digest, key) in pending.items():
+            row = future.result()
+            if "error" not in row:
+                cache[key] = {k: v for k, v in row.items() if k != "file"}
+            rows.append({**row, "sha256": digest, "cached": False})
+
+    rows.sort(key=lambda r: r["file"])
+    return rows
+
+
+def write_jsonl(rows: list, out) -> None:
+    for row in rows:
+        out.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+def write_csv(rows: list, out) -> None:
+    writer = csv.writer(out)
+    writer.writerow(["file", "sha256", "cached", "passed", *RULES, "error"])
+    for row in rows:
+        rules = row.get("rules", {})
+        writer.writerow([
+            row["file"], row["sha256"], row["cached"], row["passed"],
+            *(rules.get(rule, "") for rule in RULES),
+            row.get("error", ""),
+        ])
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="투고 원고 일괄 형식 검사")
+    parser.add_argument("source", help="원고 폴더 또는 .zip 아카이브")
+    parser.add_argument("-o", "--output", help="결과 파일 (기본: stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("--jobs", type=int, default=None, help="동시 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--cache", help="캐시 파일 경로 (기본: ~/.cache/shinsa-mcp/scan_cache.json)")
+    parser.add_argument("--no-cache", action="store_true", help="캐시 사용 안 함")
+    parser.add_argument("--profile", choices=profile_names(), default=SPEC_2025["name"],
+                        help="비교할 연도 프로필 (기본 2025)")
+    opts = parser.parse_args(argv)
+    spec = load_profile(opts.profile)
+
+    source = Path(opts.source)
+    if not source.exists():
+        print(json.dumps({"error": f"Not found: {source}"}, ensure_ascii=False))
+        return 1
+
+    cache_path = Path(opts.cache) if opts.cache else default_cache_path()
+    cache = {} if opts.no_cache else load_cache(cache_path)
+
+    try:
+        rows = scan(source, cache, opts.jobs, spec)
+    except zipfile.BadZipFile as e:
+        print(json.dumps({"error": f"BadZipFile: {e}"}, ensure_ascii=False))
+        return 1
+
+    if not opts.no_cache:
+        save_cache(cache_path, cache)
+
+    writer = write_csv if opts.format == "csv" else write_jsonl
+    if opts.output:
+        with open(opts.output, "w", encoding="utf-8", newline="") as out:
+            writer(rows, out)
+    else:
+        writer(rows, sys.stdout)
+
+    failed = sum(1 for r in rows if not r["passed"])
+    print(json.dumps({
+        "total": len(rows),
+        "passed": len(rows) - failed,
+        "failed": failed,
+        "cached": sum(1 for r in rows if r["cached"]),
+    }, ensure_ascii=False), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
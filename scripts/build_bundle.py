@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+DOCX 생성기 단일 파일 번들 (zipapp)
+shinsa_docx.py 진입점과 create_docx가 쓰는 모듈, 형식 사양(spec/shinsa_spec.json)을
+미리 컴파일한 바이트코드와 함께 .pyz 하나로 묶는다.
+
+    - 바이트코드는 zipimport가 읽는 옛 배치(모듈.pyc)로 소스 옆에 넣고,
+      unchecked-hash 방식이라 실행 시 소스 비교·재컴파일이 없다
+    - 빌드한 것과 다른 버전의 인터프리터에서는 zipimport가 소스로 되돌아간다 (동작은 같음)
+    - python-docx / lxml은 넣지 않는다 (lxml은 C 확장, python-docx는 템플릿 파일을
+      파일 경로로 읽음) — 실행 환경에 설치되어 있어야 한다 (--check로 확인)
+
+사용법:
+    python scripts/build_bundle.py [-o build/shinsa_docx.pyz] [--optimize 0|1|2]
+    python build/shinsa_docx.pyz --version
+    python build/shinsa_docx.pyz input.json output.docx
+    python build/shinsa_docx.pyz --worker
+"""
+
+import argparse
+import json
+import py_compile
+import sys
+import tempfile
+import time
+import zipapp
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+ROOT = SCRIPTS_DIR.parent
+
+# 번들에 넣는 모듈 (create_docx의 import 그래프, references·conformance·page_estimate는 지연 import)
+MODULES = (
+    "shinsa_docx",
+    "create_docx",
+    "conformance",
+    "footnotes",
+    "inline_markup",
+    "local_cache",
+    "output_cache",
+    "page_estimate",
+    "references",
+    "run_metrics",
+    "section_cache",
+    "shinsa_spec",
+    "stream_docx",
+    "tables",
+)
+
+MAIN_TEMPLATE = '''\
+# build_bundle.py가 생성한 파일 — 직접 고치지 말 것
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "scripts"))
+
+import shinsa_docx
+
+shinsa_docx.BUNDLE = {bundle}
+sys.exit(shinsa_docx.main(sys.argv[1:]))
+'''
+
+
+def bundle_info() -> dict:
+    with open(ROOT / "package.json", "r", encoding="utf-8") as f:
+        version = json.load(f)["version"]
+    return {
+        "version": version,
+        "python": "{}.{}".format(*sys.version_info[:2]),
+        "built": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def stage(directory: Path, info: dict, optimize: int) -> None:
+    """번들 내용을 directory에 배치: __main__.py, scripts/*.py(+.pyc), spec/shinsa_spec.json"""
+    scripts = directory / "scripts"
+    scripts.mkdir()
+    for name in MODULES:
+        source = SCRIPTS_DIR / f"{name}.py"
+        (scripts / source.name).write_bytes(source.read_bytes())
+        py_compile.compile(str(source), cfile=str(scripts / f"{name}.pyc"),
+                           dfile=f"scripts/{source.name}", doraise=True, optimize=optimize,
+                           invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+
+    spec = directory / "spec"
+    spec.mkdir()
+    (spec / "shinsa_spec.json").write_bytes((ROOT / "spec" / "shinsa_spec.json").read_bytes())
+
+    (directory / "__main__.py").write_text(
+        MAIN_TEMPLATE.format(bundle=repr(info)), encoding="utf-8")
+
+
+def build_bundle(output, optimize: int = 0, interpreter: str = "/usr/bin/env python3") -> dict:
+    """번들 생성. 압축하지 않는다 (시작 시 압축 해제 비용 없음, 크기는 수백 KB)"""
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    info = bundle_info()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        stage(Path(tmp), info, optimize)
+        zipapp.create_archive(tmp, output, interpreter=interpreter, compressed=False)
+
+    return {
+        "path": str(output),
+        "size_kb": round(output.stat().st_size / 1024, 1),
+        "modules": list(MODULES),
+        "optimize": optimize,
+        **info,
+    }
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="DOCX 생성기 zipapp 번들 빌드")
+    parser.add_argument("-o", "--output", default=str(ROOT / "build" / "shinsa_docx.pyz"))
+    parser.add_argument("--optimize", type=int, choices=(0, 1, 2), default=0,
+                        help="바이트코드 최적화 수준 (1: assert 제거, 2: docstring도 제거)")
+    parser.add_argument("--python", default="/usr/bin/env python3", help="shebang 인터프리터")
+    opts = parser.parse_args(argv)
+
+    try:
+        result = build_bundle(opts.output, opts.optimize, opts.python)
+    except (OSError, py_compile.PyCompileError) as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False))
+        return 1
+
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
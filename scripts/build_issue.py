@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+신학과사회 한 호(issue) 일괄 DOCX 생성기
+매니페스트 또는 JSON 입력 디렉터리의 논문들을 프로세스 풀로 병렬 생성
+
+사용법:
+    python build_issue.py manifest.json [--out DIR] [--jobs N] [--report report.json]
+    python build_issue.py inputs/ --out out/ [--start-page 1]
+    python build_issue.py manifest.json --out out/ --pdf [--pdf-workers 4]   # 교정쇄 PDF도 생성
+
+매니페스트 형식:
+    {
+        "volume": 39, "issue": 2, "year": 2025, "start_page": 1,
+        "papers": [
+            {"input": "paper1.json", "output": "paper1.docx"},
+            {"data": {...}, "output": "paper2.docx"}
+        ]
+    }
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+# 호 단위로 공유되는 헤더 값
+ISSUE_FIELDS = ("volume", "issue", "year")
+
+# 기본 리포트 파일 이름 (디렉터리 입력이면 출력도 같은 곳이라 입력에서 뺀다)
+REPORT_NAME = "batch_report.json"
+
+# 논문 입력에서 형식을 확인하는 필드
+LIST_FIELDS = ("sections", "tables", "references")
+PAGE_FIELDS = ("start_page", "end_page", "page_count")
+
+
+def validate_paper(data) -> None:
+    """논문 입력 형식 확인 (ValueError → 호 전체가 아니라 그 논문만 실패)"""
+    if not isinstance(data, dict):
+        raise ValueError("Paper input must be a JSON object")
+    if not (data.get("body") or data.get("sections")):
+        raise ValueError("Paper input has no body or sections")
+    if data.get("body") is not None and not isinstance(data["body"], str):
+        raise ValueError("'body' must be a string")
+    footnotes = data.get("footnotes")
+    if footnotes is not None and not isinstance(footnotes, (list, dict)):
+        raise ValueError("'footnotes' must be a list or an object")
+    for key in LIST_FIELDS:
+        if data.get(key) is not None and not isinstance(data[key], list):
+            raise ValueError(f"'{key}' must be a list")
+    for key in PAGE_FIELDS:
+        value = data.get(key)
+        if value is not None and (not isinstance(value, int) or isinstance(value, bool) or value < 1):
+            raise ValueError(f"'{key}' must be a positive integer")
+
+
+def load_jobs(source: Path, out_dir: Path, start_page=None, exclude=()) -> tuple:
+    """매니페스트/디렉터리에서 작업 목록 생성 (논문 순서대로)
+
+    읽을 수 없거나 형식이 틀린 논문은 job["error"]에 사유를 남기고 쪽 배정에서 뺀다.
+    exclude: 디렉터리 입력에서 건너뛸 경로 (리포트 파일 등)
+    """
+    if source.is_dir():
+        skip = {Path(p).resolve() for p in exclude}
+        inputs = [p for p in sorted(source.glob("*.json"))
+                  if p.name != REPORT_NAME and p.resolve() not in skip]
+        manifest = {"papers": [{"input": p.name} for p in inputs]}
+        base = source
+    else:
+        with open(source, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if not isinstance(manifest, dict):
+            raise ValueError("Manifest must be a JSON object")
+        if not isinstance(manifest.get("papers", []), list):
+            raise ValueError("Manifest 'papers' must be a list")
+        base = source.parent
+
+    issue_defaults = {k: manifest[k] for k in ISSUE_FIELDS if k in manifest}
+    if start_page is None:
+        start_page = manifest.get("start_page", 1)
+
+    jobs = []
+    for index, paper in enumerate(manifest.get("papers", [])):
+        job = {"index": index}
+        try:
+            if not isinstance(paper, dict):
+                raise ValueError("Manifest entry must be a JSON object")
+            if "data" in paper:
+                name = paper.get("name") or f"paper_{index + 1:02d}"
+            else:
+                input_path = base / paper["input"]
+                name = input_path.stem
+            job["name"] = name
+            job["output"] = str(out_dir / (paper.get("output") or f"{name}.docx"))
+            if "data" in paper:
+                data = paper["data"]
+            else:
+                with open(input_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            validate_paper(data)
+        except (OSError, KeyError, ValueError) as e:
+            # json.JSONDecodeError도 ValueError
+            job.setdefault("name", f"paper_{index + 1:02d}")
+            job.setdefault("output", None)
+            job["error"] = f"{type(e).__name__}: {e}"
+            jobs.append(job)
+            continue
+
+        data = dict(data)
+        for key, value in issue_defaults.items():
+            data.setdefault(key, value)
+        job["data"] = data
+        jobs.append(job)
+
+    chain_pages(jobs, start_page)
+    return jobs, manifest
+
+
+def chain_pages(jobs: list, start_page: int) -> None:
+    """start_page/end_page를 논문 순서대로 이어 붙임 (다음 논문 = 이전 end_page + 1)
+
+    쪽수는 page_count, start_page~end_page 순으로 쓰고, 둘 다 없으면 쪽수 추정기로 계산한다.
+    실패한 논문(job["error"])은 쪽을 차지하지 않는다.
+    """
+    page = start_page
+    for job in jobs:
+        if "error" in job:
+            continue
+        data = job["data"]
+        span = data.get("page_count")
+        if data.get("end_page") and data.get("start_page"):
+            span = data["end_page"] - data["start_page"] + 1
+        if not span:
+            from create_docx import estimate_paper_pages
+
+            try:
+                span = estimate_paper_pages(data)["pages"]
+            except Exception as e:
+                job["error"] = f"{type(e).__name__}: {e}"
+                continue
+            job["pages_estimated"] = True
+        if span < 1:
+            job["error"] = "ValueError: end_page is before start_page"
+            continue
+
+        data["start_page"] = page
+        data["end_page"] = page + span - 1
+        page = data["end_page"] + 1
+
+
+def rejected_entry(job: dict) -> dict:
+    """생성 전에 실패한 논문의 리포트 항목"""
+    return {
+        "index": job["index"],
+        "name": job["name"],
+        "output": job["output"],
+        "start_page": None,
+        "end_page": None,
+        "success": False,
+        "error": job["error"],
+    }
+
+
+def build_one(job: dict) -> dict:
+    """프로세스 풀 작업: 논문 1편 생성 (create_docx는 워커마다 한 번만 import)"""
+    from create_docx import create_shinsa_docx
+
+    started = time.monotonic()
+    entry = {
+        "index": job["index"],
+        "name": job["name"],
+        "output": job["output"],
+        "start_page": job["data"]["start_page"],
+        "end_page": job["data"]["end_page"],
+        "pages_estimated": job.get("pages_estimated", False),
+        "pid": os.getpid(),
+    }
+    try:
+        result = create_shinsa_docx(job["data"], job["output"])
+        entry.update(success=True, path=result["path"], metrics=result["metrics"])
+    except Exception as e:
+        entry.update(success=False, error=f"{type(e).__name__}: {e}")
+    entry["elapsed_ms"] = round((time.monotonic() - started) * 1000, 2)
+    return entry
+
+
+def attach_proof(entry: dict, future) -> None:
+    """교정쇄 변환 결과를 논문 항목에 기록"""
+    try:
+        result = future.result()
+    except Exception as e:
+        entry["pdf_error"] = f"{type(e).__name__}: {e}"
+        return
+    entry.update(pdf=result["output"], pdf_pages=result["pages"], pdf_ms=result["elapsed_ms"])
+
+
+def build_issue(jobs: list, max_workers=None, pdf_pool=None) -> list:
+    """모든 논문을 병렬 생성하고 논문 순서대로 결과 반환
+
+    pdf_pool(pdf_proofs.ConverterPool)이 있으면 논문이 끝나는 대로 교정쇄 변환을 맡겨
+    DOCX 생성과 PDF 변환이 겹쳐 진행된다.
+    """
+    if not jobs:
+        return []
+
+    results = [rejected_entry(job) for job in jobs if "error" in job]
+    proofs = []
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [pool.submit(build_one, job) for job in jobs if "error" not in job]
+        for future in as_completed(futures):
+            entry = future.result()
+            results.append(entry)
+            if pdf_pool is not None and entry["success"]:
+                proofs.append((entry, pdf_pool.submit(entry["path"])))
+
+    for entry, future in proofs:
+        attach_proof(entry, future)
+
+    results.sort(key=lambda r: r["index"])
+    return results
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="신학과사회 호 단위 DOCX 일괄 생성")
+    parser.add_argument("source", help="매니페스트 JSON 또는 입력 JSON 디렉터리")
+    parser.add_argument("--out", help="출력 디렉터리 (기본: 매니페스트 위치)")
+    parser.add_argument("--jobs", type=int, default=None, help="동시 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--start-page", type=int, default=None, help="첫 논문 시작 페이지")
+    parser.add_argument("--report", help="리포트 경로 (기본: <out>/batch_report.json)")
+    parser.add_argument("--pdf", action="store_true", help="DOCX 옆에 교정쇄 PDF도 생성")
+    parser.add_argument("--pdf-workers", type=int, default=None,
+                        help="동시 PDF 변환 수 (기본: min(4, CPU 수))")
+    parser.add_argument("--pdf-backend", default="soffice", help="PDF 변환기 (soffice | stub)")
+    opts = parser.parse_args(argv)
+
+    source = Path(opts.source)
+    if not source.exists():
+        print(json.dumps({"error": f"Not found: {source}"}, ensure_ascii=False))
+        return 1
+
+    out_dir = Path(opts.out) if opts.out else (source if source.is_dir() else source.parent)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    report_path = Path(opts.report) if opts.report else out_dir / REPORT_NAME
+
+    started = time.monotonic()
+    try:
+        jobs, manifest = load_jobs(source, out_dir, opts.start_page, exclude=(report_path,))
+    except (OSError, KeyError, ValueError) as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False))
+        return 1
+
+    pdf_pool = None
+    if opts.pdf:
+        import pdf_proofs
+
+        try:
+            pdf_pool = pdf_proofs.open_pool(opts.pdf_backend,
+                                            opts.pdf_workers or pdf_proofs.DEFAULT_WORKERS)
+        except ValueError as e:
+            print(json.dumps({"error": str(e)}, ensure_ascii=False))
+            return 1
+
+    try:
+        papers = build_issue(jobs, opts.jobs, pdf_pool)
+    finally:
+        if pdf_pool is not None:
+            pdf_pool.close()
+
+    report = {
+        "source": str(source),
+        "volume": manifest.get("volume"),
+        "issue": manifest.get("issue"),
+        "year": manifest.get("year"),
+        "total": len(papers),
+        "succeeded": sum(1 for p in papers if p["success"]),
+        "failed": sum(1 for p in papers if not p["success"]),
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 2),
+        "papers": papers,
+    }
+    if pdf_pool is not None:
+        report["pdf_failed"] = sum(1 for p in papers if p["success"] and "pdf" not in p)
+        report["pdf_pool"] = pdf_pool.stats()
+
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(json.dumps({
+        "success": report["failed"] == 0,
+        "report": str(report_path.absolute()),
+        "total": report["total"],
+        "failed": report["failed"],
+        **({"pdf_failed": report["pdf_failed"]} if pdf_pool is not None else {}),
+        "elapsed_ms": report["elapsed_ms"],
+    }, ensure_ascii=False))
+    return 0 if report["failed"] == 0 and not report.get("pdf_failed") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,313 @@
+"""
+생성 직후 형식 검사 (저장 전, 메모리의 문서 트리 기준)
+analyze_docx.py처럼 저장된 zip을 다시 열어 document.xml을 파싱하지 않고,
+python-docx가 들고 있는 lxml 트리를 그대로 훑어 사양 프로필과 비교한다.
+
+    page        sectPr 페이지 크기·여백 (신국판 152×225mm, 24/25/25/23mm)
+    style       역할별 스타일 정의의 글꼴·크기·굵게·줄간격 (PARAGRAPH_STYLES + 프로필)
+    spec        문서에 기록된 스타일 정의가 사양의 기준값(제목 14pt, 본문 10.3pt·160%, 초록·각주 8.5pt,
+                바탕체)과 맞는지 — 스타일 표를 거치지 않고 프로필 값과 직접 비교
+    paragraph   문단마다 스타일과 직접 서식(줄간격·run 크기·글꼴 덮어쓰기)이 역할 기대값과 맞는지
+                (표 셀 문단 포함)
+
+위반은 (규칙, 역할, 기대값, 실제값)별로 묶어 건수와 첫 문단 번호만 남긴다.
+각주 본문(footnotes.xml)은 Footnote 스타일 정의만 확인한다.
+"""
+
+import time
+
+from shinsa_spec import TWIPS_PER_MM
+from tables import CELL_ROLE, HEAD_ROLE, TABLE
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W = "{" + W_NS + "}"
+
+P, PPR, PSTYLE, SPACING, R, RPR = W + "p", W + "pPr", W + "pStyle", W + "spacing", W + "r", W + "rPr"
+TBL = W + "tbl"
+SZ, RFONTS, B, VERT_ALIGN = W + "sz", W + "rFonts", W + "b", W + "vertAlign"
+VAL, LINE = W + "val", W + "line"
+FONT_ATTRS = (W + "eastAsia", W + "ascii")
+
+# 사양의 기준값 → 그 값을 따라야 하는 역할 (스타일 표가 잘못돼도 잡히도록 기록된 스타일과 직접 비교)
+SPEC_SIZES = {
+    "title_size": ("Title",),
+    "body_size": ("Body",),
+    "abstract_size": ("AbstractKr", "AbstractEn"),
+    "footnote_size": ("Footnote",),
+}
+SPEC_LINE_ROLES = ("Body",)
+SPEC_KOREAN_ROLES = ("Title", "Body", "AbstractKr", "Footnote")
+
+PAGE_SIDES = ("top", "bottom", "left", "right")
+
+
+def expected_roles(cfg: dict, styles: dict) -> dict:
+    """역할별 기대값 {font, size, bold, line} (None 키 = 스타일 없는 문단 → Normal)
+
+    styles: create_docx.PARAGRAPH_STYLES — {역할: (글꼴 키, 크기 키 또는 pt, 굵게, 문단 서식)}
+    line은 배수 (없으면 1.0 = Normal 상속)
+    """
+    fonts = cfg["fonts"]
+    expected = {None: {"font": fonts["korean"], "size": fonts["body_size"], "bold": False, "line": 1.0}}
+    for role, (font_key, size, bold, fmt) in styles.items():
+        line = fmt.get("line", 1.0)
+        expected[role] = {
+            "font": fonts[font_key],
+            "size": fonts[size] if isinstance(size, str) else size,
+            "bold": bold,
+            "line": cfg[line] if isinstance(line, str) else line,
+        }
+    return expected
+
+
+def _pt(half_points) -> float:
+    return int(half_points) / 2
+
+
+class Conformance:
+    """검사기: check_* 를 부른 뒤 report()"""
+
+    def __init__(self, cfg: dict, styles: dict, prefix: str = "Shinsa "):
+        self.cfg = cfg
+        self.prefix = prefix
+        self.expected = expected_roles(cfg, styles)
+        tolerances = cfg["tolerances"]
+        self.size_tol = tolerances["size_pt"]
+        self.line_tol = tolerances["line_spacing"]
+        self.margin_tol = tolerances["margin_mm"]
+        self.style_roles = {}  # styleId → 역할 (check_styles에서 채움)
+        self.style_values = {}  # 역할 → 기록된 스타일의 {size, font, line} (check_styles에서 채움)
+        self.violations = {}
+        self.counts = {"paragraphs": 0, "runs": 0, "styles": 0, "tables": 0}
+        self.roles = {}
+        self.elapsed = 0.0
+
+    def add(self, rule: str, expected, actual, role=None, paragraph=None) -> None:
+        key = (rule, role, repr(expected), repr(actual))
+        entry = self.violations.get(key)
+        if entry is None:
+            entry = self.violations[key] = {"rule": rule, "role": role, "expected": expected,
+                                            "actual": actual, "count": 0}
+            if paragraph is not None:
+                entry["first_paragraph"] = paragraph
+        entry["count"] += 1
+
+    # ===== 페이지 =====
+
+    def check_page(self, sectPr) -> None:
+        """sectPr의 pgSz/pgMar (mm로 비교, 크기는 0.5mm, 여백은 사양 허용 오차)"""
+        started = time.perf_counter()
+        page = self.cfg["page"]
+        size = sectPr.find(W + "pgSz") if sectPr is not None else None
+        margins = sectPr.find(W + "pgMar") if sectPr is not None else None
+
+        for axis, attr in (("width", "w"), ("height", "h")):
+            value = size.get(W + attr) if size is not None else None
+            actual = round(int(value) / TWIPS_PER_MM, 1) if value else None
+            expected = page[f"{axis}_mm"]
+            if actual is None or abs(actual - expected) > 0.5:
+                self.add(f"page_{axis}", expected, actual)
+
+        for side in PAGE_SIDES:
+            value = margins.get(W + side) if margins is not None else None
+            actual = round(int(value) / TWIPS_PER_MM, 1) if value else None
+            expected = page[f"margin_{side}_mm"]
+            if actual is None or abs(actual - expected) > self.margin_tol:
+                self.add(f"margin_{side}", expected, actual)
+        self.elapsed += time.perf_counter() - started
+
+    # ===== 스타일 =====
+
+    def check_styles(self, styles_root) -> None:
+        """역할 스타일 정의 (styles.xml 트리) — 직접 지정된 값만 보고 Normal 상속은 Normal에서 확인"""
+        started = time.perf_counter()
+        found = set()
+        for style in styles_root.iterchildren(W + "style"):
+            if style.get(W + "type") != "paragraph":
+                continue
+            name = style.find(W + "name")
+            name = name.get(VAL) if name is not None else ""
+            if name == "Normal":
+                role = None
+            elif name.startswith(self.prefix) and name[len(self.prefix):] in self.expected:
+                role = name[len(self.prefix):]
+            else:
+                continue
+            self.style_roles[style.get(W + "styleId")] = role
+            found.add(role)
+            self.counts["styles"] += 1
+            self._check_style(style, role)
+
+        for role in self.expected:
+            if role not in found:
+                self.add("style_missing", self.prefix + role if role else "Normal", None, role)
+        self._check_spec()
+        self.elapsed += time.perf_counter() - started
+
+    def _check_style(self, style, role) -> None:
+        expected = self.expected[role]
+        rPr = style.find(RPR)
+        pPr = style.find(PPR)
+        sz = rPr.find(SZ) if rPr is not None else None
+        size = _pt(sz.get(VAL)) if sz is not None else None
+        if size is None or abs(size - expected["size"]) > self.size_tol:
+            self.add("style_size", expected["size"], size, role)
+
+        fonts = rPr.find(RFONTS) if rPr is not None else None
+        for attr in FONT_ATTRS:
+            font = fonts.get(attr) if fonts is not None else None
+            if font != expected["font"]:
+                self.add("style_font", expected["font"], font, role)
+
+        bold = rPr is not None and rPr.find(B) is not None and rPr.find(B).get(VAL) not in ("0", "false")
+        if role is not None and bold != expected["bold"]:
+            self.add("style_bold", expected["bold"], bold, role)
+
+        spacing = pPr.find(SPACING) if pPr is not None else None
+        line = spacing.get(LINE) if spacing is not None else None
+        actual = int(line) / 240 if line else 1.0
+        if abs(actual - expected["line"]) > self.line_tol:
+            self.add("style_line", expected["line"], actual, role)
+
+        east_asia = fonts.get(FONT_ATTRS[0]) if fonts is not None else None
+        self.style_values[role] = {"size": size, "font": east_asia, "line": actual}
+
+    def _check_spec(self) -> None:
+        """기록된 역할 스타일이 프로필의 기준값을 따르는지 (없는 스타일은 style_missing으로 이미 보고)"""
+        fonts = self.cfg["fonts"]
+        for key, roles in SPEC_SIZES.items():
+            for role in roles:
+                size = self.style_values.get(role, {}).get("size", fonts[key])
+                if size is None or abs(size - fonts[key]) > self.size_tol:
+                    self.add("spec_size", fonts[key], size, role)
+        for role in SPEC_LINE_ROLES:
+            line = self.style_values.get(role, {}).get("line", self.cfg["line_spacing"])
+            if abs(line - self.cfg["line_spacing"]) > self.line_tol:
+                self.add("spec_line", self.cfg["line_spacing"], line, role)
+        for role in SPEC_KOREAN_ROLES:
+            font = self.style_values.get(role, {}).get("font", fonts["korean"])
+            if font != fonts["korean"]:
+                self.add("spec_font", fonts["korean"], font, role)
+
+    # ===== 문단 =====
+
+    def check_paragraphs(self, container) -> None:
+        """container(body·header)의 직계 <w:p>와 표 셀 문단마다 스타일과 직접 서식 확인"""
+        started = time.perf_counter()
+        for child in container.iterchildren(P, TBL):
+            if child.tag == TBL:
+                self.counts["tables"] += 1
+                for p in child.iter(P):
+                    self._check_paragraph(p)
+            else:
+                self._check_paragraph(child)
+        self.elapsed += time.perf_counter() - started
+
+    def _check_paragraph(self, p) -> None:
+        style_roles = self.style_roles
+        counts = self.counts
+        roles = self.roles
+        index = counts["paragraphs"]
+        counts["paragraphs"] += 1
+        pPr = p.find(PPR)
+        pStyle = pPr.find(PSTYLE) if pPr is not None else None
+        role = None
+        if pStyle is not None:
+            style_id = pStyle.get(VAL)
+            if style_id not in style_roles:
+                self.add("paragraph_style", "Shinsa 스타일", style_id, None, index)
+                return
+            role = style_roles[style_id]
+        roles[role] = roles.get(role, 0) + 1
+        expected = self.expected[role]
+
+        spacing = pPr.find(SPACING) if pPr is not None else None
+        if spacing is not None and spacing.get(LINE):
+            line = int(spacing.get(LINE)) / 240
+            if abs(line - expected["line"]) > self.line_tol:
+                self.add("paragraph_line", expected["line"], line, role, index)
+
+        for r in p.iterchildren(R):
+            counts["runs"] += 1
+            rPr = r.find(RPR)
+            if rPr is None:
+                continue
+            sz = rPr.find(SZ)
+            if sz is not None and rPr.find(VERT_ALIGN) is None:
+                size = _pt(sz.get(VAL))
+                if abs(size - expected["size"]) > self.size_tol:
+                    self.add("run_size", expected["size"], size, role, index)
+            fonts = rPr.find(RFONTS)
+            if fonts is not None:
+                for attr in FONT_ATTRS:
+                    font = fonts.get(attr)
+                    if font is not None and font != expected["font"]:
+                        self.add("run_font", expected["font"], font, role, index)
+
+    def check_blocks(self, blocks):
+        """블록 (role, runs, fmt) 스트림을 그대로 흘려보내며 확인 (스트리밍 백엔드용)"""
+        counts = self.counts
+        roles = self.roles
+        for block in blocks:
+            started = time.perf_counter()
+            role, runs, _ = block
+            if role == TABLE:
+                self._check_table(runs)
+                self.elapsed += time.perf_counter() - started
+                yield block
+                continue
+            index = counts["paragraphs"]
+            counts["paragraphs"] += 1
+            counts["runs"] += len(runs)
+            if role not in self.expected:
+                self.add("paragraph_style", "Shinsa 스타일", role, None, index)
+            else:
+                roles[role] = roles.get(role, 0) + 1
+                size = self.expected[role]["size"]
+                for _, props in runs:
+                    if props and "size" in props and not props.get("superscript") \
+                            and abs(props["size"] - size) > self.size_tol:
+                        self.add("run_size", size, props["size"], role, index)
+            self.elapsed += time.perf_counter() - started
+            yield block
+
+    def _check_table(self, table: dict) -> None:
+        """표 블록: 셀 문단을 머리글·셀 역할로 센다 (python-docx 백엔드의 셀 문단 검사와 같은 수)"""
+        counts = self.counts
+        roles = self.roles
+        counts["tables"] += 1
+        for role, rows in ((HEAD_ROLE, [table["header"]] if table["header"] else []),
+                           (CELL_ROLE, table["rows"])):
+            for row in rows:
+                counts["paragraphs"] += len(row)
+                counts["runs"] += sum(map(len, row))
+                roles[role] = roles.get(role, 0) + len(row)
+
+    def report(self) -> dict:
+        violations = sorted(self.violations.values(), key=lambda v: (v["rule"], v["role"] or ""))
+        return {
+            "passed": not violations,
+            "profile": self.cfg.get("name"),
+            "violations": violations,
+            "checked": {**self.counts,
+                        "roles": {role or "Normal": n for role, n in self.roles.items()}},
+            "elapsed_ms": round(self.elapsed * 1000, 2),
+        }
+
+
+def document_check(doc, cfg: dict, styles: dict, prefix: str = "Shinsa ") -> Conformance:
+    """본문을 뺀 나머지 (페이지·스타일·헤더) 검사를 마친 검사기"""
+    check = Conformance(cfg, styles, prefix)
+    check.check_page(doc.element.body.find(W + "sectPr"))
+    check.check_styles(doc.styles.element)
+    for section in doc.sections:
+        if not section.header.is_linked_to_previous:  # 없는 헤더를 만들지 않도록
+            check.check_paragraphs(section.header._element)
+    return check
+
+
+def verify_document(doc, cfg: dict, styles: dict, prefix: str = "Shinsa ") -> dict:
+    """python-docx 문서 (저장 전) 전체 검사"""
+    check = document_check(doc, cfg, styles, prefix)
+    check.check_paragraphs(doc.element.body)
+    return check.report()
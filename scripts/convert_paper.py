@@ -6,25 +6,10 @@
 import sys
 sys.stdout.reconfigure(encoding='utf-8')
 
-from docx import Document
-from docx.shared import Pt, Mm, Cm
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
 from pathlib import Path
 
-def set_korean_font(run, font_name="바탕", size_pt=10.3):
-    """한글 폰트 설정"""
-    run.font.name = font_name
-    run.font.size = Pt(size_pt)
-    r = run._element
-    rPr = r.get_or_add_rPr()
-    rFonts = rPr.get_or_add_rFonts()
-    rFonts.set(qn('w:eastAsia'), font_name)
-
-def add_paragraph_spacing(paragraph, line_spacing=1.6, space_after_pt=6):
-    """줄간격 및 문단 간격 설정"""
-    paragraph.paragraph_format.line_spacing = line_spacing
-    paragraph.paragraph_format.space_after = Pt(space_after_pt)
+from create_docx import create_shinsa_docx as build_docx
+from shinsa_spec import load_profile
 
 # 논문 데이터
 paper_data = {
@@ -203,191 +188,28 @@ references = [
     "Venkatesh, V., Morris, M. G., Davis, G. B., & Davis, F. D. (2003). User Acceptance of Information Technology: Toward a Unified View. MIS Quarterly, 27(3), 425-478.",
 ]
 
-def create_shinsa_docx():
-    """신학과사회 2025년 형식 DOCX 생성"""
-
-    doc = Document()
-
-    # ===== 페이지 설정 (신국판 152x225mm) =====
-    section = doc.sections[0]
-    section.page_width = Mm(152)
-    section.page_height = Mm(225)
-    section.top_margin = Mm(24)
-    section.bottom_margin = Mm(25)
-    section.left_margin = Mm(25)
-    section.right_margin = Mm(23)
-
-    # ===== 헤더 =====
-    header = section.header
-    header_para = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
-    header_run = header_para.add_run(f"「신학과 사회」 {paper_data['volume']}({paper_data['issue']}) {paper_data['year']}")
-    set_korean_font(header_run, "바탕", 8.1)
-
-    page_range = header.add_paragraph()
-    page_range_run = page_range.add_run(f"pp. {paper_data['start_page']} - {paper_data['end_page']}")
-    set_korean_font(page_range_run, "바탕", 8.1)
-    page_range.paragraph_format.space_after = Pt(15)
-
-    # ===== 제목 (14pt, 굵게, 가운데) =====
-    title_para = doc.add_paragraph()
-    title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title_para.add_run(paper_data["title"])
-    set_korean_font(title_run, "바탕", 14)
-    title_run.bold = True
-    title_para.paragraph_format.space_before = Pt(20)
-    title_para.paragraph_format.space_after = Pt(8)
-
-    # ===== 부제 (12.3pt) =====
-    if paper_data.get("subtitle"):
-        subtitle_para = doc.add_paragraph()
-        subtitle_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        subtitle_run = subtitle_para.add_run(paper_data["subtitle"])
-        set_korean_font(subtitle_run, "바탕", 12.3)
-        subtitle_para.paragraph_format.space_after = Pt(15)
-
-    # ===== 저자 (11pt, 띄어쓰기) =====
-    author_para = doc.add_paragraph()
-    author_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    author_spaced = " ".join(paper_data["author"])
-    author_run = author_para.add_run(author_spaced)
-    set_korean_font(author_run, "바탕", 11)
-    author_run.bold = True
-
-    # 저자 각주 기호
-    symbol_run = author_para.add_run("*")
-    symbol_run.font.superscript = True
-    set_korean_font(symbol_run, "바탕", 8)
-    author_para.paragraph_format.space_after = Pt(20)
-
-    # ===== 구분선 =====
-    doc.add_paragraph("─" * 35)
-
-    # ===== 국문초록 =====
-    abstract_title = doc.add_paragraph()
-    abstract_title_run = abstract_title.add_run("국문초록")
-    set_korean_font(abstract_title_run, "바탕", 9)
-    abstract_title_run.bold = True
-    abstract_title.paragraph_format.space_after = Pt(8)
-
-    abstract_para = doc.add_paragraph()
-    abstract_run = abstract_para.add_run(paper_data["abstract_kr"])
-    set_korean_font(abstract_run, "바탕", 8.5)
-    add_paragraph_spacing(abstract_para, 1.5, 8)
-    abstract_para.paragraph_format.left_indent = Mm(10)
-    abstract_para.paragraph_format.right_indent = Mm(10)
-
-    # 주제어
-    keywords_para = doc.add_paragraph()
-    keywords_label = keywords_para.add_run("주제어: ")
-    set_korean_font(keywords_label, "바탕", 8.5)
-    keywords_label.bold = True
-    keywords_run = keywords_para.add_run(", ".join(paper_data["keywords_kr"]))
-    set_korean_font(keywords_run, "바탕", 8.5)
-    keywords_para.paragraph_format.left_indent = Mm(10)
-
-    # ===== 구분선 =====
-    doc.add_paragraph("─" * 35)
-
-    # ===== 본문 =====
-    for sec in sections:
-        if sec["title"]:
-            sec_para = doc.add_paragraph()
-            sec_run = sec_para.add_run(f"{sec['number']} {sec['title']}")
-
-            if sec["level"] == 1:
-                set_korean_font(sec_run, "바탕", 13)
-                sec_run.bold = True
-                sec_para.paragraph_format.space_before = Pt(18)
-            elif sec["level"] == 2:
-                set_korean_font(sec_run, "바탕", 11)
-                sec_run.bold = True
-                sec_para.paragraph_format.space_before = Pt(12)
-
-            sec_para.paragraph_format.space_after = Pt(6)
-
-        if sec["content"]:
-            for para_text in sec["content"].split("\n\n"):
-                if para_text.strip():
-                    body_para = doc.add_paragraph()
-                    body_run = body_para.add_run(para_text.strip())
-                    set_korean_font(body_run, "바탕", 10.3)
-                    add_paragraph_spacing(body_para, 1.6, 6)
-                    body_para.paragraph_format.first_line_indent = Mm(5)
-
-    # ===== 구분선 =====
-    doc.add_paragraph("─" * 35)
-
-    # ===== 참고문헌 =====
-    ref_title = doc.add_paragraph()
-    ref_title_run = ref_title.add_run("참고문헌")
-    set_korean_font(ref_title_run, "바탕", 13)
-    ref_title_run.bold = True
-    ref_title.paragraph_format.space_before = Pt(18)
-    ref_title.paragraph_format.space_after = Pt(10)
-
-    for ref in references:
-        ref_para = doc.add_paragraph()
-        ref_run = ref_para.add_run(ref)
-        # 영문 참고문헌은 Times New Roman
-        if ref[0].isascii():
-            ref_run.font.name = "Times New Roman"
-            ref_run.font.size = Pt(10.3)
-        else:
-            set_korean_font(ref_run, "바탕", 10.3)
-        ref_para.paragraph_format.left_indent = Mm(5)
-        ref_para.paragraph_format.first_line_indent = Mm(-5)
-        ref_para.paragraph_format.space_after = Pt(3)
-
-    # ===== 구분선 =====
-    doc.add_paragraph("─" * 35)
-
-    # ===== 영문 초록 =====
-    abstract_en_title = doc.add_paragraph()
-    abstract_en_run = abstract_en_title.add_run("Abstract")
-    abstract_en_run.font.name = "Times New Roman"
-    abstract_en_run.font.size = Pt(9)
-    abstract_en_run.bold = True
-
-    abstract_en_para = doc.add_paragraph()
-    abstract_en_content = abstract_en_para.add_run(paper_data["abstract_en"])
-    abstract_en_content.font.name = "Times New Roman"
-    abstract_en_content.font.size = Pt(8.5)
-    add_paragraph_spacing(abstract_en_para, 1.5, 8)
-    abstract_en_para.paragraph_format.left_indent = Mm(10)
-    abstract_en_para.paragraph_format.right_indent = Mm(10)
-
-    # Keywords
-    keywords_en_para = doc.add_paragraph()
-    keywords_en_label = keywords_en_para.add_run("Keywords: ")
-    keywords_en_label.font.name = "Times New Roman"
-    keywords_en_label.font.size = Pt(8.5)
-    keywords_en_label.bold = True
-    keywords_en_content = keywords_en_para.add_run(", ".join(paper_data["keywords_en"]))
-    keywords_en_content.font.name = "Times New Roman"
-    keywords_en_content.font.size = Pt(8.5)
-    keywords_en_para.paragraph_format.left_indent = Mm(10)
-
-    # ===== 구분선 =====
-    doc.add_paragraph("─" * 35)
-
-    # ===== 저자 각주 =====
-    footnote_para = doc.add_paragraph()
-    footnote_run = footnote_para.add_run(f"* {paper_data['affiliation']}/ {paper_data['field']}")
-    set_korean_font(footnote_run, "바탕", 8.5)
-
-    # ===== 저장 =====
-    output_path = Path(r"C:\Users\sshin\OneDrive - Global Education Research Institutute\바탕 화면\GPTs_Leadership_신사형식_2025.docx")
-    doc.save(str(output_path))
-
-    print(f"✓ 신학과사회 2025년 형식 DOCX 생성 완료!")
-    print(f"  경로: {output_path}")
+DEFAULT_OUTPUT = Path(r"C:\Users\sshin\OneDrive - Global Education Research Institute\바탕 화면\GPTs_Leadership_신사형식_2025.docx")
+
+
+def create_shinsa_docx(output_path=DEFAULT_OUTPUT):
+    """신학과사회 2025년 형식 DOCX 생성 (create_docx.py 스타일 템플릿 사용)"""
+
+    data = {**paper_data, "sections": sections, "references": references}
+    result = build_docx(data, str(output_path))
+
+    # 적용된 형식은 생성기가 읽은 사양 프로필 그대로 출력
+    spec = load_profile(data.get("profile"))
+    page, fonts = spec["page"], spec["fonts"]
+    print(f"✓ 신학과사회 {spec['name']}년 형식 DOCX 생성 완료!")
+    print(f"  경로: {result['path']}")
     print(f"\n적용된 형식:")
-    print(f"  - 페이지: 신국판 (152x225mm)")
-    print(f"  - 마진: 상24/하25/좌25/우23mm")
-    print(f"  - 폰트: 바탕체")
-    print(f"  - 제목: 14pt, 부제: 12.3pt")
-    print(f"  - 본문: 10.3pt, 줄간격: 160%")
-    print(f"  - 초록: 8.5pt, 섹션제목: 13pt")
+    print(f"  - 페이지: {page['size']} ({page['width_mm']:g}x{page['height_mm']:g}mm)")
+    print(f"  - 마진: 상{page['margin_top_mm']:g}/하{page['margin_bottom_mm']:g}"
+          f"/좌{page['margin_left_mm']:g}/우{page['margin_right_mm']:g}mm")
+    print(f"  - 폰트: {fonts['korean']}")
+    print(f"  - 제목: {fonts['title_size']:g}pt, 부제: {fonts['subtitle_size']:g}pt")
+    print(f"  - 본문: {fonts['body_size']:g}pt, 줄간격: {spec['line_spacing']:.0%}")
+    print(f"  - 초록: {fonts['abstract_size']:g}pt, 섹션제목: {fonts['section_title_size']:g}pt")
 
 if __name__ == "__main__":
-    create_shinsa_docx()
+    create_shinsa_docx(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT)
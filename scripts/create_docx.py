@@ -4,20 +4,32 @@
 python-docx를 사용하여 정확한 형식의 Word 문서 생성
 """
 
+import hashlib
+import io
 import json
+import re
 import sys
 import os
-from datetime import datetime
+import time
 from pathlib import Path
 
+# 모듈 적재 시작 시각 (계측: 인터프리터 시작·python-docx import 시간)
+_MODULE_STARTED = time.perf_counter()
+
+if __name__ == "__main__" and sys.argv[1:2] in (["--version"], ["--check"]):
+    # 설치 점검은 python-docx가 없어도 되어야 하므로 docx import 전에 넘긴다
+    from shinsa_docx import main as entry_main
+
+    sys.exit(entry_main(sys.argv[1:]))
+
 try:
     from docx import Document
-    from docx.shared import Pt, Mm, Inches, Twips
-    from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_LINE_SPACING
+    from docx.shared import Pt, Mm, Emu
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
     from docx.enum.style import WD_STYLE_TYPE
-    from docx.enum.section import WD_ORIENT
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
+    from docx.oxml.ns import qn, nsdecls
+    from docx.oxml import OxmlElement, parse_xml
+    from lxml import etree
 except ImportError:
     print(json.dumps({
         "error": "python-docx not installed",
@@ -25,409 +37,1107 @@ except ImportError:
     }))
     sys.exit(1)
 
-
-# 2025년 신학과사회 형식 설정
-SHINSA_2025 = {
-    "page": {
-        "width_mm": 152,    # 신국판
-        "height_mm": 225,
-        "margin_top_mm": 24,
-        "margin_bottom_mm": 25,
-        "margin_left_mm": 25,
-        "margin_right_mm": 23,
-    },
-    "fonts": {
-        "korean": "바탕",
-        "english": "Times New Roman",
-        "title_size": 14,
-        "subtitle_size": 12.3,
-        "author_size": 11,
-        "body_size": 10.3,
-        "abstract_size": 8.5,
-        "abstract_title_size": 9,
-        "section_title_size": 13,
-        "footnote_size": 8.5,
-        "header_size": 8.1,
-    },
-    "line_spacing": 1.6,  # 160%
-    "journal_name": "신학과 사회",
+DOCX_IMPORT_S = time.perf_counter() - _MODULE_STARTED
+
+from footnotes import FOOTNOTES_PART, Footnotes, attach_footnotes_part
+from inline_markup import inline_runs, inline_text
+from local_cache import cache_dir
+from run_metrics import RunMetrics, append_metrics, process_age_s, profiled
+from section_cache import RENDER_VERSION, SectionCache, section_key
+from shinsa_spec import load_profile
+from stream_docx import save_reproducible, table_xml
+from tables import CELL_ROLE, HEAD_ROLE, TABLE, Tables
+
+# 2025년 신학과사회 형식 설정 (spec/shinsa_spec.json의 "2025" 프로필)
+SHINSA_2025 = load_profile("2025")
+
+
+def profile_for(data: dict) -> dict:
+    """입력의 profile(연도) 값에 맞는 형식 설정 (기본 2025)"""
+    name = data.get("profile")
+    if not name or str(name) == SHINSA_2025["name"]:
+        return SHINSA_2025
+    return load_profile(name)
+
+
+# ===== 문단 스타일 =====
+# 문단마다 rPr/pPr을 반복 기록하지 않고, 기본 템플릿에 스타일을 한 번 정의한 뒤
+# 각 문단에는 스타일 ID만 붙인다. (이름 → styleId: 공백 제거, 예: "Shinsa Body" → ShinsaBody)
+#
+# 역할: (글꼴 키, 크기 키 또는 pt, 굵게, 문단 서식)
+PARAGRAPH_STYLES = {
+    "Header":         ("korean",  "header_size",         False, {}),
+    "Title":          ("korean",  "title_size",          True,  {"align": "center", "before": 20, "after": 10}),
+    "Subtitle":       ("korean",  "subtitle_size",       False, {"align": "center", "after": 15}),
+    "Author":         ("korean",  "author_size",         True,  {"align": "center", "after": 20}),
+    "AbstractTitle":  ("korean",  "abstract_title_size", True,  {"after": 8}),
+    "AbstractKr":     ("korean",  "abstract_size",       False, {"line": 1.5, "after": 8, "left_mm": 10, "right_mm": 10}),
+    "KeywordsKr":     ("korean",  "abstract_size",       False, {"left_mm": 10}),
+    "Heading1":       ("korean",  "section_title_size",  True,  {"before": 18, "after": 6, "outline": 0}),
+    "Heading2":       ("korean",  11,                    True,  {"before": 12, "after": 6, "outline": 1}),
+    "Heading3":       ("korean",  "body_size",           False, {"before": 8, "after": 6, "outline": 2}),
+    "Body":           ("korean",  "body_size",           False, {"line": "line_spacing", "after": 6, "first_mm": 5}),
+    "ReferenceTitle": ("korean",  "section_title_size",  True,  {"before": 18, "after": 10, "outline": 0}),
+    "ReferenceGroup": ("korean",  "body_size",           True,  {}),
+    "Reference":      ("korean",  "body_size",           False, {"left_mm": 5, "first_mm": -5}),
+    "ReferenceEn":    ("english", "body_size",           False, {"left_mm": 5, "first_mm": -5}),
+    "AbstractTitleEn": ("english", "abstract_title_size", True, {}),
+    "AbstractEn":     ("english", "abstract_size",       False, {"line": 1.5, "after": 8, "left_mm": 10, "right_mm": 10}),
+    "KeywordsEn":     ("english", "abstract_size",       False, {"left_mm": 10}),
+    "Footnote":       ("korean",  "footnote_size",       False, {}),
+    "TableCaption":   ("korean",  "abstract_title_size", True,  {"align": "center", "before": 8, "after": 4}),
+    "TableHead":      ("korean",  "footnote_size",       True,  {"align": "center"}),
+    "TableCell":      ("korean",  "footnote_size",       False, {}),
+    "TableNote":      ("korean",  "footnote_size",       False, {"before": 3, "after": 8}),
 }
 
+STYLE_PREFIX = "Shinsa "
 
-def set_korean_font(run, font_name="바탕", size_pt=10.3):
-    """한글 폰트 설정"""
-    run.font.name = font_name
-    run.font.size = Pt(size_pt)
-    # 한글 폰트 설정 (eastAsia)
-    r = run._element
-    rPr = r.get_or_add_rPr()
-    rFonts = rPr.get_or_add_rFonts()
-    rFonts.set(qn('w:eastAsia'), font_name)
+ALIGNMENTS = {"center": WD_ALIGN_PARAGRAPH.CENTER}
 
+_template_cache = {}
 
-def add_paragraph_spacing(paragraph, line_spacing=1.6, space_after_pt=6):
-    """줄간격 및 문단 간격 설정"""
-    paragraph.paragraph_format.line_spacing = line_spacing
-    paragraph.paragraph_format.space_after = Pt(space_after_pt)
 
+def style_name(role: str) -> str:
+    """역할 → 스타일 이름"""
+    return STYLE_PREFIX + role
 
-def create_shinsa_docx(data: dict, output_path: str) -> dict:
-    """
-    신학과사회 형식 DOCX 생성
 
-    Args:
-        data: {
-            title, subtitle, author, affiliation, field, email, funding,
-            abstract_kr, keywords_kr, body, references,
-            abstract_en, keywords_en,
-            volume, issue, year, start_page, end_page
-        }
-        output_path: 저장 경로
+# 역할 → styleId (python-docx add_style 규칙: 이름에서 공백 제거)
+# 문단마다 doc.styles[이름]을 찾으면 styles 파트 전체를 훑으므로 ID를 바로 붙인다.
+STYLE_IDS = {role: style_name(role).replace(" ", "") for role in PARAGRAPH_STYLES}
+
+
+def set_style(paragraph, role: str) -> None:
+    """문단에 스타일 ID만 붙임 (스타일 이름 조회 없음)"""
+    paragraph._p.get_or_add_pPr().style = STYLE_IDS[role]
+
+
+def _set_style_font(style, font_name: str, size_pt: float, bold: bool) -> None:
+    style.font.name = font_name
+    style.font.size = Pt(size_pt)
+    if bold:
+        style.font.bold = True
+    style.element.get_or_add_rPr().get_or_add_rFonts().set(qn('w:eastAsia'), font_name)
 
-    Returns:
-        {success, path, message}
-    """
 
+def define_styles(doc, cfg: dict) -> None:
+    """SHINSA 설정으로 문단 스타일 정의"""
+    fonts = cfg["fonts"]
+    styles = doc.styles
+
+    # 구분선 등 스타일 없는 문단도 바탕체로
+    _set_style_font(styles["Normal"], fonts["korean"], fonts["body_size"], False)
+
+    for role, (font_key, size, bold, fmt) in PARAGRAPH_STYLES.items():
+        style = styles.add_style(style_name(role), WD_STYLE_TYPE.PARAGRAPH)
+        style.base_style = styles["Normal"]
+        style.quick_style = True
+        size_pt = fonts[size] if isinstance(size, str) else size
+        _set_style_font(style, fonts[font_key], size_pt, bold)
+
+        pf = style.paragraph_format
+        if "align" in fmt:
+            pf.alignment = ALIGNMENTS[fmt["align"]]
+        if "line" in fmt:
+            line = fmt["line"]
+            pf.line_spacing = cfg[line] if isinstance(line, str) else line
+        if "before" in fmt:
+            pf.space_before = Pt(fmt["before"])
+        if "after" in fmt:
+            pf.space_after = Pt(fmt["after"])
+        if "left_mm" in fmt:
+            pf.left_indent = Mm(fmt["left_mm"])
+        if "right_mm" in fmt:
+            pf.right_indent = Mm(fmt["right_mm"])
+        if "first_mm" in fmt:
+            pf.first_line_indent = Mm(fmt["first_mm"])
+        if "outline" in fmt:
+            outline = OxmlElement("w:outlineLvl")
+            outline.set(qn("w:val"), str(fmt["outline"]))
+            style.element.get_or_add_pPr().append(outline)
+
+
+def build_base_template(cfg: dict) -> bytes:
+    """페이지 설정 + 스타일이 적용된 빈 기본 문서 (docx 바이트)"""
     doc = Document()
-    cfg = SHINSA_2025
 
     # ===== 페이지 설정 (신국판) =====
+    page = cfg["units"]["page_emu"]
     section = doc.sections[0]
-    section.page_width = Mm(cfg["page"]["width_mm"])
-    section.page_height = Mm(cfg["page"]["height_mm"])
-    section.top_margin = Mm(cfg["page"]["margin_top_mm"])
-    section.bottom_margin = Mm(cfg["page"]["margin_bottom_mm"])
-    section.left_margin = Mm(cfg["page"]["margin_left_mm"])
-    section.right_margin = Mm(cfg["page"]["margin_right_mm"])
-
-    # ===== 헤더 설정 =====
-    volume = data.get("volume", 39)
-    issue = data.get("issue", 2)
-    year = data.get("year", 2025)
-    start_page = data.get("start_page", 1)
-    end_page = data.get("end_page", start_page + 20)
+    section.page_width = Emu(page["width"])
+    section.page_height = Emu(page["height"])
+    section.top_margin = Emu(page["margin_top"])
+    section.bottom_margin = Emu(page["margin_bottom"])
+    section.left_margin = Emu(page["margin_left"])
+    section.right_margin = Emu(page["margin_right"])
 
-    header = section.header
-    header_para = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
-    header_run = header_para.add_run(f"「{cfg['journal_name']}」 {volume}({issue}) {year}")
-    set_korean_font(header_run, cfg["fonts"]["korean"], cfg["fonts"]["header_size"])
+    define_styles(doc, cfg)
 
-    # 페이지 범위 (두 번째 줄)
-    page_range_para = header.add_paragraph()
-    page_range_run = page_range_para.add_run(f"pp. {start_page} - {end_page}")
-    set_korean_font(page_range_run, cfg["fonts"]["korean"], cfg["fonts"]["header_size"])
-    page_range_para.paragraph_format.space_after = Pt(12)
+    buffer = io.BytesIO()
+    save_reproducible(doc, buffer)
+    return buffer.getvalue()
+
+
+def template_key(cfg: dict) -> str:
+    """설정 + 스타일 정의 해시 (템플릿 캐시 키)"""
+    payload = json.dumps([cfg, PARAGRAPH_STYLES], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
 
-    # ===== 제목 (14pt, 가운데 정렬, 굵게) =====
-    title_para = doc.add_paragraph()
-    title_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    title_run = title_para.add_run(data.get("title", ""))
-    set_korean_font(title_run, cfg["fonts"]["korean"], cfg["fonts"]["title_size"])
-    title_run.bold = True
-    title_para.paragraph_format.space_before = Pt(20)
-    title_para.paragraph_format.space_after = Pt(10)
+
+def base_template_bytes(cfg: dict) -> bytes:
+    """기본 템플릿 바이트: 프로세스 메모리 → 디스크 캐시 → 새로 생성 순"""
+    key = template_key(cfg)
+    if key in _template_cache:
+        return _template_cache[key]
+
+    path = cache_dir() / f"template-{key}.docx"
+    try:
+        data = path.read_bytes()
+    except OSError:
+        data = build_base_template(cfg)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # 캐시 쓰기 실패는 무시 (읽기 전용 환경)
+
+    _template_cache[key] = data
+    return data
+
+
+def new_document(cfg: dict = SHINSA_2025):
+    """캐시된 기본 템플릿으로 새 문서 생성"""
+    return Document(io.BytesIO(base_template_bytes(cfg)))
+
+
+def add_styled(container, role: str, text: str = "", bold: bool = False):
+    """스타일 ID만 붙인 문단 추가 (run 서식 없음)"""
+    para = container.add_paragraph()
+    set_style(para, role)
+    if text:
+        run = para.add_run(text)
+        if bold:
+            run.bold = True
+    return para
+
+
+# ===== 문서 블록 =====
+# 문서 내용은 백엔드와 무관한 블록 (role, runs, fmt) 의 나열로 만든다.
+#   role: 역할 (PARAGRAPH_STYLES 키, None = Normal)
+#   runs: [(text, props)] — props: None 또는 {"bold", "italic", "superscript", "size"}
+#         본문·초록·참고문헌·각주 텍스트의 *기울임* **굵게** ^위첨자^ 표시는 inline_markup이 run으로 바꿈
+#         각주 참조는 (사용자 기호 또는 "", {"footnote": id})
+#   fmt:  None 또는 문단 단위 덮어쓰기 {"space_before", "space_after"} (pt)
+# 표는 (TABLE, 표 내용, None) 블록 1개 (tables.py) — 백엔드가 <w:tbl>을 한 번에 만든다.
+# python-docx 백엔드(add_block)와 스트리밍 백엔드(stream_docx.block_xml)가 같은 블록을 소비한다.
+
+DIVIDER = "─" * 40
+
+RECEIVED_DATE_LABEL = "접수일자"
+
+
+def para(role, *runs, **fmt) -> tuple:
+    """블록 생성: runs는 문자열 또는 (text, props)"""
+    return (role, [r if isinstance(r, tuple) else (r, None) for r in runs if r], fmt or None)
+
+
+BOLD = {"bold": True}
+
+
+def add_block(container, block: tuple):
+    """블록 → python-docx 문단 (표 블록은 표)"""
+    role, runs, fmt = block
+    if role == TABLE:
+        return add_table(container, runs)
+    paragraph = container.add_paragraph()
+    if role:
+        set_style(paragraph, role)
+    for text, props in runs:
+        if props and "footnote" in props:
+            add_footnote_reference(paragraph, props["footnote"], text)
+            continue
+        run = paragraph.add_run(text)
+        if props:
+            if props.get("bold"):
+                run.bold = True
+            if props.get("italic"):
+                run.italic = True
+            if props.get("superscript"):
+                run.font.superscript = True
+            if "size" in props:
+                run.font.size = Pt(props["size"])
+    if fmt:
+        if "space_before" in fmt:
+            paragraph.paragraph_format.space_before = Pt(fmt["space_before"])
+        if "space_after" in fmt:
+            paragraph.paragraph_format.space_after = Pt(fmt["space_after"])
+    return paragraph
+
+
+def add_table(doc, table: dict):
+    """표 블록 → 본문 끝의 <w:tbl> (XML 문자열을 한 번 파싱, table.cell 호출 없음)"""
+    from docx.table import Table
+
+    tbl = parse_xml(table_xml(table, STYLE_IDS, " " + nsdecls("w")))
+    doc.element.body._insert_tbl(tbl)
+    return Table(tbl, doc._body)
+
+
+def add_footnote_reference(paragraph, note_id: int, mark: str = "") -> None:
+    """각주 참조 run (stream_docx.footnote_reference_xml과 같은 XML)"""
+    run = paragraph.add_run()
+    run.font.superscript = True
+    ref = OxmlElement("w:footnoteReference")
+    if mark:
+        ref.set(qn("w:customMarkFollows"), "1")
+    ref.set(qn("w:id"), str(note_id))
+    run._r.append(ref)
+    if mark:
+        run._r.add_t(mark)
+
+
+def author_footnote_symbol(data: dict, cfg: dict = SHINSA_2025) -> str:
+    """저자 각주 기호 (프로필의 author_footnotes)
+
+    연구비(제목 각주)가 저자 기호와 같은 기호를 쓰면 저자는 두 번째(2025: * 다음 **),
+    제목 각주 기호가 다르면(2015: ❉, 2019: 반각 * / 전각 ＊) 첫 번째부터.
+    """
+    markers = cfg["markers"]
+    symbols = markers["author_footnotes"]
+    if data.get("funding") and markers["title_footnote"] == symbols[0] and len(symbols) > 1:
+        return symbols[1]
+    return symbols[0]
+
+
+def author_info(data: dict) -> str:
+    """저자 각주 내용: 소속/ 전공/ 이메일"""
+    parts = [data.get("affiliation", "")]
+    if data.get("field"):
+        parts.append(data["field"])
+    if data.get("email"):
+        parts.append(data["email"])
+    return "/ ".join(filter(None, parts))
+
+
+def front_blocks(data: dict, notes: Footnotes, cfg: dict = SHINSA_2025):
+    """제목 ~ 국문초록/주제어 (제목·저자 각주 등록, 기호·초록 제목은 프로필의 markers)"""
+    markers = cfg["markers"]
+
+    # ===== 제목 (14pt, 가운데 정렬, 굵게) + 연구비 각주 * =====
+    if data.get("funding"):
+        mark = markers["title_footnote"]
+        yield para("Title", data.get("title", ""),
+                   (mark, {"footnote": notes.add(data["funding"], mark)}))
+    else:
+        yield para("Title", data.get("title", ""))
 
     # 부제 (있는 경우)
     if data.get("subtitle"):
-        subtitle_para = doc.add_paragraph()
-        subtitle_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        subtitle_run = subtitle_para.add_run(data["subtitle"])
-        set_korean_font(subtitle_run, cfg["fonts"]["korean"], cfg["fonts"]["subtitle_size"])
-        subtitle_para.paragraph_format.space_after = Pt(15)
+        yield para("Subtitle", data["subtitle"])
 
     # ===== 저자 (11pt, 가운데, 띄어쓰기) =====
-    author_para = doc.add_paragraph()
-    author_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    # 저자명 띄어쓰기 (이민규 → 이 민 규)
+    # 저자명 띄어쓰기 (이민규 → 이 민 규) + 저자 각주 기호
     author_name = data.get("author", "")
     author_spaced = " ".join(author_name) if author_name else ""
-    author_run = author_para.add_run(author_spaced)
-    set_korean_font(author_run, cfg["fonts"]["korean"], cfg["fonts"]["author_size"])
-    author_run.bold = True
-
-    # 저자 각주 기호
-    footnote_symbol = "**" if data.get("funding") else "*"
-    symbol_run = author_para.add_run(footnote_symbol)
-    symbol_run.font.superscript = True
-    set_korean_font(symbol_run, cfg["fonts"]["korean"], 8)
-
-    author_para.paragraph_format.space_after = Pt(20)
+    symbol = author_footnote_symbol(data, cfg)
+    yield para("Author", author_spaced,
+               (symbol, {"footnote": notes.add(author_info(data), symbol)}))
 
     # ===== 구분선 =====
-    doc.add_paragraph("─" * 40)
+    yield para(None, DIVIDER)
 
     # ===== 국문초록 (붙여쓰기) =====
-    abstract_title_para = doc.add_paragraph()
-    abstract_title_run = abstract_title_para.add_run("국문초록")
-    set_korean_font(abstract_title_run, cfg["fonts"]["korean"], cfg["fonts"]["abstract_title_size"])
-    abstract_title_run.bold = True
-    abstract_title_para.paragraph_format.space_after = Pt(8)
+    yield para("AbstractTitle", markers["abstract_kr_title"])
 
     # 초록 본문 (8.5pt)
-    abstract_para = doc.add_paragraph()
-    abstract_run = abstract_para.add_run(data.get("abstract_kr", "[초록 작성 필요]"))
-    set_korean_font(abstract_run, cfg["fonts"]["korean"], cfg["fonts"]["abstract_size"])
-    add_paragraph_spacing(abstract_para, 1.5, 8)
-    abstract_para.paragraph_format.left_indent = Mm(10)
-    abstract_para.paragraph_format.right_indent = Mm(10)
+    yield para("AbstractKr", *inline_text(data.get("abstract_kr", "[초록 작성 필요]")))
 
     # 주제어
-    keywords_para = doc.add_paragraph()
-    keywords_label = keywords_para.add_run("주제어: ")
-    set_korean_font(keywords_label, cfg["fonts"]["korean"], cfg["fonts"]["abstract_size"])
-    keywords_label.bold = True
-
     keywords_kr = data.get("keywords_kr", [])
-    keywords_text = ", ".join(keywords_kr) if keywords_kr else "[주제어 5개]"
-    keywords_run = keywords_para.add_run(keywords_text)
-    set_korean_font(keywords_run, cfg["fonts"]["korean"], cfg["fonts"]["abstract_size"])
-    keywords_para.paragraph_format.left_indent = Mm(10)
+    yield para("KeywordsKr", ("주제어: ", BOLD),
+               ", ".join(keywords_kr) if keywords_kr else "[주제어 5개]")
 
     # ===== 구분선 =====
-    doc.add_paragraph("─" * 40)
-
-    # ===== 본문 =====
-    body_text = data.get("body", "")
-    sections = parse_body_sections(body_text)
-
-    for sec in sections:
-        # 섹션 제목
-        if sec["title"]:
-            sec_para = doc.add_paragraph()
-            sec_run = sec_para.add_run(f"{sec['number']} {sec['title']}")
-
-            if sec["level"] == 1:
-                # 장 제목 (Ⅰ. 서론) - 13pt
-                set_korean_font(sec_run, cfg["fonts"]["korean"], cfg["fonts"]["section_title_size"])
-                sec_run.bold = True
-                sec_para.paragraph_format.space_before = Pt(18)
-            elif sec["level"] == 2:
-                # 절 제목 (1. 절제목) - 11pt
-                set_korean_font(sec_run, cfg["fonts"]["korean"], 11)
-                sec_run.bold = True
-                sec_para.paragraph_format.space_before = Pt(12)
+    yield para(None, DIVIDER)
+
+
+def section_blocks(sec: dict, notes: Footnotes, tables: Tables = None):
+    """본문 섹션 1개 (제목 + 본문 문단, 본문 각주 표시 → 각주 참조, [표 n] 문단 → 표)"""
+    # 섹션 제목: 장(Ⅰ. 서론) 13pt / 절(1. 절제목) 11pt / 항(1) 소제목) 10.3pt
+    if sec["title"]:
+        level = min(max(sec["level"], 1), 3)
+        yield para(f"Heading{level}", f"{sec['number']} {sec['title']}")
+
+    # 본문 내용
+    if sec["content"]:
+        for para_text in sec["content"].split("\n\n"):
+            para_text = para_text.strip()
+            if not para_text:
+                continue
+            placed = tables.place(para_text) if tables and para_text[0] == "[" else None
+            if placed:
+                yield from placed
             else:
-                # 항 제목 (1) 소제목) - 10.3pt
-                set_korean_font(sec_run, cfg["fonts"]["korean"], cfg["fonts"]["body_size"])
-                sec_para.paragraph_format.space_before = Pt(8)
-
-            sec_para.paragraph_format.space_after = Pt(6)
-
-        # 본문 내용
-        if sec["content"]:
-            for para_text in sec["content"].split("\n\n"):
-                if para_text.strip():
-                    body_para = doc.add_paragraph()
-                    body_run = body_para.add_run(para_text.strip())
-                    set_korean_font(body_run, cfg["fonts"]["korean"], cfg["fonts"]["body_size"])
-                    add_paragraph_spacing(body_para, cfg["line_spacing"], 6)
-                    body_para.paragraph_format.first_line_indent = Mm(5)
+                yield ("Body", inline_runs(notes.split_runs(para_text)), None)
+
 
+def back_blocks(data: dict, cfg: dict = SHINSA_2025):
+    """참고문헌 ~ 영문초록 (+ 접수일자·논문확정일자)"""
     # ===== 구분선 =====
-    doc.add_paragraph("─" * 40)
+    yield para(None, DIVIDER)
 
     # ===== 참고문헌 =====
-    ref_title = doc.add_paragraph()
-    ref_title_run = ref_title.add_run("참고문헌")
-    set_korean_font(ref_title_run, cfg["fonts"]["korean"], cfg["fonts"]["section_title_size"])
-    ref_title_run.bold = True
-    ref_title.paragraph_format.space_before = Pt(18)
-    ref_title.paragraph_format.space_after = Pt(10)
+    yield para("ReferenceTitle", "참고문헌")
 
-    references = data.get("references", [])
+    # 국문/외국어 분류 + 가나다/ABC 정렬 (normalize_references: 참고문헌 형식으로 정규화)
+    # references는 모듈 적재 시 정규식 수십 개를 컴파일하므로 쓸 때 import
+    from references import group_references
 
-    # 국문/외국어 분류
-    korean_refs = [r for r in references if r and r[0] >= '가' and r[0] <= '힣']
-    foreign_refs = [r for r in references if r and not (r[0] >= '가' and r[0] <= '힣')]
+    korean_refs, foreign_refs = group_references(
+        data.get("references", []), normalize=data.get("normalize_references", False))
 
     if korean_refs:
-        kr_header = doc.add_paragraph()
-        kr_header_run = kr_header.add_run("<국문 자료>")
-        set_korean_font(kr_header_run, cfg["fonts"]["korean"], cfg["fonts"]["body_size"])
-        kr_header_run.bold = True
-
+        yield para("ReferenceGroup", "<국문 자료>")
         for ref in korean_refs:
-            ref_para = doc.add_paragraph()
-            ref_run = ref_para.add_run(ref)
-            set_korean_font(ref_run, cfg["fonts"]["korean"], cfg["fonts"]["body_size"])
-            ref_para.paragraph_format.left_indent = Mm(5)
-            ref_para.paragraph_format.first_line_indent = Mm(-5)
+            yield para("Reference", *inline_text(ref))
 
     if foreign_refs:
-        en_header = doc.add_paragraph()
-        en_header_run = en_header.add_run("<외국어 자료>")
-        set_korean_font(en_header_run, cfg["fonts"]["korean"], cfg["fonts"]["body_size"])
-        en_header_run.bold = True
-        en_header.paragraph_format.space_before = Pt(10)
-
+        yield para("ReferenceGroup", "<외국어 자료>", space_before=10)
         for ref in foreign_refs:
-            ref_para = doc.add_paragraph()
-            ref_run = ref_para.add_run(ref)
-            set_korean_font(ref_run, cfg["fonts"]["english"], cfg["fonts"]["body_size"])
-            ref_para.paragraph_format.left_indent = Mm(5)
-            ref_para.paragraph_format.first_line_indent = Mm(-5)
+            yield para("ReferenceEn", *inline_text(ref))
 
     # ===== 구분선 =====
-    doc.add_paragraph("─" * 40)
+    yield para(None, DIVIDER)
 
     # ===== 영문 초록 =====
-    abstract_en_title = doc.add_paragraph()
-    abstract_en_title_run = abstract_en_title.add_run("Abstract")
-    set_korean_font(abstract_en_title_run, cfg["fonts"]["english"], cfg["fonts"]["abstract_title_size"])
-    abstract_en_title_run.bold = True
-
-    abstract_en_para = doc.add_paragraph()
-    abstract_en_run = abstract_en_para.add_run(data.get("abstract_en", "[Abstract required]"))
-    set_korean_font(abstract_en_run, cfg["fonts"]["english"], cfg["fonts"]["abstract_size"])
-    add_paragraph_spacing(abstract_en_para, 1.5, 8)
-    abstract_en_para.paragraph_format.left_indent = Mm(10)
-    abstract_en_para.paragraph_format.right_indent = Mm(10)
+    yield para("AbstractTitleEn", "Abstract")
+    yield para("AbstractEn", *inline_text(data.get("abstract_en", "[Abstract required]")))
 
     # Keywords
-    keywords_en_para = doc.add_paragraph()
-    keywords_en_label = keywords_en_para.add_run("Keywords: ")
-    set_korean_font(keywords_en_label, cfg["fonts"]["english"], cfg["fonts"]["abstract_size"])
-    keywords_en_label.bold = True
-
     keywords_en = data.get("keywords_en", [])
-    keywords_en_text = ", ".join(keywords_en) if keywords_en else "[5 keywords]"
-    keywords_en_run = keywords_en_para.add_run(keywords_en_text)
-    set_korean_font(keywords_en_run, cfg["fonts"]["english"], cfg["fonts"]["abstract_size"])
-    keywords_en_para.paragraph_format.left_indent = Mm(10)
+    yield para("KeywordsEn", ("Keywords: ", BOLD),
+               ", ".join(keywords_en) if keywords_en else "[5 keywords]")
+
+    # 접수일자 / 논문확정일자 (라벨은 프로필의 markers — 2011년 이전 게재확정일자)
+    dates = []
+    if data.get("received_date"):
+        dates.append((RECEIVED_DATE_LABEL, data["received_date"]))
+    if data.get("accepted_date"):
+        dates.append((cfg["markers"]["accepted_date_label"], data["accepted_date"]))
+    if dates:
+        runs = []
+        for label, date in dates:
+            if runs:
+                runs.append((" / ", None))
+            runs += [(f"{label}: ", BOLD), (str(date), None)]
+        yield ("KeywordsKr", runs, {"space_before": 12})
+
+
+def body_sections(data: dict):
+    """본문 섹션 (미리 구조화된 sections 우선, 없으면 body 파싱)"""
+    return data.get("sections") or iter_body_sections(data.get("body", ""))
+
+
+def setup_header(doc, data: dict, cfg: dict) -> None:
+    """첫 페이지 헤더: 저널 정보 + 페이지 범위"""
+    volume = data.get("volume", 39)
+    issue = data.get("issue", 2)
+    year = data.get("year", 2025)
+    start_page = data.get("start_page", 1)
+    end_page = data.get("end_page", start_page)
 
-    # ===== 저자 각주 =====
-    doc.add_paragraph("─" * 40)
+    header = doc.sections[0].header
+    header_para = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
+    header_para.style = doc.styles[style_name("Header")]
+    header_para.add_run(f"「{cfg['journal_name']}」 {volume}({issue}) {year}")
 
-    footnote_para = doc.add_paragraph()
+    # 페이지 범위 (두 번째 줄)
+    page_range_para = add_styled(header, "Header", f"pp. {start_page} - {end_page}")
+    page_range_para.paragraph_format.space_after = Pt(12)
 
-    # 연구비 지원 (있는 경우)
-    if data.get("funding"):
-        funding_run = footnote_para.add_run(f"* {data['funding']}\n")
-        set_korean_font(funding_run, cfg["fonts"]["korean"], cfg["fonts"]["footnote_size"])
 
-    # 저자 정보
-    author_info_parts = [data.get("affiliation", "")]
-    if data.get("field"):
-        author_info_parts.append(data["field"])
-    if data.get("email"):
-        author_info_parts.append(data["email"])
+# ===== 본문 섹션 렌더링 (섹션 캐시) =====
+
+_section_cache = None
+
+
+def default_section_cache():
+    """프로세스 공용 섹션 캐시
+
+    SHINSA_SECTION_CACHE=0 이면 사용 안 함, =disk 이면 <cache_dir>/sections 에도 저장
+    (기본: 메모리 캐시 — 워커 모드에서 같은 섹션 재생성을 건너뜀)
+    """
+    global _section_cache
+    mode = os.environ.get("SHINSA_SECTION_CACHE", "memory")
+    if mode == "0":
+        return None
+    if _section_cache is None:
+        directory = cache_dir() / "sections" if mode == "disk" else None
+        _section_cache = SectionCache(directory)
+    return _section_cache
+
+
+def render_section(doc, sec: dict, notes: Footnotes, tables: Tables = None) -> list:
+    """섹션 1개 렌더링, 추가된 문단·표 목록 반환"""
+    return [add_block(doc, block) for block in section_blocks(sec, notes, tables)]
+
+
+def splice_fragment(body, xml: str) -> None:
+    """캐시된 <w:p>·<w:tbl> 조각들을 본문 끝(sectPr 앞)에 삽입"""
+    fragment = parse_xml(f'<w:body {nsdecls("w")}>{xml}</w:body>')
+    sectPr = body.find(qn("w:sectPr"))
+    for element in list(fragment):
+        if sectPr is not None:
+            sectPr.addprevious(element)
+        else:
+            body.append(element)
+
 
-    author_info = "/ ".join(filter(None, author_info_parts))
-    author_footnote_run = footnote_para.add_run(f"{footnote_symbol} {author_info}")
-    set_korean_font(author_footnote_run, cfg["fonts"]["korean"], cfg["fonts"]["footnote_size"])
+def render_sections(doc, sections, cfg: dict, notes: Footnotes, cache=None,
+                    tables: Tables = None) -> dict:
+    """본문 섹션 렌더링: 캐시에 있는 섹션은 XML 조각을 그대로 이어 붙임
+
+    조각에는 각주 id가 들어 있으므로 캐시 키에 첫 각주 id와 인식된 각주 표시를 포함하고,
+    재사용할 때도 각주 내용은 같은 순서로 등록한다. 섹션에 배치되는 표는 그 내용도 키에 넣는다.
+    """
+    rendered = reused = 0
+
+    if cache is None:
+        for sec in sections:
+            render_section(doc, sec, notes, tables)
+            rendered += 1
+        return {"rendered": rendered, "reused": reused}
+
+    profile_key = template_key(cfg)
+    body = doc.element.body
+    for sec in sections:
+        labels = notes.labels(sec["content"]) if notes.notes else []
+        extra = [notes.next_id, labels] if labels else None
+        placed = tables.labels(sec["content"]) if tables and tables.tables else []
+        if placed:
+            extra = [extra, tables.key(placed)]
+        key = section_key(sec, profile_key, extra)
+        xml = cache.get(key)
+        if xml is None:
+            paras = render_section(doc, sec, notes, tables)
+            cache.put(key, "".join(etree.tostring(p._element, encoding="unicode") for p in paras))
+            rendered += 1
+        else:
+            splice_fragment(body, xml)
+            notes.register(labels)
+            if placed:
+                tables.register(placed)
+            reused += 1
+
+    return {"rendered": rendered, "reused": reused}
+
+
+# ===== 생성 =====
+
+BACKENDS = ("docx", "stream")
+
+
+_first_run = True
+
+
+def create_shinsa_docx(data: dict, output_path: str, section_cache=False, backend=None,
+                       metrics_file=None, profile_dir=None, verify=None, output_cache=False) -> dict:
+    """
+    신학과사회 형식 DOCX 생성
+
+    Args:
+        data: {
+            title, subtitle, author, affiliation, field, email, funding,
+            abstract_kr, keywords_kr, body, references,
+            abstract_en, keywords_en,
+            volume, issue, year, start_page, end_page (없으면 쪽수 추정으로 계산),
+            profile (선택: spec 연도 프로필, 기본 "2025" — 각주 기호·초록 제목·날짜 라벨이 프로필을 따름),
+            received_date, accepted_date (선택: 영문 키워드 아래 접수일자·논문확정일자 줄),
+            sections (선택: 미리 구조화된 [{level, number, title, content}], body 대신 사용),
+            normalize_references (선택: True면 참고문헌을 학회 형식으로 정규화, 기본은 정렬만),
+            footnotes (선택: 본문 각주 ["내용", ...] 또는 [{number, content}] —
+                       본문의 [^n] / n) 표시가 Word 각주가 됨),
+            tables (선택: 표 [{caption, columns, rows, note?, widths?}] — 본문의 [표 n] 문단 자리,
+                    표시가 없으면 본문 끝에 배치),
+            backend (선택: "docx" 기본 / "stream" 대용량 문서용),
+            verify (선택: 저장 전 형식 검사, verify 인자와 같은 값)
+        }
+        output_path: 저장 경로
+        section_cache: 섹션 캐시 (False: 프로세스 기본 캐시, None: 사용 안 함)
+        backend: 출력 백엔드 (None이면 data["backend"], 기본 "docx")
+            - docx:   python-docx 문서 트리를 만든 뒤 저장
+            - stream: document.xml을 문단 단위로 zip에 바로 기록 (메모리 일정)
+        metrics_file: 지표 JSON Lines 파일 (None이면 SHINSA_METRICS_FILE)
+        profile_dir: cProfile .pstats 저장 폴더 (None이면 SHINSA_PROFILE_DIR)
+        verify: 저장 전 메모리의 문서 트리를 사양 프로필과 비교 (conformance.py)
+            None이면 data["verify"], 그것도 없으면 SHINSA_VERIFY=1 | strict
+            - True:     위반 목록을 결과의 verify에 담고 저장
+            - "strict": 위반이 있으면 저장하지 않고 ValueError
+        output_cache: 생성 결과 캐시 (output_cache.OutputCache, False: SHINSA_OUTPUT_CACHE 설정, None: 사용 안 함)
+            같은 입력·조건이면 캐시된 DOCX를 복사하고 저장된 결과를 돌려준다 (출력은 바이트 단위로 재현됨)
+
+    Returns:
+        {success, path, message, backend, sections: {rendered, reused}, footnotes: 각주 수, tables: 표 수,
+         pages: {start, end, estimated},
+         verify?: {passed, profile, violations: [{rule, role, expected, actual, count, first_paragraph?}],
+                   checked: {paragraphs, runs, styles, roles}, elapsed_ms},
+         cache?: {hit, key} (출력 캐시 사용 시),
+         metrics: {total_ms, phases_ms, counts: {paragraphs, runs, elements}, peak_rss_mb, profile?}}
+    """
+    global _first_run
+
+    metrics_file = metrics_file or os.environ.get("SHINSA_METRICS_FILE")
+    profile_dir = profile_dir or os.environ.get("SHINSA_PROFILE_DIR")
+
+    metrics = RunMetrics()
+    if _first_run:
+        # 단발 실행(CLI)에서만 의미 있는 단계: 프로세스 시작 ~ 이 모듈 적재, python-docx import
+        _first_run = False
+        age = process_age_s()
+        if age is not None:
+            metrics.add("startup", max(0.0, age - (time.perf_counter() - _MODULE_STARTED)))
+        metrics.add("import", DOCX_IMPORT_S)
+
+    if output_cache is False:
+        output_cache = default_output_cache()
+
+    with profiled(profile_dir) as profile:
+        if output_cache is None:
+            result = build_document(data, output_path, section_cache, backend, metrics, verify)
+        else:
+            result = cached_document(data, output_path, section_cache, backend, metrics, verify,
+                                     output_cache)
+
+    result["metrics"] = metrics.summary()
+    if "path" in profile:
+        result["metrics"]["profile"] = profile["path"]
+    if metrics_file:
+        append_metrics(metrics_file, {
+            "ts": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "pid": os.getpid(),
+            "path": result["path"],
+            "backend": result["backend"],
+            "sections": result["sections"],
+            "footnotes": result["footnotes"],
+            **result["metrics"],
+        })
+    return result
+
+
+_output_cache = None
+
+
+def default_output_cache():
+    """프로세스 공용 출력 캐시 (SHINSA_OUTPUT_CACHE=1 또는 폴더 경로일 때, 기본은 사용 안 함)"""
+    global _output_cache
+    if os.environ.get("SHINSA_OUTPUT_CACHE", "0") in ("", "0"):
+        return None
+    if _output_cache is None:
+        from output_cache import cache_from_env
+
+        _output_cache = cache_from_env()
+    return _output_cache
+
+
+def cached_document(data: dict, output_path, section_cache, backend, metrics: RunMetrics, verify,
+                    cache) -> dict:
+    """출력 캐시를 거치는 build_document (키: 입력 + 사양·스타일 해시 + 렌더러 버전 + 백엔드·검사 모드)"""
+    from output_cache import output_key
+
+    with metrics.phase("cache"):
+        cfg = profile_for(data)
+        key = output_key(data, cfg["spec_version"], template_key(cfg), RENDER_VERSION,
+                         backend or data.get("backend") or "docx", verify_mode(data, verify))
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        result = cache.get(key, output_path)
+    if result is not None:
+        result.update(path=str(output_path.absolute()), message=done_message(output_path, cfg),
+                      cache={"hit": True, "key": key[:16]})
+        return result
+
+    result = build_document(data, output_path, section_cache, backend, metrics, verify)
+    with metrics.phase("cache_store"):
+        cache.put(key, output_path, {k: v for k, v in result.items() if k not in ("path", "message")})
+    result["cache"] = {"hit": False, "key": key[:16]}
+    return result
+
+
+def done_message(output_path: Path, cfg: dict = SHINSA_2025) -> str:
+    """완료 메시지 (연도 프로필은 "2011년 형식", 파생 프로필은 "corpus-2019 프로필 형식")"""
+    name = cfg["name"]
+    label = f"{name}년" if name.isdigit() else f"{name} 프로필"
+    return f"신학과사회 {label} 형식 DOCX 생성 완료: {output_path.name}"
+
+
+def verify_mode(data: dict, verify=None):
+    """검사 모드: False / True / "strict" (인자 → data["verify"] → SHINSA_VERIFY)"""
+    if verify is None:
+        verify = data.get("verify")
+    if verify is None:
+        verify = os.environ.get("SHINSA_VERIFY", "0")
+    if isinstance(verify, str):
+        verify = verify.strip().lower()
+        return "strict" if verify == "strict" else verify not in ("", "0", "false", "no", "off")
+    return bool(verify)
+
+
+def check_conformance(report: dict, mode) -> None:
+    """strict 모드에서 위반이 있으면 저장 전에 중단"""
+    if mode == "strict" and not report["passed"]:
+        rules = ", ".join(sorted({v["rule"] for v in report["violations"]}))
+        raise ValueError(f"Conformance check failed ({len(report['violations'])} violations: {rules})")
+
+
+def build_document(data: dict, output_path, section_cache, backend, metrics: RunMetrics,
+                   verify=None) -> dict:
+    """create_shinsa_docx 본체 — 단계마다 metrics.phase로 시간 측정"""
+    with metrics.phase("profile"):
+        cfg = profile_for(data)
+    with metrics.phase("paginate"):
+        data, estimate = with_page_range(data)
+    backend = backend or data.get("backend") or "docx"
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend} (available: {', '.join(BACKENDS)})")
+    verify = verify_mode(data, verify)
+    report = None
 
-    # ===== 저장 =====
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(str(output_path))
 
-    return {
+    with metrics.phase("template"):
+        doc = new_document(cfg)
+    with metrics.phase("header"):
+        setup_header(doc, data, cfg)
+
+    # 제목·저자·본문 각주는 문서 순서대로 모았다가 footnotes.xml로 한 번에 기록
+    notes = Footnotes(data.get("footnotes"))
+    tables = Tables(data.get("tables"), cfg)
+    footnote_style = STYLE_IDS["Footnote"]
+
+    def footnotes_xml() -> bytes:
+        return notes.part_xml(footnote_style).encode("utf-8")
+
+    if backend == "stream":
+        from stream_docx import write_streaming_docx
+
+        section_stats = {"rendered": 0, "reused": 0}
+        attach_footnotes_part(doc)  # 자리만 잡고 내용은 본문을 다 쓴 뒤 기록
+        blocks = stream_blocks(data, notes, section_stats, tables, cfg)
+        target = output_path
+        if verify:
+            # 본문은 트리에 남지 않으므로 블록이 지나갈 때 확인
+            from conformance import document_check
+
+            with metrics.phase("verify"):
+                check = document_check(doc, cfg, PARAGRAPH_STYLES, STYLE_PREFIX)
+            blocks = check.check_blocks(blocks)
+            if verify == "strict":
+                # 결과는 다 쓴 뒤에야 나오므로 같은 폴더의 임시 파일에 쓰고, 통과하면 바꿔 넣는다
+                target = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+        try:
+            # 블록 생성·XML 변환·압축·저장이 문단 단위로 섞여 있어 한 단계로 잰다
+            with metrics.phase("stream_write"):
+                written = write_streaming_docx(doc, blocks, target, STYLE_IDS,
+                                               deferred={FOOTNOTES_PART: footnotes_xml})
+            metrics.counts.update(written)
+            if verify:
+                report = check.report()
+                check_conformance(report, verify)
+        except BaseException:
+            if target != output_path:
+                target.unlink(missing_ok=True)
+            raise
+        if target != output_path:
+            os.replace(target, output_path)
+    else:
+        with metrics.phase("front"):
+            for block in front_blocks(data, notes, cfg):
+                add_block(doc, block)
+
+        # ===== 본문 =====
+        with metrics.phase("body"):
+            if section_cache is False:
+                section_cache = default_section_cache()
+            section_stats = render_sections(doc, body_sections(data), cfg, notes, section_cache,
+                                            tables)
+            for block in tables.rest():
+                add_block(doc, block)
+
+        with metrics.phase("references"):
+            for block in back_blocks(data, cfg):
+                add_block(doc, block)
+
+        # ===== 저장 =====
+        with metrics.phase("footnotes"):
+            attach_footnotes_part(doc, footnotes_xml())
+        if verify:
+            from conformance import verify_document
+
+            with metrics.phase("verify"):
+                report = verify_document(doc, cfg, PARAGRAPH_STYLES, STYLE_PREFIX)
+            check_conformance(report, verify)
+        with metrics.phase("save"):
+            save_reproducible(doc, str(output_path))
+        with metrics.phase("count"):
+            metrics.count_body(doc.element.body)
+
+    result = {
         "success": True,
         "path": str(output_path.absolute()),
-        "message": f"신학과사회 2025년 형식 DOCX 생성 완료: {output_path.name}"
+        "message": done_message(output_path, cfg),
+        "backend": backend,
+        "sections": section_stats,
+        "footnotes": len(notes.entries),
+        "tables": len(tables.placed),
+        "pages": {"start": data.get("start_page", 1), "end": data["end_page"],
+                  "estimated": estimate is not None},
     }
+    if report is not None:
+        result["verify"] = report
+    return result
+
+
+def stream_blocks(data: dict, notes: Footnotes, stats: dict, tables: Tables = None,
+                  cfg: dict = SHINSA_2025):
+    """스트리밍 백엔드용 전체 블록 (본문 섹션은 하나씩 파싱하며 생성)"""
+    yield from front_blocks(data, notes, cfg)
+    for sec in body_sections(data):
+        yield from section_blocks(sec, notes, tables)
+        stats["rendered"] += 1
+    if tables:
+        yield from tables.rest()
+    yield from back_blocks(data, cfg)
+
+
+def estimate_paper_pages(data: dict) -> dict:
+    """쪽수 추정 (문서를 만들지 않고 블록만 생성해 page_estimate로 배치)"""
+    from page_estimate import estimate_pages
+
+    cfg = profile_for(data)
+    notes = Footnotes(data.get("footnotes"))
+    blocks = stream_blocks(data, notes, {"rendered": 0}, Tables(data.get("tables"), cfg), cfg)
+    return estimate_pages(blocks, notes, cfg, PARAGRAPH_STYLES)
+
+
+def with_page_range(data: dict) -> tuple:
+    """end_page가 없으면 쪽수 추정으로 채운 사본과 추정 결과 (있으면 data 그대로, None)"""
+    if data.get("end_page"):
+        return data, None
+    estimate = estimate_paper_pages(data)
+    start_page = data.get("start_page", 1)
+    return {**data, "start_page": start_page, "end_page": start_page + estimate["pages"] - 1}, estimate
+
+
+# ===== 본문 섹션 파싱 =====
+# 줄마다 정규식 6개를 돌리지 않고, 첫 글자로 제목 후보만 골라
+# 미리 컴파일한 정규식 하나로 분류한다.
+
+HEADING_RE = re.compile(r"""
+    ^(?:
+        \#\#\#\s+(?P<h3>.+)                                        # ### 항
+      | \#\#\s+(?P<h2>.+)                                          # ## 절
+      | \#\s+(?P<h1>.+)                                            # # 장
+      | (?:(?=[IVX])X{0,3}(?:IX|IV|V?I{0,3})|[Ⅰ-Ⅻ])\.\s+(?P<roman>.+)  # I. ~ XXXIX. / Ⅰ. 장
+      | \d+\.\s+(?P<arabic>.+)                                     # 1. 절
+      | \d+\)\s+(?P<paren>.+)                                      # 1) 항
+    )$""", re.X)
+
+# 그룹 이름 → 섹션 레벨
+HEADING_LEVELS = {"h1": 1, "roman": 1, "h2": 2, "arabic": 2, "h3": 3, "paren": 3}
+
+# 제목이 될 수 있는 줄의 첫 글자 (나머지 줄은 정규식 없이 본문 처리)
+HEADING_START = frozenset("#0123456789IVX" + "".join(chr(c) for c in range(0x2160, 0x216C)))
+
+# Ⅰ ~ Ⅻ 는 한 글자 로마 숫자, 그 이상은 ⅩⅢ, ⅩⅩⅣ 처럼 조합
+ROMAN_SINGLE = [""] + [chr(c) for c in range(0x2160, 0x216C)]
+ROMAN_LETTERS = {"I": "Ⅰ", "V": "Ⅴ", "X": "Ⅹ", "L": "Ⅼ", "C": "Ⅽ", "D": "Ⅾ", "M": "Ⅿ"}
+ROMAN_VALUES = [(1000, "M"), (900, "CM"), (500, "D"), (400, "CD"), (100, "C"), (90, "XC"),
+                (50, "L"), (40, "XL"), (10, "X")]
+
+
+def roman_numeral(n: int) -> str:
+    """장 번호 → 로마 숫자 (Ⅰ, Ⅱ, ..., Ⅻ, ⅩⅢ, ...)"""
+    if n < len(ROMAN_SINGLE):
+        return ROMAN_SINGLE[n]
+    tens = ""
+    rest = n - n % 10
+    for value, letters in ROMAN_VALUES:
+        while rest >= value:
+            tens += "".join(ROMAN_LETTERS[c] for c in letters)
+            rest -= value
+    return tens + ROMAN_SINGLE[n % 10]
+
+
+def iter_body_sections(body: str):
+    """본문에서 섹션 구조를 한 번의 줄 순회로 추출 (generator)
+
+    빈 줄은 문단 경계로 유지한다: 섹션 content의 문단은 "\n\n"으로 구분되고,
+    문단 안의 줄바꿈은 "\n"으로 남는다.
+    """
+    level = 0
+    number = ""
+    title = ""
+    paragraphs = []
+    lines = []
+    chapter_num = section_num = subsection_num = 0
+
+    for raw in body.splitlines():
+        line = raw.strip()
+        if not line:
+            if lines:
+                paragraphs.append("\n".join(lines))
+                lines = []
+            continue
+
+        match = HEADING_RE.match(line) if line[0] in HEADING_START else None
+        if match is None:
+            lines.append(line)
+            continue
+
+        if lines:
+            paragraphs.append("\n".join(lines))
+            lines = []
+        if title or paragraphs:
+            yield {"level": level, "number": number, "title": title,
+                   "content": "\n\n".join(paragraphs)}
+        paragraphs = []
+
+        group = match.lastgroup
+        title = match.group(group)
+        level = HEADING_LEVELS[group]
+        if level == 1:
+            chapter_num += 1
+            section_num = subsection_num = 0
+            number = f"{roman_numeral(chapter_num)}."
+        elif level == 2:
+            section_num += 1
+            subsection_num = 0
+            number = f"{section_num}."
+        else:
+            subsection_num += 1
+            number = f"{subsection_num})"
+
+    # 마지막 섹션 추가
+    if lines:
+        paragraphs.append("\n".join(lines))
+    if title or paragraphs:
+        yield {"level": level, "number": number, "title": title,
+               "content": "\n\n".join(paragraphs)}
 
 
 def parse_body_sections(body: str) -> list:
     """본문에서 섹션 구조 추출"""
-    sections = []
-    lines = body.split("\n")
+    return list(iter_body_sections(body))
+
+
+# ===== 워커 모드 =====
+# TS 서버가 호출마다 인터프리터를 새로 띄우지 않도록, 한 프로세스가
+# 줄 단위 JSON(NDJSON) 요청을 받아 결과를 줄 단위 JSON으로 돌려준다.
+#
+# 요청: {"id": 1, "method": "create", "data": {...}, "output_path": "..."}
+#       {"id": 2, "method": "ping"}
+#       {"id": 3, "method": "shutdown"}
+# 응답: {"id": 1, "result": {success, path, message}} 또는 {"id": 1, "error": "..."}
+
+WORKER_PROTOCOL_VERSION = 1
+
+
+class WorkerState:
+    """워커 프로세스 상태 (헬스 체크 응답용)"""
+
+    def __init__(self, max_requests: int = 0):
+        self.started = time.monotonic()
+        self.handled = 0
+        self.failed = 0
+        self.max_requests = max_requests
+
+    def exhausted(self) -> bool:
+        """재시작 정책: max_requests 건 처리 후 스스로 종료"""
+        return self.max_requests > 0 and self.handled >= self.max_requests
+
+    def health(self) -> dict:
+        return {
+            "ok": True,
+            "pid": os.getpid(),
+            "protocol": WORKER_PROTOCOL_VERSION,
+            "uptime_s": round(time.monotonic() - self.started, 3),
+            "handled": self.handled,
+            "failed": self.failed,
+            "max_requests": self.max_requests,
+        }
+
+
+def handle_request(req: dict, state: WorkerState) -> dict:
+    """워커 요청 1건 처리"""
+    req_id = req.get("id")
+    method = req.get("method", "create")
+
+    if method == "ping":
+        return {"id": req_id, "result": state.health()}
+    if method == "shutdown":
+        return {"id": req_id, "result": {"ok": True, "shutdown": True}}
+    if method != "create":
+        return {"id": req_id, "error": f"Unknown method: {method}"}
 
-    current = {"level": 0, "number": "", "title": "", "content": []}
-    chapter_num = 0
-    section_num = 0
-    subsection_num = 0
+    started = time.monotonic()
+    try:
+        result = create_shinsa_docx(req.get("data") or {}, req["output_path"])
+    except Exception as e:
+        state.handled += 1
+        state.failed += 1
+        return {"id": req_id, "error": str(e)}
 
-    roman_numerals = ["", "Ⅰ", "Ⅱ", "Ⅲ", "Ⅳ", "Ⅴ", "Ⅵ", "Ⅶ", "Ⅷ", "Ⅸ", "Ⅹ"]
+    state.handled += 1
+    result["elapsed_ms"] = round((time.monotonic() - started) * 1000, 2)
+    return {"id": req_id, "result": result}
 
-    import re
 
+def serve_stream(lines, write, state: WorkerState) -> bool:
+    """줄 단위 요청 스트림 처리 (stdin 또는 소켓 연결 공용). 종료 요청 시 True"""
     for line in lines:
         line = line.strip()
         if not line:
             continue
+        try:
+            req = json.loads(line)
+        except json.JSONDecodeError as e:
+            write({"id": None, "error": f"Invalid JSON: {e}"})
+            continue
+        if not isinstance(req, dict):
+            write({"id": None, "error": "Invalid request: expected a JSON object"})
+            continue
 
-        # # 또는 I. II. 패턴 감지
-        h1_match = re.match(r'^#\s+(.+)$', line)
-        roman_match = re.match(r'^(I{1,3}|IV|V|VI{0,3})\.\s+(.+)$', line)
-        h2_match = re.match(r'^##\s+(.+)$', line)
-        arabic_match = re.match(r'^(\d+)\.\s+(.+)$', line)
-        h3_match = re.match(r'^###\s+(.+)$', line)
-        paren_match = re.match(r'^(\d+)\)\s+(.+)$', line)
+        response = handle_request(req, state)
+        write(response)
 
-        if h1_match or roman_match:
-            if current["title"] or current["content"]:
-                current["content"] = "\n".join(current["content"])
-                sections.append(current)
+        if req.get("method") == "shutdown" or state.exhausted():
+            return True
 
-            chapter_num += 1
-            section_num = 0
-            subsection_num = 0
-            title = h1_match.group(1) if h1_match else roman_match.group(2)
-            current = {
-                "level": 1,
-                "number": f"{roman_numerals[chapter_num]}.",
-                "title": title,
-                "content": []
-            }
-        elif h2_match or (arabic_match and not line.startswith('1)')):
-            if current["title"] or current["content"]:
-                current["content"] = "\n".join(current["content"])
-                sections.append(current)
+    return False
 
-            section_num += 1
-            subsection_num = 0
-            title = h2_match.group(1) if h2_match else arabic_match.group(2)
-            current = {
-                "level": 2,
-                "number": f"{section_num}.",
-                "title": title,
-                "content": []
-            }
-        elif h3_match or paren_match:
-            if current["title"] or current["content"]:
-                current["content"] = "\n".join(current["content"])
-                sections.append(current)
 
-            subsection_num += 1
-            title = h3_match.group(1) if h3_match else paren_match.group(2)
-            current = {
-                "level": 3,
-                "number": f"{subsection_num})",
-                "title": title,
-                "content": []
-            }
-        else:
-            current["content"].append(line)
+def warm_up() -> None:
+    """python-docx 내부 지연 로딩(기본 템플릿, oxml 클래스)을 미리 끝내 둔다"""
+    doc = new_document()
+    add_styled(doc, "Body", "warm-up")
 
-    # 마지막 섹션 추가
-    if current["title"] or current["content"]:
-        current["content"] = "\n".join(current["content"])
-        sections.append(current)
 
-    return sections
+def run_worker(max_requests: int = 0) -> None:
+    """stdin/stdout NDJSON 워커"""
+    state = WorkerState(max_requests)
+    warm_up()
 
+    def write(obj: dict) -> None:
+        sys.stdout.write(json.dumps(obj, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+    write({"event": "ready", **state.health()})
+    serve_stream(sys.stdin, write, state)
+
+
+def run_socket_worker(socket_path: str, max_requests: int = 0) -> None:
+    """로컬 Unix 소켓 NDJSON 워커 (연결은 순차 처리)"""
+    import socket
+
+    state = WorkerState(max_requests)
+    warm_up()
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    print(json.dumps({"event": "ready", "socket": socket_path, **state.health()}), flush=True)
+
+    try:
+        while not state.exhausted():
+            conn, _ = server.accept()
+            with conn, conn.makefile("r", encoding="utf-8") as reader, \
+                    conn.makefile("w", encoding="utf-8") as writer:
+
+                def write(obj: dict) -> None:
+                    writer.write(json.dumps(obj, ensure_ascii=False) + "\n")
+                    writer.flush()
+
+                if serve_stream(reader, write, state):
+                    break
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def main(argv: list) -> int:
+    if argv[:1] in (["--version"], ["--check"]):
+        from shinsa_docx import main as entry_main
+        return entry_main(argv)
+
+    if argv and argv[0] == "--worker":
+        import argparse
+
+        parser = argparse.ArgumentParser(prog="create_docx.py --worker")
+        parser.add_argument("--socket", help="stdin 대신 사용할 Unix 소켓 경로")
+        parser.add_argument("--max-requests", type=int, default=0,
+                            help="N건 처리 후 종료 (0 = 무제한)")
+        opts = parser.parse_args(argv[1:])
+
+        if opts.socket:
+            run_socket_worker(opts.socket, opts.max_requests)
+        else:
+            run_worker(opts.max_requests)
+        return 0
 
-if __name__ == "__main__":
     # 명령줄에서 JSON 입력 받기
-    if len(sys.argv) < 3:
+    if len(argv) < 2:
         print(json.dumps({
-            "error": "Usage: python create_docx.py <input.json> <output.docx>"
+            "error": "Usage: python create_docx.py <input.json> <output.docx> "
+                     "[--metrics FILE] [--profile-dir DIR] [--verify|--strict] [--cache] "
+                     "| --worker | --version | --check"
         }))
-        sys.exit(1)
-
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+        return 1
+
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="create_docx.py")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--metrics", help="지표 JSON Lines 파일 (기본: SHINSA_METRICS_FILE)")
+    parser.add_argument("--profile-dir", help="cProfile .pstats 저장 폴더 (기본: SHINSA_PROFILE_DIR)")
+    parser.add_argument("--verify", action="store_const", const=True,
+                        help="저장 전 형식 검사 (결과의 verify)")
+    parser.add_argument("--strict", dest="verify", action="store_const", const="strict",
+                        help="형식 검사 위반이 있으면 저장하지 않고 실패")
+    parser.add_argument("--cache", action="store_true",
+                        help="출력 캐시 사용 (기본: SHINSA_OUTPUT_CACHE, 없으면 <cache_dir>/outputs)")
+    opts = parser.parse_args(argv)
 
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
+        with open(opts.input, 'r', encoding='utf-8') as f:
             data = json.load(f)
 
-        result = create_shinsa_docx(data, output_file)
+        output_cache = False
+        if opts.cache:
+            from output_cache import OutputCache, cache_from_env, default_directory
+
+            output_cache = cache_from_env() or OutputCache(default_directory())
+        result = create_shinsa_docx(data, opts.output, metrics_file=opts.metrics,
+                                    profile_dir=opts.profile_dir, verify=opts.verify,
+                                    output_cache=output_cache)
         print(json.dumps(result, ensure_ascii=False))
 
     except Exception as e:
         print(json.dumps({
             "error": str(e)
         }, ensure_ascii=False))
-        sys.exit(1)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
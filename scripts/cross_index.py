@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+본문 인용 ↔ 참고문헌 대조
+create_docx.py 입력(JSON)의 각주·본문 괄호 인용과 references를 저자/연도/제목 키로
+해시 맵에 색인해 한 번씩만 훑어 대조하고 다음을 보고한다.
+
+    orphans      참고문헌에만 있고 인용되지 않은 항목
+    missing      인용됐지만 참고문헌에 없는 저작
+    short_forms  약식 인용(저자, 『책』, 쪽) 문제: 전체 인용 전 사용, 전체 인용 반복
+                 (대응 저작이 참고문헌에도 없으면 missing에만 보고)
+    ibid         Ibid. 문제: 앞 각주에 인용이 없거나 여러 건이라 가리키는 저작이 모호함
+
+사용법:
+    python scripts/cross_index.py paper.json [--json]
+    python scripts/cross_index.py issue/*.json --json -o report.json   # 호 전체
+"""
+
+import argparse
+import json
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from footnotes import normalize_notes
+from references import HANGUL, match_key, parse_citation
+
+# 본문 괄호 인용: (홍길동, 2021), (Smith 2010: 45), (김철수, 2019; 이영희, 2018, 12)
+PAREN_RE = re.compile(r"\(([^()]*\d{4}[^()]*)\)")
+INLINE_RE = re.compile(r"^\s*(.+?),?\s+(\d{4})[a-z]?(?:\s*[:,]\s*[\d\-–]+)?\s*$")
+AUTHOR_SPLIT = re.compile(r"\s*(?:[·&;]|,\s*(?=[가-힣])|\band\b)\s*")
+
+FULL_TYPES = {"korean_article", "korean_book", "korean_chapter", "korean_translation",
+              "foreign_article", "foreign_book", "thesis", "web"}
+
+
+def author_key(name: str) -> str:
+    """첫 저자의 대조 키: 국문은 이름 전체, 외국어는 성 (Last, First / First Last 모두)"""
+    if not name:
+        return ""
+    first = AUTHOR_SPLIT.split(name.strip(), maxsplit=1)[0]
+    if HANGUL.search(first):
+        return match_key(first)
+    last = first.split(",")[0] if "," in first else first.split()[-1]
+    return match_key(last)
+
+
+def work_keys(parsed: dict) -> tuple:
+    """(저자 키, 연도, 제목 키) — 번역서는 원저자 기준"""
+    f = parsed["fields"]
+    author = f.get("author") or f.get("originalAuthor") or ""
+    return author_key(author), f.get("year") or "", match_key(f.get("title") or "")
+
+
+class ReferenceIndex:
+    """참고문헌 색인: (저자, 연도) → 항목 번호들, 저자 → 항목 번호들"""
+
+    def __init__(self, references):
+        self.entries = []
+        self.by_author_year = {}
+        self.by_author = {}
+        for ref in references:
+            if not ref or not ref.strip():
+                continue
+            parsed = parse_citation(ref)
+            author, year, title = work_keys(parsed)
+            index = len(self.entries)
+            self.entries.append({"reference": parsed["original"], "type": parsed["type"],
+                                 "author": author, "year": year, "title": title})
+            if author:
+                self.by_author_year.setdefault((author, year), []).append(index)
+                self.by_author.setdefault(author, []).append(index)
+        self.cited = set()
+
+    def lookup(self, author: str, year: str = "", title: str = ""):
+        """인용 키 → 항목 번호 (없으면 None). 같은 저자·연도가 여럿이면 제목으로 가림"""
+        candidates = (self.by_author_year.get((author, year)) if year
+                      else self.by_author.get(author)) or []
+        if title and (len(candidates) > 1 or not year):
+            titled = [i for i in candidates if _title_matches(title, self.entries[i]["title"])]
+            candidates = titled or (candidates if year else [])
+        if not candidates:
+            return None
+        self.cited.add(candidates[0])
+        return candidates[0]
+
+
+def _title_matches(short: str, full: str) -> bool:
+    # 약식 제목은 전체 제목의 앞부분 (『한국 교회』 ↔ 『한국 교회의 미래』)
+    return bool(short) and bool(full) and (full.startswith(short) or short.startswith(full))
+
+
+def iter_citations(data: dict):
+    """(위치, 인용 문자열, 각주 여부) — 각주 순서대로, 각주 안의 ;로 나뉜 인용은 따로"""
+    for label, content in normalize_notes(data.get("footnotes")).items():
+        for part in content.split(";"):
+            if part.strip():
+                yield f"footnote {label}", part.strip(), True
+
+    texts = [data.get("body") or ""]
+    texts += [sec.get("content", "") for sec in data.get("sections") or []]
+    for text in texts:
+        for paren in PAREN_RE.finditer(text):
+            for part in paren.group(1).split(";"):
+                if part.strip():
+                    yield "body", part.strip(), False
+
+
+def cross_index(data: dict) -> dict:
+    """create_docx 입력 1건 대조 보고서"""
+    index = ReferenceIndex(data.get("references") or [])
+    missing = []
+    short_forms = []
+    ibid = []
+    unparsed = []
+
+    seen_full = {}      # (저자, 제목) → 처음 전체 인용된 위치
+    by_author = {}      # 저자 → 전체 인용된 제목 키들 (약식 인용 대조용)
+    previous = []       # 직전 각주의 인용들 (Ibid. 대상)
+    current_where = None
+    current = []
+    citations = 0
+
+    for where, text, in_footnote in iter_citations(data):
+        if where != current_where:
+            if current_where is not None and current_where.startswith("footnote"):
+                previous = current
+            current_where, current = where, []
+        citations += 1
+        parsed = parse_citation(text)
+        kind = parsed["type"]
+
+        if kind == "ibid":
+            if not previous:
+                ibid.append({"where": where, "citation": text, "issue": "no_antecedent"})
+            elif len(previous) > 1:
+                ibid.append({"where": where, "citation": text, "issue": "ambiguous"})
+            current.extend(previous[:1])
+            continue
+
+        if kind in FULL_TYPES:
+            author, year, title = work_keys(parsed)
+            work = (author, title)
+            if in_footnote and work in seen_full:
+                short_forms.append({"where": where, "citation": text, "issue": "repeated_full",
+                                    "first": seen_full[work]})
+            seen_full.setdefault(work, where)
+            by_author.setdefault(author, []).append(title)
+            if index.lookup(author, year, title) is None:
+                missing.append({"where": where, "citation": text, "author": author, "year": year})
+            current.append(work)
+            continue
+
+        if kind == "short_ref":
+            author, _, title = work_keys(parsed)
+            titles = by_author.get(author, [])
+            full = next((t for t in titles if _title_matches(title, t)), None)
+            if full is None:
+                # 참고문헌에도 없으면 누락 하나로만 보고 (약식 인용 문제로 중복 집계하지 않음)
+                if index.lookup(author, "", title) is None:
+                    missing.append({"where": where, "citation": text, "author": author, "year": ""})
+                else:
+                    short_forms.append({"where": where, "citation": text, "issue": "before_full"})
+            else:
+                index.lookup(author, "", full)
+            current.append((author, full or title))
+            continue
+
+        # 괄호 인용 (저자, 연도)
+        match = INLINE_RE.match(text)
+        if match:
+            author, year = author_key(match.group(1)), match.group(2)
+            if index.lookup(author, year) is None:
+                missing.append({"where": where, "citation": text, "author": author, "year": year})
+            current.append((author, year))
+        elif in_footnote:
+            unparsed.append({"where": where, "citation": text})
+
+    orphans = [{"index": i, "reference": entry["reference"]}
+               for i, entry in enumerate(index.entries) if i not in index.cited]
+
+    return {
+        "title": data.get("title", ""),
+        "citations": citations,
+        "references": len(index.entries),
+        "matched_references": len(index.cited),
+        "orphans": orphans,
+        "missing": missing,
+        "short_forms": short_forms,
+        "ibid": ibid,
+        "unparsed": unparsed,
+        "passed": not (orphans or missing or short_forms or ibid),
+    }
+
+
+def cross_index_file(path: str) -> dict:
+    """프로세스 풀 작업: 입력 파일 1개"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            report = cross_index(json.load(f))
+    except (OSError, json.JSONDecodeError) as e:
+        return {"file": path, "passed": False, "error": f"{type(e).__name__}: {e}"}
+    return {"file": path, **report}
+
+
+def print_report(report: dict) -> None:
+    print(f"\n=== {report.get('file') or report['title']} ===")
+    if "error" in report:
+        print(f"  오류: {report['error']}")
+        return
+    print(f"  인용 {report['citations']}건 / 참고문헌 {report['references']}건 "
+          f"(대응 {report['matched_references']}건)")
+    for entry in report["orphans"]:
+        print(f"  [인용 안 됨] {entry['reference']}")
+    for entry in report["missing"]:
+        print(f"  [참고문헌 없음] {entry['where']}: {entry['citation']}")
+    for entry in report["short_forms"]:
+        print(f"  [약식 인용: {entry['issue']}] {entry['where']}: {entry['citation']}")
+    for entry in report["ibid"]:
+        print(f"  [Ibid.: {entry['issue']}] {entry['where']}: {entry['citation']}")
+    print("  ✓ 통과" if report["passed"] else "  ✗ 확인 필요")
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="본문 인용 ↔ 참고문헌 대조")
+    parser.add_argument("inputs", nargs="+", help="create_docx 입력 JSON (여러 개면 호 전체)")
+    parser.add_argument("--json", action="store_true", help="JSON 출력")
+    parser.add_argument("-o", "--output", help="JSON 보고서 파일")
+    parser.add_argument("--jobs", type=int, default=None, help="동시 프로세스 수 (기본: CPU 수)")
+    opts = parser.parse_args(argv)
+
+    if len(opts.inputs) == 1:
+        reports = [cross_index_file(opts.inputs[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=opts.jobs) as pool:
+            reports = list(pool.map(cross_index_file, opts.inputs))
+
+    if len(reports) == 1 and "error" in reports[0]:
+        print(json.dumps({"error": reports[0]["error"]}, ensure_ascii=False))
+        return 1
+
+    if opts.output:
+        with open(opts.output, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+    if opts.json:
+        print(json.dumps(reports if len(reports) > 1 else reports[0], ensure_ascii=False, indent=2))
+    elif not opts.output:
+        for report in reports:
+            print_report(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
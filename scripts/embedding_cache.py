@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+임베딩 캐시 (SQLite)
+정규화한 텍스트 + 모델 이름의 sha256을 키로 임베딩 벡터(float32)를 보관한다.
+같은 인용 문자열을 반복 검색·적재할 때 임베딩 API 호출을 건너뛰기 위한 것.
+
+- 정규화: 유니코드 NFC, 연속 공백 하나로, 앞뒤 공백 제거 (대소문자·기호는 그대로 —
+  임베딩 결과가 달라질 수 있으므로)
+- 축출: 최근 사용 시각(LRU) 순으로 max_bytes / max_entries를 넘는 만큼 지움
+- 적중/실패 횟수는 프로세스별(session)과 누적(total)으로 보고
+
+Python 도구는 CachedEmbedder로 임베더를 감싸 쓰고, TS 서버(getEmbedding)는
+serve로 띄운 소켓에 줄 단위 JSON으로 조회·저장한다.
+
+사용법:
+    python scripts/embedding_cache.py stats [--cache PATH]
+    python scripts/embedding_cache.py evict [--max-mb 512] [--max-entries N]
+    python scripts/embedding_cache.py clear
+    python scripts/embedding_cache.py serve [--socket /tmp/shinsa-embed.sock]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+import unicodedata
+from array import array
+from pathlib import Path
+
+from local_cache import cache_dir
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+# 축출 검사(전체 크기 집계) 간격 — 저장할 때마다 세지 않는다
+EVICT_EVERY = 256
+# 소켓 서버가 종료 요청을 확인하는 간격 (accept 대기 타임아웃)
+ACCEPT_POLL_S = 0.5
+SPACES = re.compile(r"\s+")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key BLOB PRIMARY KEY,
+    model TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used);
+CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+def default_cache_path() -> Path:
+    return cache_dir() / "embeddings.sqlite3"
+
+
+def normalize_text(text: str) -> str:
+    return SPACES.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def cache_key(text: str, model: str) -> bytes:
+    return hashlib.sha256(f"{model}\0{normalize_text(text)}".encode("utf-8")).digest()
+
+
+class EmbeddingCache:
+    """SQLite 임베딩 캐시 (WAL — 여러 프로세스가 함께 읽고 써도 됨)"""
+
+    def __init__(self, path=None, max_bytes: int = DEFAULT_MAX_BYTES, max_entries: int = 0):
+        self.path = Path(path) if path else default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.conn = sqlite3.connect(self.path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self._since_evict = EVICT_EVERY  # 열 때 한 번 검사
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ----- 조회·저장 -----
+
+    def get_many(self, texts: list, model: str) -> list:
+        """texts와 같은 순서의 벡터 목록 (없으면 None)"""
+        keys = [cache_key(text, model) for text in texts]
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        for i in range(0, len(unique), 500):  # SQLite 바인드 변수 상한
+            batch = unique[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({','.join('?' * len(batch))})",
+                batch)
+            for key, blob in rows:
+                vector = array("f")
+                vector.frombytes(blob)
+                found[key] = vector.tolist()
+
+        results = [found.get(key) for key in keys]
+        hit = sum(1 for vector in results if vector is not None)
+        self.hits += hit
+        self.misses += len(results) - hit
+
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "UPDATE embeddings SET last_used = ?, hits = hits + 1 WHERE key = ?",
+                [(now, key) for key in found])
+            self._add_counter("hits", hit)
+            self._add_counter("misses", len(results) - hit)
+        return results
+
+    def get(self, text: str, model: str):
+        return self.get_many([text], model)[0]
+
+    def put_many(self, texts: list, vectors, model: str) -> int:
+        now = time.time()
+        rows = []
+        for text, vector in zip(texts, vectors):
+            blob = array("f", vector).tobytes()
+            rows.append((cache_key(text, model), model, len(blob) // 4, blob, now))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, model, dim, vector, last_used) "
+                "VALUES (?, ?, ?, ?, ?)", rows)
+        self._since_evict += len(rows)
+        if self._since_evict >= EVICT_EVERY:
+            self.evict()
+        return len(rows)
+
+    def put(self, text: str, vector, model: str) -> None:
+        self.put_many([text], [vector], model)
+
+    # ----- 축출·통계 -----
+
+    def evict(self) -> int:
+        """한도를 넘으면 가장 오래 안 쓴 항목부터 한도의 90%까지 지움, 지운 개수 반환"""
+        self._since_evict = 0
+        entries, size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(vector)), 0) FROM embeddings").fetchone()
+        over_entries = self.max_entries and entries > self.max_entries
+        over_bytes = self.max_bytes and size > self.max_bytes
+        if not (over_entries or over_bytes):
+            return 0
+
+        target_entries = int(self.max_entries * 0.9) if over_entries else entries
+        target_bytes = int(self.max_bytes * 0.9) if over_bytes else size
+        removed = []
+        for key, length in self.conn.execute(
+                "SELECT key, LENGTH(vector) FROM embeddings ORDER BY last_used"):
+            if entries <= target_entries and size <= target_bytes:
+                break
+            removed.append((key,))
+            entries -= 1
+            size -= length
+        with self.conn:
+            self.conn.executemany("DELETE FROM embeddings WHERE key = ?", removed)
+            self._add_counter("evicted", len(removed))
+        return len(removed)
+
+    def _add_counter(self, name: str, value: int) -> None:
+        if value:
+            self.conn.execute(
+                "INSERT INTO counters (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value", (name, value))
+
+    def stats(self) -> dict:
+        counters = dict(self.conn.execute("SELECT name, value FROM counters"))
+        by_model = {model: {"entries": entries, "bytes": size}
+                    for model, entries, size in self.conn.execute(
+                        "SELECT model, COUNT(*), SUM(LENGTH(vector)) FROM embeddings GROUP BY model")}
+        total_hits, total_misses = counters.get("hits", 0), counters.get("misses", 0)
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": sum(m["entries"] for m in by_model.values()),
+            "bytes": sum(m["bytes"] for m in by_model.values()),
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries or None,
+            "by_model": by_model,
+            "session": {"hits": self.hits, "misses": self.misses,
+                        "hit_rate": round(self.hits / lookups, 4) if lookups else None},
+            "total": {"hits": total_hits, "misses": total_misses,
+                      "evicted": counters.get("evicted", 0),
+                      "hit_rate": round(total_hits / (total_hits + total_misses), 4)
+                      if total_hits + total_misses else None},
+        }
+
+    def clear(self) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM embeddings")
+            self.conn.execute("DELETE FROM counters")
+        self.conn.execute("VACUUM")
+
+
+class CachedEmbedder:
+    """임베더(texts → 벡터 목록)를 감싸 캐시에 없는 텍스트만 넘긴다"""
+
+    def __init__(self, embedder, cache: EmbeddingCache):
+        self.embedder = embedder
+        self.cache = cache
+        self.model = embedder.model
+
+    def __call__(self, texts: list) -> list:
+        vectors = self.cache.get_many(texts, self.model)
+        missing = {}
+        for i, vector in enumerate(vectors):
+            if vector is None:
+                missing.setdefault(normalize_text(texts[i]), []).append(i)
+        if missing:
+            fresh = self.embedder(list(missing))
+            fresh = fresh.tolist() if hasattr(fresh, "tolist") else [list(v) for v in fresh]
+            self.cache.put_many(list(missing), fresh, self.model)
+            for positions, vector in zip(missing.values(), fresh):
+                for i in positions:
+                    vectors[i] = vector
+        return vectors
+
+
+# ===== 조회 서버 =====
+# vector_index.py와 같은 줄 단위 JSON.
+#
+# 요청: {"id": 1, "method": "get", "params": {"text": "...", "model": "text-embedding-3-small"}}
+#       {"id": 2, "method": "put", "params": {"text": "...", "model": "...", "embedding": [...]}}
+#       {"id": 3, "method": "get_many" | "put_many", "params": {"texts": [...], ...}}
+#       {"id": 4, "method": "stats"} / "evict" / "ping" / "shutdown"
+# 응답: {"id": 1, "result": {"embedding": [...] 또는 null}} 또는 {"id": 1, "error": "..."}
+
+def handle_request(req: dict, state: dict) -> dict:
+    req_id = req.get("id")
+    method = req.get("method")
+    params = req.get("params") or {}
+    cache = state["cache"]
+    try:
+        if method == "get":
+            result = {"embedding": cache.get(params["text"], params["model"])}
+        elif method == "get_many":
+            result = {"embeddings": cache.get_many(params["texts"], params["model"])}
+        elif method == "put":
+            cache.put(params["text"], params["embedding"], params["model"])
+            result = {"ok": True}
+        elif method == "put_many":
+            result = {"ok": True, "stored": cache.put_many(params["texts"], params["embeddings"],
+                                                           params["model"])}
+        elif method == "stats":
+            result = cache.stats()
+        elif method == "evict":
+            result = {"evicted": cache.evict()}
+        elif method == "ping":
+            result = {"ok": True, "pid": os.getpid(),
+                      "uptime_s": round(time.monotonic() - state["started"], 3)}
+        elif method == "shutdown":
+            result = {"ok": True, "shutdown": True}
+        else:
+            return {"id": req_id, "error": f"Unknown method: {method}"}
+    except Exception as e:
+        return {"id": req_id, "error": f"{type(e).__name__}: {e}"}
+    return {"id": req_id, "result": result}
+
+
+def serve_stream(lines, write, state: dict) -> bool:
+    """줄 단위 요청 스트림 처리. 종료 요청 시 True"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+        except json.JSONDecodeError as e:
+            write({"id": None, "error": f"Invalid JSON: {e}"})
+            continue
+        if not isinstance(req, dict):
+            write({"id": None, "error": "Invalid request: expected a JSON object"})
+            continue
+        write(handle_request(req, state))
+        if req.get("method") == "shutdown":
+            return True
+    return False
+
+
+def serve(cache: EmbeddingCache, socket_path=None) -> None:
+    state = {"cache": cache, "started": time.monotonic()}
+    ready = {"event": "ready", "path": str(cache.path)}
+
+    if not socket_path:
+        def write(obj: dict) -> None:
+            sys.stdout.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+        write(ready)
+        serve_stream(sys.stdin, write, state)
+        return
+
+    import socket
+    import threading
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    print(json.dumps({**ready, "socket": socket_path}), flush=True)
+    stop = threading.Event()
+
+    def serve_connection(conn) -> None:
+        # SQLite 연결은 스레드 간에 공유하지 않으므로 연결마다 따로 연다 (WAL — 동시 읽기·쓰기 가능)
+        conn_cache = EmbeddingCache(cache.path, cache.max_bytes, cache.max_entries)
+        try:
+            with conn, conn.makefile("r", encoding="utf-8") as reader, \
+                    conn.makefile("w", encoding="utf-8") as writer:
+
+                def write(obj: dict) -> None:
+                    writer.write(json.dumps(obj, ensure_ascii=False) + "\n")
+                    writer.flush()
+
+                if serve_stream(reader, write, {**state, "cache": conn_cache}):
+                    stop.set()
+        except OSError:
+            pass  # 클라이언트가 먼저 끊음
+        finally:
+            conn_cache.close()
+
+    # 연결마다 스레드: 연결을 열어 두는 클라이언트(TS 서버)가 있어도 다른 클라이언트가 막히지 않는다
+    server.settimeout(ACCEPT_POLL_S)
+    try:
+        while not stop.is_set():
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            threading.Thread(target=serve_connection, args=(conn,), daemon=True).start()
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="임베딩 캐시 (SQLite)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("stats", "적중률·크기"), ("evict", "한도까지 LRU 축출"),
+                            ("clear", "전부 삭제"), ("serve", "조회 서버 (stdin/stdout 또는 Unix 소켓)")):
+        p = sub.add_parser(name, help=help_text)
+        p.add_argument("--cache", help="캐시 파일 (기본: ~/.cache/shinsa-mcp/embeddings.sqlite3)")
+        p.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                       help="크기 한도 MB (0 = 무제한)")
+        p.add_argument("--max-entries", type=int, default=0, help="항목 수 한도 (0 = 무제한)")
+    sub.choices["serve"].add_argument("--socket", help="Unix 소켓 경로")
+    opts = parser.parse_args(argv)
+
+    try:
+        cache = EmbeddingCache(opts.cache, int(opts.max_mb * 1024 * 1024), opts.max_entries)
+    except sqlite3.Error as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False))
+        return 1
+
+    try:
+        if opts.command == "serve":
+            serve(cache, opts.socket)
+            return 0
+        if opts.command == "evict":
+            result = {"evicted": cache.evict(), **cache.stats()}
+        elif opts.command == "clear":
+            cache.clear()
+            result = {"ok": True}
+        else:
+            result = cache.stats()
+    finally:
+        cache.close()
+
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
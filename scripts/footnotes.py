@@ -0,0 +1,136 @@
+"""
+Word 각주 (word/footnotes.xml)
+제목 각주(*), 저자 각주(** 또는 *), 본문 인용 각주(자동 번호)를 문서 순서대로 모은 뒤
+footnotes.xml을 한 번에 직렬화한다 — 각주마다 문서 트리를 고치지 않으므로 각주 수에 선형.
+
+본문 각주 표시:
+    [^3]  — 마크다운 형식, 항상 인식
+    3)    — convert_paper/TS 변환기 형식, 3번 각주가 정의돼 있고 문단·줄 첫머리가 아닐 때만 인식
+"""
+
+import re
+
+from inline_markup import inline_text
+from stream_docx import run_xml
+
+FOOTNOTES_PART = "word/footnotes.xml"
+FOOTNOTES_CT = "application/vnd.openxmlformats-officedocument.wordprocessingml.footnotes+xml"
+FOOTNOTES_RT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/footnotes"
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+MARKER_RE = re.compile(r"\[\^([^\]\s]+)\]|(?<![\d(\n])(\d+)\)")
+
+# 구분선 각주 (Word 기본: id -1 구분선, id 0 연속 구분선)
+SEPARATORS = (
+    '<w:footnote w:type="separator" w:id="-1"><w:p><w:pPr><w:spacing w:after="0" w:line="240" '
+    'w:lineRule="auto"/></w:pPr><w:r><w:separator/></w:r></w:p></w:footnote>'
+    '<w:footnote w:type="continuationSeparator" w:id="0"><w:p><w:pPr><w:spacing w:after="0" '
+    'w:line="240" w:lineRule="auto"/></w:pPr><w:r><w:continuationSeparator/></w:r></w:p></w:footnote>'
+)
+
+
+def normalize_notes(footnotes) -> dict:
+    """입력 각주 → {표시 문자열: 내용}
+
+    허용 형식: ["내용", ...] (1번부터), [{"number", "content"}], {"1": "내용"}
+    내용 앞의 "1) " 번호는 떼어 낸다 (Word가 번호를 붙임).
+    """
+    if not footnotes:
+        return {}
+    if isinstance(footnotes, dict):
+        items = footnotes.items()
+    else:
+        items = (
+            (note.get("number", i), note.get("content", "")) if isinstance(note, dict) else (i, note)
+            for i, note in enumerate(footnotes, 1)
+        )
+    notes = {}
+    for number, content in items:
+        label = str(number)
+        content = str(content).strip()
+        if content.startswith(f"{label})"):
+            content = content[len(label) + 1:].lstrip()
+        notes[label] = content
+    return notes
+
+
+class Footnotes:
+    """문서 순서대로 각주를 모으는 수집기 (id는 1부터)"""
+
+    def __init__(self, footnotes=None):
+        self.notes = normalize_notes(footnotes)
+        self.entries = []  # (id, 사용자 기호 또는 "", 내용)
+
+    @property
+    def next_id(self) -> int:
+        return len(self.entries) + 1
+
+    def add(self, text: str, mark: str = "") -> int:
+        """각주 1개 추가, footnoteReference id 반환 (mark: 사용자 기호, 빈 문자열이면 자동 번호)"""
+        note_id = self.next_id
+        self.entries.append((note_id, mark, text))
+        return note_id
+
+    def _matches(self, text: str):
+        for match in MARKER_RE.finditer(text):
+            label = match.group(1) or match.group(2)
+            if label not in self.notes:
+                continue
+            if match.group(2) and match.start() == 0:
+                continue  # 문단 첫머리 "1)"은 항 번호
+            yield match, label
+
+    def labels(self, content: str) -> list:
+        """섹션 본문에서 인식될 각주 표시 목록 (split_runs와 같은 규칙, 등록하지 않음)"""
+        return [
+            label
+            for para in content.split("\n\n") if para.strip()
+            for _, label in self._matches(para.strip())
+        ]
+
+    def register(self, labels) -> None:
+        """캐시된 섹션 재사용 시: 렌더링 없이 각주만 같은 순서로 등록"""
+        for label in labels:
+            self.add(self.notes[label])
+
+    def split_runs(self, text: str) -> list:
+        """문단 텍스트 → runs (각주 표시는 footnoteReference run으로 바뀜)"""
+        runs = []
+        pos = 0
+        for match, label in self._matches(text):
+            if match.start() > pos:
+                runs.append((text[pos:match.start()], None))
+            runs.append(("", {"footnote": self.add(self.notes[label])}))
+            pos = match.end()
+        if pos < len(text):
+            runs.append((text[pos:], None))
+        return runs
+
+    def part_xml(self, style_id: str) -> str:
+        """footnotes.xml 전체 (한 번에 직렬화)"""
+        parts = [
+            "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n",
+            f'<w:footnotes xmlns:w="{W_NS}">',
+            SEPARATORS,
+        ]
+        for note_id, mark, text in self.entries:
+            ref = (f"<w:t>{mark}</w:t>" if mark else "<w:footnoteRef/>")
+            parts.append(
+                f'<w:footnote w:id="{note_id}"><w:p><w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>'
+                f'<w:r><w:rPr><w:vertAlign w:val="superscript"/></w:rPr>{ref}</w:r>'
+                f"{''.join(run_xml(t, p) for t, p in inline_text(' ' + text)) if text else ''}"
+                "</w:p></w:footnote>"
+            )
+        parts.append("</w:footnotes>")
+        return "".join(parts)
+
+
+def attach_footnotes_part(doc, blob: bytes = b""):
+    """문서에 footnotes 파트 연결 (관계·콘텐츠 형식 등록), 파트 반환"""
+    from docx.opc.packuri import PackURI
+    from docx.opc.part import Part
+
+    part = Part(PackURI("/" + FOOTNOTES_PART), FOOTNOTES_CT, blob, doc.part.package)
+    doc.part.relate_to(part, FOOTNOTES_RT)
+    return part
@@ -0,0 +1,545 @@
+#!/usr/bin/env python3
+"""
+게재 논문 → 인용 사례 말뭉치 일괄 적재
+폴더 또는 zip 안의 .docx 논문에서 각주(word/footnotes.xml)와 참고문헌 절을
+프로세스 풀로 스트리밍 추출하고, parse_citation으로 분류·중복 제거한 뒤
+묶음 단위로 임베딩해 로컬 색인(vector_index.py) 또는 Postgres citations 테이블에
+청크 단위 트랜잭션으로 기록한다.
+
+청크가 커밋될 때마다 체크포인트에 끝난 논문(원본 경로::이름 → 내용 해시·지문)을 기록하므로
+중단 후 같은 명령을 다시 실행하면 남은 논문부터 이어 간다. 중복 판정은 대상에 이미 있는 인용도
+포함하므로 커밋 직후 중단돼 논문을 다시 읽어도 같은 인용이 두 번 들어가지 않는다.
+
+임베더:
+    openai          text-embedding-3-small (OPENAI_API_KEY, pip install openai)
+    hash            결정적 로컬 대체 (문자 n-gram 해싱, 네트워크 없음 — 시험용)
+    모듈:함수       texts(list[str]) → 벡터 목록을 돌려주는 임의의 함수
+임베딩은 embedding_cache.py 캐시를 거친다 (--no-embed-cache로 끔).
+
+사용법:
+    python scripts/ingest_citations.py papers/ [--index DIR] [--embedder openai]
+    python scripts/ingest_citations.py backissues.zip --target postgres --dsn postgresql://...
+    python scripts/ingest_citations.py papers/ --embedder hash --dry-run
+"""
+
+import argparse
+import hashlib
+import importlib
+import io
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from embedding_cache import CachedEmbedder, EmbeddingCache
+from local_cache import cache_dir, file_fingerprint
+from references import SPACES, match_key, parse_citation
+from vector_index import LocalIndex, default_index_dir, normalize_rows, np
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+DC = '{http://purl.org/dc/elements/1.1/}'
+
+CHECKPOINT_VERSION = 2
+DEFAULT_MODEL = "text-embedding-3-small"
+
+# 예시로 쓸 수 없는 유형 (Ibid.는 앞 각주 없이는 의미가 없다)
+SKIP_TYPES = {"unknown", "ibid"}
+
+REFERENCE_TITLES = {"참고문헌", "참고 문헌", "references", "bibliography", "works cited"}
+# 참고문헌 절이 끝나는 제목 (영문초록·국문초록·주제어)
+SECTION_END = re.compile(r"^(?:<?\s*abstract\s*>?|국문\s*초록|초록|keywords?\s*:?|주제어\s*:?)", re.I)
+# 구분선(─, -, =, _)과 <국문 자료>·<외국어 자료> 같은 묶음 제목
+DIVIDER_RE = re.compile(r"^[─━\-=_\s]{5,}$")
+GROUP_RE = re.compile(r"^<[^<>]{1,20}>$")
+# 작성 도구가 넣는 기본 작성자 — 논문 저자로 쓰지 않음
+GENERATOR_AUTHORS = {"python-docx", "microsoft office user", "windows user", "user", "사용자"}
+
+
+# ===== 추출 (작업 프로세스) =====
+
+def iter_papers(source: Path):
+    """(이름, 위치) 순회 — 위치는 (파일 경로, zip 항목 이름 또는 None)"""
+    if source.is_dir():
+        for path in sorted(source.rglob("*.docx")):
+            if not path.name.startswith("~$"):
+                yield str(path.relative_to(source)), (str(path), None)
+        return
+    if source.suffix.lower() == ".docx":
+        yield source.name, (str(source), None)
+        return
+    with zipfile.ZipFile(source) as archive:
+        names = sorted(info.filename for info in archive.infolist() if not info.is_dir())
+    for name in names:
+        if (name.lower().endswith(".docx") and not name.startswith("__MACOSX/")
+                and not Path(name).name.startswith("~$")):
+            yield name, (str(source), name)
+
+
+def read_paper(location: tuple) -> bytes:
+    path, member = location
+    if member is None:
+        with open(path, "rb") as f:
+            return f.read()
+    with zipfile.ZipFile(path) as archive:
+        return archive.read(member)
+
+
+def _is_on(elem) -> bool:
+    # <w:i/> 또는 <w:i w:val="1|true|on"/>
+    return elem is not None and elem.get(W + "val", "true") not in ("0", "false", "off")
+
+
+def paragraph_text(p) -> str:
+    """문단 텍스트. 기울임 run은 *...*로 감싼다 (외국어 서명 표기, patterns.ts와 같음)"""
+    parts = []
+    for r in p.iter(W + "r"):
+        rPr = r.find(W + "rPr")
+        italic = rPr is not None and _is_on(rPr.find(W + "i"))
+        text = "".join((t.text or "") if t.tag == W + "t" else " "
+                       for t in r if t.tag in (W + "t", W + "tab"))
+        if not text:
+            continue
+        if parts and parts[-1][1] == italic:
+            parts[-1][0] += text
+        else:
+            parts.append([text, italic])
+    return "".join(f"*{text.strip()}*{' ' if text.endswith(' ') else ''}"
+                   if italic and text.strip() else text
+                   for text, italic in parts)
+
+
+def iter_paragraphs(z: zipfile.ZipFile, part: str, container: str):
+    """part 안의 container(w:body·w:footnote) 단위로 문단 텍스트 목록을 스트리밍"""
+    try:
+        f = z.open(part)
+    except KeyError:
+        return
+    with f:
+        for _, elem in ET.iterparse(f, events=("end",)):
+            if elem.tag != W + container:
+                if elem.tag == W + "p" and container == "body":
+                    yield None, paragraph_text(elem)
+                    elem.clear()
+                continue
+            if container == "footnote":
+                yield elem.get(W + "type"), " ".join(
+                    text for text in map(paragraph_text, elem.iter(W + "p")) if text.strip())
+            elem.clear()
+
+
+def paper_meta(z: zipfile.ZipFile) -> dict:
+    """docProps/core.xml 제목·작성자 (없으면 빈 값)"""
+    try:
+        root = ET.fromstring(z.read("docProps/core.xml"))
+    except (KeyError, ET.ParseError):
+        return {}
+    author = (root.findtext(DC + "creator") or "").strip()
+    return {"title": (root.findtext(DC + "title") or "").strip(),
+            "author": "" if author.casefold() in GENERATOR_AUTHORS else author}
+
+
+def extract_paper(name: str, location: tuple) -> dict:
+    """프로세스 풀 작업: 논문 1편 → {paper, sha256, title, author, citations: [(문장, 유형)]}"""
+    result = {"paper": name}
+    try:
+        data = read_paper(location)
+        result["sha256"] = hashlib.sha256(data).hexdigest()
+        with zipfile.ZipFile(io.BytesIO(data)) as z:
+            meta = paper_meta(z)
+            texts = []
+            for kind, text in iter_paragraphs(z, "word/footnotes.xml", "footnote"):
+                if kind in (None, "normal"):  # separator·continuationSeparator 제외
+                    texts.extend(part for part in text.split(";"))
+
+            title = meta.get("title")
+            in_refs = False
+            for _, text in iter_paragraphs(z, "word/document.xml", "body"):
+                text = text.strip()
+                if not text:
+                    continue
+                if not title:
+                    title = text.replace("*", "")
+                if text.casefold() in REFERENCE_TITLES:
+                    in_refs = True
+                elif in_refs:
+                    if SECTION_END.match(text):
+                        in_refs = False
+                    elif not (DIVIDER_RE.match(text) or GROUP_RE.match(text)):
+                        texts.append(text)
+    except (OSError, zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    citations = []
+    for text in texts:
+        text = SPACES.sub(" ", text).strip()
+        if not text:
+            continue
+        kind = parse_citation(text)["type"]
+        if kind not in SKIP_TYPES:
+            citations.append((text, kind))
+
+    result.update(title=title or Path(name).stem, author=meta.get("author") or None,
+                  citations=citations)
+    return result
+
+
+def dedupe_key(text: str) -> str:
+    """대조 키(기호·공백·대소문자 무시)의 해시 — 같은 인용의 표기 차이를 하나로"""
+    key = match_key(text)
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=12).hexdigest() if key else ""
+
+
+# ===== 임베더 =====
+
+class HashEmbedder:
+    """결정적 로컬 임베더: 문자 3-gram + 단어를 crc32로 해싱 (부호 있는 특징 해싱)
+
+    의미 유사도는 없지만 같은 입력에는 항상 같은 벡터를 돌려주고 표기가 비슷한 인용끼리
+    가깝다. 네트워크 없이 적재·검색 경로 전체를 시험하는 용도.
+    """
+
+    def __init__(self, dim: int = 1536):
+        self.dim = dim
+        self.model = f"hash-{dim}"
+
+    def __call__(self, texts: list):
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            text = f" {SPACES.sub(' ', text).casefold()} "
+            features = [text[j:j + 3] for j in range(len(text) - 2)] + text.split()
+            for feature in features:
+                h = zlib.crc32(feature.encode("utf-8"))
+                out[i, h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        return normalize_rows(out)
+
+
+class OpenAIEmbedder:
+    """OpenAI 임베딩 (getEmbedding과 같은 모델·8000자 절단), 묶음당 요청 1회"""
+
+    def __init__(self, model: str = DEFAULT_MODEL, retries: int = 5):
+        try:
+            from openai import OpenAI
+        except ImportError:
+            raise ImportError("openai not installed (pip install openai)")
+        self.client = OpenAI()
+        self.model = model
+        self.retries = retries
+
+    def __call__(self, texts: list):
+        inputs = [text[:8000] for text in texts]
+        for attempt in range(self.retries):
+            try:
+                response = self.client.embeddings.create(model=self.model, input=inputs)
+                break
+            except Exception:
+                if attempt == self.retries - 1:
+                    raise
+                time.sleep(2 ** attempt)  # 속도 제한·일시 오류: 지수 백오프
+        return np.asarray([item.embedding for item in response.data], dtype=np.float32)
+
+
+def load_embedder(name: str, model: str = DEFAULT_MODEL, dim: int = 1536):
+    """이름 → texts → 벡터 행렬 함수 (model 속성으로 색인 meta에 기록)"""
+    if name == "hash":
+        return HashEmbedder(dim)
+    if name == "openai":
+        return OpenAIEmbedder(model)
+    if ":" not in name:
+        raise ValueError(f"Unknown embedder: {name} (openai, hash, module:function)")
+    module_name, attr = name.split(":", 1)
+    fn = getattr(importlib.import_module(module_name), attr)
+    if not hasattr(fn, "model"):
+        fn.model = name
+    return fn
+
+
+# ===== 대상 =====
+
+class LocalTarget:
+    """vector_index.py 색인 — 청크마다 add (meta.json 교체가 커밋)"""
+
+    def __init__(self, directory, dtype: str = "float32"):
+        self.directory = Path(directory) if directory else default_index_dir()
+        self.dtype = dtype
+        self.index = LocalIndex(self.directory) if (self.directory / "meta.json").exists() else None
+
+    def describe(self) -> str:
+        return f"local:{self.directory}"
+
+    def existing_keys(self) -> set:
+        if self.index is None:
+            return set()
+        return {dedupe_key(row.get("content") or "") for row in self.index.rows}
+
+    def write(self, rows: list, vectors, model: str) -> int:
+        if self.index is None:
+            self.index = LocalIndex.create(self.directory, vectors.shape[1], self.dtype, model)
+        elif self.index.meta.get("model") not in (None, model):
+            raise ValueError(f"Embedding model mismatch: index {self.index.meta['model']}, "
+                             f"embedder {model}")
+        return self.index.add(vectors, rows)
+
+    def close(self) -> None:
+        pass
+
+
+class PostgresTarget:
+    """citations 테이블 (README의 pgvector 스키마) — 청크마다 트랜잭션 1개
+
+    이미 같은 content가 있으면 넣지 않는다 (md5(content) 비교, 인덱스 권장:
+    CREATE INDEX ON citations (md5(content))).
+    """
+
+    INSERT = """
+        INSERT INTO citations (content, citation_type, paper_title, paper_author, embedding)
+        SELECT v.content, v.citation_type, v.paper_title, v.paper_author, v.embedding::vector
+        FROM (VALUES %s) AS v(content, citation_type, paper_title, paper_author, embedding)
+        WHERE NOT EXISTS (SELECT 1 FROM citations c WHERE md5(c.content) = md5(v.content))
+    """
+
+    def __init__(self, dsn: str):
+        try:
+            import psycopg2
+            from psycopg2.extras import execute_values
+        except ImportError:
+            raise ImportError("psycopg2 not installed (pip install psycopg2-binary)")
+        self.dsn = dsn
+        self.conn = psycopg2.connect(dsn)
+        self.execute_values = execute_values
+
+    def describe(self) -> str:
+        return "postgres:" + re.sub(r"//[^@/]*@", "//***@", self.dsn)
+
+    def existing_keys(self) -> set:
+        keys = set()
+        with self.conn, self.conn.cursor(name="ingest_existing") as cur:
+            cur.itersize = 10000
+            cur.execute("SELECT content FROM citations")
+            for (content,) in cur:
+                keys.add(dedupe_key(content or ""))
+        return keys
+
+    def write(self, rows: list, vectors, model: str) -> int:
+        values = [(row["content"], row["citation_type"], row["paper_title"], row["paper_author"],
+                   "[" + ",".join(f"{x:.7g}" for x in vector) + "]")
+                  for row, vector in zip(rows, vectors.tolist())]
+        with self.conn, self.conn.cursor() as cur:  # 블록 끝에서 커밋, 예외 시 롤백
+            self.execute_values(cur, self.INSERT, values, page_size=1000)
+            return cur.rowcount
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+# ===== 체크포인트 =====
+
+def default_checkpoint_path() -> Path:
+    return cache_dir() / "ingest_checkpoint.json"
+
+
+def load_checkpoint(path: Path, target: str) -> dict:
+    """대상이 같을 때만 이어 간다 (다른 대상이면 처음부터)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        checkpoint = {}
+    if checkpoint.get("version") != CHECKPOINT_VERSION or checkpoint.get("target") != target:
+        checkpoint = {"version": CHECKPOINT_VERSION, "target": target, "papers": {}}
+    return checkpoint
+
+
+def save_checkpoint(path: Path, checkpoint: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(checkpoint, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+# ===== 파이프라인 =====
+
+def ingest(source: Path, target, embedder, checkpoint: dict, checkpoint_path=None,
+           chunk: int = 2000, batch: int = 256, max_workers=None, log=None) -> dict:
+    """추출(병렬) → 분류·중복 제거 → 청크마다 묶음 임베딩 + 대상 커밋 + 체크포인트"""
+    done = checkpoint["papers"]
+    seen = target.existing_keys()
+    stats = {"papers": 0, "skipped_papers": 0, "failed": [], "extracted": 0,
+             "duplicates": 0, "added": 0, "chunks": 0, "embed_s": 0.0, "write_s": 0.0}
+    pending_rows = []
+    pending_papers = {}
+
+    def flush():
+        if pending_rows:
+            vectors = []
+            started = time.perf_counter()
+            for i in range(0, len(pending_rows), batch):
+                vectors.append(np.asarray(
+                    embedder([row["content"] for row in pending_rows[i:i + batch]]), np.float32))
+            stats["embed_s"] += time.perf_counter() - started
+            started = time.perf_counter()
+            stats["added"] += target.write(pending_rows, np.concatenate(vectors), embedder.model)
+            stats["write_s"] += time.perf_counter() - started
+            stats["chunks"] += 1
+        if pending_papers:
+            done.update(pending_papers)
+            if checkpoint_path:
+                save_checkpoint(checkpoint_path, checkpoint)
+            if log:
+                log({"chunk": stats["chunks"], "papers": len(done), "added": stats["added"]})
+        pending_rows.clear()
+        pending_papers.clear()
+
+    # 체크포인트 키는 원본 경로 + 이름 (호마다 폴더·zip이 따로면 01.docx 같은 이름이 겹침),
+    # 지문이 같을 때만 끝난 논문으로 본다 (같은 자리의 파일이 바뀌면 다시 적재)
+    prefix = f"{source.resolve()}::"
+    archives = {}
+    papers = []
+    todo = []
+    for name, location in iter_papers(source):
+        key = prefix + name
+        mark = file_fingerprint(location, archives)
+        papers.append(key)
+        entry = done.get(key)
+        if entry is None or entry.get("fingerprint") != mark:
+            todo.append((key, mark, name, location))
+    stats["skipped_papers"] = len(papers) - len(todo)
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        names = [name for _, _, name, _ in todo]
+        locations = [location for _, _, _, location in todo]
+        results = pool.map(extract_paper, names, locations, chunksize=4) if todo else []
+        for (key, mark, _, _), paper in zip(todo, results):
+            if "error" in paper:
+                stats["failed"].append({"paper": paper["paper"], "error": paper["error"]})
+                continue
+            stats["papers"] += 1
+            added = 0
+            for text, kind in paper["citations"]:
+                stats["extracted"] += 1
+                dup_key = dedupe_key(text)
+                if not dup_key or dup_key in seen:
+                    stats["duplicates"] += 1
+                    continue
+                seen.add(dup_key)
+                added += 1
+                pending_rows.append({"content": text, "citation_type": kind,
+                                     "paper_title": paper["title"], "paper_author": paper["author"]})
+            pending_papers[key] = {"sha256": paper["sha256"], "fingerprint": mark, "citations": added}
+            if len(pending_rows) >= chunk:
+                flush()
+        flush()
+
+    stats["embed_s"] = round(stats["embed_s"], 2)
+    stats["write_s"] = round(stats["write_s"], 2)
+    return stats
+
+
+class DryRunTarget:
+    """--dry-run: 추출·분류·중복 제거·임베딩까지만 하고 기록하지 않음"""
+
+    def describe(self) -> str:
+        return "dry-run"
+
+    def existing_keys(self) -> set:
+        return set()
+
+    def write(self, rows: list, vectors, model: str) -> int:
+        return len(rows)
+
+    def close(self) -> None:
+        pass
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="게재 논문 → 인용 사례 말뭉치 일괄 적재")
+    parser.add_argument("source", help=".docx 폴더, .zip 아카이브 또는 .docx 1편")
+    parser.add_argument("--target", choices=["local", "postgres"], default="local")
+    parser.add_argument("--index", help="로컬 색인 디렉터리 (기본: SHINSA_INDEX_DIR 또는 ~/.cache/shinsa-mcp/citation_index)")
+    parser.add_argument("--dtype", choices=["float32", "float16"], default="float32")
+    parser.add_argument("--dsn", default=os.environ.get("DATABASE_URL"),
+                        help="Postgres 접속 문자열 (기본: DATABASE_URL)")
+    parser.add_argument("--embedder", default="openai", help="openai | hash | 모듈:함수")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--dim", type=int, default=1536, help="hash 임베더 차원")
+    parser.add_argument("--embed-cache", help="임베딩 캐시 (기본: ~/.cache/shinsa-mcp/embeddings.sqlite3)")
+    parser.add_argument("--no-embed-cache", action="store_true", help="임베딩 캐시 사용 안 함")
+    parser.add_argument("--chunk", type=int, default=2000, help="트랜잭션당 인용 수")
+    parser.add_argument("--batch", type=int, default=256, help="임베딩 요청당 인용 수")
+    parser.add_argument("--jobs", type=int, default=None, help="추출 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--checkpoint", help="체크포인트 파일 (기본: ~/.cache/shinsa-mcp/ingest_checkpoint.json)")
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 무시하고 처음부터")
+    parser.add_argument("--dry-run", action="store_true", help="기록하지 않고 통계만")
+    opts = parser.parse_args(argv)
+
+    source = Path(opts.source)
+    if not source.exists():
+        print(json.dumps({"error": f"Not found: {source}"}, ensure_ascii=False))
+        return 1
+
+    try:
+        embedder = load_embedder(opts.embedder, opts.model, opts.dim)
+        cache = None if opts.no_embed_cache else EmbeddingCache(opts.embed_cache)
+        if cache:
+            embedder = CachedEmbedder(embedder, cache)
+        if opts.dry_run:
+            target = DryRunTarget()
+        elif opts.target == "postgres":
+            if not opts.dsn:
+                raise ValueError("--dsn or DATABASE_URL is required for --target postgres")
+            target = PostgresTarget(opts.dsn)
+        else:
+            target = LocalTarget(opts.index, opts.dtype)
+    except ImportError as e:
+        message, _, fix = str(e).partition(" (")
+        print(json.dumps({"error": message, "fix": fix.rstrip(")")}, ensure_ascii=False))
+        return 1
+    except Exception as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False))
+        return 1
+
+    checkpoint_path = None if opts.dry_run else (
+        Path(opts.checkpoint) if opts.checkpoint else default_checkpoint_path())
+    checkpoint = load_checkpoint(checkpoint_path, target.describe()) if checkpoint_path and not opts.restart \
+        else {"version": CHECKPOINT_VERSION, "target": target.describe(), "papers": {}}
+
+    def log(progress: dict) -> None:
+        print(json.dumps(progress, ensure_ascii=False), file=sys.stderr, flush=True)
+
+    started = time.perf_counter()
+    try:
+        stats = ingest(source, target, embedder, checkpoint, checkpoint_path,
+                       opts.chunk, opts.batch, opts.jobs, log)
+        if cache:
+            stats["embed_cache"] = {"hits": cache.hits, "misses": cache.misses}
+    except Exception as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}",
+                          "resume": "re-run the same command to continue from the last chunk"},
+                         ensure_ascii=False))
+        return 1
+    finally:
+        target.close()
+        if cache:
+            cache.close()
+
+    stats["target"] = target.describe()
+    stats["embedder"] = embedder.model
+    stats["elapsed_s"] = round(time.perf_counter() - started, 2)
+    print(json.dumps(stats, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,124 @@
+"""
+인라인 서식 표시 → runs
+문단 텍스트를 한 번 훑어 서식 표시를 run 속성으로 바꾸고, 이웃한 같은 서식 run은 합친다.
+(서식이 없는 문단은 run 1개 그대로 — 문단마다 w:r이 늘지 않음)
+
+    ***굵은 기울임***   **굵게**   *기울임* (외국어 서명: *The Nature of Doctrine*)
+    ^위첨자^ (19^th^)   \\* \\^ \\\\ — 표시 문자 그대로
+    「」 『』 《》 — 서명·논문명 괄호는 글자 그대로 둔다
+
+여는 표시 바로 뒤와 닫는 표시 바로 앞은 공백이 아니어야 하고, 짝이 없는 표시는 글자 그대로 남는다
+(예: "2 * 3", "p < .05*"). 각주 참조처럼 이미 속성이 정해진 run은 건드리지 않고
+그 자리를 넘어 서식이 이어질 수 있다 (**강조[^1] 문장**).
+"""
+
+import re
+
+MARKUP_RE = re.compile(r"""
+    \\(?P<escaped>[*^\\])
+  | \*\*\*(?P<bold_italic>[^\s*](?:.*?[^\s*])?)\*\*\*
+  | \*\*(?P<bold>[^\s*](?:.*?[^\s*])?)\*\*
+  | \*(?P<italic>[^\s*](?:.*?[^\s*])?)\*
+  | \^(?P<superscript>[^\s^]+)\^
+""", re.VERBOSE | re.DOTALL)
+
+MARKUP_PROPS = {
+    "bold_italic": {"bold": True, "italic": True},
+    "bold": {"bold": True},
+    "italic": {"italic": True},
+    "superscript": {"superscript": True},
+}
+
+# 안쪽 표시도 해석하는 서식 (**굵게 *기울임* 굵게**)
+NESTED = ("bold", "italic")
+
+# 속성이 정해진 run(각주 참조 등)의 자리 표시 — 입력에 이 글자가 있으면 표시 해석을 하지 않는다
+PLACEHOLDER = "\ufffc"
+
+
+def has_markup(text: str) -> bool:
+    return "*" in text or "^" in text or "\\" in text
+
+
+def tokenize(text: str, props=None) -> list:
+    """텍스트 → [(text, props)] (표시 제거, 합치기 전)"""
+    if not has_markup(text):
+        return [(text, props)]
+    runs = []
+    pos = 0
+    for match in MARKUP_RE.finditer(text):
+        if match.start() > pos:
+            runs.append((text[pos:match.start()], props))
+        kind = match.lastgroup
+        inner = match.group(kind)
+        if kind == "escaped":
+            runs.append((inner, props))
+        elif kind in NESTED:
+            runs.extend(tokenize(inner, {**props, **MARKUP_PROPS[kind]} if props else MARKUP_PROPS[kind]))
+        else:
+            runs.append((inner, {**props, **MARKUP_PROPS[kind]} if props else MARKUP_PROPS[kind]))
+        pos = match.end()
+    if pos < len(text):
+        runs.append((text[pos:], props))
+    return runs
+
+
+def coalesce(runs) -> list:
+    """빈 run을 버리고 이웃한 같은 속성 run을 합침 (각주 참조는 합치지 않음)"""
+    merged = []
+    for text, props in runs:
+        props = props or None
+        fixed = props is not None and "footnote" in props
+        if not text and not fixed:
+            continue
+        if merged and not fixed and merged[-1][1] == props:
+            merged[-1] = (merged[-1][0] + text, props)
+        else:
+            merged.append((text, props))
+    return merged
+
+
+def inline_runs(runs) -> list:
+    """runs (각주 참조 포함 가능) → 서식 표시를 해석하고 합친 runs
+
+    속성이 없는 run의 텍스트만 표시로 읽는다. 속성이 있는 run은 자리 표시로 바꿔
+    문단 전체를 한 번에 토큰화한 뒤 제자리에 되돌린다.
+    """
+    if len(runs) == 1 and runs[0][1] is None:
+        text = runs[0][0]
+        return coalesce(tokenize(text)) if has_markup(text) and PLACEHOLDER not in text else list(runs)
+
+    fixed = []
+    parts = []
+    for text, props in runs:
+        if props:
+            fixed.append((text, props))
+            parts.append(PLACEHOLDER)
+        else:
+            parts.append(text)
+    text = "".join(parts)
+    if not has_markup(text) or text.count(PLACEHOLDER) != len(fixed):
+        return coalesce(runs)
+
+    result = []
+    pending = iter(fixed)
+    for piece, props in tokenize(text):
+        if PLACEHOLDER not in piece:
+            result.append((piece, props))
+            continue
+        pieces = piece.split(PLACEHOLDER)
+        for i, part in enumerate(pieces):
+            if i:
+                result.append(next(pending))
+            result.append((part, props))
+    return coalesce(result)
+
+
+def inline_text(text: str) -> list:
+    """문단 텍스트 1개 → runs"""
+    return inline_runs([(text, None)])
+
+
+def strip_markup(text: str) -> str:
+    """표시를 뺀 글자만 (쪽수 추정 등 글자 폭 계산용)"""
+    return "".join(t for t, _ in tokenize(text)) if has_markup(text) else text
@@ -0,0 +1,34 @@
+"""
+로컬 캐시·증분 처리 공용 도우미 (표준 라이브러리만 사용)
+
+    cache_dir          디스크 캐시 위치 (SHINSA_CACHE_DIR, 기본 ~/.cache/shinsa-mcp)
+    file_fingerprint   내용을 읽지 않고 원고가 바뀌었는지 판단할 지문
+"""
+
+import os
+import zipfile
+from pathlib import Path
+
+
+def cache_dir() -> Path:
+    """디스크 캐시 위치 (SHINSA_CACHE_DIR, 기본 ~/.cache/shinsa-mcp)"""
+    path = os.environ.get("SHINSA_CACHE_DIR")
+    return Path(path) if path else Path.home() / ".cache" / "shinsa-mcp"
+
+
+def file_fingerprint(location: tuple, archives: dict) -> list:
+    """내용을 읽지 않고 바뀌었는지 판단할 지문 (파일: 크기·수정 시각, zip 항목: 크기·CRC)
+
+    location: (파일 경로, zip 항목 이름 또는 None)
+    archives: zip 경로 → {항목 이름: ZipInfo} (아카이브마다 목록을 한 번만 읽음)
+    """
+    path, member = location
+    if member is None:
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns]
+    infos = archives.get(path)
+    if infos is None:
+        with zipfile.ZipFile(path) as archive:
+            infos = archives[path] = {info.filename: info for info in archive.infolist()}
+    info = infos[member]
+    return [info.file_size, info.CRC]
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+생성 결과(DOCX) 디스크 캐시
+같은 논문 JSON이 다시 들어오면 (에이전트 재시도, 같은 도구 호출 반복) 다시 생성하지 않고
+저장해 둔 파일을 복사해 돌려준다. 출력은 바이트 단위로 재현되므로(stream_docx.zip_info)
+캐시된 파일은 새로 생성한 파일과 같다.
+
+    키    입력 JSON(정렬) + 사양 버전·프로필 해시 + 렌더러 버전 + 백엔드·검사 모드의 SHA-256
+    항목  <dir>/<키 앞 2자>/<키>.docx + <키>.json (생성 결과 JSON)
+    정리  put 때마다: max_age_s보다 오래 안 쓴 항목 삭제 → 합계가 max_bytes를 넘으면 오래 안 쓴 순 삭제
+          (적중 시 mtime을 갱신하므로 mtime = 마지막 사용 시각)
+
+출력 형식이 바뀌는 변경은 OUTPUT_VERSION(또는 section_cache.RENDER_VERSION)을 올려 이전 캐시를 무효화한다.
+
+사용법:
+    python scripts/output_cache.py stats [--dir DIR]
+    python scripts/output_cache.py evict [--max-mb 512] [--max-age-days 30]
+    python scripts/output_cache.py clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+from local_cache import cache_dir
+
+OUTPUT_VERSION = 2
+
+DEFAULT_MAX_MB = 512
+DEFAULT_MAX_AGE_DAYS = 30
+
+
+def output_key(data: dict, *parts) -> str:
+    """입력 + 생성 조건 → 캐시 키"""
+    payload = json.dumps([OUTPUT_VERSION, parts, data], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class OutputCache:
+    """키 → DOCX 파일 + 결과 JSON"""
+
+    def __init__(self, directory, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024,
+                 max_age_s: float = DEFAULT_MAX_AGE_DAYS * 86400):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_s = max_age_s
+        self.hits = 0
+        self.misses = 0
+
+    def _paths(self, key: str) -> tuple:
+        base = self.directory / key[:2] / key
+        return base.with_suffix(".docx"), base.with_suffix(".json")
+
+    def get(self, key: str, output_path):
+        """적중하면 파일을 output_path로 복사하고 저장된 결과 dict 반환, 아니면 None"""
+        docx, meta = self._paths(key)
+        try:
+            with open(meta, "r", encoding="utf-8") as f:
+                result = json.load(f)
+            output_path = Path(output_path)
+            tmp = output_path.with_name(f".{output_path.name}.{os.getpid()}.tmp")
+            shutil.copyfile(docx, tmp)
+            os.replace(tmp, output_path)
+            now = time.time()
+            os.utime(docx, (now, now))
+            os.utime(meta, (now, now))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def put(self, key: str, source_path, result: dict) -> None:
+        """생성된 파일과 결과 저장 (실패는 무시 — 캐시는 없어도 동작)"""
+        docx, meta = self._paths(key)
+        docx_tmp = docx.with_name(f"{key}.{os.getpid()}.docx.tmp")
+        meta_tmp = meta.with_name(f"{key}.{os.getpid()}.json.tmp")
+        try:
+            docx.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(source_path, docx_tmp)
+            with open(meta_tmp, "w", encoding="utf-8") as f:
+                json.dump(result, f, ensure_ascii=False)
+            # 결과 JSON이 있어야 적중으로 보므로 파일을 먼저 옮긴다
+            os.replace(docx_tmp, docx)
+            os.replace(meta_tmp, meta)
+        except OSError:
+            return
+        self.evict()
+
+    def entries(self) -> list:
+        """[(마지막 사용 시각, 바이트, 키)]"""
+        items = []
+        if not self.directory.is_dir():
+            return items
+        for docx in self.directory.glob("*/*.docx"):
+            try:
+                docx_stat = docx.stat()
+                meta_size = docx.with_suffix(".json").stat().st_size
+            except OSError:
+                continue
+            items.append((docx_stat.st_mtime, docx_stat.st_size + meta_size, docx.stem))
+        return items
+
+    def remove(self, key: str) -> None:
+        for path in self._paths(key):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def evict(self) -> dict:
+        """나이·크기 기준 정리"""
+        entries = sorted(self.entries())
+        cutoff = time.time() - self.max_age_s
+        removed = freed = 0
+        total = sum(size for _, size, _ in entries)
+        for used, size, key in entries:
+            if used >= cutoff and total <= self.max_bytes:
+                break
+            self.remove(key)
+            removed += 1
+            freed += size
+            total -= size
+        return {"removed": removed, "freed_bytes": freed, "entries": len(entries) - removed,
+                "bytes": total}
+
+    def clear(self) -> dict:
+        entries = self.entries()
+        for _, _, key in entries:
+            self.remove(key)
+        return {"removed": len(entries)}
+
+    def stats(self) -> dict:
+        entries = self.entries()
+        return {
+            "directory": str(self.directory),
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "max_age_s": self.max_age_s,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def cache_from_env():
+    """SHINSA_OUTPUT_CACHE: 없음/0 → None, 1 → <cache_dir>/outputs, 그 외 → 그 경로
+    크기·나이 한도: SHINSA_OUTPUT_CACHE_MAX_MB, SHINSA_OUTPUT_CACHE_MAX_AGE_DAYS"""
+    setting = os.environ.get("SHINSA_OUTPUT_CACHE", "0")
+    if setting in ("", "0"):
+        return None
+    directory = default_directory() if setting == "1" else Path(setting)
+    max_mb = float(os.environ.get("SHINSA_OUTPUT_CACHE_MAX_MB", DEFAULT_MAX_MB))
+    max_age_days = float(os.environ.get("SHINSA_OUTPUT_CACHE_MAX_AGE_DAYS", DEFAULT_MAX_AGE_DAYS))
+    return OutputCache(directory, int(max_mb * 1024 * 1024), max_age_days * 86400)
+
+
+def default_directory() -> Path:
+    """<cache_dir>/outputs"""
+    return cache_dir() / "outputs"
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="DOCX 생성 결과 캐시 관리")
+    parser.add_argument("command", choices=("stats", "evict", "clear"))
+    parser.add_argument("--dir", help="캐시 폴더 (기본: SHINSA_OUTPUT_CACHE 경로 또는 <cache_dir>/outputs)")
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_MB)
+    parser.add_argument("--max-age-days", type=float, default=DEFAULT_MAX_AGE_DAYS)
+    opts = parser.parse_args(argv)
+
+    setting = os.environ.get("SHINSA_OUTPUT_CACHE", "")
+    directory = opts.dir or (setting if setting not in ("", "0", "1") else default_directory())
+    cache = OutputCache(directory, int(opts.max_mb * 1024 * 1024), opts.max_age_days * 86400)
+
+    if opts.command == "evict":
+        result = cache.evict()
+    elif opts.command == "clear":
+        result = cache.clear()
+    else:
+        result = cache.stats()
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
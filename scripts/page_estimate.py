@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+신국판 쪽수 추정기
+Word로 열지 않고 블록(create_docx의 (role, runs, fmt))과 각주만으로 줄바꿈·쪽 나눔을 근사 계산한다.
+논문 1편에 수 ms 수준이라 생성할 때마다, 호 단위로는 논문마다 이어서 돌릴 수 있다.
+
+    - 글자 폭 (1/1000 em): 한글·한자·전각 기호 = 1000, 라틴 글자는 Times New Roman 폭 표
+      (바탕의 라틴 글자는 같은 표 × BATANG_LATIN_SCALE 근사), 굵게는 BOLD_SCALE
+    - 줄 높이: 글꼴 한 줄 높이(LINE_EM) × 글자 크기 × 줄 간격 배수 (본문 160%)
+    - 줄바꿈: 공백 기준 단어(한글은 어절) 단위, 한 줄보다 긴 단어는 줄 폭 단위로 자름.
+      줄 끝 공백은 폭에 넣지 않는다 (Word와 같음)
+    - 쪽 나눔: 문단 앞뒤 간격(쪽 첫머리의 앞 간격은 생략), 외톨이·과부 줄 방지,
+      각주는 참조한 줄과 같은 쪽 아래에 구분선과 함께 배치 (한 쪽보다 긴 각주는 다음 쪽으로 이어짐)
+    - 표: 행 높이 = 셀마다 열 폭으로 줄바꿈한 줄 수의 최댓값, 행 단위로 쪽을 나누고
+      넘어간 쪽에는 머리글 행을 다시 넣음
+
+사용법:
+    python scripts/page_estimate.py paper.json [paper2.json ...] [--start-page 1]
+"""
+
+import json
+import sys
+import time
+
+from inline_markup import inline_text
+from tables import CELL_ROLE, HEAD_ROLE, TABLE
+
+PT_PER_MM = 72 / 25.4
+
+# Times New Roman (Adobe Times-Roman AFM과 같은 폭) — ASCII 32 ~ 126, 1/1000 em
+TIMES_ASCII = (
+    250, 333, 408, 500, 500, 833, 778, 180, 333, 333, 500, 564, 250, 333, 250, 278,  # space ~ /
+    500, 500, 500, 500, 500, 500, 500, 500, 500, 500,                                # 0 ~ 9
+    278, 278, 564, 564, 564, 444, 921,                                               # : ~ @
+    722, 667, 667, 722, 611, 556, 722, 722, 333, 389, 722, 611, 889,                 # A ~ M
+    722, 722, 556, 722, 667, 556, 611, 722, 722, 944, 722, 722, 611,                 # N ~ Z
+    333, 278, 333, 469, 500, 333,                                                    # [ ~ `
+    444, 500, 444, 500, 444, 333, 500, 500, 278, 278, 500, 278, 778,                 # a ~ m
+    500, 500, 500, 500, 333, 389, 278, 500, 500, 722, 500, 500, 444,                 # n ~ z
+    480, 200, 480, 541,                                                              # { ~ ~
+)
+TIMES = {chr(32 + i): width for i, width in enumerate(TIMES_ASCII)}
+TIMES.update({
+    "‘": 333, "’": 333, "“": 444, "”": 444,  # ‘ ’ “ ”
+    "–": 500, "—": 1000, "…": 1000, "·": 250, "\u00a0": 250,
+})
+# 표에 없는 라틴 문자(악센트 등)의 폭
+TIMES_DEFAULT = 500
+
+# 한국어 글꼴에서 전각으로 찍히는 문장 부호 (따옴표, 가운뎃점, 말줄임표, 참고표)
+KOREAN_WIDE_PUNCT = frozenset("‘’“”·…※")
+
+BATANG_LATIN_SCALE = 1.05
+BOLD_SCALE = 1.05
+
+# 글꼴 한 줄 높이 (em, Word "한 줄" 간격 기준)
+LINE_EM = {"바탕": 1.0, "Times New Roman": 1.15}
+DEFAULT_LINE_EM = 1.15
+
+# 위첨자(각주 번호) 크기 비율
+SUPERSCRIPT_SCALE = 0.65
+
+# 표 셀 좌우 여백 (stream_docx.CELL_MARGIN, pt)
+CELL_MARGIN_PT = 57 / 20
+
+
+def is_wide(ch: str) -> bool:
+    """전각 문자 (한글, 한자, 가나, 전각 기호, 로마 숫자·원문자·상자 그림 등 CJK 글꼴 기호)"""
+    cp = ord(ch)
+    return (0xAC00 <= cp <= 0xD7A3 or 0x1100 <= cp <= 0x115F or 0x2E80 <= cp <= 0xA4CF
+            or 0xF900 <= cp <= 0xFAFF or 0xFE30 <= cp <= 0xFE4F or 0xFF00 <= cp <= 0xFF60
+            or 0xFFE0 <= cp <= 0xFFE6 or 0x2160 <= cp <= 0x217F or 0x2460 <= cp <= 0x27BF
+            or 0x3000 <= cp <= 0x303F)
+
+
+class Advances(dict):
+    """글꼴 1개의 글자 → 폭(1/1000 em) 표. 처음 보는 글자는 계산해 채워 둔다"""
+
+    def __init__(self, korean: bool, bold: bool = False):
+        super().__init__()
+        self.latin_scale = (BATANG_LATIN_SCALE if korean else 1.0) * (BOLD_SCALE if bold else 1.0)
+        self.korean = korean
+
+    def __missing__(self, ch: str) -> float:
+        if is_wide(ch) or (self.korean and ch in KOREAN_WIDE_PUNCT):
+            width = 1000.0
+        elif ch in "\t\n\r":
+            width = TIMES[" "] * self.latin_scale
+        else:
+            width = TIMES.get(ch, TIMES_DEFAULT) * self.latin_scale
+        self[ch] = width
+        return width
+
+
+_advances = {}
+
+
+def advances(font: str, bold: bool = False) -> Advances:
+    key = (font, bold)
+    table = _advances.get(key)
+    if table is None:
+        table = _advances[key] = Advances(font != "Times New Roman", bold)
+    return table
+
+
+def text_width(text: str, font: str, size: float, bold: bool = False) -> float:
+    """문자열 폭 (pt)"""
+    get = advances(font, bold).__getitem__
+    return sum(map(get, text)) * size / 1000
+
+
+class Layout:
+    """쪽 설정 + 스타일별 글꼴·크기·간격 (프로필 1개당 한 번 계산)"""
+
+    def __init__(self, cfg: dict, styles: dict):
+        page, fonts = cfg["page"], cfg["fonts"]
+        self.width = (page["width_mm"] - page["margin_left_mm"] - page["margin_right_mm"]) * PT_PER_MM
+        self.height = (page["height_mm"] - page["margin_top_mm"] - page["margin_bottom_mm"]) * PT_PER_MM
+        self.fonts = fonts
+        self.normal = self._style(fonts["korean"], fonts["body_size"], False, {}, cfg)
+        self.styles = {
+            role: self._style(fonts[font_key], fonts[size] if isinstance(size, str) else size,
+                              bold, fmt, cfg)
+            for role, (font_key, size, bold, fmt) in styles.items()
+        }
+        footnote = self.styles.get("Footnote") or self.normal
+        self.footnote = footnote
+        # 각주 구분선 문단: Normal 크기, 한 줄 간격
+        self.separator = fonts["body_size"] * LINE_EM.get(fonts["korean"], DEFAULT_LINE_EM)
+
+    def _style(self, font: str, size: float, bold: bool, fmt: dict, cfg: dict) -> dict:
+        line = fmt.get("line", 1.0)
+        multiple = cfg[line] if isinstance(line, str) else line
+        left = fmt.get("left_mm", 0) * PT_PER_MM
+        right = fmt.get("right_mm", 0) * PT_PER_MM
+        first = fmt.get("first_mm", 0) * PT_PER_MM
+        return {
+            "font": font,
+            "size": size,
+            "bold": bold,
+            "line": size * LINE_EM.get(font, DEFAULT_LINE_EM) * multiple,
+            "before": fmt.get("before", 0),
+            "after": fmt.get("after", 0),
+            "width": self.width - left - right,
+            "first_width": self.width - left - right - first,
+        }
+
+    def style(self, role):
+        return self.styles.get(role, self.normal) if role else self.normal
+
+
+def words(runs, style: dict, mark_width) -> tuple:
+    """runs → (단어 폭 목록 pt, 단어 사이 공백 폭 pt, {단어 번호: 각주 id 목록})
+
+    각주 참조는 앞 글자에 붙어 있으므로 그 단어의 폭에 더한다.
+    """
+    font, size, bold = style["font"], style["size"], style["bold"]
+    space = advances(font)[" "] * size / 1000
+    widths = [0.0]
+    notes = {}
+    for text, props in runs:
+        if props and "footnote" in props:
+            widths[-1] += mark_width(text, props["footnote"], font, size)
+            notes.setdefault(len(widths) - 1, []).append(props["footnote"])
+            continue
+        run_size = props.get("size", size) if props else size
+        if props and props.get("superscript"):
+            run_size *= SUPERSCRIPT_SCALE
+        get = advances(font, bold or bool(props and props.get("bold"))).__getitem__
+        scale = run_size / 1000
+        pieces = [sum(map(get, piece)) * scale for piece in text.split(" ")]
+        widths[-1] += pieces[0]
+        widths.extend(pieces[1:])
+    return widths, space, notes
+
+
+def break_lines(widths: list, space: float, notes: dict, first_width: float, width: float) -> list:
+    """단어 폭 목록 → 줄마다 각주 id 목록 (줄 수 = 길이)"""
+    lines = [[]]
+    x = 0.0
+    limit = first_width
+    for index, word in enumerate(widths):
+        if x and x + word > limit:
+            lines.append([])
+            x, limit = 0.0, width
+        while word > limit > 0:
+            # 한 줄보다 긴 단어(URL, 공백 없는 긴 문자열)는 줄 폭 단위로 잘림
+            lines.append([])
+            word -= limit
+            limit = width
+        x += word + space
+        if index in notes:
+            lines[-1].extend(notes[index])
+    return lines
+
+
+class PageFlow:
+    """본문 줄과 각주를 쪽에 채워 나가는 상태"""
+
+    def __init__(self, layout: Layout):
+        self.layout = layout
+        self.capacity = layout.height
+        self.pages = 1
+        self.used = 0.0
+        self.page_has_notes = False
+        self.lines = 0
+        self.footnote_lines = 0
+
+    def new_page(self) -> None:
+        self.pages += 1
+        self.used = 0.0
+        self.page_has_notes = False
+
+    def _cost(self, line: float, notes: float, has_notes: bool) -> float:
+        return line + notes + (self.layout.separator if notes and not has_notes else 0.0)
+
+    def fit(self, line: float, note_heights: list) -> int:
+        """지금 쪽에 들어가는 줄 수"""
+        used, has_notes = self.used, self.page_has_notes
+        for count, notes in enumerate(note_heights):
+            cost = self._cost(line, notes, has_notes)
+            if used + cost > self.capacity:
+                return count
+            used += cost
+            has_notes = has_notes or notes > 0
+        return len(note_heights)
+
+    def place(self, line: float, notes: float) -> None:
+        self.used += self._cost(line, notes, self.page_has_notes)
+        self.page_has_notes = self.page_has_notes or notes > 0
+        self.lines += 1
+        while self.used > self.capacity:
+            # 한 쪽을 넘는 각주: 넘친 만큼 다음 쪽으로 이어짐
+            overflow = self.used - self.capacity
+            self.new_page()
+            self.used = overflow
+            self.page_has_notes = overflow > 0
+
+    def paragraph(self, style: dict, note_heights: list, fmt=None) -> None:
+        before = fmt.get("space_before", style["before"]) if fmt else style["before"]
+        after = fmt.get("space_after", style["after"]) if fmt else style["after"]
+        line = style["line"]
+
+        if self.used > 0:
+            if self.used + before >= self.capacity:
+                self.new_page()
+            else:
+                self.used += before
+
+        total = len(note_heights)
+        i = 0
+        while i < total:
+            rest = note_heights[i:]
+            count = self.fit(line, rest)
+            if count < len(rest):
+                if i == 0 and count == 1 and total >= 2:
+                    count = 0  # 외톨이 줄: 첫 줄만 쪽 끝에 남기지 않음
+                elif len(rest) - count == 1 and total >= 3:
+                    count -= 1  # 과부 줄: 마지막 줄만 다음 쪽으로 넘기지 않음
+                    if i == 0 and count == 1:
+                        count = 0
+                if count == 0 and self.used == 0:
+                    count = 1  # 빈 쪽에도 안 들어가는 줄은 그대로 둠
+            for notes in rest[:count]:
+                self.place(line, notes)
+            i += count
+            if i < total:
+                self.new_page()
+
+        self.used = min(self.used + after, self.capacity)
+
+    def table(self, header: float, rows: list) -> None:
+        """표: 행은 쪽을 넘어 나뉘지 않고, 새 쪽에는 머리글 행이 반복됨"""
+        if self.used + header + (rows[0] if rows else 0.0) > self.capacity and self.used > 0:
+            self.new_page()
+        self.used += header
+        self.lines += 1 if header else 0
+        for height in rows:
+            if self.used + height > self.capacity and self.used > header:
+                self.new_page()
+                self.used = header
+            self.used += height
+            self.lines += 1
+
+
+def cell_height(runs, style: dict, width: float) -> float:
+    widths, space, _ = words(runs, style, None)
+    return len(break_lines(widths, space, {}, width, width)) * style["line"]
+
+
+def row_height(cells, style: dict, widths: list) -> float:
+    """행 높이 (셀 중 가장 긴 것)"""
+    return max((cell_height(runs, style, width) for runs, width in zip(cells, widths)), default=0.0)
+
+
+def estimate_pages(blocks, notes, cfg: dict, styles: dict) -> dict:
+    """블록 전체의 쪽수 추정
+
+    Args:
+        blocks: (role, runs, fmt) 블록 iterable (create_docx.stream_blocks)
+        notes: 각주 수집기 (footnotes.Footnotes — entries[id - 1] = (id, 기호, 내용)),
+               블록을 만들면서 채워지므로 blocks와 같은 객체여야 한다
+        cfg: 형식 프로필 (page, fonts, line_spacing)
+        styles: create_docx.PARAGRAPH_STYLES
+
+    Returns:
+        {pages, lines, footnote_lines, last_page_fill, elapsed_ms}
+    """
+    started = time.perf_counter()
+    layout = Layout(cfg, styles)
+    flow = PageFlow(layout)
+    footnote = layout.footnote
+    note_cache = {}
+
+    def mark_width(text: str, note_id: int, font: str, size: float) -> float:
+        return text_width(text or str(note_id), font, size * SUPERSCRIPT_SCALE)
+
+    def note_height(note_id: int) -> float:
+        height = note_cache.get(note_id)
+        if height is None:
+            _, mark, text = notes.entries[note_id - 1]
+            widths, space, _ = words([(mark or str(note_id), {"superscript": True}),
+                                      *inline_text(" " + text)], footnote, mark_width)
+            lines = len(break_lines(widths, space, {}, footnote["first_width"], footnote["width"]))
+            flow.footnote_lines += lines
+            height = note_cache[note_id] = lines * footnote["line"]
+        return height
+
+    for role, runs, fmt in blocks:
+        if role == TABLE:
+            widths = [w / 20 - 2 * CELL_MARGIN_PT for w in runs["widths"]]
+            header = row_height(runs["header"], layout.style(HEAD_ROLE), widths) if runs["header"] else 0.0
+            cell = layout.style(CELL_ROLE)
+            flow.table(header, [row_height(row, cell, widths) for row in runs["rows"]])
+            continue
+        style = layout.style(role)
+        widths, space, ids = words(runs, style, mark_width)
+        lines = break_lines(widths, space, ids, style["first_width"], style["width"])
+        flow.paragraph(style, [sum(map(note_height, ids)) if ids else 0.0 for ids in lines], fmt)
+
+    return {
+        "pages": flow.pages,
+        "lines": flow.lines,
+        "footnote_lines": flow.footnote_lines,
+        "last_page_fill": round(flow.used / flow.capacity, 3),
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
+def main(argv: list) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="신국판 쪽수 추정 (입력 JSON)")
+    parser.add_argument("inputs", nargs="+", help="create_docx 입력 JSON (여러 개면 순서대로 쪽 번호 연결)")
+    parser.add_argument("--start-page", type=int, default=None,
+                        help="첫 논문 시작 페이지 (기본: 첫 입력의 start_page 또는 1)")
+    opts = parser.parse_args(argv)
+
+    from create_docx import estimate_paper_pages
+
+    papers = []
+    page = opts.start_page
+    try:
+        for path in opts.inputs:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if page is None:
+                page = data.get("start_page", 1)
+            estimate = estimate_paper_pages(data)
+            papers.append({"input": path, "start_page": page,
+                           "end_page": page + estimate["pages"] - 1, **estimate})
+            page += estimate["pages"]
+    except (OSError, ValueError, KeyError) as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False))
+        return 1
+
+    print(json.dumps(papers[0] if len(papers) == 1 else {"papers": papers},
+                     ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
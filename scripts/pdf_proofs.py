@@ -0,0 +1,653 @@
+#!/usr/bin/env python3
+"""
+DOCX → PDF 교정쇄 변환 풀
+변환기(헤드리스 LibreOffice)를 프로세스마다 한 번만 띄워 두고 여러 파일을 돌려 쓴다.
+파일마다 soffice를 새로 띄우는 비용(수 초)을 풀 크기만큼만 낸다.
+
+    - 풀 = 워커 프로세스 N개 (동시 변환 수 상한). 각 워커는 변환기 1개를 소유하고
+      NDJSON으로 요청을 받는다 ({"id", "method", "params"} → {"id", "result" | "error"})
+    - 워커는 max_jobs 건 처리 후 교체, 죽으면 새 워커로 한 번 다시 시도, 시간 초과면 종료 후 교체
+    - PDF는 DOCX 옆에 같은 이름으로 저장 (임시 파일에 쓴 뒤 교체)
+
+변환기:
+    soffice  헤드리스 LibreOffice + UNO (python3-uno 필요, --uno-python으로 LibreOffice의 python 지정 가능)
+    stub     시험용 대역: 1쪽짜리 PDF를 쓴다 (--stub-startup / --stub-delay로 기동·변환 시간 흉내,
+             --stub-crash-every N이면 N건마다 비정상 종료)
+
+사용법:
+    python scripts/pdf_proofs.py convert out/*.docx [--workers 4] [--max-jobs 50] [--timeout 120]
+    python scripts/pdf_proofs.py convert out/*.docx --backend stub --stub-delay 0.2
+    python scripts/pdf_proofs.py serve [--socket /tmp/shinsa-pdf.sock] [--workers 4]
+"""
+
+import argparse
+import json
+import os
+import queue
+import re
+import select
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+BACKENDS = ("soffice", "stub")
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_SOFFICE = os.environ.get("SHINSA_SOFFICE", "soffice")
+DEFAULT_UNO_PYTHON = os.environ.get("SHINSA_UNO_PYTHON")
+
+PAGE_RE = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+
+
+def pdf_pages(path) -> int:
+    """PDF 쪽수 (pypdf가 있으면 사용, 없으면 페이지 객체 수 / 최상위 /Count)"""
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        data = Path(path).read_bytes()
+        pages = len(PAGE_RE.findall(data))
+        return pages or max((int(n) for n in COUNT_RE.findall(data)), default=0)
+    return len(PdfReader(str(path)).pages)
+
+
+def proof_path(docx) -> Path:
+    """교정쇄 경로: DOCX 옆의 같은 이름 .pdf"""
+    return Path(docx).with_suffix(".pdf")
+
+
+def kill_group(pgid) -> None:
+    """프로세스 그룹 전체 종료 (이미 없으면 무시)"""
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+# ===== 변환기 (워커 프로세스 안) =====
+
+class ConverterDead(RuntimeError):
+    """변환기 프로세스가 죽음 (워커도 응답 없이 끝내 풀이 새 워커로 교체)"""
+
+
+def minimal_pdf(title: str) -> bytes:
+    """제목 한 줄이 찍힌 1쪽 PDF (A5 크기)"""
+    text = title.encode("latin-1", "replace").replace(b"\\", b"\\\\").replace(b"(", b"\\(") \
+        .replace(b")", b"\\)")
+    stream = b"BT /F1 12 Tf 72 520 Td (" + text + b") Tj ET"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 431 638] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class StubConverter:
+    """시험용 대역 변환기"""
+
+    name = "stub"
+    pgid = None
+
+    def __init__(self, startup: float = 0.0, delay: float = 0.0, crash_every: int = 0):
+        time.sleep(startup)
+        self.delay = delay
+        self.crash_every = crash_every
+        self.converted = 0
+
+    def convert(self, source: str, target: str) -> None:
+        if not os.path.exists(source):
+            raise FileNotFoundError(source)
+        self.converted += 1
+        if self.crash_every and self.converted % self.crash_every == 0:
+            os._exit(70)  # 비정상 종료 흉내 (응답 없이 끊김)
+        time.sleep(self.delay)
+        with open(target, "wb") as f:
+            f.write(minimal_pdf(Path(source).stem))
+
+    def close(self) -> None:
+        pass
+
+
+class SofficeConverter:
+    """헤드리스 LibreOffice 1개 (UNO 파이프로 연결, 문서마다 열기 → PDF 저장 → 닫기)"""
+
+    name = "soffice"
+
+    def __init__(self, soffice: str = "soffice", profile=None, start_timeout: float = 60.0):
+        import uno
+        from com.sun.star.connection import NoConnectException
+
+        self.uno = uno
+        # LibreOffice는 사용자 프로필 하나를 프로세스 하나만 쓸 수 있으므로 워커마다 따로 둔다
+        self.profile = Path(profile) if profile else Path(tempfile.mkdtemp(prefix="shinsa-lo-"))
+        self.owns_profile = profile is None
+        pipe = f"shinsa_pdf_{os.getpid()}"
+        # soffice는 실행 스크립트 → oosplash → soffice.bin으로 자식을 띄우므로 자체 프로세스 그룹으로
+        # 시작해 그룹째 종료한다 (워커가 강제 종료돼도 풀이 이 그룹을 정리)
+        self.proc = subprocess.Popen(
+            [soffice, "--headless", "--invisible", "--nologo", "--nodefault", "--norestore",
+             "--nolockcheck", f"-env:UserInstallation={self.profile.resolve().as_uri()}",
+             f"--accept=pipe,name={pipe};urp;StarOffice.ComponentContext"],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            start_new_session=True)
+        self.pgid = self.proc.pid
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local)
+        deadline = time.monotonic() + start_timeout
+        while True:
+            try:
+                context = resolver.resolve(f"uno:pipe,name={pipe};urp;StarOffice.ComponentContext")
+                break
+            except NoConnectException:
+                if self.proc.poll() is not None:
+                    raise RuntimeError(f"soffice exited with code {self.proc.returncode}")
+                if time.monotonic() > deadline:
+                    self.close()
+                    raise TimeoutError(f"soffice did not start within {start_timeout}s")
+                time.sleep(0.1)
+        self.desktop = context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.frame.Desktop", context)
+
+    def _props(self, **values) -> tuple:
+        from com.sun.star.beans import PropertyValue
+        return tuple(PropertyValue(Name=name, Value=value) for name, value in values.items())
+
+    def _check_alive(self) -> None:
+        if self.proc.poll() is not None:
+            raise ConverterDead(f"soffice exited with code {self.proc.returncode}")
+
+    def convert(self, source: str, target: str) -> None:
+        if not os.path.exists(source):
+            raise FileNotFoundError(source)
+        self._check_alive()
+        try:
+            doc = self.desktop.loadComponentFromURL(
+                self.uno.systemPathToFileUrl(source), "_blank", 0,
+                self._props(Hidden=True, ReadOnly=True))
+            if doc is None:
+                raise RuntimeError(f"LibreOffice could not open {source}")
+            try:
+                doc.storeToURL(self.uno.systemPathToFileUrl(target),
+                               self._props(FilterName="writer_pdf_Export"))
+            finally:
+                doc.close(True)
+        except Exception as e:
+            # 연결이 끊겨 난 UNO 예외면 문서 오류가 아니라 변환기 사망
+            if type(e).__name__ == "DisposedException":
+                raise ConverterDead(f"soffice connection lost: {e}") from e
+            self._check_alive()
+            raise
+
+    def close(self) -> None:
+        try:
+            self.desktop.terminate()
+        except Exception:
+            pass  # 이미 죽었거나 연결이 끊김
+        try:
+            self.proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            pass
+        kill_group(self.pgid)  # 실행 스크립트가 끝나도 soffice.bin이 남을 수 있음
+        self.proc.wait()
+        if self.owns_profile:
+            shutil.rmtree(self.profile, ignore_errors=True)
+
+
+def convert_file(converter, source: str, target: str) -> dict:
+    """변환 1건 (임시 파일에 쓴 뒤 교체 — 중간에 죽어도 반쯤 쓴 PDF가 남지 않음)"""
+    started = time.monotonic()
+    source = os.path.abspath(source)
+    target = os.path.abspath(target)
+    tmp = f"{target}.{os.getpid()}.tmp.pdf"
+    try:
+        converter.convert(source, tmp)
+        os.replace(tmp, target)
+    finally:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+    return {
+        "input": source,
+        "output": target,
+        "bytes": os.path.getsize(target),
+        "pages": pdf_pages(target),
+        "elapsed_ms": round((time.monotonic() - started) * 1000, 2),
+    }
+
+
+def run_worker(converter) -> int:
+    """워커 프로세스 본체: stdin/stdout NDJSON (convert, ping, shutdown) → 종료 코드"""
+    def write(obj: dict) -> None:
+        sys.stdout.write(json.dumps(obj, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+    handled = 0
+    write({"event": "ready", "pid": os.getpid(), "backend": converter.name,
+           "converter_pgid": converter.pgid})
+    try:
+        for line in sys.stdin:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                req = json.loads(line)
+            except json.JSONDecodeError as e:
+                write({"id": None, "error": f"Invalid JSON: {e}"})
+                continue
+            req_id, method = req.get("id"), req.get("method")
+            params = req.get("params") or {}
+            if method == "ping":
+                write({"id": req_id, "result": {"ok": True, "pid": os.getpid(), "handled": handled}})
+            elif method == "shutdown":
+                write({"id": req_id, "result": {"ok": True, "shutdown": True}})
+                break
+            elif method == "convert":
+                try:
+                    result = convert_file(converter, params["input"], params["output"])
+                except ConverterDead as e:
+                    # 응답 없이 끝내야 풀이 WorkerCrashed로 보고 새 워커로 다시 시도한다
+                    print(f"{type(e).__name__}: {e}", file=sys.stderr, flush=True)
+                    return 75
+                except Exception as e:
+                    write({"id": req_id, "error": f"{type(e).__name__}: {e}"})
+                else:
+                    write({"id": req_id, "result": result})
+                handled += 1
+            else:
+                write({"id": req_id, "error": f"Unknown method: {method}"})
+    finally:
+        converter.close()
+    return 0
+
+
+# ===== 풀 (부모 프로세스) =====
+
+class WorkerCrashed(RuntimeError):
+    """워커가 응답 없이 종료됨"""
+
+
+class ConverterProcess:
+    """워커 프로세스 1개 (요청 하나씩 순서대로)"""
+
+    def __init__(self, command: list, start_timeout: float):
+        # 버퍼 없는 바이너리 파이프: select로 시간 초과를 걸려면 파이썬 쪽 버퍼에 줄이 남으면 안 된다
+        # 워커는 자체 프로세스 그룹으로 띄워 강제 종료 때 그룹째 정리한다
+        self.proc = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     bufsize=0, start_new_session=True)
+        self.next_id = 1
+        self.jobs = 0
+        self.converter_pgid = None
+        try:
+            ready = self._read(start_timeout)
+        except Exception:
+            self.kill()
+            raise
+        if ready.get("event") != "ready":
+            self.kill()
+            raise RuntimeError(ready.get("error") or f"Converter worker failed to start: {ready}")
+        self.converter_pgid = ready.get("converter_pgid")
+
+    def _read(self, timeout: float) -> dict:
+        readable, _, _ = select.select([self.proc.stdout], [], [], timeout)
+        if not readable:
+            raise TimeoutError(f"no response within {timeout}s")
+        line = self.proc.stdout.readline()
+        if not line:
+            code = self.proc.wait()
+            raise WorkerCrashed(f"converter worker exited with code {code}")
+        return json.loads(line)
+
+    def call(self, method: str, params: dict, timeout: float):
+        req_id = self.next_id
+        self.next_id += 1
+        try:
+            self.proc.stdin.write((json.dumps({"id": req_id, "method": method, "params": params},
+                                              ensure_ascii=False) + "\n").encode("utf-8"))
+        except BrokenPipeError:
+            raise WorkerCrashed(f"converter worker exited with code {self.proc.wait()}")
+        response = self._read(timeout)
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    def shutdown(self) -> None:
+        try:
+            self.call("shutdown", {}, 10)
+            self.proc.wait(timeout=10)
+        except (OSError, RuntimeError, TimeoutError, ValueError, subprocess.TimeoutExpired):
+            self.kill()
+
+    def kill(self) -> None:
+        """워커와 변환기(soffice)를 프로세스 그룹째 강제 종료"""
+        if self.proc.poll() is None:
+            kill_group(self.proc.pid)
+            self.proc.wait()
+        if self.converter_pgid:
+            kill_group(self.converter_pgid)
+
+
+class ConverterPool:
+    """변환 워커 풀: 동시 변환 workers건, 워커는 처음 쓸 때 띄워 계속 재사용
+
+    with ConverterPool(workers=4) as pool:
+        futures = [pool.submit(path) for path in docx_files]
+    """
+
+    def __init__(self, workers: int = 2, backend: str = "soffice", max_jobs: int = 50,
+                 timeout: float = 120.0, start_timeout: float = 60.0, python=None,
+                 worker_args=()):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (available: {', '.join(BACKENDS)})")
+        self.backend = backend
+        self.max_jobs = max_jobs
+        self.timeout = timeout
+        self.start_timeout = start_timeout
+        self.command = [python or sys.executable, str(Path(__file__).resolve()), "worker",
+                        "--backend", backend, *worker_args]
+        # soffice 프로필은 워커 교체 후에도 같은 슬롯이 다시 쓴다 (프로필 초기화 비용은 처음 한 번)
+        self.profiles = tempfile.mkdtemp(prefix="shinsa-pdf-") if backend == "soffice" else None
+
+        self.slots = queue.LifoQueue()  # 최근에 쓴(이미 떠 있는) 워커부터
+        for index in range(workers):
+            self.slots.put({"index": index, "process": None})
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pdf-proof")
+        self.lock = threading.Lock()
+        self.counts = {"converted": 0, "failed": 0, "started": 0, "recycled": 0, "crashed": 0}
+        self.workers = workers
+
+    def _count(self, name: str) -> None:
+        with self.lock:
+            self.counts[name] += 1
+
+    def _process(self, slot: dict) -> ConverterProcess:
+        if slot["process"] is None:
+            command = list(self.command)
+            if self.profiles:
+                command += ["--profile", os.path.join(self.profiles, f"slot-{slot['index']}")]
+            slot["process"] = ConverterProcess(command, self.start_timeout)
+            self._count("started")
+        return slot["process"]
+
+    def _discard(self, slot: dict, crashed: bool) -> None:
+        process, slot["process"] = slot["process"], None
+        if process is None:
+            return
+        if crashed:
+            process.kill()
+            self._count("crashed")
+        else:
+            process.shutdown()
+            self._count("recycled")
+
+    def convert(self, docx, pdf=None) -> dict:
+        """변환 1건 (호출 스레드에서 실행, 빈 워커가 날 때까지 기다림)"""
+        source = str(Path(docx).resolve())
+        target = str(Path(pdf).resolve() if pdf else proof_path(source))
+        slot = self.slots.get()
+        try:
+            for attempt in (1, 2):
+                try:
+                    process = self._process(slot)
+                    result = process.call("convert", {"input": source, "output": target}, self.timeout)
+                except WorkerCrashed:
+                    self._discard(slot, crashed=True)
+                    if attempt == 2:
+                        raise
+                    continue  # 새 워커로 한 번 더
+                except TimeoutError:
+                    self._discard(slot, crashed=True)
+                    raise TimeoutError(f"PDF conversion timed out after {self.timeout}s: {source}")
+                process.jobs += 1
+                if process.jobs >= self.max_jobs:
+                    self._discard(slot, crashed=False)
+                self._count("converted")
+                return result
+        except Exception:
+            self._count("failed")
+            raise
+        finally:
+            self.slots.put(slot)
+
+    def submit(self, docx, pdf=None):
+        """비동기 변환 → Future (동시 실행은 workers건까지, 나머지는 대기열)"""
+        return self.executor.submit(self.convert, docx, pdf)
+
+    def convert_all(self, paths) -> list:
+        """여러 파일 병렬 변환, 입력 순서대로 결과 (실패는 {"input", "error"})"""
+        futures = [(path, self.submit(path)) for path in paths]
+        results = []
+        for path, future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({"input": str(path), "error": f"{type(e).__name__}: {e}"})
+        return results
+
+    def stats(self) -> dict:
+        with self.lock:
+            return {"backend": self.backend, "workers": self.workers, "max_jobs": self.max_jobs,
+                    **self.counts}
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=True)
+        while not self.slots.empty():
+            process = self.slots.get()["process"]
+            if process is not None:
+                process.shutdown()
+        if self.profiles:
+            shutil.rmtree(self.profiles, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# ===== 상주 서버 =====
+
+def handle_request(req: dict, pool: ConverterPool) -> dict:
+    req_id = req.get("id")
+    method = req.get("method")
+    params = req.get("params") or {}
+    try:
+        if method == "convert":
+            result = pool.convert(params["input"], params.get("output"))
+        elif method == "convert_many":
+            result = {"results": pool.convert_all(params["inputs"])}
+        elif method == "stats":
+            result = pool.stats()
+        elif method == "ping":
+            result = {"ok": True, "pid": os.getpid()}
+        elif method == "shutdown":
+            result = {"ok": True, "shutdown": True}
+        else:
+            return {"id": req_id, "error": f"Unknown method: {method}"}
+    except Exception as e:
+        return {"id": req_id, "error": f"{type(e).__name__}: {e}"}
+    return {"id": req_id, "result": result}
+
+
+def serve_stream(lines, write, pool: ConverterPool) -> bool:
+    """줄 단위 요청 스트림 처리. 종료 요청 시 True"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+        except json.JSONDecodeError as e:
+            write({"id": None, "error": f"Invalid JSON: {e}"})
+            continue
+        if not isinstance(req, dict):
+            write({"id": None, "error": "Invalid request: expected a JSON object"})
+            continue
+        write(handle_request(req, pool))
+        if req.get("method") == "shutdown":
+            return True
+    return False
+
+
+def serve(pool: ConverterPool, socket_path=None) -> None:
+    ready = {"event": "ready", **pool.stats()}
+
+    if not socket_path:
+        def write(obj: dict) -> None:
+            sys.stdout.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+        write(ready)
+        serve_stream(sys.stdin, write, pool)
+        return
+
+    import socket
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    print(json.dumps({**ready, "socket": socket_path}), flush=True)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn, conn.makefile("r", encoding="utf-8") as reader, \
+                    conn.makefile("w", encoding="utf-8") as writer:
+
+                def write(obj: dict) -> None:
+                    writer.write(json.dumps(obj, ensure_ascii=False) + "\n")
+                    writer.flush()
+
+                if serve_stream(reader, write, pool):
+                    break
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# ===== 명령줄 =====
+
+def add_pool_arguments(parser) -> None:
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help="동시 변환 워커 수 (기본: min(4, CPU 수))")
+    parser.add_argument("--backend", choices=BACKENDS, default="soffice")
+    parser.add_argument("--max-jobs", type=int, default=50, help="워커 1개가 처리할 최대 건수 (이후 교체)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="변환 1건 시간 제한 (초)")
+    parser.add_argument("--soffice", default=DEFAULT_SOFFICE,
+                        help="LibreOffice 실행 파일 (기본: SHINSA_SOFFICE 또는 soffice)")
+    parser.add_argument("--uno-python", default=DEFAULT_UNO_PYTHON,
+                        help="워커를 실행할 python (import uno가 되는 것, 기본: 현재 python)")
+    parser.add_argument("--stub-startup", type=float, default=0.0, help="stub 기동 시간 (초)")
+    parser.add_argument("--stub-delay", type=float, default=0.0, help="stub 변환 1건 시간 (초)")
+    parser.add_argument("--stub-crash-every", type=int, default=0, help="stub이 N건마다 비정상 종료")
+
+
+def open_pool(backend: str = "soffice", workers: int = DEFAULT_WORKERS, max_jobs: int = 50,
+              timeout: float = 120.0, soffice: str = DEFAULT_SOFFICE, python=DEFAULT_UNO_PYTHON,
+              stub_startup: float = 0.0, stub_delay: float = 0.0,
+              stub_crash_every: int = 0) -> ConverterPool:
+    """풀 생성 (soffice가 없으면 ValueError)"""
+    if backend == "soffice":
+        if not shutil.which(soffice):
+            raise ValueError(f"LibreOffice not found: {soffice} "
+                             "(install LibreOffice or set SHINSA_SOFFICE)")
+        worker_args = ["--soffice", soffice]
+    else:
+        worker_args = ["--stub-startup", str(stub_startup), "--stub-delay", str(stub_delay),
+                       "--stub-crash-every", str(stub_crash_every)]
+    return ConverterPool(workers, backend, max_jobs, timeout, python=python, worker_args=worker_args)
+
+
+def worker_main(opts) -> int:
+    if opts.backend == "stub":
+        converter = StubConverter(opts.stub_startup, opts.stub_delay, opts.stub_crash_every)
+    else:
+        try:
+            converter = SofficeConverter(opts.soffice, opts.profile)
+        except ImportError:
+            print(json.dumps({
+                "error": "python3-uno not installed",
+                "fix": "apt install python3-uno (또는 --uno-python으로 LibreOffice의 python 지정)"
+            }, ensure_ascii=False), flush=True)
+            return 1
+        except (OSError, RuntimeError, TimeoutError) as e:
+            print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False), flush=True)
+            return 1
+    return run_worker(converter)
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="DOCX → PDF 교정쇄 변환 풀")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    convert = sub.add_parser("convert", help="DOCX 파일들을 PDF로 (각 DOCX 옆에 저장)")
+    convert.add_argument("inputs", nargs="+")
+    add_pool_arguments(convert)
+
+    serve_parser = sub.add_parser("serve", help="상주 변환 서버 (NDJSON)")
+    serve_parser.add_argument("--socket", help="Unix 소켓 경로 (기본: stdin/stdout)")
+    add_pool_arguments(serve_parser)
+
+    worker = sub.add_parser("worker", help=argparse.SUPPRESS)
+    worker.add_argument("--backend", choices=BACKENDS, default="soffice")
+    worker.add_argument("--soffice", default="soffice")
+    worker.add_argument("--profile")
+    worker.add_argument("--stub-startup", type=float, default=0.0)
+    worker.add_argument("--stub-delay", type=float, default=0.0)
+    worker.add_argument("--stub-crash-every", type=int, default=0)
+
+    opts = parser.parse_args(argv)
+
+    if opts.command == "worker":
+        return worker_main(opts)
+
+    try:
+        pool = open_pool(opts.backend, opts.workers, opts.max_jobs, opts.timeout, opts.soffice,
+                         opts.uno_python, opts.stub_startup, opts.stub_delay, opts.stub_crash_every)
+    except ValueError as e:
+        print(json.dumps({"error": str(e)}, ensure_ascii=False))
+        return 1
+
+    with pool:
+        if opts.command == "serve":
+            serve(pool, opts.socket)
+            return 0
+
+        started = time.monotonic()
+        results = pool.convert_all(opts.inputs)
+        failed = sum(1 for r in results if "error" in r)
+        print(json.dumps({
+            "success": failed == 0,
+            "total": len(results),
+            "failed": failed,
+            "elapsed_ms": round((time.monotonic() - started) * 1000, 2),
+            "pool": pool.stats(),
+            "results": results,
+        }, ensure_ascii=False, indent=2))
+    return 0 if failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+신학과사회 참고문헌 엔진
+인용 문법(src/parsers/patterns.ts와 같은 유형)을 모듈 로드 시 한 번만 컴파일하고,
+참고문헌 목록 전체를 한 번에 분류·정규화한 뒤 미리 계산한 정렬 키로
+국문(가나다) → 외국어(ABC) 순으로 정렬한다.
+
+각주 형식(저자, 『제목』 (도시: 출판사, 연도), 쪽.)과
+참고문헌 형식(저자. 『제목』. 도시: 출판사. 연도.)을 모두 인식한다.
+
+사용법:
+    python scripts/references.py refs.txt            # 한 줄에 하나 (또는 JSON 배열)
+    python scripts/references.py refs.json --json -o normalized.json
+"""
+
+import argparse
+import json
+import re
+import sys
+import unicodedata
+
+# ===== 인용 문법 (컴파일 1회) =====
+
+KR = r"[가-힣]+(?:\s*[·,]\s*[가-힣]+)*"
+# 외국어 이름 단어: 대문자(악센트 포함)로 시작, 이니셜 허용 (patterns.ts는 "First Last" 두 단어를 놓침)
+EN_WORD = r"[A-ZÀ-Þ][A-Za-zÀ-ÿ'\-]*\.?"
+EN_NAME = rf"{EN_WORD}(?:\s+{EN_WORD})+"
+LAST_FIRST = r"[A-ZÀ-Þa-z][A-Za-zÀ-ÿ'\-]+,\s*[^.\"“*]+?(?:\s+[A-Z]\.)?"
+Q = r"[\"“”]"
+NQ = r"[^\"“”]"
+PAGE = r"(\d+(?:[-–]\d+)?)"
+YEAR = r"(\d{4})"
+
+PATTERNS = {name: re.compile(pattern) for name, pattern in {
+    # ----- 각주 형식 (patterns.ts) -----
+    "KOREAN_ARTICLE":
+        rf"({KR})\s*,\s*{Q}({NQ}+){Q}\s*,?\s*「([^」]+)」\s*(\d+)(?:/(\d+))?\s*\({YEAR}\)\s*,?\s*{PAGE}?\.?",
+    "KOREAN_BOOK":
+        rf"({KR})\s*,\s*『([^』]+)』\s*\(([가-힣]+)\s*:\s*([^,]+),\s*{YEAR}\)\s*,?\s*{PAGE}?\.?",
+    "TRANSLATION":
+        rf"([A-Za-zÀ-ÿ\s.]+?)\s*/\s*([가-힣]+)\s*옮김\s*[,.]\s*『([^』]+)』\s*(?:\(([가-힣]+)\s*:\s*([^,]+),\s*{YEAR}\)"
+        rf"|\.\s*([가-힣]+)\s*:\s*([^.,]+)[.,]\s*{YEAR})\s*,?\s*{PAGE}?\.?",
+    "KOREAN_CHAPTER":
+        rf"({KR})\s*,\s*{Q}({NQ}+){Q}\s*,\s*([가-힣]+)\s*편\s*,\s*『([^』]+)』\s*\(([가-힣]+)\s*:\s*([^,]+),\s*{YEAR}\)\s*,?\s*{PAGE}?\.?",
+    "FOREIGN_ARTICLE":
+        rf"({EN_NAME}(?:\s+(?:and|&)\s+{EN_NAME})*)\s*,\s*{Q}({NQ}+){Q}\s*,?\s*\*([^*]+)\*\s*(\d+)(?:/(\d+))?\s*\({YEAR}\)\s*,?\s*{PAGE}?\.?",
+    "FOREIGN_BOOK":
+        rf"({EN_NAME})\s*,\s*\*([^*]+)\*\s*\(([A-Za-z\s]+)\s*:\s*([^,]+),\s*{YEAR}\)\s*,?\s*{PAGE}?\.?",
+    "THESIS_KR":
+        rf"({KR})\s*[,.]\s*{Q}({NQ}+){Q}\s*[,.]?\s*(박사|석사)학위논문\s*[,.]\s*([가-힣]+(?:대학교?|대|대학원))\s*[,.]\s*{YEAR}\s*[,.]?\s*{PAGE}?\.?",
+    "THESIS_EN":
+        rf"([A-Za-zÀ-ÿ\s.,]+?)\s*[,.]\s*{Q}({NQ}+){Q}\s*[,.]?\s*(Ph\.?D\.?|M\.?A\.?|doctoral|master'?s?)\s*(?:dissertation|thesis)\s*[,.]\s*"
+        rf"([A-Za-z\s]+(?:University|College|Seminary)[A-Za-z\s]*?)\s*[,.]\s*{YEAR}\s*[,.]?\s*{PAGE}?\.?",
+    "WEB":
+        rf"(?:([가-힣A-Za-z\s,]+?)\s*[,.]\s*)?{Q}?({NQ}+?){Q}?\s*[,.]?\s*\[온라인자료\]\s*(https?://[^\s,]+?)\s*[,.]\s*(\d{{4}})\.(\d{{1,2}})\.(\d{{1,2}})\.?\s*접속\.?",
+    "IBID": r"^Ibid\.\s*,?\s*(\d+(?:-\d+)?)?\.?$",
+    "BIBLE": r"\(([가-힣A-Za-z]+)\s*(\d+):(\d+(?:-\d+)?)\s*(?:,\s*([가-힣A-Za-z]+))?\)",
+    "SHORT_REF_BOOK_KR": rf"([가-힣]+)\s*,\s*『([^』]+)』\s*,\s*{PAGE}\.?",
+    "SHORT_REF_BOOK_EN": rf"([A-Za-zÀ-ÿ\s.]+)\s*,\s*\*([^*]+)\*\s*,\s*{PAGE}\.?",
+
+    # ----- 참고문헌 형식 (converters/index.ts BIBLIOGRAPHY_TEMPLATES) -----
+    "BIB_KOREAN_ARTICLE":
+        rf"({KR})\s*\.\s*{Q}({NQ}+){Q}\s*「([^」]+)」\s*(\d+)(?:/(\d+))?\s*(?:\.\s*{YEAR}|\({YEAR}\))\s*[.,:]?\s*{PAGE}?\.?",
+    "BIB_KOREAN_BOOK":
+        rf"({KR})\s*\.\s*『([^』]+)』\s*\.\s*([가-힣]+)\s*:\s*([^.,]+)[.,]\s*{YEAR}\.?",
+    "BIB_KOREAN_CHAPTER":
+        rf"({KR})\s*\.\s*{Q}({NQ}+){Q}\s*([가-힣]+)\s*편\s*\.\s*『([^』]+)』\s*\.\s*([가-힣]+)\s*:\s*([^.,]+)[.,]\s*{YEAR}\s*\.?\s*{PAGE}?\.?",
+    "BIB_FOREIGN_ARTICLE":
+        rf"({LAST_FIRST})\s*\.\s*{Q}({NQ}+){Q}\s*\*?([^*\d]+?)\*?\s+(\d+)(?:/(\d+))?\s*(?:\.\s*{YEAR}|\({YEAR}\))\s*[.,:]?\s*{PAGE}?\.?",
+    "BIB_FOREIGN_BOOK":
+        rf"({LAST_FIRST})\s*\.\s*\*([^*]+)\*\s*\.\s*([A-Za-z\s]+)\s*:\s*([^.,]+)[.,]\s*{YEAR}\.?",
+}.items()}
+
+# 국문/외국어 구분 (sortBibliography와 같은 규칙: 첫 글자가 한글 음절이면 국문)
+HANGUL_FIRST = re.compile(r"^[가-힣]")
+HANGUL = re.compile(r"[가-힣]")
+SPACES = re.compile(r"\s+")
+
+
+def _page(value):
+    return value or None
+
+
+def _clean_title(title: str) -> str:
+    # "제목," / "Title." 처럼 따옴표 안에 들어간 구두점 제거
+    return title.strip().rstrip(",.").strip()
+
+
+def _fields(kind: str, m) -> dict:
+    """매치 → 필드 (각주/참고문헌 형식 공통 이름)"""
+    g = m.groups()
+    if kind in ("KOREAN_ARTICLE", "FOREIGN_ARTICLE"):
+        return {"author": g[0].strip(), "title": _clean_title(g[1]), "journal": g[2].strip(),
+                "volume": g[3], "issue": g[4], "year": g[5], "page": _page(g[6])}
+    if kind in ("BIB_KOREAN_ARTICLE", "BIB_FOREIGN_ARTICLE"):
+        return {"author": g[0].strip(), "title": _clean_title(g[1]), "journal": g[2].strip(),
+                "volume": g[3], "issue": g[4], "year": g[5] or g[6], "page": _page(g[7])}
+    if kind in ("KOREAN_BOOK", "FOREIGN_BOOK", "BIB_KOREAN_BOOK", "BIB_FOREIGN_BOOK"):
+        return {"author": g[0].strip(), "title": g[1].strip(), "city": g[2].strip(),
+                "publisher": g[3].strip(), "year": g[4], "page": _page(g[5] if len(g) > 5 else None)}
+    if kind == "TRANSLATION":
+        city, publisher, year = (g[3], g[4], g[5]) if g[3] else (g[6], g[7], g[8])
+        return {"originalAuthor": g[0].strip(), "translator": g[1].strip(), "title": g[2].strip(),
+                "city": city.strip(), "publisher": publisher.strip(), "year": year, "page": _page(g[9])}
+    if kind in ("KOREAN_CHAPTER", "BIB_KOREAN_CHAPTER"):
+        return {"author": g[0].strip(), "title": _clean_title(g[1]), "editor": g[2].strip(),
+                "bookTitle": g[3].strip(), "city": g[4].strip(), "publisher": g[5].strip(),
+                "year": g[6], "page": _page(g[7])}
+    if kind == "THESIS_KR":
+        return {"author": g[0].strip(), "title": _clean_title(g[1]),
+                "degree": "doctoral" if g[2] == "박사" else "master",
+                "university": g[3].strip(), "year": g[4], "page": _page(g[5])}
+    if kind == "THESIS_EN":
+        return {"author": g[0].strip().rstrip(",."), "title": _clean_title(g[1]),
+                "degree": "doctoral" if re.match(r"Ph\.?D|doctoral", g[2], re.I) else "master",
+                "university": g[3].strip(), "year": g[4], "page": _page(g[5])}
+    if kind == "WEB":
+        return {"author": g[0].strip() if g[0] else None, "title": _clean_title(g[1]), "url": g[2],
+                "accessDate": f"{g[3]}.{g[4].zfill(2)}.{g[5].zfill(2)}"}
+    if kind in ("SHORT_REF_BOOK_KR", "SHORT_REF_BOOK_EN"):
+        return {"author": g[0].strip(), "title": g[1].strip(), "page": g[2]}
+    return {}
+
+
+def _try(text: str, *candidates):
+    """(유형, 패턴 이름, 신뢰도) 후보를 순서대로 시도"""
+    for citation_type, kind, confidence in candidates:
+        m = PATTERNS[kind].search(text)
+        if m:
+            return citation_type, confidence, _fields(kind, m)
+    return None
+
+
+def parse_citation(text: str) -> dict:
+    """인용 1건 분류 (parsers/index.ts parseCitation과 같은 순서·유형 이름)
+
+    Returns:
+        {original, type, confidence, fields}
+    """
+    trimmed = SPACES.sub(" ", text).strip()
+    result = None
+
+    # 값싼 부분 문자열 검사로 후보 패턴만 시도
+    if "/" in trimmed and "옮김" in trimmed:
+        result = _try(trimmed, ("korean_translation", "TRANSLATION", 0.95))
+    if result is None:
+        m = PATTERNS["IBID"].match(trimmed)
+        if m:
+            result = ("ibid", 1.0, {"isIbid": True, "page": m.group(1)})
+    if result is None and "[온라인자료]" in trimmed:
+        result = _try(trimmed, ("web", "WEB", 0.90))
+    if result is None and "학위논문" in trimmed:
+        result = _try(trimmed, ("thesis", "THESIS_KR", 0.92))
+    if result is None and ("dissertation" in trimmed or "thesis" in trimmed.lower()):
+        result = _try(trimmed, ("thesis", "THESIS_EN", 0.88))
+    if result is None and "「" in trimmed:
+        result = _try(trimmed, ("korean_article", "KOREAN_ARTICLE", 0.92),
+                      ("korean_article", "BIB_KOREAN_ARTICLE", 0.92))
+    if result is None and "『" in trimmed:
+        result = _try(trimmed, ("korean_chapter", "KOREAN_CHAPTER", 0.90),
+                      ("korean_chapter", "BIB_KOREAN_CHAPTER", 0.90),
+                      ("korean_book", "KOREAN_BOOK", 0.92),
+                      ("korean_book", "BIB_KOREAN_BOOK", 0.92),
+                      ("short_ref", "SHORT_REF_BOOK_KR", 0.85))
+    if result is None and ('"' in trimmed or "“" in trimmed):
+        result = _try(trimmed, ("foreign_article", "FOREIGN_ARTICLE", 0.90),
+                      ("foreign_article", "BIB_FOREIGN_ARTICLE", 0.88))
+    if result is None and "*" in trimmed:
+        result = _try(trimmed, ("foreign_book", "FOREIGN_BOOK", 0.90),
+                      ("foreign_book", "BIB_FOREIGN_BOOK", 0.90),
+                      ("short_ref", "SHORT_REF_BOOK_EN", 0.85))
+    if result is None:
+        m = PATTERNS["BIBLE"].search(trimmed)
+        if m:
+            result = ("bible", 0.98, {"book": m.group(1), "chapter": m.group(2),
+                                      "verse": m.group(3), "version": m.group(4)})
+
+    if result is None:
+        return {"original": trimmed, "type": "unknown", "confidence": 0.0, "fields": {}}
+    citation_type, confidence, fields = result
+    return {"original": trimmed, "type": citation_type, "confidence": confidence, "fields": fields}
+
+
+# ===== 정규화 (참고문헌 형식) =====
+
+def to_last_first(name: str) -> str:
+    """First Last → Last, First (converters/index.ts convertToLastFirst)"""
+    if not name or "," in name:
+        return name
+    parts = name.split()
+    if len(parts) < 2:
+        return name
+    return f"{parts[-1]}, {' '.join(parts[:-1])}"
+
+
+def _issue(f: dict) -> str:
+    return f"{f['volume']}/{f['issue']}" if f.get("issue") else f"{f['volume']}"
+
+
+def _tail_page(text: str, f: dict) -> str:
+    return f"{text} {f['page']}." if f.get("page") else text
+
+
+def to_bibliography(parsed: dict) -> str:
+    """분류 결과 → 참고문헌 형식 문자열 (인식 못한 항목은 공백만 정리한 원문)"""
+    f = parsed["fields"]
+    t = parsed["type"]
+    if t == "korean_article":
+        return _tail_page(f'{f["author"]}. "{f["title"]}." 「{f["journal"]}」 {_issue(f)}. {f["year"]}.', f)
+    if t == "korean_book":
+        return f'{f["author"]}. 『{f["title"]}』. {f["city"]}: {f["publisher"]}. {f["year"]}.'
+    if t == "korean_chapter":
+        return _tail_page(f'{f["author"]}. "{f["title"]}." {f["editor"]} 편. 『{f["bookTitle"]}』. '
+                          f'{f["city"]}: {f["publisher"]}. {f["year"]}.', f)
+    if t == "korean_translation":
+        return (f'{f["originalAuthor"]} / {f["translator"]} 옮김. 『{f["title"]}』. '
+                f'{f["city"]}: {f["publisher"]}. {f["year"]}.')
+    if t == "foreign_article":
+        return _tail_page(f'{to_last_first(f["author"])}. "{f["title"]}." *{f["journal"]}* '
+                          f'{_issue(f)}. {f["year"]}.', f)
+    if t == "foreign_book":
+        return f'{to_last_first(f["author"])}. *{f["title"]}*. {f["city"]}: {f["publisher"]}. {f["year"]}.'
+    if t == "thesis":
+        if HANGUL_FIRST.match(f["author"]):
+            degree = "박사" if f["degree"] == "doctoral" else "석사"
+            return f'{f["author"]}. "{f["title"]}." {degree}학위논문. {f["university"]}. {f["year"]}.'
+        degree = "Ph.D. dissertation" if f["degree"] == "doctoral" else "M.A. thesis"
+        return f'{to_last_first(f["author"])}. "{f["title"]}." {degree}. {f["university"]}. {f["year"]}.'
+    if t == "web":
+        author = f"{f['author']}. " if f.get("author") else ""
+        return f'{author}"{f["title"]}." [온라인자료] {f["url"]}. {f["accessDate"]} 접속.'
+    return parsed["original"]
+
+
+# ===== 정렬 키 =====
+
+def _fold(text: str) -> str:
+    """ABC 정렬용: 발음 구별 기호 제거 + 대소문자 무시"""
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch)).casefold()
+
+
+def _sort_text(text: str) -> str:
+    # 정렬에 영향 없는 기호(따옴표·괄호·구두점·공백) 제거
+    return "".join(ch for ch in text if ch.isalnum())
+
+
+def match_key(text: str) -> str:
+    """대조용 키: 기호·공백 제거, 외국어는 악센트·대소문자 무시 (한글은 자모 분해하지 않음)"""
+    if HANGUL.search(text):
+        return _sort_text(text).casefold()
+    return _sort_text(_fold(text))
+
+
+def collation_key(parsed: dict, normalized: str) -> tuple:
+    """(그룹, 저자, 연도, 제목, 전체) — 그룹 0 = 국문(가나다), 1 = 외국어(ABC)
+
+    한글 음절은 유니코드 순서가 곧 가나다 순이므로 코드 포인트 비교로 충분하다.
+    """
+    f = parsed["fields"]
+    author = f.get("author") or f.get("originalAuthor") or ""
+    if parsed["type"] in ("foreign_article", "foreign_book", "thesis") and author:
+        author = to_last_first(author)
+    korean = bool(HANGUL_FIRST.match(normalized))
+    fold = (lambda s: _sort_text(s)) if korean else (lambda s: _sort_text(_fold(s)))
+    return (0 if korean else 1, fold(author) if author else fold(normalized),
+            f.get("year") or "", fold(f.get("title") or ""), normalized)
+
+
+# ===== 목록 단위 처리 =====
+
+def process_references(entries, normalize: bool = True) -> dict:
+    """참고문헌 목록 전체를 한 번에 분류·정규화·정렬
+
+    Args:
+        entries: 참고문헌 문자열 목록 (빈 항목 무시)
+        normalize: False면 분류·정렬만 하고 원문을 그대로 둔다
+
+    Returns:
+        {korean: [...], foreign: [...], entries: [{original, type, confidence, normalized}],
+         stats: {total, by_type, unknown, duplicates}}
+    """
+    decorated = []
+    records = []
+    by_type = {}
+    seen = set()
+    duplicates = 0
+
+    for entry in entries:
+        if not entry or not entry.strip():
+            continue
+        parsed = parse_citation(entry)
+        text = to_bibliography(parsed) if normalize else parsed["original"]
+        key = collation_key(parsed, text)
+
+        identity = key[1:4] if parsed["type"] != "unknown" else (text.casefold(),)
+        if identity in seen:
+            duplicates += 1
+        seen.add(identity)
+
+        by_type[parsed["type"]] = by_type.get(parsed["type"], 0) + 1
+        decorated.append((key, text))
+        records.append({"original": parsed["original"], "type": parsed["type"],
+                        "confidence": parsed["confidence"], "normalized": text})
+
+    decorated.sort(key=lambda item: item[0])
+    korean = [text for key, text in decorated if key[0] == 0]
+    foreign = [text for key, text in decorated if key[0] == 1]
+
+    return {
+        "korean": korean,
+        "foreign": foreign,
+        "entries": records,
+        "stats": {
+            "total": len(records),
+            "by_type": by_type,
+            "unknown": by_type.get("unknown", 0),
+            "duplicates": duplicates,
+        },
+    }
+
+
+def group_references(entries, normalize: bool = False) -> tuple:
+    """DOCX 생성용: (국문 목록, 외국어 목록), 각각 가나다/ABC 순"""
+    result = process_references(entries, normalize)
+    return result["korean"], result["foreign"]
+
+
+# ===== CLI =====
+
+def load_entries(path: str) -> list:
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        return json.loads(text)
+    return text.splitlines()
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="참고문헌 일괄 분류·정규화·정렬")
+    parser.add_argument("input", help="참고문헌 파일 (한 줄에 하나 또는 JSON 배열)")
+    parser.add_argument("-o", "--output", help="결과 파일 (기본: stdout)")
+    parser.add_argument("--json", action="store_true", help="분류 결과·통계를 JSON으로 출력")
+    parser.add_argument("--keep", action="store_true", help="정규화하지 않고 정렬만")
+    opts = parser.parse_args(argv)
+
+    try:
+        entries = load_entries(opts.input)
+    except (OSError, json.JSONDecodeError) as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False))
+        return 1
+
+    result = process_references(entries, normalize=not opts.keep)
+    if opts.json:
+        output = json.dumps(result, ensure_ascii=False, indent=2) + "\n"
+    else:
+        output = "\n".join(result["korean"] + result["foreign"]) + "\n"
+
+    if opts.output:
+        with open(opts.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        sys.stdout.write(output)
+
+    print(json.dumps(result["stats"], ensure_ascii=False), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
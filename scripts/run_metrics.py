@@ -0,0 +1,129 @@
+"""
+DOCX 생성 계측
+단계별 단조 시계(perf_counter) 측정, 문단·run·XML 요소 수, 프로세스 최대 RSS,
+선택적으로 JSON Lines 지표 파일과 실행마다 cProfile(pstats) 파일을 남긴다.
+
+    SHINSA_METRICS_FILE=metrics.jsonl   생성 1건마다 지표 1줄 추가
+    SHINSA_PROFILE_DIR=profiles/        생성 1건마다 create_docx-<시각>-<pid>-<n>.pstats
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+W_P = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p"
+W_R = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}r"
+W_SECTPR = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}sectPr"
+
+
+class RunMetrics:
+    """생성 1건의 단계별 시간(ms)과 개수"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.counts = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def count_body(self, body) -> None:
+        """본문 트리의 문단·run·요소 수 (sectPr 제외)"""
+        paragraphs = runs = elements = 0
+        for child in body:
+            if child.tag == W_SECTPR:
+                continue
+            for elem in child.iter():
+                elements += 1
+                if elem.tag == W_P:
+                    paragraphs += 1
+                elif elem.tag == W_R:
+                    runs += 1
+        self.counts.update(paragraphs=paragraphs, runs=runs, elements=elements)
+
+    def summary(self) -> dict:
+        return {
+            "total_ms": round((time.perf_counter() - self.started) * 1000, 2),
+            "phases_ms": {name: round(seconds * 1000, 2) for name, seconds in self.phases.items()},
+            "counts": self.counts,
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+
+def peak_rss_mb():
+    """프로세스 최대 RSS (MB, 워커 모드에서는 지금까지의 최대). resource 없는 OS는 None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def process_age_s():
+    """프로세스 시작 후 경과 시간 (Linux /proc 기준, 10ms 단위). 알 수 없으면 None"""
+    try:
+        with open("/proc/self/stat", "rb") as f:
+            # 두 번째 필드(실행 파일 이름)에 공백이 있을 수 있으므로 ')' 뒤부터 센다
+            fields = f.read().rsplit(b")", 1)[1].split()
+        with open("/proc/uptime", "rb") as f:
+            uptime = float(f.read().split()[0])
+        return max(0.0, uptime - int(fields[19]) / os.sysconf("SC_CLK_TCK"))
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+_profile_runs = 0
+
+
+@contextmanager
+def profiled(directory):
+    """directory가 있으면 블록 전체를 cProfile로 감싸 .pstats 파일을 남김
+
+    yield 값 dict의 "path"에 저장 경로가 들어간다 (블록이 끝난 뒤).
+    """
+    info = {}
+    if not directory:
+        yield info
+        return
+
+    import cProfile
+    global _profile_runs
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield info
+    finally:
+        profiler.disable()
+        _profile_runs += 1
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = directory / f"create_docx-{stamp}-{os.getpid()}-{_profile_runs}.pstats"
+        profiler.dump_stats(str(path))
+        info["path"] = str(path)
+
+
+def append_metrics(path, record: dict) -> None:
+    """지표 1줄 추가 (O_APPEND 한 번 쓰기 — 여러 워커가 같은 파일에 써도 줄이 섞이지 않음)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    line = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
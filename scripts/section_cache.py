@@ -0,0 +1,80 @@
+"""
+본문 섹션 렌더링 캐시
+parse_body_sections 결과 블록 + 스타일 프로필 해시를 키로,
+미리 렌더링한 WordprocessingML 조각(<w:p>...)을 저장한다.
+같은 섹션은 다시 렌더링하지 않고 캐시된 XML을 본문에 이어 붙인다.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+# 섹션 렌더링 방식이 바뀌면 올려서 이전 캐시를 무효화
+RENDER_VERSION = 3
+
+
+def section_key(section: dict, profile_key: str, extra=None) -> str:
+    """섹션 내용 + 프로필 해시 + 렌더러 버전 → 캐시 키"""
+    payload = json.dumps(
+        [RENDER_VERSION, profile_key, section, extra],
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SectionCache:
+    """메모리 LRU + 선택적 디스크 캐시 (키 → XML 조각 문자열)"""
+
+    def __init__(self, directory=None, max_entries: int = 4096):
+        self.directory = Path(directory) if directory else None
+        self.max_entries = max_entries
+        self._memory = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.xml"
+
+    def get(self, key: str):
+        xml = self._memory.get(key)
+        if xml is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return xml
+
+        if self.directory is not None:
+            try:
+                xml = self._path(key).read_text(encoding="utf-8")
+            except OSError:
+                xml = None
+            if xml is not None:
+                self._remember(key, xml)
+                self.hits += 1
+                return xml
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, xml: str) -> None:
+        self._remember(key, xml)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(xml, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            pass  # 디스크 캐시 실패는 무시 (메모리 캐시는 유지)
+
+    def _remember(self, key: str, xml: str) -> None:
+        self._memory[key] = xml
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._memory)}
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+DOCX 생성기 빠른 시작 진입점
+create_docx.py와 같은 명령줄을 받되, 실제 생성·워커 실행일 때만 create_docx(python-docx)를 import한다.
+--version / --check는 python-docx를 전혀 import하지 않는다.
+
+    python scripts/shinsa_docx.py --version
+    python scripts/shinsa_docx.py --check
+    python scripts/shinsa_docx.py input.json output.docx [--metrics FILE] [--profile-dir DIR]
+    python scripts/shinsa_docx.py --worker [--socket PATH] [--max-requests N]
+
+build_bundle.py로 만든 zipapp(shinsa_docx.pyz)의 진입점이기도 하다.
+"""
+
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (모듈, pip 패키지)
+REQUIRED = (("docx", "python-docx"), ("lxml", "lxml"))
+
+# 번들 빌드 정보 {version, python, built} — build_bundle.py가 만든 __main__에서 채운다
+BUNDLE = None
+
+
+def version() -> str:
+    """package.json 버전 (번들이면 빌드 시점 값)"""
+    if BUNDLE:
+        return BUNDLE["version"]
+    try:
+        with open(os.path.join(ROOT, "package.json"), "r", encoding="utf-8") as f:
+            return json.load(f)["version"]
+    except (OSError, ValueError, KeyError):
+        return "unknown"
+
+
+def version_info() -> dict:
+    info = {"version": version(), "python": sys.version.split()[0]}
+    if BUNDLE:
+        info["bundle"] = BUNDLE
+    return info
+
+
+def check() -> dict:
+    """실행 환경 점검: 의존성 설치 위치(import 없이 find_spec), 사양 파일, 번들 바이트코드"""
+    from importlib.util import find_spec
+
+    problems = []
+    modules = {}
+    for module, package in REQUIRED:
+        spec = find_spec(module)
+        modules[module] = spec.origin if spec else None
+        if spec is None:
+            problems.append(f"{package} not installed (pip install {package})")
+
+    try:
+        from shinsa_spec import load_profile, spec_path
+        load_profile("2025")
+        spec_file = str(spec_path())
+    except (OSError, ValueError, KeyError) as e:
+        spec_file = None
+        problems.append(f"spec: {type(e).__name__}: {e}")
+
+    report = {
+        "ok": not problems,
+        **version_info(),
+        "executable": sys.executable,
+        "modules": modules,
+        "spec": spec_file,
+        "problems": problems,
+    }
+    if BUNDLE:
+        # 다른 버전 인터프리터에서는 번들의 .pyc를 못 쓰고 소스를 컴파일한다 (동작은 같음)
+        current = "{}.{}".format(*sys.version_info[:2])
+        report["bytecode"] = BUNDLE["python"] == current
+    return report
+
+
+def main(argv: list) -> int:
+    if argv[:1] == ["--version"]:
+        print(json.dumps(version_info(), ensure_ascii=False))
+        return 0
+
+    if argv[:1] == ["--check"]:
+        report = check()
+        print(json.dumps(report, ensure_ascii=False))
+        return 0 if report["ok"] else 1
+
+    from create_docx import main as create_main
+    return create_main(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,115 @@
+"""
+신학과사회 형식 사양 로더
+spec/shinsa_spec.json (생성기·분석기·TS 서버 공용 단일 원본)을 한 번만 읽고,
+연도별 프로필을 해석해 twips/half-point/EMU 값을 미리 계산해 둔다.
+
+SHINSA_PROFILES에 추가 프로필 파일(derive_profiles.py가 코퍼스에서 도출한 같은 형식의 JSON,
+os.pathsep로 여러 개)을 주면 그 프로필들도 함께 쓸 수 있다. 추가 프로필의 spec_version은 그 파일의 version.
+"""
+
+import copy
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+
+SPEC_PATH = Path(__file__).resolve().parent.parent / "spec" / "shinsa_spec.json"
+
+# 1 inch = 1440 twips = 914400 EMU = 25.4 mm
+TWIPS_PER_MM = 1440 / 25.4
+EMU_PER_MM = 36000
+
+PAGE_KEYS = ("width_mm", "height_mm", "margin_top_mm", "margin_bottom_mm",
+             "margin_left_mm", "margin_right_mm")
+
+
+def spec_path() -> Path:
+    """사양 파일 경로 (SHINSA_SPEC 환경 변수로 변경 가능)"""
+    path = os.environ.get("SHINSA_SPEC")
+    return Path(path) if path else SPEC_PATH
+
+
+def extra_profile_paths() -> list:
+    """추가 프로필 파일 경로 (SHINSA_PROFILES)"""
+    value = os.environ.get("SHINSA_PROFILES", "")
+    return [Path(p) for p in value.split(os.pathsep) if p]
+
+
+def _read_spec(path: Path) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, NotADirectoryError):
+        # zipapp 번들 안에서는 파일 경로로 열 수 없으므로 zipimport 로더로 읽는다
+        if path != SPEC_PATH or not hasattr(__loader__, "get_data"):
+            raise
+        return json.loads(__loader__.get_data(str(path)).decode("utf-8"))
+
+
+@lru_cache(maxsize=None)
+def load_spec() -> dict:
+    """사양 파일 전체 + 추가 프로필 (프로세스당 한 번만 읽음)"""
+    spec = _read_spec(spec_path())
+    for path in extra_profile_paths():
+        extra = _read_spec(path)
+        for name, profile in extra["profiles"].items():
+            spec["profiles"][name] = {**profile, "spec_version": extra["version"]}
+    return spec
+
+
+def _merge(base: dict, override: dict) -> dict:
+    merged = copy.deepcopy(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def _resolve(profiles: dict, name: str, seen=()) -> dict:
+    if name not in profiles:
+        raise KeyError(f"Unknown spec profile: {name} (available: {', '.join(profiles)})")
+    if name in seen:
+        raise ValueError(f"Circular spec profile: {' -> '.join(seen + (name,))}")
+    profile = profiles[name]
+    parent = profile.get("extends")
+    if not parent:
+        return copy.deepcopy(profile)
+    return _merge(_resolve(profiles, parent, seen + (name,)), profile)
+
+
+def _derive_units(profile: dict) -> dict:
+    """자주 쓰는 단위 변환 값을 미리 계산"""
+    page = profile["page"]
+    fonts = profile["fonts"]
+    return {
+        "page_twips": {k[:-3]: round(page[k] * TWIPS_PER_MM) for k in PAGE_KEYS},
+        "page_emu": {k[:-3]: round(page[k] * EMU_PER_MM) for k in PAGE_KEYS},
+        "half_points": {
+            k: round(v * 2) for k, v in fonts.items() if isinstance(v, (int, float))
+        },
+        # w:spacing w:line (lineRule=auto, 240 = 1줄)
+        "line_240": round(profile["line_spacing"] * 240),
+    }
+
+
+@lru_cache(maxsize=None)
+def _load_profile(name: str) -> dict:
+    spec = load_spec()
+    profile = _resolve(spec["profiles"], name)
+    profile.pop("extends", None)
+    profile["name"] = name
+    profile.setdefault("spec_version", spec["version"])
+    profile["units"] = _derive_units(profile)
+    return profile
+
+
+def load_profile(name=None) -> dict:
+    """연도별 프로필 (기본: default_profile). 호출자가 수정하지 않도록 사본 반환"""
+    name = str(name) if name else load_spec()["default_profile"]
+    return copy.deepcopy(_load_profile(name))
+
+
+def profile_names() -> list:
+    return list(load_spec()["profiles"])
@@ -0,0 +1,146 @@
+"""
+표 입력 (tables) → 블록
+질적 연구의 참여자 정보·주제 매트릭스, 설문 결과표처럼 행이 많은 표를 문단 블록과 같은 흐름에 넣는다.
+python-docx의 table.cell(i, j)는 부를 때마다 표 전체 셀 목록을 다시 만들어 행×열이 커지면 제곱으로 느려지므로,
+표 1개를 블록 1개로 넘기고 각 백엔드가 <w:tbl> 문자열을 한 번에 만든다 (stream_docx.table_xml).
+
+    입력  tables: [{caption, columns: [머리글], rows: [[셀, ...]], note?, widths?: [열 상대 폭], number?}]
+    배치  본문에서 문단 하나가 통째로 [표 1] (또는 [Table 1])인 자리, 표시가 없는 표는 본문 끝(참고문헌 앞)
+    형식  <표 1> 제목 (가운데, 굵게) / 셀 8.5pt 바탕, 위·아래 선과 머리글 아래 가는 선 (세로선 없음)
+          / 표 아래 주 (note) / 쪽이 넘어가면 머리글 행 반복
+
+표 블록: (TABLE, {"number", "widths": [열 폭 twip], "header": [셀 runs], "rows": [[셀 runs]]}, None)
+"""
+
+import re
+
+from inline_markup import inline_text
+from shinsa_spec import TWIPS_PER_MM
+
+# 표 블록의 역할 자리 (PARAGRAPH_STYLES 키와 겹치지 않는 이름)
+TABLE = "table"
+
+# 셀 문단 역할
+HEAD_ROLE = "TableHead"
+CELL_ROLE = "TableCell"
+
+TABLE_MARKER_RE = re.compile(r"\[(?:표|Table)\s*(\d+)\]")
+
+# widths가 없을 때 열 폭: 열에서 가장 긴 셀 글자 수에 비례 (너무 좁거나 넓지 않게 자름)
+AUTO_MIN_CHARS = 4
+AUTO_MAX_CHARS = 40
+
+
+def text_width_twips(cfg: dict) -> int:
+    """본문 폭 (twip) = 쪽 너비 - 좌우 여백"""
+    page = cfg["page"]
+    return int((page["width_mm"] - page["margin_left_mm"] - page["margin_right_mm"]) * TWIPS_PER_MM)
+
+
+def _cell(value) -> str:
+    return "" if value is None else str(value)
+
+
+def column_widths(columns: list, rows: list, count: int, total: int, widths=None) -> list:
+    """열 폭 (twip, 합계 = total)"""
+    if widths:
+        weights = list(widths)
+    else:
+        longest = [len(c) for c in columns] + [0] * (count - len(columns))
+        for row in rows:
+            for index, text in enumerate(row):
+                if len(text) > longest[index]:
+                    longest[index] = len(text)
+        weights = [min(max(n, AUTO_MIN_CHARS), AUTO_MAX_CHARS) for n in longest]
+    scale = total / sum(weights)
+    result = [int(w * scale) for w in weights]
+    result[-1] += total - sum(result)
+    return result
+
+
+def prepare_table(table: dict, number: int, total_width: int) -> dict:
+    """입력 표 1개 → 표 블록 내용 (셀 텍스트의 서식 표시는 run으로)"""
+    if not isinstance(table, dict):
+        raise ValueError(f"table {number}: expected an object")
+    columns = [_cell(c) for c in table.get("columns") or []]
+    rows = [[_cell(c) for c in row] for row in table.get("rows") or []]
+    if not columns and not rows:
+        raise ValueError(f"table {number}: columns or rows required")
+    count = max([len(columns)] + [len(row) for row in rows])
+    # 짧은 행은 빈 셀로 채움
+    for row in rows:
+        if len(row) < count:
+            row.extend([""] * (count - len(row)))
+    if columns and len(columns) < count:
+        columns.extend([""] * (count - len(columns)))
+    widths = table.get("widths")
+    if widths and (len(widths) != count or any(w <= 0 for w in widths)):
+        raise ValueError(f"table {number}: widths must have {count} positive numbers")
+
+    return {
+        "number": number,
+        "widths": column_widths(columns, rows, count, total_width, widths),
+        "header": [inline_text(text) for text in columns],
+        "rows": [[inline_text(text) for text in row] for row in rows],
+    }
+
+
+class Tables:
+    """입력 표 모음 — 본문 표시 자리에 배치하고, 남은 표는 본문 끝에 (footnotes.Footnotes와 같은 흐름)"""
+
+    def __init__(self, tables, cfg: dict):
+        self.tables = {}
+        self.width = text_width_twips(cfg)
+        for index, table in enumerate(tables or []):
+            number = int(table.get("number", index + 1)) if isinstance(table, dict) else index + 1
+            self.tables[number] = table
+        self.placed = set()
+
+    def labels(self, content: str) -> list:
+        """섹션 본문에서 배치될 표 번호 (섹션 캐시 키·재사용용, place와 같은 규칙)"""
+        numbers = []
+        for text in content.split("\n\n"):
+            match = TABLE_MARKER_RE.fullmatch(text.strip())
+            if match is None:
+                continue
+            number = int(match.group(1))
+            if number in self.tables and number not in self.placed and number not in numbers:
+                numbers.append(number)
+        return numbers
+
+    def key(self, numbers: list) -> list:
+        """섹션 캐시 키에 넣을 표 내용"""
+        return [[n, self.tables[n]] for n in numbers]
+
+    def register(self, numbers: list) -> None:
+        """캐시에서 재사용한 섹션의 표를 배치된 것으로 표시"""
+        self.placed.update(numbers)
+
+    def place(self, text: str):
+        """문단 텍스트가 표 표시 하나뿐이면 그 표의 블록 목록, 아니면 None"""
+        match = TABLE_MARKER_RE.fullmatch(text)
+        if match is None:
+            return None
+        number = int(match.group(1))
+        if number not in self.tables or number in self.placed:
+            return None
+        self.placed.add(number)
+        return self.blocks(number)
+
+    def blocks(self, number: int) -> list:
+        table = self.tables[number]
+        blocks = []
+        if isinstance(table, dict) and table.get("caption"):
+            blocks.append(("TableCaption", [(f"<표 {number}> ", None), *inline_text(table["caption"])],
+                           None))
+        blocks.append((TABLE, prepare_table(table, number, self.width), None))
+        if isinstance(table, dict) and table.get("note"):
+            blocks.append(("TableNote", inline_text(table["note"]), None))
+        return blocks
+
+    def rest(self):
+        """본문에 표시가 없던 표 (번호 순)"""
+        for number in sorted(self.tables):
+            if number not in self.placed:
+                self.placed.add(number)
+                yield from self.blocks(number)
@@ -0,0 +1,559 @@
+#!/usr/bin/env python3
+"""
+인용 사례 로컬 벡터 색인
+Supabase pgvector `match_citations` RPC를 대신하는 오프라인 색인.
+임베딩은 메모리 매핑한 float32(또는 float16) 행렬 파일에, 인용 정보는 JSON Lines 사이드카에 둔다.
+질의는 정규화된 벡터의 내적(= 코사인 유사도)으로 묶음 단위 top-k를 구하고,
+큰 말뭉치는 IVF(역색인 군집)로 일부 군집만 훑는다.
+
+색인 디렉터리:
+    meta.json     {version, dim, dtype, count, rows_bytes, model, ivf}
+    vectors.bin   count × dim 행렬 (행마다 L2 정규화)
+    rows.jsonl    행마다 {id, content, citation_type, paper_title, paper_author}
+    ivf.npz       IVF 중심점 + 군집별 행 번호 (build-ivf 후)
+
+사용법:
+    python scripts/vector_index.py import citations.jsonl [--index DIR] [--dtype float16]
+    python scripts/vector_index.py build-ivf [--index DIR] [--nlist 256]
+    python scripts/vector_index.py stats [--index DIR]
+    python scripts/vector_index.py serve [--index DIR] [--socket /tmp/shinsa-index.sock]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print(json.dumps({
+        "error": "numpy not installed",
+        "fix": "pip install numpy"
+    }))
+    sys.exit(1)
+
+from local_cache import cache_dir
+
+INDEX_VERSION = 1
+DTYPES = {"float32": np.float32, "float16": np.float16}
+
+# 전수 탐색 시 한 번에 곱하는 행 수 (행렬 곱 메모리 상한)
+CHUNK_ROWS = 32768
+DEFAULT_NPROBE = 8
+# 소켓 서버가 종료 요청을 확인하는 간격 (accept 대기 타임아웃)
+ACCEPT_POLL_S = 0.5
+
+
+def default_index_dir() -> Path:
+    """기본 색인 위치: SHINSA_INDEX_DIR 또는 <캐시>/citation_index"""
+    path = os.environ.get("SHINSA_INDEX_DIR")
+    if path:
+        return Path(path)
+    return cache_dir() / "citation_index"
+
+
+def normalize_rows(vectors) -> "np.ndarray":
+    """행마다 L2 정규화 (영벡터는 그대로)"""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors[None, :]
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _merge_topk(best_ids, best_scores, ids, scores, k: int):
+    """(k, b) 누적 top-k와 새 후보를 합쳐 다시 top-k"""
+    if best_ids is not None:
+        ids = np.concatenate([best_ids, ids])
+        scores = np.concatenate([best_scores, scores])
+    if len(scores) > k:
+        part = np.argpartition(-scores, k - 1, axis=0)[:k]
+        ids = np.take_along_axis(ids, part, axis=0)
+        scores = np.take_along_axis(scores, part, axis=0)
+    return ids, scores
+
+
+class LocalIndex:
+    """메모리 매핑 벡터 색인 (쓰기는 add로 뒤에 덧붙이기만 함)"""
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else default_index_dir()
+        with open(self.directory / "meta.json", "r", encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported index version: {self.meta.get('version')}")
+        self._vectors = None
+        self._rows = None
+        self._ivf = None
+
+    # ----- 생성·추가 -----
+
+    @classmethod
+    def create(cls, directory, dim: int, dtype: str = "float32", model=None) -> "LocalIndex":
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        if dtype not in DTYPES:
+            raise ValueError(f"Unknown dtype: {dtype} (available: {', '.join(DTYPES)})")
+        meta = {"version": INDEX_VERSION, "dim": dim, "dtype": dtype, "count": 0,
+                "rows_bytes": 0, "model": model, "ivf": None}
+        (directory / "vectors.bin").write_bytes(b"")
+        (directory / "rows.jsonl").write_text("", encoding="utf-8")
+        cls._write_meta(directory, meta)
+        return cls(directory)
+
+    @classmethod
+    def open_or_create(cls, directory, dim: int, dtype: str = "float32", model=None) -> "LocalIndex":
+        directory = Path(directory) if directory else default_index_dir()
+        if (directory / "meta.json").exists():
+            index = cls(directory)
+            if index.dim != dim:
+                raise ValueError(f"Dimension mismatch: index {index.dim}, vectors {dim}")
+            return index
+        return cls.create(directory, dim, dtype, model)
+
+    @staticmethod
+    def _write_meta(directory: Path, meta: dict) -> None:
+        tmp = directory / f"meta.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, directory / "meta.json")
+
+    @property
+    def dim(self) -> int:
+        return self.meta["dim"]
+
+    @property
+    def count(self) -> int:
+        return self.meta["count"]
+
+    def add(self, vectors, rows: list) -> int:
+        """벡터·인용 정보 덧붙이기, 추가된 행 수 반환
+
+        meta.json 교체가 커밋 시점이다. 그 전에 중단돼 파일 끝에 남은 행은
+        다음 add가 잘라내고 이어 쓴다.
+        IVF는 다시 만들지 않는다 — 만든 뒤 추가된 행은 검색 때 전수 탐색한다.
+        """
+        vectors = normalize_rows(vectors)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"Dimension mismatch: index {self.dim}, vectors {vectors.shape[1]}")
+        if len(vectors) != len(rows):
+            raise ValueError("vectors and rows must have the same length")
+
+        start = self.count
+        itemsize = np.dtype(DTYPES[self.meta["dtype"]]).itemsize
+        with open(self.directory / "vectors.bin", "r+b") as f:
+            f.truncate(start * self.dim * itemsize)
+            f.seek(0, os.SEEK_END)
+            f.write(vectors.astype(DTYPES[self.meta["dtype"]]).tobytes())
+        with open(self.directory / "rows.jsonl", "r+", encoding="utf-8") as f:
+            if "rows_bytes" in self.meta:
+                f.truncate(self.meta["rows_bytes"])
+            f.seek(0, os.SEEK_END)
+            for offset, row in enumerate(rows):
+                record = {"id": row.get("id", start + offset + 1),
+                          "content": row.get("content", ""),
+                          "citation_type": row.get("citation_type"),
+                          "paper_title": row.get("paper_title"),
+                          "paper_author": row.get("paper_author")}
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.meta["rows_bytes"] = f.tell()
+
+        self.meta["count"] = start + len(rows)
+        self._write_meta(self.directory, self.meta)
+        self._vectors = None
+        self._rows = None
+        return len(rows)
+
+    # ----- 읽기 -----
+
+    @property
+    def vectors(self):
+        if self._vectors is None:
+            if self.count == 0:
+                self._vectors = np.zeros((0, self.dim), dtype=DTYPES[self.meta["dtype"]])
+            else:
+                self._vectors = np.memmap(self.directory / "vectors.bin",
+                                          dtype=DTYPES[self.meta["dtype"]], mode="r",
+                                          shape=(self.count, self.dim))
+        return self._vectors
+
+    def _load_rows(self) -> None:
+        rows = []
+        with open(self.directory / "rows.jsonl", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    rows.append(json.loads(line))
+        rows = rows[:self.count]
+        names = sorted({row.get("citation_type") or "" for row in rows})
+        codes = {name: code for code, name in enumerate(names)}
+        self._rows = rows
+        self._type_codes = codes
+        self._types = np.fromiter((codes[row.get("citation_type") or ""] for row in rows),
+                                  dtype=np.int32, count=len(rows))
+        self._type_rows = {}
+
+    @property
+    def rows(self) -> list:
+        if self._rows is None:
+            self._load_rows()
+        return self._rows
+
+    def rows_of_type(self, citation_type: str):
+        """filter_type에 해당하는 행 번호 (한 번 계산 후 보관)"""
+        self.rows  # 유형 코드 배열 적재
+        if citation_type not in self._type_rows:
+            code = self._type_codes.get(citation_type)
+            self._type_rows[citation_type] = (
+                np.flatnonzero(self._types == code) if code is not None else np.zeros(0, np.int64))
+        return self._type_rows[citation_type]
+
+    @property
+    def ivf(self):
+        if self._ivf is None and self.meta.get("ivf"):
+            with np.load(self.directory / "ivf.npz") as data:
+                self._ivf = {key: data[key] for key in data.files}
+        return self._ivf
+
+    # ----- IVF -----
+
+    def build_ivf(self, nlist=None, iterations: int = 10, sample: int = 0, seed: int = 0) -> dict:
+        """구면 k-means로 군집 중심을 구하고 모든 행을 가장 가까운 군집에 배정"""
+        n = self.count
+        if n == 0:
+            raise ValueError("Index is empty")
+        nlist = min(nlist or max(1, int(4 * np.sqrt(n))), n)
+        rng = np.random.default_rng(seed)
+
+        sample = min(n, sample or max(nlist * 64, 10000))
+        sample_ids = np.sort(rng.choice(n, size=sample, replace=False))
+        data = np.asarray(self.vectors[sample_ids], dtype=np.float32)
+        centroids = data[rng.choice(sample, size=nlist, replace=False)].copy()
+
+        for _ in range(iterations):
+            assign = self._nearest(data, centroids)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, data)
+            empty = np.bincount(assign, minlength=nlist) == 0
+            sums[empty] = centroids[empty]
+            centroids = normalize_rows(sums)
+
+        assign = np.concatenate([
+            self._nearest(np.asarray(self.vectors[start:start + CHUNK_ROWS], dtype=np.float32), centroids)
+            for start in range(0, n, CHUNK_ROWS)
+        ])
+        order = np.argsort(assign, kind="stable").astype(np.int64)
+        offsets = np.concatenate([[0], np.cumsum(np.bincount(assign, minlength=nlist))]).astype(np.int64)
+
+        np.savez(self.directory / "ivf.npz", centroids=centroids, ids=order, offsets=offsets)
+        self.meta["ivf"] = {"nlist": int(nlist), "built_count": n, "iterations": iterations}
+        self._write_meta(self.directory, self.meta)
+        self._ivf = None
+        return self.meta["ivf"]
+
+    @staticmethod
+    def _nearest(data, centroids):
+        return np.argmax(data @ centroids.T, axis=1)
+
+    # ----- 검색 -----
+
+    def _score_ranges(self, queries, k: int):
+        """전체 행 전수 탐색 (연속 구간 단위 행렬 곱)"""
+        best_ids = best_scores = None
+        for start in range(0, self.count, CHUNK_ROWS):
+            block = np.asarray(self.vectors[start:start + CHUNK_ROWS], dtype=np.float32)
+            scores = block @ queries.T
+            ids = np.broadcast_to(np.arange(start, start + len(block))[:, None], scores.shape)
+            best_ids, best_scores = _merge_topk(best_ids, best_scores, ids, scores, k)
+        return best_ids, best_scores
+
+    def _score_ids(self, queries, candidates, k: int):
+        """지정한 행들만 탐색 (filter_type, IVF 후보)"""
+        best_ids = best_scores = None
+        for start in range(0, len(candidates), CHUNK_ROWS):
+            chunk = candidates[start:start + CHUNK_ROWS]
+            block = np.asarray(self.vectors[chunk], dtype=np.float32)
+            scores = block @ queries.T
+            ids = np.broadcast_to(chunk[:, None], scores.shape)
+            best_ids, best_scores = _merge_topk(best_ids, best_scores, ids, scores, k)
+        return best_ids, best_scores
+
+    def _ivf_candidates(self, query, nprobe: int):
+        ivf = self.ivf
+        lists = np.argpartition(-(ivf["centroids"] @ query), min(nprobe, len(ivf["centroids"])) - 1)[:nprobe]
+        offsets = ivf["offsets"]
+        parts = [ivf["ids"][offsets[c]:offsets[c + 1]] for c in lists]
+        built = self.meta["ivf"]["built_count"]
+        if built < self.count:
+            parts.append(np.arange(built, self.count))
+        return np.concatenate(parts) if parts else np.zeros(0, np.int64)
+
+    def search(self, query_embeddings, match_count: int = 5, filter_type=None,
+               nprobe=None, exact: bool = False) -> list:
+        """질의 벡터 묶음 → 질의마다 [{id, content, citation_type, paper_title, similarity}]
+
+        IVF가 있으면 nprobe개 군집만 훑고, exact=True면 항상 전수 탐색한다.
+        """
+        queries = normalize_rows(query_embeddings)
+        if queries.shape[1] != self.dim:
+            raise ValueError(f"Dimension mismatch: index {self.dim}, query {queries.shape[1]}")
+        if self.count == 0 or match_count <= 0:
+            return [[] for _ in queries]
+
+        allowed = self.rows_of_type(filter_type) if filter_type else None
+        use_ivf = self.ivf is not None and not exact
+
+        if not use_ivf:
+            if allowed is None:
+                ids, scores = self._score_ranges(queries, match_count)
+            else:
+                ids, scores = self._score_ids(queries, allowed, match_count)
+            if ids is None:
+                return [[] for _ in queries]
+            return [self._results(ids[:, j], scores[:, j]) for j in range(len(queries))]
+
+        results = []
+        mask = None
+        if allowed is not None:
+            mask = np.zeros(self.count, dtype=bool)
+            mask[allowed] = True
+        for query in queries:
+            candidates = self._ivf_candidates(query, nprobe or DEFAULT_NPROBE)
+            if mask is not None:
+                candidates = candidates[mask[candidates]]
+            ids, scores = self._score_ids(query[None, :], candidates, match_count)
+            results.append([] if ids is None else self._results(ids[:, 0], scores[:, 0]))
+        return results
+
+    def _results(self, ids, scores) -> list:
+        results = []
+        for j in np.argsort(-scores, kind="stable"):
+            row = self.rows[int(ids[j])]
+            results.append({"id": row["id"], "content": row["content"],
+                            "citation_type": row.get("citation_type"),
+                            "paper_title": row.get("paper_title"),
+                            "similarity": round(float(scores[j]), 6)})
+        return results
+
+    def paper_rows(self, paper_title: str) -> list:
+        """논문 제목 부분 일치 (Supabase ilike '%제목%'와 같게 대소문자 무시)"""
+        needle = paper_title.casefold()
+        return [{"content": row.get("content"), "citation_type": row.get("citation_type"),
+                 "paper_title": row.get("paper_title"), "similarity": 1.0}
+                for row in self.rows if needle in (row.get("paper_title") or "").casefold()]
+
+    def stats(self) -> dict:
+        by_type = {}
+        by_paper = {}
+        for row in self.rows:
+            key = row.get("citation_type") or "unknown"
+            by_type[key] = by_type.get(key, 0) + 1
+            paper = row.get("paper_title") or "unknown"
+            by_paper[paper] = by_paper.get(paper, 0) + 1
+        return {"directory": str(self.directory), "count": self.count, "dim": self.dim,
+                "dtype": self.meta["dtype"], "model": self.meta.get("model"),
+                "ivf": self.meta.get("ivf"), "by_type": by_type, "by_paper": by_paper}
+
+
+# ===== JSON-RPC 서버 =====
+# create_docx.py 워커와 같은 줄 단위 JSON. 메서드 이름·인자는 Supabase RPC와 같다.
+#
+# 요청: {"id": 1, "method": "match_citations",
+#        "params": {"query_embedding": [...], "match_count": 5, "filter_type": null}}
+#       {"id": 2, "method": "search_batch", "params": {"query_embeddings": [[...], ...], ...}}
+#       {"id": 3, "method": "paper_citations", "params": {"paper_title": "..."}}
+#       {"id": 4, "method": "stats"} / "reload" / "ping" / "shutdown"
+# 응답: {"id": 1, "result": [...]} 또는 {"id": 1, "error": "..."}
+
+def handle_request(req: dict, state: dict) -> dict:
+    req_id = req.get("id")
+    method = req.get("method")
+    params = req.get("params") or {}
+    index = state["index"]
+    try:
+        if method == "match_citations":
+            result = index.search([params["query_embedding"]], int(params.get("match_count", 5)),
+                                  params.get("filter_type"), params.get("nprobe"))[0]
+        elif method == "search_batch":
+            result = index.search(params["query_embeddings"], int(params.get("match_count", 5)),
+                                  params.get("filter_type"), params.get("nprobe"))
+        elif method == "paper_citations":
+            result = index.paper_rows(params["paper_title"])
+        elif method == "stats":
+            result = index.stats()
+        elif method == "reload":
+            state["index"] = LocalIndex(index.directory)
+            result = {"ok": True, "count": state["index"].count}
+        elif method == "ping":
+            result = {"ok": True, "pid": os.getpid(), "count": index.count,
+                      "uptime_s": round(time.monotonic() - state["started"], 3)}
+        elif method == "shutdown":
+            result = {"ok": True, "shutdown": True}
+        else:
+            return {"id": req_id, "error": f"Unknown method: {method}"}
+    except Exception as e:
+        return {"id": req_id, "error": f"{type(e).__name__}: {e}"}
+    return {"id": req_id, "result": result}
+
+
+def serve_stream(lines, write, state: dict) -> bool:
+    """줄 단위 요청 스트림 처리. 종료 요청 시 True"""
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+        except json.JSONDecodeError as e:
+            write({"id": None, "error": f"Invalid JSON: {e}"})
+            continue
+        if not isinstance(req, dict):
+            write({"id": None, "error": "Invalid request: expected a JSON object"})
+            continue
+        write(handle_request(req, state))
+        if req.get("method") == "shutdown":
+            return True
+    return False
+
+
+def serve(directory, socket_path=None) -> None:
+    index = LocalIndex(directory)
+    # 사이드카·벡터·IVF를 미리 읽어 첫 질의 지연을 없앰 (연결 스레드들이 지연 로드를 겹쳐 하지 않게)
+    index.rows
+    index.vectors
+    index.ivf
+    state = {"index": index, "started": time.monotonic()}
+    ready = {"event": "ready", "count": index.count, "dim": index.dim, "ivf": index.meta.get("ivf")}
+
+    if not socket_path:
+        def write(obj: dict) -> None:
+            sys.stdout.write(json.dumps(obj, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+
+        write(ready)
+        serve_stream(sys.stdin, write, state)
+        return
+
+    import socket
+    import threading
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen()
+    print(json.dumps({**ready, "socket": socket_path}), flush=True)
+    stop = threading.Event()
+
+    def serve_connection(conn) -> None:
+        try:
+            with conn, conn.makefile("r", encoding="utf-8") as reader, \
+                    conn.makefile("w", encoding="utf-8") as writer:
+
+                def write(obj: dict) -> None:
+                    writer.write(json.dumps(obj, ensure_ascii=False) + "\n")
+                    writer.flush()
+
+                if serve_stream(reader, write, state):
+                    stop.set()
+        except OSError:
+            pass  # 클라이언트가 먼저 끊음
+
+    # 연결마다 스레드: 연결을 열어 두는 클라이언트(MCP 서버)가 있어도 다른 프로세스가 막히지 않는다.
+    # 서버 안에서 색인은 읽기 전용이라(reload는 새 객체로 교체) 질의가 겹쳐도 된다.
+    server.settimeout(ACCEPT_POLL_S)
+    try:
+        while not stop.is_set():
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                continue
+            threading.Thread(target=serve_connection, args=(conn,), daemon=True).start()
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+
+# ===== CLI =====
+
+def import_jsonl(path: str, directory, dtype: str, batch: int = 4096, model=None) -> dict:
+    """Supabase citations 내보내기(JSON Lines, embedding 열 포함) → 로컬 색인"""
+    index = None
+    rows, vectors = [], []
+    added = 0
+
+    def flush():
+        nonlocal index, added, rows, vectors
+        if not rows:
+            return
+        if index is None:
+            index = LocalIndex.open_or_create(directory, len(vectors[0]), dtype, model)
+        added += index.add(np.asarray(vectors, dtype=np.float32), rows)
+        rows, vectors = [], []
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            embedding = record.pop("embedding")
+            if isinstance(embedding, str):  # pgvector 텍스트 표현 "[0.1,0.2,...]"
+                embedding = json.loads(embedding)
+            vectors.append(embedding)
+            rows.append(record)
+            if len(rows) >= batch:
+                flush()
+    flush()
+    return {"added": added, "count": index.count if index else 0}
+
+
+def main(argv: list) -> int:
+    parser = argparse.ArgumentParser(description="인용 사례 로컬 벡터 색인")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="JSON Lines(embedding 포함) 가져오기")
+    p_import.add_argument("input")
+    p_import.add_argument("--dtype", choices=list(DTYPES), default="float32")
+    p_import.add_argument("--model", default="text-embedding-3-small")
+
+    p_ivf = sub.add_parser("build-ivf", help="IVF 군집 색인 생성")
+    p_ivf.add_argument("--nlist", type=int, default=None, help="군집 수 (기본: 4·√N)")
+    p_ivf.add_argument("--iterations", type=int, default=10)
+
+    sub.add_parser("stats", help="색인 통계")
+
+    p_serve = sub.add_parser("serve", help="JSON-RPC 서버 (stdin/stdout 또는 Unix 소켓)")
+    p_serve.add_argument("--socket", help="Unix 소켓 경로")
+
+    for p in (p_import, p_ivf, sub.choices["stats"], p_serve):
+        p.add_argument("--index", help="색인 디렉터리 (기본: SHINSA_INDEX_DIR 또는 ~/.cache/shinsa-mcp/citation_index)")
+
+    opts = parser.parse_args(argv)
+    directory = Path(opts.index) if opts.index else default_index_dir()
+
+    try:
+        if opts.command == "import":
+            result = import_jsonl(opts.input, directory, opts.dtype, model=opts.model)
+        elif opts.command == "build-ivf":
+            started = time.perf_counter()
+            result = LocalIndex(directory).build_ivf(opts.nlist, opts.iterations)
+            result["elapsed_s"] = round(time.perf_counter() - started, 2)
+        elif opts.command == "stats":
+            result = LocalIndex(directory).stats()
+        else:
+            serve(directory, opts.socket)
+            return 0
+    except (OSError, ValueError, KeyError, json.JSONDecodeError) as e:
+        print(json.dumps({"error": f"{type(e).__name__}: {e}"}, ensure_ascii=False))
+        return 1
+
+    print(json.dumps(result, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.stdout.reconfigure(encoding='utf-8')
+    sys.exit(main(sys.argv[1:]))
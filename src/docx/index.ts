@@ -0,0 +1,310 @@
+// create_docx.py 상주 워커 관리
+// 호출마다 python 인터프리터/python-docx import 비용을 내지 않도록
+// `create_docx.py --worker` 프로세스 하나를 띄워 두고 NDJSON으로 통신한다.
+
+import { spawn, type ChildProcessWithoutNullStreams } from 'child_process';
+import { createInterface } from 'readline';
+import path from 'path';
+
+export interface DocxMetrics {
+  total_ms: number;
+  // startup·import(첫 생성만), profile, template, header, front, body, references, footnotes, save
+  // 또는 stream 백엔드의 stream_write, 출력 캐시의 cache·cache_store
+  phases_ms: Record<string, number>;
+  counts: { paragraphs?: number; runs?: number; elements?: number };
+  peak_rss_mb: number | null;
+  profile?: string;
+}
+
+export interface DocxResult {
+  success: boolean;
+  path: string;
+  message: string;
+  elapsed_ms?: number;
+  // 출력 캐시 (SHINSA_OUTPUT_CACHE) — hit이면 저장해 둔 DOCX를 복사한 결과
+  cache?: { hit: boolean; key: string };
+  metrics?: DocxMetrics;
+}
+
+export interface WorkerHealth {
+  ok: boolean;
+  pid: number;
+  protocol: number;
+  uptime_s: number;
+  handled: number;
+  failed: number;
+  max_requests: number;
+}
+
+export interface DocxWorkerOptions {
+  python?: string;
+  scriptPath?: string;
+  // N건 처리 후 워커 재시작 (메모리 누수 방지, 0 = 무제한)
+  maxRequests?: number;
+  // 요청 1건 타임아웃
+  requestTimeoutMs?: number;
+  // 헬스 체크 주기 (0 = 사용 안 함)
+  healthCheckIntervalMs?: number;
+  // restartWindowMs 안에 maxRestarts 번 넘게 죽으면 재시작 중단
+  maxRestarts?: number;
+  restartWindowMs?: number;
+}
+
+interface Job {
+  method: string;
+  params: Record<string, unknown>;
+  resolve: (value: any) => void;
+  reject: (err: Error) => void;
+}
+
+interface InFlight extends Job {
+  id: number;
+  timer: NodeJS.Timeout;
+}
+
+const DEFAULT_OPTIONS: Required<Omit<DocxWorkerOptions, 'scriptPath'>> = {
+  python: process.env.SHINSA_PYTHON || 'python',
+  maxRequests: 500,
+  requestTimeoutMs: 60_000,
+  healthCheckIntervalMs: 30_000,
+  maxRestarts: 5,
+  restartWindowMs: 60_000
+};
+
+// dist/docx/index.js 기준 scripts/create_docx.py 경로
+export function defaultScriptPath(): string {
+  let scriptDir = path.dirname(new URL(import.meta.url).pathname);
+  // Windows 경로 수정
+  if (process.platform === 'win32' && scriptDir.startsWith('/')) {
+    scriptDir = scriptDir.substring(1);
+  }
+  return path.join(scriptDir, '..', '..', 'scripts', 'create_docx.py');
+}
+
+export class DocxWorker {
+  private options: Required<DocxWorkerOptions>;
+  private proc: ChildProcessWithoutNullStreams | null = null;
+  private ready: Promise<void> | null = null;
+  // 워커는 요청을 한 건씩 처리하므로 클라이언트 큐에서 한 건씩 보낸다
+  // (타임아웃은 보낸 시점부터, 계획된 재시작 때 답을 못 받은 요청은 새 워커로 다시 보냄)
+  private queue: Job[] = [];
+  private inflight: InFlight | null = null;
+  private dispatching = false;
+  // 현재 워커가 처리한 create 건수 (워커의 WorkerState.handled와 같은 기준)
+  private served = 0;
+  private plannedExit = false;
+  private nextId = 1;
+  private restarts: number[] = [];
+  private healthTimer: NodeJS.Timeout | null = null;
+  private stderrTail = '';
+
+  constructor(options: DocxWorkerOptions = {}) {
+    this.options = {
+      ...DEFAULT_OPTIONS,
+      // SHINSA_DOCX_SCRIPT: scripts/build_bundle.py로 만든 .pyz 번들 등 다른 진입점
+      scriptPath: process.env.SHINSA_DOCX_SCRIPT || defaultScriptPath(),
+      ...options
+    } as Required<DocxWorkerOptions>;
+  }
+
+  async create(data: Record<string, unknown>, outputPath: string): Promise<DocxResult> {
+    return this.request('create', { data, output_path: outputPath });
+  }
+
+  async ping(): Promise<WorkerHealth> {
+    return this.request('ping', {});
+  }
+
+  async close(): Promise<void> {
+    this.stopHealthCheck();
+    if (!this.proc) return;
+    const proc = this.proc;
+    await this.request('shutdown', {}).catch(() => {});
+    proc.kill();
+  }
+
+  private request(method: string, params: Record<string, unknown>): Promise<any> {
+    return new Promise((resolve, reject) => {
+      this.queue.push({ method, params, resolve, reject });
+      this.dispatch();
+    });
+  }
+
+  // 워커가 --max-requests 건을 처리했으면 곧 스스로 종료하므로 더 보내지 않는다
+  private exhausted(): boolean {
+    return this.options.maxRequests > 0 && this.served >= this.options.maxRequests;
+  }
+
+  private dispatch(): void {
+    if (this.dispatching || this.inflight || this.queue.length === 0) return;
+    if (this.proc && this.exhausted()) return;  // close 뒤 onExit에서 새 워커로
+
+    this.dispatching = true;
+    this.ensureStarted().then(() => {
+      this.dispatching = false;
+      if (this.proc) {
+        this.send();
+      } else {
+        this.dispatch();
+      }
+    }, (err) => {
+      this.dispatching = false;
+      for (const job of this.queue.splice(0)) job.reject(err);
+    });
+  }
+
+  private send(): void {
+    if (this.inflight || this.exhausted()) return;
+    const job = this.queue.shift();
+    if (!job) return;
+
+    const id = this.nextId++;
+    const timer = setTimeout(() => {
+      if (this.inflight?.id !== id) return;
+      this.inflight = null;
+      job.reject(new Error(`create_docx worker timeout (${job.method})`));
+      // 응답이 없는 워커는 교체 (큐에 남은 요청은 새 워커로)
+      this.kill('timeout');
+    }, this.options.requestTimeoutMs);
+
+    this.inflight = { ...job, id, timer };
+    this.proc!.stdin.write(JSON.stringify({ id, method: job.method, ...job.params }) + '\n');
+  }
+
+  private ensureStarted(): Promise<void> {
+    if (this.proc && this.ready) return this.ready;
+
+    const now = Date.now();
+    this.restarts = this.restarts.filter(t => now - t < this.options.restartWindowMs);
+    if (this.restarts.length >= this.options.maxRestarts) {
+      return Promise.reject(new Error(
+        `create_docx worker restarted ${this.restarts.length} times in ${this.options.restartWindowMs}ms: ${this.stderrTail}`
+      ));
+    }
+    // --max-requests 후 정상 종료(계획된 재시작)는 비정상 재시작 횟수에 넣지 않는다
+    if (!this.plannedExit) this.restarts.push(now);
+    this.plannedExit = false;
+
+    const proc = spawn(this.options.python, [
+      this.options.scriptPath,
+      '--worker',
+      '--max-requests', String(this.options.maxRequests)
+    ], {
+      // 서버는 같은 요청이 반복되므로 출력 캐시를 기본으로 켠다 (SHINSA_OUTPUT_CACHE=0으로 끔)
+      env: { ...process.env, PYTHONIOENCODING: 'utf-8', SHINSA_OUTPUT_CACHE: process.env.SHINSA_OUTPUT_CACHE ?? '1' }
+    });
+    this.proc = proc;
+    this.served = 0;
+    this.stderrTail = '';
+    // 종료 중인 워커에 쓴 요청의 EPIPE는 close 처리에서 다시 보낸다
+    proc.stdin.on('error', () => {});
+
+    this.ready = new Promise<void>((resolve, reject) => {
+      const lines = createInterface({ input: proc.stdout });
+
+      lines.on('line', (line) => {
+        let msg: any;
+        try {
+          msg = JSON.parse(line);
+        } catch {
+          return;
+        }
+
+        if (msg.event === 'ready') {
+          resolve();
+          return;
+        }
+        // import 실패 시 워커가 {"error", "fix"} 한 줄을 출력하고 종료
+        if (msg.fix) {
+          reject(new Error(`${msg.error} (${msg.fix})`));
+          return;
+        }
+
+        const job = this.inflight;
+        if (!job || msg.id !== job.id) return;
+        this.inflight = null;
+        clearTimeout(job.timer);
+        if (job.method === 'create') this.served++;
+        if (msg.error) {
+          job.reject(new Error(msg.error));
+        } else {
+          job.resolve(msg.result);
+        }
+        this.dispatch();
+      });
+
+      proc.stderr.on('data', (chunk) => {
+        this.stderrTail = (this.stderrTail + chunk.toString()).slice(-2000);
+      });
+
+      proc.on('error', (err) => {
+        reject(err);
+        this.onExit(proc, err.message, false);
+      });
+
+      proc.on('close', (code) => {
+        reject(new Error(this.stderrTail || `create_docx worker exited with code ${code}`));
+        // 정상 종료 (--max-requests 도달·shutdown): 워커는 응답을 쓴 뒤에만 종료하므로 보낸 요청은 처리 전
+        this.onExit(proc, `exited with code ${code}`, code === 0);
+      });
+    });
+
+    this.startHealthCheck();
+    return this.ready;
+  }
+
+  // 워커 종료 시 처리 중이던 요청은 계획된 종료면 큐 앞으로 되돌리고, 아니면 실패 처리.
+  // 큐에 남은 요청은 새 워커로 이어서 보낸다
+  private onExit(proc: ChildProcessWithoutNullStreams, reason: string, planned: boolean): void {
+    if (this.proc !== proc) return;
+    this.proc = null;
+    this.ready = null;
+    this.plannedExit = planned;
+    this.stopHealthCheck();
+
+    const job = this.inflight;
+    if (job) {
+      this.inflight = null;
+      clearTimeout(job.timer);
+      if (planned) {
+        this.queue.unshift(job);
+      } else {
+        job.reject(new Error(`create_docx worker ${reason}: ${this.stderrTail}`));
+      }
+    }
+    this.dispatch();
+  }
+
+  private kill(reason: string): void {
+    const proc = this.proc;
+    if (!proc) return;
+    this.onExit(proc, reason, false);
+    proc.kill();
+  }
+
+  private startHealthCheck(): void {
+    if (this.healthTimer || this.options.healthCheckIntervalMs <= 0) return;
+    this.healthTimer = setInterval(() => {
+      // 처리 중인 요청이 있으면 해당 요청의 타임아웃이 감시한다
+      if (!this.proc || this.inflight || this.queue.length > 0) return;
+      this.ping().catch(() => this.kill('health check failed'));
+    }, this.options.healthCheckIntervalMs);
+    this.healthTimer.unref();
+  }
+
+  private stopHealthCheck(): void {
+    if (this.healthTimer) {
+      clearInterval(this.healthTimer);
+      this.healthTimer = null;
+    }
+  }
+}
+
+let sharedWorker: DocxWorker | null = null;
+
+export function getDocxWorker(): DocxWorker {
+  if (!sharedWorker) {
+    sharedWorker = new DocxWorker();
+  }
+  return sharedWorker;
+}
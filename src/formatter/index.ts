@@ -53,3 +53,10 @@ export {
   type FormatCheckResult,
   type ValidationReport
 } from './checklist.js';
+
+// 형식 사양 (spec/shinsa_spec.json)
+export {
+  getSpecProfile,
+  getSpecVersion,
+  type SpecProfile
+} from './spec.js';
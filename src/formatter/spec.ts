@@ -0,0 +1,103 @@
+// 신학과사회 형식 사양 (spec/shinsa_spec.json)
+// Python 생성기/분석기와 같은 파일을 읽어 형식 값이 어긋나지 않게 한다.
+
+import { readFileSync } from 'fs';
+import { delimiter } from 'path';
+
+export interface SpecProfile {
+  label: string;
+  journal_name: string;
+  page: {
+    size: string;
+    width_mm: number;
+    height_mm: number;
+    margin_top_mm: number;
+    margin_bottom_mm: number;
+    margin_left_mm: number;
+    margin_right_mm: number;
+  };
+  fonts: {
+    korean: string;
+    english: string;
+    title_size: number;
+    subtitle_size: number;
+    author_size: number;
+    body_size: number;
+    abstract_size: number;
+    abstract_title_size: number;
+    section_title_size: number;
+    footnote_size: number;
+    header_size: number;
+  };
+  line_spacing: number;
+  markers: {
+    title_footnote: string;
+    author_footnotes: string[];
+    abstract_kr_title: string;
+    accepted_date_label: string;
+  };
+  legacy_variants?: Partial<Record<'title_footnote' | 'author_footnotes' | 'abstract_kr_title' | 'accepted_date_label', string[]>>;
+  tolerances: { margin_mm: number; size_pt: number; line_spacing: number };
+  spec_version?: string;
+}
+
+interface SpecFile {
+  version: string;
+  default_profile: string;
+  profiles: Record<string, Partial<SpecProfile> & { extends?: string }>;
+}
+
+// dist/formatter/spec.js 기준 ../../spec/shinsa_spec.json
+const SPEC_URL = new URL('../../spec/shinsa_spec.json', import.meta.url);
+
+let specCache: SpecFile | null = null;
+const profileCache = new Map<string, SpecProfile>();
+
+function loadSpecFile(): SpecFile {
+  if (!specCache) {
+    specCache = JSON.parse(readFileSync(SPEC_URL, 'utf-8')) as SpecFile;
+    // SHINSA_PROFILES: derive_profiles.py가 만든 추가 프로필 파일 (scripts/shinsa_spec.py와 같은 규칙)
+    for (const path of (process.env.SHINSA_PROFILES || '').split(delimiter).filter(Boolean)) {
+      const extra = JSON.parse(readFileSync(path, 'utf-8')) as SpecFile;
+      for (const [name, profile] of Object.entries(extra.profiles)) {
+        specCache.profiles[name] = { ...profile, spec_version: extra.version };
+      }
+    }
+  }
+  return specCache;
+}
+
+function merge(base: any, override: any): any {
+  const result: any = { ...base };
+  for (const [key, value] of Object.entries(override)) {
+    if (value && typeof value === 'object' && !Array.isArray(value) && typeof base?.[key] === 'object') {
+      result[key] = merge(base[key], value);
+    } else {
+      result[key] = value;
+    }
+  }
+  return result;
+}
+
+export function getSpecVersion(): string {
+  return loadSpecFile().version;
+}
+
+// 연도별 프로필 (extends 상속 해소)
+export function getSpecProfile(name?: string): SpecProfile {
+  const spec = loadSpecFile();
+  const key = name || spec.default_profile;
+  const cached = profileCache.get(key);
+  if (cached) return cached;
+
+  const raw = spec.profiles[key];
+  if (!raw) {
+    throw new Error(`Unknown spec profile: ${key} (available: ${Object.keys(spec.profiles).join(', ')})`);
+  }
+
+  const { extends: parent, ...own } = raw;
+  const profile = (parent ? merge(getSpecProfile(parent), own) : own) as SpecProfile;
+  profile.spec_version ??= spec.version;
+  profileCache.set(key, profile);
+  return profile;
+}
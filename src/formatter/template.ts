@@ -1,6 +1,11 @@
 // 신학과사회 저널 정확한 형식 템플릿
 // 공식 투고 규정 기반 (학회논문투고 규정.md)
 
+import { getSpecProfile } from './spec.js';
+
+// 페이지/글꼴 수치는 spec/shinsa_spec.json (Python 생성기·분석기와 공용)
+const SPEC = getSpecProfile('2025');
+
 export interface JournalTemplate {
   // 문서 정보
   journal_name: string;
@@ -161,29 +166,38 @@ export interface JournalTemplate {
 
 // 신학과사회 기본 템플릿 (공식 투고 규정 기반)
 export const SHINSA_TEMPLATE: JournalTemplate = {
-  journal_name: '신학과 사회',
+  journal_name: SPEC.journal_name,
   volume: 39,
   issue: 2,
   year: 2025,
 
   // 페이지 설정 (2025년 실제 논문 기준: 신국판)
   page: {
-    size: '신국판',  // 152x225mm (A4가 아님!)
-    margins: { top: 24, bottom: 25, left: 25, right: 23 },  // 실측값 (mm)
+    size: SPEC.page.size,  // 152x225mm (A4가 아님!)
+    margins: {                // 실측값 (mm): 24/25/25/23
+      top: SPEC.page.margin_top_mm,
+      bottom: SPEC.page.margin_bottom_mm,
+      left: SPEC.page.margin_left_mm,
+      right: SPEC.page.margin_right_mm
+    },
     recommended_pages: { min: 10, max: 12 }
   },
 
   // 폰트 설정 (2025년 실제 논문 기준)
   fonts: {
-    title: { family: '바탕', size: 14, bold: true },        // 논문 제목 14pt
-    subtitle: { family: '바탕', size: 12.3, bold: false },  // 부제 12.3pt
-    author: { family: '바탕', size: 11 },                   // 저자명 11pt (띄어쓰기: 이 민 규)
-    body: { family: '바탕', size: 10.3, line_spacing: 160 }, // 본문 10.3pt
-    abstract: { family: '바탕', size: 8.5 },                // 초록 본문 8.5pt
-    abstract_title: { family: '바탕', size: 9 },            // 국문초록/Abstract 제목 9pt
-    section_title: { family: '바탕', size: 13, bold: true }, // 섹션 제목 (Ⅰ. 서론) 13pt
-    footnote: { family: '바탕', size: 8.5 },                // 각주 8.5pt
-    header: { family: '바탕', size: 8.1 }                   // 헤더 8.1pt
+    title: { family: SPEC.fonts.korean, size: SPEC.fonts.title_size, bold: true },           // 논문 제목 14pt
+    subtitle: { family: SPEC.fonts.korean, size: SPEC.fonts.subtitle_size, bold: false },  // 부제 12.3pt
+    author: { family: SPEC.fonts.korean, size: SPEC.fonts.author_size },                   // 저자명 11pt (띄어쓰기: 이 민 규)
+    body: {                                                                                // 본문 10.3pt, 160%
+      family: SPEC.fonts.korean,
+      size: SPEC.fonts.body_size,
+      line_spacing: Math.round(SPEC.line_spacing * 100)
+    },
+    abstract: { family: SPEC.fonts.korean, size: SPEC.fonts.abstract_size },               // 초록 본문 8.5pt
+    abstract_title: { family: SPEC.fonts.korean, size: SPEC.fonts.abstract_title_size },   // 국문초록/Abstract 제목 9pt
+    section_title: { family: SPEC.fonts.korean, size: SPEC.fonts.section_title_size, bold: true }, // 섹션 제목 (Ⅰ. 서론) 13pt
+    footnote: { family: SPEC.fonts.korean, size: SPEC.fonts.footnote_size },               // 각주 8.5pt
+    header: { family: SPEC.fonts.korean, size: SPEC.fonts.header_size }                    // 헤더 8.1pt
   },
 
   // 인용 표기 기호 (공식 규정 4장)
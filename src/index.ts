@@ -11,8 +11,9 @@ import {
 
 import { parseCitation, extractCitations } from './parsers/index.js';
 import { toFootnote, toBibliography, convertCitation, sortBibliography } from './converters/index.js';
+import { getDocxWorker } from './docx/index.js';
 import { initRAG, searchCitations, getPaperCitations, getStats, isRAGInitialized } from './rag/index.js';
-import { convertEssayToPaper, toMarkdown, toWordHTML, SHINSA_TEMPLATE, SHINSA_2025_CHECKLIST, getChecklistSummary, checkItem, generateValidationReport } from './formatter/index.js';
+import { convertEssayToPaper, toMarkdown, toWordHTML, SHINSA_TEMPLATE, SHINSA_2025_CHECKLIST, getChecklistSummary, checkItem, generateValidationReport, getSpecProfile } from './formatter/index.js';
 import type { FormatCheckResult } from './formatter/index.js';
 import type { ParsedCitation, BatchConvertResult, CitationType } from './types/citation.js';
 import type { EssayInput, ConversionOptions } from './formatter/index.js';
@@ -715,6 +716,30 @@ server.setRequestHandler(ListToolsRequestSchema, async () => {
               items: { type: 'string' },
               description: '참고문헌 목록'
             },
+            footnotes: {
+              type: 'array',
+              items: { type: 'string' },
+              description: '본문 각주 (n번째 항목 = 본문의 [^n] 또는 n) 표시에 달리는 Word 각주)'
+            },
+            tables: {
+              type: 'array',
+              items: {
+                type: 'object',
+                properties: {
+                  caption: { type: 'string', description: '표 제목 (<표 n> 뒤에 붙음)' },
+                  columns: { type: 'array', items: { type: 'string' }, description: '머리글 행' },
+                  rows: {
+                    type: 'array',
+                    items: { type: 'array', items: { type: ['string', 'number'] } },
+                    description: '행 목록 (셀 문자열 배열)'
+                  },
+                  note: { type: 'string', description: '표 아래 주 (예: "주: ...")' },
+                  widths: { type: 'array', items: { type: 'number' }, description: '열 상대 폭' }
+                },
+                required: ['rows']
+              },
+              description: '표 (n번째 항목 = 본문에서 문단 하나가 [표 n]인 자리, 없으면 본문 끝에 배치)'
+            },
             abstract_en: {
               type: 'string',
               description: '영문 초록'
@@ -738,7 +763,19 @@ server.setRequestHandler(ListToolsRequestSchema, async () => {
             },
             start_page: {
               type: 'integer',
-              description: '시작 페이지 번호 (기본: 1)'
+              description: '시작 페이지 번호 (기본: 1, 끝 페이지는 쪽수 추정으로 계산)'
+            },
+            received_date: {
+              type: 'string',
+              description: '접수일자 (선택, 예: 2025년 4월 1일)'
+            },
+            accepted_date: {
+              type: 'string',
+              description: '논문확정일자 (선택, 2011 프로필은 게재확정일자로 표기)'
+            },
+            profile: {
+              type: 'string',
+              description: '형식 연도 프로필 (기본: 2025, 레거시: 2019·2015·2011 — 각주 기호·초록 제목·날짜 라벨)'
             },
             output_path: {
               type: 'string',
@@ -1487,8 +1524,6 @@ ${abstractEn || '[English abstract required]'}
     // DOCX 파일 생성 도구 (python-docx 기반)
     // ============================================
     case 'create_shinsa_docx': {
-      const { spawn } = await import('child_process');
-      const { writeFile, unlink, mkdir } = await import('fs/promises');
       const path = await import('path');
       const os = await import('os');
 
@@ -1514,12 +1549,17 @@ ${abstractEn || '[English abstract required]'}
         keywords_kr: args?.keywords_kr as string[] | undefined,
         body,
         references: args?.references as string[] | undefined,
+        footnotes: args?.footnotes as string[] | undefined,
+        tables: args?.tables as object[] | undefined,
         abstract_en: args?.abstract_en as string | undefined,
         keywords_en: args?.keywords_en as string[] | undefined,
         volume: args?.volume as number | undefined,
         issue: args?.issue as number | undefined,
         year: args?.year as number | undefined,
-        start_page: args?.start_page as number | undefined
+        start_page: args?.start_page as number | undefined,
+        received_date: args?.received_date as string | undefined,
+        accepted_date: args?.accepted_date as string | undefined,
+        profile: args?.profile as string | undefined
       };
 
       // 출력 경로 결정
@@ -1530,57 +1570,10 @@ ${abstractEn || '[English abstract required]'}
         outputPath = path.join(desktop, `${safeTitle}_신사형식.docx`);
       }
 
-      // 임시 JSON 파일 생성
-      const tempDir = os.tmpdir();
-      const tempJsonPath = path.join(tempDir, `shinsa_input_${Date.now()}.json`);
-
       try {
-        await writeFile(tempJsonPath, JSON.stringify(inputData, null, 2), 'utf-8');
-
-        // Python 스크립트 경로
-        const scriptDir = path.dirname(new URL(import.meta.url).pathname);
-        let scriptPath = path.join(scriptDir, '..', 'scripts', 'create_docx.py');
-
-        // Windows 경로 수정
-        if (process.platform === 'win32' && scriptPath.startsWith('/')) {
-          scriptPath = scriptPath.substring(1);
-        }
-
-        // Python 실행
-        const result = await new Promise<string>((resolve, reject) => {
-          const pythonProcess = spawn('python', [scriptPath, tempJsonPath, outputPath], {
-            env: { ...process.env, PYTHONIOENCODING: 'utf-8' }
-          });
-
-          let stdout = '';
-          let stderr = '';
-
-          pythonProcess.stdout.on('data', (data) => {
-            stdout += data.toString();
-          });
-
-          pythonProcess.stderr.on('data', (data) => {
-            stderr += data.toString();
-          });
-
-          pythonProcess.on('close', (code) => {
-            if (code === 0) {
-              resolve(stdout);
-            } else {
-              reject(new Error(stderr || `Python exited with code ${code}`));
-            }
-          });
-
-          pythonProcess.on('error', (err) => {
-            reject(err);
-          });
-        });
-
-        // 임시 파일 삭제
-        await unlink(tempJsonPath).catch(() => {});
-
-        // 결과 파싱
-        const resultJson = JSON.parse(result);
+        // 상주 워커로 생성 (워커가 없거나 죽었으면 자동 재시작)
+        const resultJson = await getDocxWorker().create(inputData, outputPath);
+        const spec = getSpecProfile(inputData.profile);
 
         return {
           content: [{
@@ -1590,21 +1583,20 @@ ${abstractEn || '[English abstract required]'}
               path: resultJson.path,
               message: resultJson.message,
               format: {
-                page_size: '신국판 (152x225mm)',
-                font: '바탕체',
-                title_size: '14pt',
-                body_size: '10.3pt',
-                line_spacing: '160%'
+                page_size: `${spec.page.size} (${spec.page.width_mm}x${spec.page.height_mm}mm)`,
+                font: `${spec.fonts.korean}체`,
+                title_size: `${spec.fonts.title_size}pt`,
+                body_size: `${spec.fonts.body_size}pt`,
+                line_spacing: `${Math.round(spec.line_spacing * 100)}%`
               },
-              note: 'python-docx로 생성된 정확한 형식의 DOCX 파일입니다.'
+              note: 'python-docx로 생성된 정확한 형식의 DOCX 파일입니다.',
+              elapsed_ms: resultJson.elapsed_ms,
+              metrics: resultJson.metrics
             }, null, 2)
           }]
         };
 
       } catch (error) {
-        // 임시 파일 정리
-        await unlink(tempJsonPath).catch(() => {});
-
         return {
           content: [{
             type: 'text',
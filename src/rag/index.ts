@@ -1,5 +1,8 @@
 import { createClient, SupabaseClient } from '@supabase/supabase-js';
 import OpenAI from 'openai';
+import { callLocalIndex, getCachedEmbedding, localIndexPath, putCachedEmbedding } from './local.js';
+
+const EMBEDDING_MODEL = 'text-embedding-3-small';
 
 let supabase: SupabaseClient | null = null;
 let openai: OpenAI | null = null;
@@ -8,8 +11,10 @@ export function initRAG() {
   const supabaseUrl = process.env.SUPABASE_URL;
   const supabaseKey = process.env.SUPABASE_KEY;
   const openaiKey = process.env.OPENAI_API_KEY;
+  const useLocal = Boolean(localIndexPath());
 
-  if (!supabaseUrl || !supabaseKey) {
+  // SHINSA_LOCAL_INDEX(로컬 색인 서버 소켓)가 있으면 Supabase 없이 검색
+  if (!useLocal && (!supabaseUrl || !supabaseKey)) {
     console.error('SUPABASE_URL and SUPABASE_KEY are required for RAG');
     return false;
   }
@@ -19,7 +24,9 @@ export function initRAG() {
     return false;
   }
 
-  supabase = createClient(supabaseUrl, supabaseKey);
+  if (!useLocal) {
+    supabase = createClient(supabaseUrl!, supabaseKey!);
+  }
   openai = new OpenAI({ apiKey: openaiKey });
   return true;
 }
@@ -29,12 +36,20 @@ export async function getEmbedding(text: string): Promise<number[]> {
     throw new Error('OpenAI client not initialized');
   }
 
+  // SHINSA_EMBED_CACHE가 있으면 같은 문자열은 API를 다시 부르지 않음
+  const cached = await getCachedEmbedding(text, EMBEDDING_MODEL);
+  if (cached) {
+    return cached;
+  }
+
   const response = await openai.embeddings.create({
-    model: 'text-embedding-3-small',
+    model: EMBEDDING_MODEL,
     input: text.substring(0, 8000)
   });
 
-  return response.data[0].embedding;
+  const embedding = response.data[0].embedding;
+  await putCachedEmbedding(text, EMBEDDING_MODEL, embedding);
+  return embedding;
 }
 
 export interface SearchResult {
@@ -49,7 +64,7 @@ export async function searchCitations(
   topK: number = 5,
   filterType?: string
 ): Promise<SearchResult[]> {
-  if (!supabase) {
+  if (!supabase && !localIndexPath()) {
     throw new Error('Supabase client not initialized');
   }
 
@@ -64,6 +79,10 @@ export async function searchCitations(
     params.filter_type = filterType;
   }
 
+  if (!supabase) {
+    return callLocalIndex<SearchResult[]>('match_citations', params);
+  }
+
   const { data, error } = await supabase.rpc('match_citations', params);
 
   if (error) {
@@ -74,6 +93,9 @@ export async function searchCitations(
 }
 
 export async function getPaperCitations(paperTitle: string): Promise<SearchResult[]> {
+  if (!supabase && localIndexPath()) {
+    return callLocalIndex<SearchResult[]>('paper_citations', { paper_title: paperTitle });
+  }
   if (!supabase) {
     throw new Error('Supabase client not initialized');
   }
@@ -100,6 +122,14 @@ export async function getStats(): Promise<{
   byType: Record<string, number>;
   byPaper: Record<string, number>;
 }> {
+  if (!supabase && localIndexPath()) {
+    const stats = await callLocalIndex<{
+      count: number;
+      by_type: Record<string, number>;
+      by_paper: Record<string, number>;
+    }>('stats');
+    return { total: stats.count, byType: stats.by_type, byPaper: stats.by_paper };
+  }
   if (!supabase) {
     throw new Error('Supabase client not initialized');
   }
@@ -130,5 +160,5 @@ export async function getStats(): Promise<{
 }
 
 export function isRAGInitialized(): boolean {
-  return supabase !== null && openai !== null;
+  return (supabase !== null || Boolean(localIndexPath())) && openai !== null;
 }
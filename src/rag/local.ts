@@ -0,0 +1,190 @@
+import net from 'net';
+
+// 로컬 Python 서버 클라이언트 (줄 단위 JSON: {"id", "method", "params"} → {"id", "result" | "error"})
+//   SHINSA_LOCAL_INDEX  scripts/vector_index.py serve --socket   — match_citations 대체
+//   SHINSA_EMBED_CACHE  scripts/embedding_cache.py serve --socket — 임베딩 캐시
+//   SHINSA_LOCAL_TIMEOUT_MS  호출 1건 타임아웃 (기본 10000) — 넘으면 거부하고 연결을 버림 (다음 호출에서 재연결)
+
+const DEFAULT_TIMEOUT_MS = 10_000;
+
+interface Pending {
+  resolve: (value: unknown) => void;
+  reject: (reason: Error) => void;
+}
+
+class SocketClient {
+  private socket: net.Socket | null = null;
+  private connecting: Promise<net.Socket> | null = null;
+  private nextId = 1;
+  private buffer = '';
+  private pending = new Map<number, Pending>();
+
+  constructor(
+    private readonly path: string,
+    private readonly timeoutMs: number = Number(process.env.SHINSA_LOCAL_TIMEOUT_MS) || DEFAULT_TIMEOUT_MS
+  ) {}
+
+  call<T>(method: string, params: Record<string, unknown> = {}): Promise<T> {
+    const id = this.nextId++;
+    return new Promise<T>((resolve, reject) => {
+      // 연결 대기까지 포함한 타임아웃 — 서버가 응답하지 않아도 호출자가 대체 경로로 갈 수 있게
+      const timer = setTimeout(() => {
+        if (!this.pending.delete(id)) return;
+        reject(new Error(`${method} on ${this.path} timed out after ${this.timeoutMs}ms`));
+        // 응답이 막힌 연결은 버리고 다음 호출에서 다시 연결
+        this.reset(new Error(`Connection to ${this.path} reset after a timeout`));
+      }, this.timeoutMs);
+
+      this.pending.set(id, {
+        resolve: (value) => {
+          clearTimeout(timer);
+          resolve(value as T);
+        },
+        reject: (error) => {
+          clearTimeout(timer);
+          reject(error);
+        }
+      });
+      this.connect().then(
+        (conn) => {
+          if (this.pending.has(id)) conn.write(JSON.stringify({ id, method, params }) + '\n');
+        },
+        (error) => {
+          const waiter = this.pending.get(id);
+          if (!waiter) return;
+          this.pending.delete(id);
+          waiter.reject(error);
+        }
+      );
+    });
+  }
+
+  private failAll(error: Error) {
+    for (const { reject } of this.pending.values()) {
+      reject(error);
+    }
+    this.pending.clear();
+  }
+
+  private reset(error: Error) {
+    const conn = this.socket;
+    this.socket = null;
+    this.buffer = '';
+    this.failAll(error);
+    conn?.destroy();
+  }
+
+  private onData(chunk: string) {
+    this.buffer += chunk;
+    let newline: number;
+    while ((newline = this.buffer.indexOf('\n')) >= 0) {
+      const line = this.buffer.slice(0, newline).trim();
+      this.buffer = this.buffer.slice(newline + 1);
+      if (!line) continue;
+      let message: { id?: number; result?: unknown; error?: string };
+      try {
+        message = JSON.parse(line);
+      } catch {
+        continue;
+      }
+      if (message.id === undefined || !this.pending.has(message.id)) continue;
+      const waiter = this.pending.get(message.id)!;
+      this.pending.delete(message.id);
+      if (message.error) {
+        waiter.reject(new Error(message.error));
+      } else {
+        waiter.resolve(message.result);
+      }
+    }
+  }
+
+  private connect(): Promise<net.Socket> {
+    if (this.socket) {
+      return Promise.resolve(this.socket);
+    }
+    if (this.connecting) {
+      return this.connecting;
+    }
+
+    this.connecting = new Promise((resolve, reject) => {
+      const conn = net.createConnection(this.path);
+      let connected = false;
+      conn.setEncoding('utf8');
+
+      conn.on('connect', () => {
+        connected = true;
+        this.socket = conn;
+        this.connecting = null;
+        resolve(conn);
+      });
+      // reset으로 버린 연결의 늦은 데이터·종료는 새 연결에 영향을 주지 않게 무시
+      conn.on('data', (chunk: string) => {
+        if (this.socket === conn) this.onData(chunk);
+      });
+      conn.on('error', (error) => {
+        // 연결 후 오류는 뒤따르는 close에서 처리
+        if (!connected) {
+          this.connecting = null;
+          reject(error);
+        }
+      });
+      conn.on('close', () => {
+        if (this.socket === conn) this.reset(new Error(`Connection to ${this.path} closed`));
+      });
+    });
+
+    return this.connecting;
+  }
+}
+
+const clients = new Map<string, SocketClient>();
+
+function client(path: string): SocketClient {
+  let existing = clients.get(path);
+  if (!existing) {
+    existing = new SocketClient(path);
+    clients.set(path, existing);
+  }
+  return existing;
+}
+
+export function localIndexPath(): string | undefined {
+  return process.env.SHINSA_LOCAL_INDEX || undefined;
+}
+
+export async function callLocalIndex<T>(method: string, params: Record<string, unknown> = {}): Promise<T> {
+  const path = localIndexPath();
+  if (!path) {
+    throw new Error('SHINSA_LOCAL_INDEX is not set');
+  }
+  return client(path).call<T>(method, params);
+}
+
+// ===== 임베딩 캐시 =====
+// 캐시는 보조 수단이므로 서버가 없거나 오류가 나도 예외를 던지지 않는다 (OpenAI로 진행).
+
+export function embedCachePath(): string | undefined {
+  return process.env.SHINSA_EMBED_CACHE || undefined;
+}
+
+export async function getCachedEmbedding(text: string, model: string): Promise<number[] | null> {
+  const path = embedCachePath();
+  if (!path) return null;
+  try {
+    const result = await client(path).call<{ embedding: number[] | null }>('get', { text, model });
+    return result.embedding;
+  } catch (error) {
+    console.error(`Embedding cache lookup failed: ${error}`);
+    return null;
+  }
+}
+
+export async function putCachedEmbedding(text: string, model: string, embedding: number[]): Promise<void> {
+  const path = embedCachePath();
+  if (!path) return;
+  try {
+    await client(path).call('put', { text, model, embedding });
+  } catch (error) {
+    console.error(`Embedding cache store failed: ${error}`);
+  }
+}